@@ -13,6 +13,7 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import List
 
+from jdxi_editor.core.db.instrumented import InstrumentedConnection
 from jdxi_editor.core.db.pragma import Pragma
 
 
@@ -36,7 +37,11 @@ class DatabaseConnection:
         """
         Get a SQLite connection with proper settings.
         """
-        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            factory=InstrumentedConnection,
+        )
         conn.row_factory = sqlite3.Row  # Enable column access by name
         conn.execute(Pragma.FOREIGN_KEYS_ON)  # Enable foreign key support
         return conn
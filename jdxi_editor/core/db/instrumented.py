@@ -0,0 +1,70 @@
+"""
+This module provides SQLite connection and cursor classes that time each
+statement into the ``db.query.<VERB>`` instruments (e.g. ``db.query.SELECT``)
+while instrumentation is enabled.
+
+Pass ``factory=InstrumentedConnection`` to ``sqlite3.connect``; SQLAlchemy
+engines take it through ``connect_args``. Statements run through
+``Connection.execute`` and through cursors are both timed. While
+instrumentation is disabled a statement costs one extra attribute read.
+
+Classes:
+    InstrumentedCursor: A cursor timing execute / executemany.
+    InstrumentedConnection: A connection timing execute and handing out InstrumentedCursors.
+"""
+
+import sqlite3
+
+from jdxi_editor.core.instrumentation import instruments
+
+
+def query_metric(sql: str) -> str:
+    """
+    Instrument name for a statement, by its first keyword.
+
+    :param sql: str SQL statement
+    :return: str e.g. "db.query.SELECT"
+    """
+    words = sql.split(None, 1)
+    return f"db.query.{words[0].upper() if words else 'EMPTY'}"
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """A cursor timing its statements."""
+
+    def execute(self, sql, parameters=(), /):
+        if not instruments.enabled:
+            return super().execute(sql, parameters)
+        with instruments.span(query_metric(sql)):
+            return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters, /):
+        if not instruments.enabled:
+            return super().executemany(sql, seq_of_parameters)
+        with instruments.span(query_metric(sql)):
+            return super().executemany(sql, seq_of_parameters)
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """A connection timing its statements and handing out InstrumentedCursors."""
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or InstrumentedCursor)
+
+    def execute(self, sql, parameters=(), /):
+        if not instruments.enabled:
+            return super().execute(sql, parameters)
+        with instruments.span(query_metric(sql)):
+            return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters, /):
+        if not instruments.enabled:
+            return super().executemany(sql, seq_of_parameters)
+        with instruments.span(query_metric(sql)):
+            return super().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script, /):
+        if not instruments.enabled:
+            return super().executescript(sql_script)
+        with instruments.span("db.query.SCRIPT"):
+            return super().executescript(sql_script)
@@ -0,0 +1,148 @@
+"""
+This module provides `ConnectionPool`, the shared SQLite access layer for the
+editor's database file: one persistent connection per thread, configured once.
+
+Opening a connection per call costs a file open, schema parse and pragma
+setup every time, and throws away sqlite3's prepared-statement cache. Pooled
+connections keep both: each thread's connection is opened on first use with
+the pragmas from ``Pragma``, and statements it has run before are reused from
+its cache. WAL journal mode is stored in the database file, so it is set once
+when the pool opens its first connection.
+
+Connections are ``InstrumentedConnection``s, so every statement is timed into
+the ``db.query.*`` instruments.
+
+Classes:
+    ConnectionPool: Per-thread persistent connections to one database file.
+
+Example usage:
+--------------
+>>> pool = get_pool(Path("~/.jdxi_editor/user_programs.db").expanduser())
+>>> with pool.transaction() as conn:
+...     conn.executemany("DELETE FROM playlist_items WHERE id = ?", rows)
+>>> pool.connection().execute("SELECT COUNT(*) FROM programs").fetchone()
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from decologr import Decologr as log
+
+from jdxi_editor.core.db.instrumented import InstrumentedConnection
+from jdxi_editor.core.db.pragma import Pragma
+
+PREPARED_STATEMENT_CACHE = 256  # --- statements kept prepared per connection
+BUSY_TIMEOUT_SEC = 30.0
+
+# --- Per-connection settings; journal mode is per file and set once
+CONNECTION_PRAGMAS = (
+    Pragma.FOREIGN_KEYS_ON,
+    Pragma.SYNCHRONOUS_NORMAL,
+    Pragma.BUSY_TIMEOUT_30_SEC,
+)
+
+
+class ConnectionPool:
+    """Per-thread persistent connections to one SQLite database file."""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the pool; connections are opened on first use.
+
+        :param db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._journal_mode_set = False
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        The calling thread's connection, opened and configured on first use.
+
+        :return: sqlite3.Connection with sqlite3.Row rows
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=BUSY_TIMEOUT_SEC,
+            factory=InstrumentedConnection,
+            cached_statements=PREPARED_STATEMENT_CACHE,
+            check_same_thread=False,  # --- only so close() can run on any thread
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        with self._lock:
+            if not self._journal_mode_set:
+                conn.execute(Pragma.JOURNAL_MODE_WAL)
+                self._journal_mode_set = True
+            self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        The calling thread's connection, committed on success and rolled back on error.
+
+        :return: context manager yielding sqlite3.Connection
+        """
+        conn = self.connection()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def close(self) -> None:
+        """Close every connection; threads reconnect on their next use."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as ex:
+                log.warning(
+                    f"Error closing {self.db_path}: {ex}",
+                    scope=self.__class__.__name__,
+                )
+        self._local = threading.local()
+
+
+_pools: Dict[Path, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Path) -> ConnectionPool:
+    """
+    The shared pool for a database file, created on first use.
+
+    :param db_path: Path to the SQLite database file
+    :return: ConnectionPool
+    """
+    key = Path(db_path).expanduser().resolve()
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(key)
+        return pool
+
+
+def close_pools() -> None:
+    """Close every pool's connections, e.g. on shutdown."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close()
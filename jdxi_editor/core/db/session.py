@@ -16,6 +16,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from jdxi_editor.core.db.base import Base
+from jdxi_editor.core.db.instrumented import InstrumentedConnection
 from jdxi_editor.core.db.pragma import Pragma
 
 # --- Import models to ensure they're registered with Base
@@ -52,6 +53,7 @@ class DatabaseSession:
             connect_args={
                 "check_same_thread": False,
                 "timeout": 30.0,
+                "factory": InstrumentedConnection,  # --- db.query.* timings
             },
             poolclass=StaticPool,
             echo=False,  # --- Set to True for SQL debugging
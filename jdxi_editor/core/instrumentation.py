@@ -0,0 +1,403 @@
+"""
+Instrumentation
+===============
+
+Counters, gauges, histograms and span timers for the editor's hot paths, with
+a trace buffer that exports to the Chrome trace format (``chrome://tracing``,
+Perfetto).
+
+``profiling_decorator`` profiles a whole run with cProfile, which is too slow
+to leave on and says nothing about latency. These instruments are cheap enough
+to stay in the code permanently:
+
+- Disabled (the default) an instrumented path costs one attribute read:
+  ``if instruments.enabled:`` or ``instruments.span(name)``, which returns a
+  shared no-op span.
+- Enabled, a sample is a ``perf_counter_ns`` pair and a few integer updates;
+  nothing is locked. Each metric is normally written by one thread (the MIDI
+  callback, the decode worker, the output scheduler, the Qt thread), so a
+  sample is only lost if two threads write the same metric at once.
+- Trace events are only kept while ``tracing`` is on, in a bounded buffer
+  (the most recent ``TRACE_CAPACITY`` events).
+
+Metric names are dotted, the first part naming the subsystem:
+
+- ``midi_in.*``: input pipeline stages (``IngestLatencyStats``)
+- ``sysex_dispatch.*`` and ``ui.update.<Editor>``: SysEx bus fan-out and the
+  time each editor takes to apply an update
+- ``midi_out.*``: output scheduler queue depth, queue wait and pacing
+- ``playback.jitter``: how late the playback scheduler sends
+- ``db.query``: SQLite statements
+
+Classes:
+    Histogram: Bucketed samples with recent-sample percentiles.
+    Instrumentation: The metric registry, span timers and trace buffer.
+
+Example usage:
+--------------
+>>> instruments.enabled = True
+>>> with instruments.span("ui.update.AnalogSynthEditor"):
+...     editor.apply(event)
+>>> instruments.record_duration("midi_in.decode", elapsed_ns)
+>>> instruments.set_gauge("midi_out.depth.BULK", 12)
+>>> instruments.snapshot()["histograms"]["midi_in.decode"]["p95"]
+>>> instruments.tracing = True
+>>> instruments.export_chrome_trace("trace.json")
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Deque, Dict, Optional, Tuple, TypeVar, Union
+
+R = TypeVar("R")
+
+# --- Bucket upper bounds; durations are in microseconds
+HISTOGRAM_BOUNDS = (
+    1,
+    2,
+    5,
+    10,
+    20,
+    50,
+    100,
+    200,
+    500,
+    1_000,
+    2_000,
+    5_000,
+    10_000,
+    20_000,
+    50_000,
+    100_000,
+    1_000_000,
+)
+HISTOGRAM_RECENT = 1024  # samples kept for percentiles
+TRACE_CAPACITY = 200_000  # trace events kept while tracing
+
+PHASE_COMPLETE = "X"
+PHASE_COUNTER = "C"
+
+
+class Histogram:
+    """
+    Samples of one metric in buckets, with percentiles over the recent ones.
+
+    :param name: str metric name
+    :param unit: str unit of the samples, "us" for durations
+    """
+
+    __slots__ = ("name", "unit", "counts", "count", "total", "max", "_recent")
+
+    def __init__(self, name: str, unit: str = "us"):
+        self.name = name
+        self.unit = unit
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._recent: Deque[float] = deque(maxlen=HISTOGRAM_RECENT)
+
+    def record(self, value: float) -> None:
+        """
+        :param value: float sample in the histogram's unit
+        """
+        self.counts[bisect_left(HISTOGRAM_BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        self._recent.append(value)
+
+    def percentile(self, percent: float) -> float:
+        """
+        :param percent: float 0-100
+        :return: float percentile of the recent samples (0.0 without samples)
+        """
+        recent = sorted(self._recent)
+        if not recent:
+            return 0.0
+        return recent[min(len(recent) - 1, int(len(recent) * percent / 100.0))]
+
+    def snapshot(self) -> Dict[str, object]:
+        """
+        :return: dict unit, count, mean, p50, p95, p99, max and bucket counts
+        """
+        labels = [f"<={bound}" for bound in HISTOGRAM_BOUNDS]
+        labels.append(f">{HISTOGRAM_BOUNDS[-1]}")
+        return {
+            "unit": self.unit,
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class _NullSpan:
+    """Span handed out while instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Times a block into a duration histogram (and the trace, when tracing)."""
+
+    __slots__ = ("_instruments", "_name", "_start_ns")
+
+    def __init__(self, instruments: "Instrumentation", name: str):
+        self._instruments = instruments
+        self._name = name
+        self._start_ns = 0
+
+    def __enter__(self) -> "_Span":
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        end_ns = time.perf_counter_ns()
+        self._instruments.record_duration(
+            self._name, end_ns - self._start_ns, end_ns=end_ns
+        )
+
+
+class Instrumentation:
+    """
+    Registry of counters, gauges and histograms, with span timers and a trace buffer.
+
+    :param enabled: bool record samples
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._tracing = False
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+        self.gauge_max: Dict[str, float] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self._trace: Deque[Tuple] = deque(maxlen=TRACE_CAPACITY)
+        self._trace_origin_ns = time.perf_counter_ns()
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()  # --- creating metrics only
+
+    @property
+    def tracing(self) -> bool:
+        """Whether spans and gauges are also kept as trace events (needs enabled)."""
+        return self._tracing and self.enabled
+
+    @tracing.setter
+    def tracing(self, tracing: bool) -> None:
+        if tracing and not self._tracing:
+            self._trace.clear()
+            self._thread_names.clear()
+            self._trace_origin_ns = time.perf_counter_ns()
+        self._tracing = tracing
+
+    # --- Recording
+
+    def histogram(self, name: str, unit: str = "us") -> Histogram:
+        """
+        The histogram called name, created on first use.
+
+        :param name: str
+        :param unit: str unit when created
+        :return: Histogram
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, Histogram(name, unit))
+        return histogram
+
+    def span(self, name: str) -> Union[_Span, _NullSpan]:
+        """
+        Context manager timing a block into the duration histogram name.
+
+        :param name: str
+        :return: context manager; a shared no-op while disabled
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def timed(self, name: str) -> Callable[[Callable[..., R]], Callable[..., R]]:
+        """
+        Decorator timing every call of a function into the histogram name.
+
+        :param name: str
+        :return: decorator
+        """
+
+        def decorator(func: Callable[..., R]) -> Callable[..., R]:
+            @wraps(func)
+            def wrapper(*args, **kwargs) -> R:
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def record_duration(
+        self, name: str, elapsed_ns: int, end_ns: Optional[int] = None
+    ) -> None:
+        """
+        Record a duration measured by the caller.
+
+        :param name: str histogram name
+        :param elapsed_ns: int nanoseconds
+        :param end_ns: Optional[int] perf_counter_ns() when it ended, for the trace; now if None
+        """
+        if not self.enabled:
+            return
+        self.histogram(name).record(elapsed_ns / 1000.0)
+        if self._tracing:
+            if end_ns is None:
+                end_ns = time.perf_counter_ns()
+            self._append_trace(PHASE_COMPLETE, name, end_ns - elapsed_ns, elapsed_ns)
+
+    def record_value(self, name: str, value: float, unit: str = "us") -> None:
+        """
+        Record a sample that is not a timed span, e.g. lateness or a fan-out count.
+
+        :param name: str histogram name
+        :param value: float
+        :param unit: str unit when the histogram is created
+        """
+        if self.enabled:
+            self.histogram(name, unit).record(value)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """
+        :param name: str counter name
+        :param amount: int added to the counter
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """
+        Set a level, e.g. a queue depth; the maximum is kept too.
+
+        :param name: str gauge name
+        :param value: float
+        """
+        if not self.enabled:
+            return
+        self.gauges[name] = value
+        highest = self.gauge_max.get(name)
+        if highest is None or value > highest:
+            self.gauge_max[name] = value
+        if self._tracing:
+            self._append_trace(PHASE_COUNTER, name, time.perf_counter_ns(), value)
+
+    def _append_trace(self, phase: str, name: str, start_ns: int, value) -> None:
+        thread_id = threading.get_ident()
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = threading.current_thread().name
+        self._trace.append((phase, name, start_ns, value, thread_id))
+
+    # --- Reading
+
+    def reset(self) -> None:
+        """Clear every metric and the trace."""
+        with self._lock:
+            self.counters = {}
+            self.gauges = {}
+            self.gauge_max = {}
+            self.histograms = {}
+        self._trace.clear()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        Current values of every metric.
+
+        :return: dict {"counters": {...}, "gauges": {name: {"value", "max"}}, "histograms": {name: Histogram.snapshot()}}
+        """
+        return {
+            "counters": dict(self.counters),
+            "gauges": {
+                name: {"value": value, "max": self.gauge_max.get(name, value)}
+                for name, value in list(self.gauges.items())
+            },
+            "histograms": {
+                name: histogram.snapshot()
+                for name, histogram in list(self.histograms.items())
+            },
+        }
+
+    @property
+    def trace_event_count(self) -> int:
+        return len(self._trace)
+
+    def chrome_trace(self) -> Dict[str, object]:
+        """
+        The trace buffer in the Chrome trace event format.
+
+        Spans are complete ("X") events and gauges counter ("C") events, one
+        track per thread; timestamps are microseconds since tracing started.
+
+        :return: dict with "traceEvents"
+        """
+        pid = os.getpid()
+        origin_ns = self._trace_origin_ns
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in list(self._thread_names.items())
+        ]
+        for phase, name, start_ns, value, thread_id in list(self._trace):
+            event = {
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": phase,
+                "ts": (start_ns - origin_ns) / 1000.0,
+                "pid": pid,
+                "tid": thread_id,
+            }
+            if phase == PHASE_COMPLETE:
+                event["dur"] = value / 1000.0
+            else:
+                event["args"] = {"value": value}
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: Union[str, Path]) -> Path:
+        """
+        Write the trace buffer as a Chrome trace JSON file.
+
+        :param path: Union[str, Path]
+        :return: Path written
+        """
+        path = Path(path)
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+        return path
+
+
+instruments = Instrumentation()
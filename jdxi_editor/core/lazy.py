@@ -0,0 +1,113 @@
+"""
+Lazy attributes
+===============
+
+Deferred imports and deferred construction for the editor's large tables, so
+that importing ``JDXi`` (the composition object every module uses for styles
+and constants) does not evaluate the preset and program tables before the
+splash screen is up.
+
+- ``LazyImport``: a class attribute naming ``"module:attribute"``; the module
+  is imported on first access and the value replaces the descriptor, so later
+  reads are plain class attribute reads.
+- ``lazy_classattribute``: a class attribute computed by a function of the
+  class on first access and then stored on the class in the same way.
+- ``lazy_module_attributes``: a PEP 562 module ``__getattr__`` for packages
+  that re-export a heavy submodule's names.
+
+Classes:
+    LazyImport: Class attribute imported on first access.
+    lazy_classattribute: Class attribute computed on first access.
+
+Example usage:
+--------------
+>>> class JDXiUI:
+...     Preset = LazyImport("jdxi_editor.ui.preset.tone.lists:JDXiUIPreset")
+>>> class JDXiUIProgramList:
+...     @lazy_classattribute
+...     def ROM_PROGRAM_LIST(cls):
+...         return [JDXiProgram.from_dict(data) for data in ROM_PROGRAMS]
+>>> __getattr__ = lazy_module_attributes(
+...     __name__, {"JDXiUIProgramList": ".programs:JDXiUIProgramList"}
+... )
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def resolve(target: str, package: Optional[str] = None) -> Any:
+    """
+    Import "module:attribute" and return the attribute.
+
+    :param target: str e.g. "jdxi_editor.ui.programs.programs:JDXiUIProgramList"
+    :param package: Optional[str] anchor for a relative module name
+    :return: the attribute, or the module when target has no ":attribute"
+    """
+    module_name, _, attribute = target.partition(":")
+    module = importlib.import_module(module_name, package)
+    return getattr(module, attribute) if attribute else module
+
+
+class LazyImport:
+    """Class attribute that imports its value on first access."""
+
+    def __init__(self, target: str):
+        """
+        :param target: str "module:attribute" to import
+        """
+        self.target = target
+        self.name = target.rpartition(":")[2]
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        value = resolve(self.target)
+        setattr(owner, self.name, value)
+        return value
+
+    def __repr__(self) -> str:
+        return f"LazyImport({self.target!r})"
+
+
+class lazy_classattribute(Generic[T]):
+    """Class attribute computed by func(cls) on first access, then stored on the class."""
+
+    def __init__(self, func: Callable[[type], T]):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> T:
+        value = self.func(owner)
+        setattr(owner, self.name, value)
+        return value
+
+
+def lazy_module_attributes(
+    module_name: str, attributes: Dict[str, str]
+) -> Callable[[str], Any]:
+    """
+    A module ``__getattr__`` importing the named attributes on first access.
+
+    :param module_name: str the module's ``__name__``, anchor for relative targets
+    :param attributes: Dict[str, str] attribute name -> "module:attribute"
+    :return: Callable[[str], Any] to assign to the module's ``__getattr__``
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = attributes.get(name)
+        if target is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = resolve(target, module_name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
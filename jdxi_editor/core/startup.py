@@ -0,0 +1,248 @@
+"""
+Startup
+=======
+
+Time to first window: milestones along the startup path and an import-time
+report in the style of ``python -X importtime``, recorded in-process so the
+editor can show it (Performance panel, "Startup Report...").
+
+Milestones are seconds since this module was imported, which ``main`` does
+before anything else. They are also recorded as ``startup.<milestone>``
+instruments (ms) when instrumentation is on.
+
+Import timing is off by default. Starting the editor with ``--importtime`` or
+``JDXI_IMPORTTIME=1`` installs an ``ImportTimer`` at the front of
+``sys.meta_path``; it wraps the loader of each module imported from then on
+and records the module's self and cumulative load time, nested as imported.
+The timer is removed once the first window is shown.
+
+Classes:
+    ImportRecord: One module's import time.
+    ImportTimer: Meta path finder timing module loads.
+
+Example usage:
+--------------
+>>> startup.install_import_timer_if_requested(sys.argv)
+>>> startup.mark("splash")
+>>> startup.mark("first_window")
+>>> startup.import_timer.uninstall()
+>>> print(startup.report())
+"""
+
+import os
+import sys
+import threading
+import time
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from jdxi_editor.core.instrumentation import instruments
+
+IMPORTTIME_ARGUMENT = "--importtime"
+IMPORTTIME_ENVIRONMENT = "JDXI_IMPORTTIME"
+REPORT_LIMIT = 40  # --- slowest modules listed in the summary
+
+PROCESS_START = time.perf_counter()
+
+
+class ImportRecord(NamedTuple):
+    """One module's import time; depth is how deeply it was nested."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+class _TimedLoader:
+    """Loader proxy timing create_module and exec_module of the wrapped loader."""
+
+    def __init__(self, timer: "ImportTimer", loader: Any):
+        self._timer = timer
+        self._loader = loader
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> Any:
+        create_module = getattr(self._loader, "create_module", None)
+        self._timer._begin(spec.name)
+        try:
+            return create_module(spec) if create_module else None
+        except BaseException:
+            self._timer._end(spec.name)
+            raise
+
+    def exec_module(self, module: Any) -> None:
+        try:
+            self._loader.exec_module(module)
+        finally:
+            # --- The spec's name: an extension module may name itself differently
+            self._timer._end(module.__spec__.name)
+
+
+class ImportTimer(MetaPathFinder):
+    """Meta path finder that times the loading of every module found after it."""
+
+    def __init__(self):
+        self.records: List[ImportRecord] = []
+        self._local = threading.local()
+
+    @property
+    def installed(self) -> bool:
+        return self in sys.meta_path
+
+    def install(self) -> None:
+        """Time imports from now on."""
+        if not self.installed:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        """Stop timing imports; the records are kept."""
+        if self.installed:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self, fullname: str, path: Optional[Sequence[str]], target: Any = None
+    ) -> Optional[ModuleSpec]:
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            spec = None
+            for finder in sys.meta_path:
+                find_spec = getattr(finder, "find_spec", None)
+                if finder is self or find_spec is None:
+                    continue
+                spec = find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._local.finding = False
+        if spec is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _TimedLoader(self, spec.loader)
+        return spec
+
+    # --- Timing: a stack of [name, start_ns, children_ns] per thread
+
+    def _stack(self) -> List[list]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _begin(self, name: str) -> None:
+        self._stack().append([name, time.perf_counter_ns(), 0])
+
+    def _end(self, name: str) -> None:
+        stack = self._stack()
+        if not stack or stack[-1][0] != name:
+            return
+        _, start_ns, children_ns = stack.pop()
+        cumulative_ns = time.perf_counter_ns() - start_ns
+        if stack:
+            stack[-1][2] += cumulative_ns
+        self.records.append(
+            ImportRecord(
+                name,
+                (cumulative_ns - children_ns) // 1000,
+                cumulative_ns // 1000,
+                len(stack),
+            )
+        )
+
+    def report(self) -> str:
+        """
+        Every timed import, nested, as printed by ``python -X importtime``.
+
+        :return: str
+        """
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for record in self.records:
+            lines.append(
+                f"import time: {record.self_us:>9} | {record.cumulative_us:>10} | "
+                f"{'  ' * record.depth}{record.name}"
+            )
+        return "\n".join(lines)
+
+    def slowest(self, limit: int = REPORT_LIMIT) -> List[ImportRecord]:
+        """
+        The modules that took longest to import themselves.
+
+        :param limit: int
+        :return: List[ImportRecord] by self time, slowest first
+        """
+        return sorted(self.records, key=lambda record: -record.self_us)[:limit]
+
+
+import_timer = ImportTimer()
+milestones: List[Tuple[str, float]] = []
+
+
+def import_timing_requested(argv: Sequence[str] = ()) -> bool:
+    """
+    Whether import timing was asked for on the command line or in the environment.
+
+    :param argv: Sequence[str] command line arguments
+    :return: bool
+    """
+    return IMPORTTIME_ARGUMENT in argv or os.environ.get(
+        IMPORTTIME_ENVIRONMENT, ""
+    ) not in ("", "0")
+
+
+def install_import_timer_if_requested(argv: Sequence[str] = ()) -> bool:
+    """
+    Install the import timer if import timing was asked for.
+
+    :param argv: Sequence[str] command line arguments
+    :return: bool True if the timer is installed
+    """
+    if import_timing_requested(argv):
+        import_timer.install()
+    return import_timer.installed
+
+
+def mark(milestone: str) -> float:
+    """
+    Record that startup reached a milestone.
+
+    :param milestone: str e.g. "splash", "first_window"
+    :return: float seconds since startup began
+    """
+    elapsed = time.perf_counter() - PROCESS_START
+    milestones.append((milestone, elapsed))
+    instruments.record_value(f"startup.{milestone}", elapsed * 1000, unit="ms")
+    return elapsed
+
+
+def report(limit: int = REPORT_LIMIT) -> str:
+    """
+    The startup milestones and, when import timing was on, the slowest imports.
+
+    :param limit: int slowest imports listed
+    :return: str
+    """
+    lines = ["Startup milestones (s):"]
+    lines += [f"  {name:<24} {elapsed:8.3f}" for name, elapsed in milestones]
+    if not import_timer.records:
+        lines.append(
+            f"\nImport timing was off; start with {IMPORTTIME_ARGUMENT} or "
+            f"{IMPORTTIME_ENVIRONMENT}=1 to record it."
+        )
+        return "\n".join(lines)
+    total_us = sum(
+        record.cumulative_us for record in import_timer.records if not record.depth
+    )
+    lines.append(
+        f"\n{len(import_timer.records)} modules imported in {total_us / 1e6:.3f} s; "
+        f"slowest (self / cumulative ms):"
+    )
+    for record in import_timer.slowest(limit):
+        lines.append(
+            f"  {record.self_us / 1000:8.1f} {record.cumulative_us / 1000:9.1f}  "
+            f"{record.name}"
+        )
+    return "\n".join(lines)
@@ -25,6 +25,29 @@ def silence_midi_note_logging() -> bool:
     return True
 
 
+# Key for user preference: when True, pattern playback sends MIDI clock and Start/Stop to the synth.
+SEND_MIDI_CLOCK_KEY = "send_midi_clock"
+
+
+def send_midi_clock() -> bool:
+    """True if the user has chosen to send MIDI clock during playback. Default False."""
+    val = settings.value(SEND_MIDI_CLOCK_KEY, False)
+    if isinstance(val, bool):
+        return val
+    if isinstance(val, str):
+        return val.lower() in ("true", "1", "yes")
+    return False
+
+
+# Key for user preference: when True, the drum editor rebinds one partial panel to every drum partial.
+SHARED_DRUM_PANEL_KEY = "drum_shared_partial_panel"
+
+
+def shared_drum_panel() -> bool:
+    """True if the drum editor shares one partial panel between its partials. Default False."""
+    return settings.value(SHARED_DRUM_PANEL_KEY, False, type=bool)
+
+
 PROFILING = True
 logger = logging.getLogger(__package_name__)
 
@@ -17,6 +17,12 @@ Functions:
     main(): Main entry point to initialize and run the JD-Xi Editor application,
     set up the window, and handle MIDI message listening.
 
+Only light modules are imported at module load: the splash screen's modules
+are imported when it is built and the instrument window's (editors, preset
+tables, MIDI stack) once the splash screen is showing. Run with --importtime
+(or JDXI_IMPORTTIME=1) to log an import-time report when the window opens;
+see jdxi_editor.core.startup.
+
 """
 
 import cProfile
@@ -27,6 +33,7 @@ import platform
 import pstats
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from decologr import setup_logging
 from PySide6.QtCore import QLocale, QSettings, QTranslator
@@ -41,19 +48,14 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
-from jdxi_editor.core.jdxi import JDXi
-from jdxi_editor.log.message import log_message
+from jdxi_editor.core import startup
+from jdxi_editor.core.instrumentation import instruments
 from jdxi_editor.project import __organization_name__, __program__, __version__
-from jdxi_editor.resources import resource_path
-from jdxi_editor.ui.style import JDXiUIDimensions
-from jdxi_editor.ui.widgets.digital.title import DigitalTitle
-from jdxi_editor.ui.widgets.editor.helper import (
-    create_icon_label_with_pixmap,
-    create_layout_with_items,
-)
-from jdxi_editor.ui.windows.jdxi.instrument import JDXiInstrument
 from jdxi_editor.utils.profiling_decorator import profiling_decorator
 
+if TYPE_CHECKING:
+    from jdxi_editor.ui.widgets.digital.title import DigitalTitle
+
 os.environ["QT_LOGGING_RULES"] = "qt.qpa.fonts=false"
 
 
@@ -81,9 +83,17 @@ def load_translations(app: QApplication) -> bool:
 def main() -> None:
     """Main entry point for the JD-Xi Editor application."""
     try:
+        # --- Time the imports below if asked to (--importtime / JDXI_IMPORTTIME=1)
+        startup.install_import_timer_if_requested(sys.argv)
+        from jdxi_editor.core.db.pool import close_pools
+        from jdxi_editor.log.message import log_message
+        from jdxi_editor.ui.windows.midi.performance import INSTRUMENTATION_SETTING
+
         # --- Set up logging first
         settings = QSettings(__organization_name__, __program__)
         log_level = int(str(settings.value("log_level", logging.DEBUG)))
+        # --- Hot-path instrumentation, switched on from the Performance panel
+        instruments.enabled = settings.value(INSTRUMENTATION_SETTING, False, type=bool)
         logger = setup_logging(use_rich=False, project_name="jdxi_editor")  # @@@
 
         # --- Create application
@@ -137,6 +147,15 @@ def main() -> None:
                 log_message("Using fallback icon")
 
         splash, progress_bar, status_label = setup_splash_screen(app)
+        startup.mark("splash")
+
+        # --- Import the window's modules now the splash screen can show progress
+        status_label.setText("Loading editors…")
+        progress_bar.setValue(5)
+        app.processEvents()
+        from jdxi_editor.ui.windows.jdxi.instrument import JDXiInstrument
+
+        startup.mark("window_imported")
 
         # --- Update splash screen with initial progress
         status_label.setText("Initializing MIDI subsystem…")
@@ -151,6 +170,13 @@ def main() -> None:
         # --- Finalize splash screen
         splash.finish(window)
         window.show()
+        startup.mark("first_window")
+        if startup.import_timer.installed:
+            startup.import_timer.uninstall()
+            log_message(startup.report())
+
+        # --- Close pooled database connections (checkpoints the WAL) on exit
+        app.aboutToQuit.connect(close_pools)
 
         # --- Start event loop
         return app.exec()
@@ -162,12 +188,21 @@ def main() -> None:
 
 def setup_splash_screen(
     app: QApplication,
-) -> tuple[QSplashScreen, QProgressBar, DigitalTitle]:
+) -> tuple[QSplashScreen, QProgressBar, "DigitalTitle"]:
     """Setup and digital a professional application splash screen with rotating status text.
 
     Returns:
         tuple: (splash_screen, progress_bar, status_label) for updating progress
     """
+    from jdxi_editor.core.jdxi import JDXi
+    from jdxi_editor.resources import resource_path
+    from jdxi_editor.ui.style import JDXiUIDimensions
+    from jdxi_editor.ui.widgets.digital.title import DigitalTitle
+    from jdxi_editor.ui.widgets.editor.helper import (
+        create_icon_label_with_pixmap,
+        create_layout_with_items,
+    )
+
     splash = QSplashScreen()
     # Need to use the screen center to digital the splash screen
     # In Qt 6, QApplication.desktop() was removed, use QScreen instead
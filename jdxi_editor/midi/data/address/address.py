@@ -153,9 +153,7 @@ class Address(MidiSysExByte):
         :param address: int The address value
         :return: Optional[T] The parameter
         """
-        return next(
-            (parameter for parameter in cls if parameter.value == address), None
-        )
+        return cls._value2member_map_.get(address)
 
     @classmethod
     def from_sysex_bytes(cls: Type[T], address: bytes) -> Optional[T]:
@@ -0,0 +1,100 @@
+"""
+JD-Xi Parameter Address Index
+=============================
+
+One table from a full 4-byte parameter address (MSB, UMB, LMB, LSB) to the
+parameter class and member living there, covering the temporary program and
+tone areas and the system common and controller blocks.
+
+The table is built on first use from the patch area definitions, so this
+module can be imported from anywhere in the address package without pulling in
+the parameter maps.
+
+Example usage:
+--------------
+>>> parameter_at((0x19, 0x42, 0x00, 0x16))
+(<enum 'AnalogParam'>, <AnalogParam.OSC_WAVEFORM: ...>)
+>>> parameter_at((0x19, 0x70, 0x2F, 0x10))   # drum partial, two-byte offset
+"""
+
+import threading
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from jdxi_editor.midi.data.address.address import (
+    JDXiSysExAddressStartMSB,
+    JDXiSysExOffsetSystemLMB,
+    JDXiSysExOffsetSystemUMB,
+)
+
+Address = Tuple[int, int, int, int]
+
+SYSTEM_COMMON_ADDRESS = (
+    JDXiSysExAddressStartMSB.SETUP,
+    JDXiSysExOffsetSystemUMB.COMMON,
+    JDXiSysExOffsetSystemLMB.COMMON,
+    0x00,
+)
+SYSTEM_CONTROLLER_ADDRESS = (
+    JDXiSysExAddressStartMSB.SETUP,
+    JDXiSysExOffsetSystemUMB.COMMON,
+    JDXiSysExOffsetSystemLMB.CONTROLLER,
+    0x00,
+)
+
+_INDEX: Optional[Dict[Address, Tuple[type, Any]]] = None
+_INDEX_LOCK = threading.Lock()
+
+
+def _build_index() -> Dict[Address, Tuple[type, Any]]:
+    from jdxi_editor.midi.data.parameter.index import member_address
+    from jdxi_editor.midi.data.parameter.system.common import SystemCommonParam
+    from jdxi_editor.midi.data.parameter.system.controller import (
+        SystemControllerParam,
+    )
+    from jdxi_editor.midi.patch.state import (
+        PATCH_AREAS,
+        linear_offset,
+        pack_address,
+        parameter_index,
+        unpack_address,
+    )
+
+    areas = [(spec.address, spec.param_class) for spec in PATCH_AREAS]
+    areas.append((SYSTEM_COMMON_ADDRESS, SystemCommonParam))
+    areas.append((SYSTEM_CONTROLLER_ADDRESS, SystemControllerParam))
+
+    index: Dict[Address, Tuple[type, Any]] = {}
+    for base, param_class in areas:
+        start = pack_address(base)
+        _by_offset, params = parameter_index(param_class)
+        for param in params:
+            offset = member_address(param)
+            if offset is None:
+                continue
+            key = unpack_address(start + linear_offset(offset))
+            index.setdefault(key, (param_class, param))
+    return index
+
+
+def parameter_address_index() -> Dict[Address, Tuple[type, Any]]:
+    """
+    The full address table, built on first call.
+
+    :return: Dict[Address, Tuple[type, member]]
+    """
+    global _INDEX
+    if _INDEX is None:
+        with _INDEX_LOCK:
+            if _INDEX is None:
+                _INDEX = _build_index()
+    return _INDEX
+
+
+def parameter_at(address: Sequence[int]) -> Optional[Tuple[type, Any]]:
+    """
+    Parameter class and member at a 4-byte address.
+
+    :param address: Sequence[int] (msb, umb, lmb, lsb)
+    :return: Optional[Tuple[type, member]] None if no parameter starts there
+    """
+    return parameter_address_index().get(tuple(address))
@@ -24,6 +24,4 @@ class SysExByte(IntEnum):
         :param address: int The address
         :return: Optional[T] The parameter
         """
-        return next(
-            (parameter for parameter in cls if parameter.value == address), None
-        )
+        return cls._value2member_map_.get(address)
@@ -40,6 +40,7 @@ This class helps structure and manage parameter mappings for JD-Xi SysEx process
 from typing import Optional, Tuple
 
 from jdxi_editor.midi.data.parameter.digital.mapping import ENVELOPE_MAPPING
+from jdxi_editor.midi.data.parameter.index import parameter_by_address
 from jdxi_editor.midi.parameter.spec import RANGE_BIPOLAR_63, ParameterSpec
 from picomidi.sysex.parameter.address import AddressParameter
 
@@ -452,10 +453,8 @@ class AnalogParam(AddressParameter):
         :param address: int The address
         :return: Optional[str] The parameter name
         """
-        for param in AnalogParam:
-            if param.address == address:
-                return param.name
-        return None  # Return None if the address is not found
+        param = parameter_by_address(AnalogParam, address)
+        return param.name if param else None
 
     @property
     def display_name(self) -> str:
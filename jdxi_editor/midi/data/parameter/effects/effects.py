@@ -91,6 +91,7 @@ Param 3	00 19	(possibly unused or Level)
 from typing import Optional, Tuple
 
 from jdxi_editor.midi.data.parameter.effects.common import AddressParameterEffectCommon
+from jdxi_editor.midi.data.parameter.index import parameter_by_address
 from jdxi_editor.midi.parameter.spec import ParameterSpec
 from picomidi.constant import Midi
 from picomidi.sysex.parameter.address import AddressParameter
@@ -376,10 +377,7 @@ class Effect1Param(AddressParameter):
         :param address: int The address
         :return: Optional[object] The parameter
         """
-        for param in cls:
-            if isinstance(param.value, tuple) and param.value[0] == address:
-                return param
-        return None  # Return None if no match is found
+        return parameter_by_address(cls, address)
 
     @classmethod
     def get_by_name(cls, name: str) -> Optional[object]:
@@ -612,10 +610,7 @@ class Effect2Param(AddressParameter):
         :param address: int The address
         :return: Optional[object] The parameter
         """
-        for param in cls:
-            if isinstance(param.value, tuple) and param.value[0] == address:
-                return param
-        return None  # Return None if no match is found
+        return parameter_by_address(cls, address)
 
     @classmethod
     def get_by_name(cls, name: str) -> Optional[object]:
@@ -859,10 +854,7 @@ class DelayParam(AddressParameter):
         :param address: int The address
         :return: Optional[object] The parameter
         """
-        for param in cls:
-            if isinstance(param.value, tuple) and param.value[0] == address:
-                return param
-        return None  # Return None if no match is found
+        return parameter_by_address(cls, address)
 
     @classmethod
     def get_by_name(cls, name: str) -> Optional[object]:
@@ -1059,10 +1051,7 @@ class ReverbParam(AddressParameter):
         :param address: int The address
         :return: Optional[object] The parameter
         """
-        for param in cls:
-            if isinstance(param.value, tuple) and param.value[0] == address:
-                return param
-        return None  # Return None if no match is found
+        return parameter_by_address(cls, address)
 
     @classmethod
     def get_by_name(cls, name: str) -> Optional[object]:
@@ -0,0 +1,87 @@
+"""
+Parameter Index
+===============
+
+Lookup tables for the parameter enums, built once per class on first use.
+
+Address lookups run for every parameter of every SysEx message sent or
+received; walking the enum each time made decoding a long dump dominated by
+enum iteration. The tables here turn those lookups into dictionary hits. Name
+lookups need no table: ``__members__`` is already a dictionary.
+
+A parameter's address is ``member.address`` for ``AddressParameter`` enums,
+otherwise the first element of a tuple value or the value itself. When two
+members share an address the first one in iteration order wins, as the linear
+scans did.
+
+Example usage:
+--------------
+>>> parameter_by_address(Effect1Param, 0x11)
+<Effect1Param.EFX1_PARAM_1: ...>
+>>> for param in parameter_members(DigitalPartialParam): ...
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+_MEMBERS: Dict[type, Tuple[Any, ...]] = {}
+_ADDRESS_INDEX: Dict[type, Dict[int, Any]] = {}
+
+
+def member_address(member: Any) -> Optional[int]:
+    """
+    Address of a parameter enum member.
+
+    :param member: enum member
+    :return: Optional[int] address, or None if the member has none
+    """
+    address = getattr(member, "address", None)
+    if isinstance(address, int):
+        return address
+    value = getattr(member, "value", None)
+    if isinstance(value, tuple) and value and isinstance(value[0], int):
+        return value[0]
+    if isinstance(value, int):
+        return value
+    return None
+
+
+def parameter_members(param_class: type) -> Tuple[Any, ...]:
+    """
+    Members of a parameter class in iteration order (aliases excluded).
+
+    :param param_class: type parameter enum
+    :return: Tuple of members
+    """
+    members = _MEMBERS.get(param_class)
+    if members is None:
+        members = _MEMBERS[param_class] = tuple(param_class)
+    return members
+
+
+def address_index(param_class: type) -> Dict[int, Any]:
+    """
+    Address -> member table of a parameter class.
+
+    :param param_class: type parameter enum
+    :return: Dict[int, member]
+    """
+    index = _ADDRESS_INDEX.get(param_class)
+    if index is None:
+        index = {}
+        for member in parameter_members(param_class):
+            address = member_address(member)
+            if address is not None:
+                index.setdefault(address, member)
+        _ADDRESS_INDEX[param_class] = index
+    return index
+
+
+def parameter_by_address(param_class: type, address: int) -> Optional[Any]:
+    """
+    Look up a parameter by its address.
+
+    :param param_class: type parameter enum
+    :param address: int address (offset within its area)
+    :return: Optional member
+    """
+    return address_index(param_class).get(address)
@@ -47,6 +47,7 @@ Usage example:
 
 from typing import Optional, Tuple
 
+from jdxi_editor.midi.data.parameter.index import parameter_by_address
 from jdxi_editor.midi.parameter.spec import ParameterSpec
 from picomidi.sysex.parameter.address import AddressParameter
 
@@ -241,10 +242,8 @@ class VocalFXParam(AddressParameter):
         :param address: int The address
         :return: Optional[str] The parameter name
         """
-        for param in VocalFXParam:
-            if param.address == address:
-                return param.name
-        return None  # Return None if the address is not found
+        param = parameter_by_address(VocalFXParam, address)
+        return param.name if param else None
 
     @property
     def display_name(self) -> str:
@@ -0,0 +1,147 @@
+"""
+MIDI File Loader
+================
+
+Loads and indexes MIDI files on a worker thread.
+
+Parsing a large file with ``mido.MidiFile`` and indexing it
+(``jdxi_editor.midi.file.model``) used to run on the GUI thread. The loader
+does both on a worker thread and emits ``loaded`` with the finished
+``MidiFileModel``; the model is cached with its file, so the analyzers and
+widgets that ask for it afterwards get it without another pass.
+
+Starting a new load cancels the one in progress: its worker stops at the next
+checkpoint (after parsing, after indexing) and its result is never emitted.
+Results carry the id of the request that produced them, so a result already
+queued for the GUI thread when the next load started can be recognised with
+``is_current`` and dropped.
+
+Classes:
+    MidiFileLoadResult: A loaded file.
+    MidiFileLoader: QObject running loads on worker threads.
+
+Example usage:
+--------------
+>>> loader = MidiFileLoader()
+>>> loader.loaded.connect(on_loaded)    # MidiFileLoadResult, delivered on the Qt thread
+>>> loader.failed.connect(on_failed)    # (file_path, error message)
+>>> loader.load("song.mid")
+>>> loader.load("other.mid")            # song.mid is cancelled
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from decologr import Decologr as log
+from mido import MidiFile
+from PySide6.QtCore import QObject, Signal
+
+from jdxi_editor.midi.file.model import MidiFileModel, midi_file_model
+
+
+@dataclass(frozen=True)
+class MidiFileLoadResult:
+    """A parsed and indexed MIDI file."""
+
+    file_path: str
+    model: MidiFileModel
+    request_id: int
+    seconds: float
+
+    @property
+    def midi_file(self) -> MidiFile:
+        return self.model.file
+
+
+class MidiFileLoader(QObject):
+    """
+    Parses and indexes MIDI files on worker threads, one load at a time.
+
+    Signals are emitted from the worker thread; connected slots on the GUI
+    thread receive them through Qt's queued connections.
+    """
+
+    loaded = Signal(object)  # MidiFileLoadResult
+    failed = Signal(str, str)  # file_path, error message
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._request_id = 0
+        self._cancel: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loading(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_current(self, result: MidiFileLoadResult) -> bool:
+        """Whether result belongs to the latest load request."""
+        return result.request_id == self._request_id
+
+    def load(self, file_path: str) -> int:
+        """
+        Start loading file_path, cancelling a load in progress.
+
+        :param file_path: str .mid file
+        :return: int request id carried by the result
+        """
+        with self._lock:
+            if self._cancel is not None:
+                self._cancel.set()
+            self._request_id += 1
+            request_id = self._request_id
+            cancel = threading.Event()
+            self._cancel = cancel
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(file_path, request_id, cancel),
+                name="MidiFileLoader",
+                daemon=True,
+            )
+            self._thread.start()
+        return request_id
+
+    def cancel(self) -> None:
+        """Cancel the load in progress; nothing is emitted for it."""
+        with self._lock:
+            if self._cancel is not None:
+                self._cancel.set()
+            self._request_id += 1
+
+    def _run(self, file_path: str, request_id: int, cancel: threading.Event) -> None:
+        t_start = time.monotonic()
+        try:
+            midi_file = MidiFile(file_path)
+            # --- Keep the path with the file for saving and display
+            midi_file.filename = file_path
+            if cancel.is_set():
+                return
+            model = midi_file_model(midi_file)
+        except Exception as ex:
+            if not cancel.is_set():
+                log.error(
+                    f"Error {ex} occurred loading {file_path}",
+                    scope=self.__class__.__name__,
+                )
+                self.failed.emit(file_path, str(ex))
+            return
+        if cancel.is_set():
+            log.message(f"Load of {file_path} cancelled", scope=self.__class__.__name__)
+            return
+        result = MidiFileLoadResult(
+            file_path=file_path,
+            model=model,
+            request_id=request_id,
+            seconds=time.monotonic() - t_start,
+        )
+        log.message(
+            f"Loaded {file_path}: {len(model.tracks)} tracks, {len(model.events)} "
+            f"events in {result.seconds:.2f}s",
+            scope=self.__class__.__name__,
+        )
+        self.loaded.emit(result)
@@ -0,0 +1,433 @@
+"""
+Indexed MIDI File Model
+=======================
+
+A read-only index of a ``mido.MidiFile`` built in one pass over its messages,
+shared by the file player, the track analyzers and the track viewer.
+
+Each track is stored as columns aligned with the track's messages:
+
+- ``ticks``: absolute tick of the message
+- ``status``: status byte (``0x90 | channel`` etc.); ``0xF0`` for SysEx, ``0xFF`` for meta
+- ``channel``: 0-15, or -1 for SysEx and meta messages
+- ``data1`` / ``data2``: note and velocity, controller and value, program,
+  pressure or the two 7-bit halves of a pitch bend
+
+plus per-track summaries (name, channels, first channel, programs, note count).
+The file gets a merged, tick-ordered event list in the player's
+``(tick, message, track_index)`` form and a ``TempoMap``: tempo breakpoints
+with the cumulative seconds at each, so time and tick convert either way by
+bisection, honouring every tempo change.
+
+``midi_file_model`` caches the model on the ``MidiFile`` itself, so it is freed
+with the file; a file whose tracks were replaced, added, removed or resized is
+indexed again on the next call.
+
+Classes:
+    TrackColumns: Columns and summaries of one track.
+    TempoMap: Tempo breakpoints with cumulative seconds.
+    MidiFileModel: The whole file.
+
+Example usage:
+--------------
+>>> model = midi_file_model(MidiFile("song.mid"))
+>>> model.duration_seconds, model.initial_tempo
+>>> model.tracks[9].first_channel
+>>> notes = model.tracks[1].note_on_mask()
+>>> start = model.event_index_at(model.tick_at(42.0))   # seek, O(log n)
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from mido import MidiFile, MidiTrack
+
+from picomidi.constant import Midi
+
+STATUS_NOTE_OFF = 0x80
+STATUS_NOTE_ON = 0x90
+STATUS_POLYTOUCH = 0xA0
+STATUS_CONTROL_CHANGE = 0xB0
+STATUS_PROGRAM_CHANGE = 0xC0
+STATUS_AFTERTOUCH = 0xD0
+STATUS_PITCHWHEEL = 0xE0
+STATUS_SYSEX = 0xF0
+STATUS_META = 0xFF
+STATUS_TYPE_MASK = 0xF0
+PITCHWHEEL_CENTER = 8192
+
+# --- mido type -> (status, first data attribute, second data attribute)
+_CHANNEL_TYPES: Dict[str, Tuple[int, Optional[str], Optional[str]]] = {
+    "note_off": (STATUS_NOTE_OFF, "note", "velocity"),
+    "note_on": (STATUS_NOTE_ON, "note", "velocity"),
+    "polytouch": (STATUS_POLYTOUCH, "note", "value"),
+    "control_change": (STATUS_CONTROL_CHANGE, "control", "value"),
+    "program_change": (STATUS_PROGRAM_CHANGE, "program", None),
+    "aftertouch": (STATUS_AFTERTOUCH, "value", None),
+    "pitchwheel": (STATUS_PITCHWHEEL, None, None),
+}
+# --- mido type -> status without channel, for channel messages
+STATUS_BY_TYPE: Dict[str, int] = {
+    msg_type: spec[0] for msg_type, spec in _CHANNEL_TYPES.items()
+}
+# --- Message types get_first_channel() takes the track's channel from
+_FIRST_CHANNEL_STATUSES = (
+    STATUS_NOTE_OFF,
+    STATUS_NOTE_ON,
+    STATUS_CONTROL_CHANGE,
+    STATUS_PROGRAM_CHANGE,
+)
+
+
+@dataclass(frozen=True)
+class TrackColumns:
+    """
+    One track as columns aligned with its messages.
+
+    :param index: int track number in the file
+    :param track: MidiTrack the indexed track
+    """
+
+    index: int
+    track: MidiTrack
+    name: Optional[str]
+    ticks: np.ndarray
+    status: np.ndarray
+    channel: np.ndarray
+    data1: np.ndarray
+    data2: np.ndarray
+    channels: frozenset
+    first_channel: int
+    programs: Tuple[int, ...]
+    note_count: int
+    tempo_changes: Tuple[Tuple[int, int], ...]
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    @property
+    def end_tick(self) -> int:
+        return int(self.ticks[-1]) if len(self.ticks) else 0
+
+    @property
+    def status_type(self) -> np.ndarray:
+        """Status with the channel masked off (0x80, 0x90, ... 0xF0, 0xFF meta)."""
+        return np.where(self.channel >= 0, self.status & STATUS_TYPE_MASK, self.status)
+
+    def note_on_mask(self) -> np.ndarray:
+        """Note-ons with a velocity above zero."""
+        return (self.status_type == STATUS_NOTE_ON) & (self.data2 > 0)
+
+    def note_off_mask(self) -> np.ndarray:
+        """Note-offs, including note-ons with velocity zero."""
+        status_type = self.status_type
+        return (status_type == STATUS_NOTE_OFF) | (
+            (status_type == STATUS_NOTE_ON) & (self.data2 == 0)
+        )
+
+
+def index_track(track: MidiTrack, index: int = 0) -> TrackColumns:
+    """
+    Index one track in a single pass.
+
+    :param track: MidiTrack
+    :param index: int track number
+    :return: TrackColumns
+    """
+    count = len(track)
+    ticks = np.empty(count, dtype=np.int64)
+    status = np.empty(count, dtype=np.uint8)
+    channel = np.full(count, -1, dtype=np.int8)
+    data1 = np.zeros(count, dtype=np.int16)
+    data2 = np.zeros(count, dtype=np.int16)
+    name = None
+    first_channel = None
+    programs: List[int] = []
+    tempo_changes: List[Tuple[int, int]] = []
+    channel_types = _CHANNEL_TYPES
+
+    tick = 0
+    for i, msg in enumerate(track):
+        tick += msg.time
+        ticks[i] = tick
+        spec = channel_types.get(msg.type)
+        if spec is None:
+            if msg.is_meta:
+                status[i] = STATUS_META
+                if msg.type == "set_tempo":
+                    tempo_changes.append((tick, msg.tempo))
+                elif msg.type == "track_name" and name is None:
+                    name = msg.name
+            else:
+                status[i] = STATUS_SYSEX
+            continue
+        status_byte, first, second = spec
+        msg_channel = msg.channel
+        status[i] = status_byte | msg_channel
+        channel[i] = msg_channel
+        if first is None:
+            bend = msg.pitch + PITCHWHEEL_CENTER
+            data1[i] = bend & 0x7F
+            data2[i] = bend >> 7
+        else:
+            data1[i] = getattr(msg, first)
+            if second is not None:
+                data2[i] = getattr(msg, second)
+        if first_channel is None and status_byte in _FIRST_CHANNEL_STATUSES:
+            first_channel = msg_channel
+        if status_byte == STATUS_PROGRAM_CHANGE:
+            programs.append(msg.program)
+
+    note_ons = ((status & STATUS_TYPE_MASK) == STATUS_NOTE_ON) & (channel >= 0)
+    return TrackColumns(
+        index=index,
+        track=track,
+        name=name,
+        ticks=ticks,
+        status=status,
+        channel=channel,
+        data1=data1,
+        data2=data2,
+        channels=frozenset(int(c) for c in np.unique(channel[channel >= 0])),
+        first_channel=first_channel if first_channel is not None else 0,
+        programs=tuple(programs),
+        note_count=int(np.count_nonzero(note_ons & (data2 > 0))),
+        tempo_changes=tuple(tempo_changes),
+    )
+
+
+@dataclass(frozen=True)
+class TempoMap:
+    """
+    Piecewise-constant tempo: ``tempos[i]`` (µs per beat) holds from
+    ``ticks[i]`` up to ``ticks[i + 1]``; ``seconds[i]`` is the time at ``ticks[i]``.
+    """
+
+    ticks_per_beat: int
+    ticks: Tuple[int, ...]
+    tempos: Tuple[int, ...]
+    seconds: Tuple[float, ...]
+
+    @classmethod
+    def build(
+        cls,
+        ticks_per_beat: int,
+        tempo_changes: Iterable[Tuple[int, int]],
+        default_tempo: int = Midi.tempo.BPM_120_USEC,
+    ) -> "TempoMap":
+        """
+        :param ticks_per_beat: int
+        :param tempo_changes: Iterable[(tick, tempo)] in playback order
+        :param default_tempo: int tempo before the first change
+        :return: TempoMap
+        """
+        ticks = [0]
+        tempos = [default_tempo]
+        seconds = [0.0]
+        for tick, tempo in tempo_changes:
+            if tick == ticks[-1]:
+                tempos[-1] = tempo  # --- the last change at a tick wins
+                continue
+            seconds.append(
+                seconds[-1] + (tick - ticks[-1]) * tempos[-1] / 1e6 / ticks_per_beat
+            )
+            ticks.append(tick)
+            tempos.append(tempo)
+        return cls(ticks_per_beat, tuple(ticks), tuple(tempos), tuple(seconds))
+
+    def segment_at_tick(self, tick: int) -> int:
+        """Index of the tempo segment containing tick."""
+        return max(0, bisect_right(self.ticks, tick) - 1)
+
+    def tempo_at(self, tick: int) -> int:
+        """Tempo (µs per beat) in effect at tick."""
+        return self.tempos[self.segment_at_tick(tick)]
+
+    def seconds_at(self, tick: int) -> float:
+        """
+        Playback time of a tick.
+
+        :param tick: int absolute tick
+        :return: float seconds
+        """
+        i = self.segment_at_tick(tick)
+        return (
+            self.seconds[i]
+            + (tick - self.ticks[i]) * self.tempos[i] / 1e6 / self.ticks_per_beat
+        )
+
+    def tick_at(self, seconds: float) -> float:
+        """
+        Tick at a playback time; the inverse of seconds_at.
+
+        :param seconds: float seconds from the start
+        :return: float tick (fractional between ticks)
+        """
+        i = max(0, bisect_right(self.seconds, seconds) - 1)
+        return (
+            self.ticks[i]
+            + (seconds - self.seconds[i]) * 1e6 * self.ticks_per_beat / self.tempos[i]
+        )
+
+    def seconds_at_ticks(self, ticks: np.ndarray) -> np.ndarray:
+        """
+        seconds_at for an array of ticks.
+
+        :param ticks: np.ndarray absolute ticks
+        :return: np.ndarray float64 seconds
+        """
+        ticks = np.asarray(ticks, dtype=np.float64)
+        segment = np.maximum(
+            np.searchsorted(np.asarray(self.ticks), ticks, side="right") - 1, 0
+        )
+        tempos = np.asarray(self.tempos, dtype=np.float64)[segment]
+        return (
+            np.asarray(self.seconds)[segment]
+            + (ticks - np.asarray(self.ticks)[segment])
+            * tempos
+            / 1e6
+            / self.ticks_per_beat
+        )
+
+
+@dataclass(frozen=True)
+class MidiFileModel:
+    """Indexed, read-only view of a MidiFile."""
+
+    file: MidiFile
+    ticks_per_beat: int
+    tracks: Tuple[TrackColumns, ...]
+    tempo_map: TempoMap
+    events: Tuple[Tuple[int, Any, int], ...]
+    event_ticks: Tuple[int, ...]
+    total_ticks: int
+    duration_seconds: float
+    initial_tempo: int
+    initial_track_tempos: Dict[int, int]
+
+    @classmethod
+    def build(cls, midi_file: MidiFile) -> "MidiFileModel":
+        """
+        Index a file; one pass over each track, then a merge.
+
+        :param midi_file: MidiFile
+        :return: MidiFileModel
+        """
+        ticks_per_beat = midi_file.ticks_per_beat
+        tracks = tuple(
+            index_track(track, i) for i, track in enumerate(midi_file.tracks)
+        )
+        events = _merge_events(tracks)
+        total_ticks = max((t.end_tick for t in tracks), default=0)
+
+        # --- Tempo changes in playback order; equal ticks keep track order
+        tempo_changes = sorted(
+            (change for t in tracks for change in t.tempo_changes),
+            key=lambda change: change[0],
+        )
+        tempo_map = TempoMap.build(ticks_per_beat, tempo_changes)
+
+        # --- Initial tempo: first set_tempo of the first track that has one
+        initial_tempo = Midi.tempo.BPM_120_USEC
+        initial_track_tempos: Dict[int, int] = {}
+        for t in tracks:
+            if t.tempo_changes:
+                initial_tempo = t.tempo_changes[0][1]
+                initial_track_tempos[t.index] = initial_tempo
+                break
+
+        return cls(
+            file=midi_file,
+            ticks_per_beat=ticks_per_beat,
+            tracks=tracks,
+            tempo_map=tempo_map,
+            events=events,
+            event_ticks=tuple(event[0] for event in events),
+            total_ticks=total_ticks,
+            duration_seconds=tempo_map.seconds_at(total_ticks),
+            initial_tempo=initial_tempo,
+            initial_track_tempos=initial_track_tempos,
+        )
+
+    def seconds_at(self, tick: int) -> float:
+        """Playback time of a tick, following tempo changes."""
+        return self.tempo_map.seconds_at(tick)
+
+    def tick_at(self, seconds: float) -> float:
+        """Tick at a playback time, following tempo changes."""
+        return self.tempo_map.tick_at(seconds)
+
+    def event_index_at(self, tick: float) -> int:
+        """
+        Index in events of the first event at or after tick.
+
+        :param tick: float absolute tick
+        :return: int len(events) if every event is earlier
+        """
+        return bisect_left(self.event_ticks, tick)
+
+    def first_channel_in(self, channels: Iterable[int]) -> Optional[int]:
+        """
+        Channel of the first channel message (in track order) on one of channels.
+
+        :param channels: Iterable[int] candidate channels 0-15
+        :return: Optional[int]
+        """
+        wanted = np.fromiter(channels, dtype=np.int8)
+        for t in self.tracks:
+            hits = np.flatnonzero(np.isin(t.channel, wanted))
+            if len(hits):
+                return int(t.channel[hits[0]])
+        return None
+
+
+def _merge_events(tracks: Sequence[TrackColumns]) -> Tuple[Tuple[int, Any, int], ...]:
+    """All messages as (tick, message, track_index), stable-sorted by tick."""
+    if not tracks:
+        return ()
+    ticks = np.concatenate([t.ticks for t in tracks])
+    track_of = np.concatenate(
+        [np.full(len(t), t.index, dtype=np.int32) for t in tracks]
+    )
+    position = np.concatenate([np.arange(len(t), dtype=np.int64) for t in tracks])
+    order = np.argsort(ticks, kind="stable")
+    by_index = {t.index: t.track for t in tracks}
+    return tuple(
+        (tick, by_index[track][pos], track)
+        for tick, track, pos in zip(
+            ticks[order].tolist(), track_of[order].tolist(), position[order].tolist()
+        )
+    )
+
+
+# --- Attribute holding (signature, model) on the file. The model refers back to
+# --- the file, so a cache outside the file would keep every file alive.
+_MODEL_ATTRIBUTE = "_jdxi_file_model"
+
+
+def _signature(midi_file: MidiFile) -> tuple:
+    """Cheap check that the file's tracks are the ones indexed."""
+    return (
+        midi_file.ticks_per_beat,
+        tuple((id(track), len(track)) for track in midi_file.tracks),
+    )
+
+
+def midi_file_model(midi_file: MidiFile) -> MidiFileModel:
+    """
+    The file's model, indexed on first use and cached with the file.
+
+    :param midi_file: MidiFile
+    :return: MidiFileModel
+    """
+    signature = _signature(midi_file)
+    cached = getattr(midi_file, _MODEL_ATTRIBUTE, None)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    model = MidiFileModel.build(midi_file)
+    setattr(midi_file, _MODEL_ATTRIBUTE, (signature, model))
+    return model
@@ -1,24 +1,274 @@
-"""clock test file"""
+"""
+MIDI Clock Master
+=================
 
+Sends MIDI clock and transport messages locked to editor playback, so the
+JD-Xi arpeggiator and sequencer follow the editor's tempo.
+
+Clock pulses (24 per quarter note) are scheduled on absolute deadlines: pulse
+``n`` is due at ``origin + tempo_map.seconds_at(n * ticks_per_beat / 24)``.
+Nothing accumulates from pulse to pulse, so the clock does not drift from the
+playback over a long song, and tempo changes in the tempo map move the pulses
+exactly as they move the notes. The wait before each pulse is the playback
+scheduler's hybrid sleep/spin wait (``jdxi_editor.midi.playback.realtime``).
+
+Transport:
+
+- ``play(0)`` sends Start; the first pulse follows at once.
+- ``play(tick)`` elsewhere, and ``seek`` while playing, send Stop, a Song
+  Position Pointer and Continue. The song position counts sixteenth notes,
+  so the clock resumes at the first sixteenth at or after the tick and the
+  pulse at that sixteenth lands when playback gets there.
+- ``pause`` sends Stop, ``resume`` Continue, ``stop`` Stop and ends the thread.
+
+Messages are handed to ``send``, normally the output scheduler's real-time
+lane (``MidiIOHelper.send_raw_message(message, lane=OutputLane.REALTIME)``).
+
+Classes:
+    MidiClockMaster: The clock thread.
+
+Example usage:
+--------------
+>>> clock = MidiClockMaster(send=lambda m: helper.send_raw_message(m, lane=OutputLane.REALTIME),
+...                         tempo_map=timeline.tempo_map)
+>>> clock.play(0)          # with the playback scheduler
+>>> clock.pause(); clock.resume(); clock.seek(1920)
+>>> clock.stop()
+"""
+
+from __future__ import annotations
+
+import math
+import threading
 import time
+from typing import Callable, Optional
+
+from decologr import Decologr as log
+
+from jdxi_editor.midi.file.model import TempoMap
+from jdxi_editor.midi.playback.realtime import (
+    SPIN_THRESHOLD,
+    lower_switch_interval,
+    wait_until,
+)
+
+MIDI_TIMING_CLOCK = 0xF8
+MIDI_START = 0xFA
+MIDI_CONTINUE = 0xFB
+MIDI_STOP = 0xFC
+MIDI_SONG_POSITION = 0xF2
+
+PULSES_PER_QUARTER_NOTE = 24
+PULSES_PER_SIXTEENTH = PULSES_PER_QUARTER_NOTE // 4  # Song Position Pointer unit
+SONG_POSITION_MAX = 0x3FFF
+
+
+def song_position_message(sixteenths: int) -> bytes:
+    """
+    Song Position Pointer for a position in sixteenth notes.
+
+    :param sixteenths: int sixteenth notes from the start (clamped to 14 bits)
+    :return: bytes
+    """
+    sixteenths = max(0, min(SONG_POSITION_MAX, sixteenths))
+    return bytes((MIDI_SONG_POSITION, sixteenths & 0x7F, sixteenths >> 7))
+
+
+class MidiClockMaster(threading.Thread):
+    """
+    Thread sending 24 PPQN clock and transport messages from a tempo map.
+
+    :param send: Callable[[bytes], object] sends one message (clock thread and callers of the transport methods)
+    :param tempo_map: TempoMap of the music being played
+    :param spin_threshold: float seconds of busy-waiting before each pulse
+    :param clock: Callable[[], float] monotonic clock in seconds
+    """
+
+    def __init__(
+        self,
+        send: Callable[[bytes], object],
+        tempo_map: TempoMap,
+        spin_threshold: float = SPIN_THRESHOLD,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        super().__init__(name="MidiClockMaster", daemon=True)
+        self.send = send
+        self.tempo_map = tempo_map
+        self.spin_threshold = spin_threshold
+        self.clock = clock
+
+        self._condition = threading.Condition()
+        self._pulse = 0  # next pulse to send
+        self._origin = 0.0  # clock time of playback time zero
+        self._paused_at: Optional[float] = None  # playback seconds while paused
+        self._running = False  # between play() and stop()
+        self._generation = 0  # bumped by transport changes to abort a wait
+        self._stopping = False
+        self.pulses_sent = 0
+
+    @property
+    def ticks_per_pulse(self) -> float:
+        return self.tempo_map.ticks_per_beat / PULSES_PER_QUARTER_NOTE
+
+    def pulse_seconds(self, pulse: int) -> float:
+        """Playback time of a pulse."""
+        return self.tempo_map.seconds_at(pulse * self.ticks_per_pulse)
+
+    # --- Transport
+
+    def play(self, start_tick: float = 0) -> None:
+        """
+        Start the clock with playback at start_tick.
+
+        :param start_tick: float absolute tick
+        """
+        with self._condition:
+            if self._stopping:
+                return
+            self._paused_at = None
+            if start_tick <= 0:
+                self.send(bytes((MIDI_START,)))
+                self._locate(0.0, 0)
+            else:
+                self._locate_tick(start_tick, was_running=self._running)
+            self._running = True
+        if not self.is_alive():
+            lower_switch_interval(True)
+            self.start()
+
+    def pause(self) -> None:
+        """Send Stop and hold the clock at the current position."""
+        with self._condition:
+            if not self._running or self._paused_at is not None:
+                return
+            self._paused_at = self.clock() - self._origin
+            self._generation += 1
+            self.send(bytes((MIDI_STOP,)))
+            self._condition.notify_all()
+
+    def resume(self) -> None:
+        """Send Continue and carry on from where pause() held the clock."""
+        with self._condition:
+            if self._paused_at is None:
+                return
+            self._origin = self.clock() - self._paused_at
+            self._paused_at = None
+            self._generation += 1
+            self.send(bytes((MIDI_CONTINUE,)))
+            self._condition.notify_all()
+
+    def seek(self, tick: float) -> None:
+        """
+        Move the clock to playback position tick; a paused clock stays paused.
+
+        :param tick: float absolute tick
+        """
+        with self._condition:
+            if not self._running:
+                return
+            if self._paused_at is not None:
+                pulse = self._first_pulse_at(tick)
+                self.send(song_position_message(pulse // PULSES_PER_SIXTEENTH))
+                self._pulse = pulse
+                self._paused_at = self.tempo_map.seconds_at(tick)
+                self._generation += 1
+                self._condition.notify_all()
+            else:
+                self._locate_tick(tick, was_running=True)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        Send Stop and end the thread.
+
+        :param timeout: float seconds to wait for the thread to exit
+        """
+        with self._condition:
+            if self._stopping:
+                return
+            self._stopping = True
+            self._generation += 1
+            self._condition.notify_all()
+        if self._running:
+            self.send(bytes((MIDI_STOP,)))
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def set_tempo_map(self, tempo_map: TempoMap) -> None:
+        """
+        Follow a new tempo map from the current playback position, e.g. after
+        the pattern tempo changed.
+
+        :param tempo_map: TempoMap
+        """
+        with self._condition:
+            if self._paused_at is not None:
+                tick = self.tempo_map.tick_at(self._paused_at)
+                self.tempo_map = tempo_map
+                self._paused_at = tempo_map.seconds_at(tick)
+            else:
+                tick = self.tempo_map.tick_at(max(0.0, self.clock() - self._origin))
+                self.tempo_map = tempo_map
+                self._origin = self.clock() - tempo_map.seconds_at(tick)
+            self._generation += 1
+            self._condition.notify_all()
+
+    # --- Positioning (lock held)
+
+    def _first_pulse_at(self, tick: float) -> int:
+        """First pulse on a sixteenth note at or after tick."""
+        sixteenth = math.ceil(tick / (self.ticks_per_pulse * PULSES_PER_SIXTEENTH))
+        return min(sixteenth, SONG_POSITION_MAX) * PULSES_PER_SIXTEENTH
+
+    def _locate(self, seconds: float, pulse: int) -> None:
+        self._origin = self.clock() - seconds
+        self._pulse = pulse
+        self._generation += 1
+        self._condition.notify_all()
+
+    def _locate_tick(self, tick: float, was_running: bool) -> None:
+        """Song Position Pointer and Continue for playback at tick."""
+        pulse = self._first_pulse_at(tick)
+        if was_running:
+            # --- Receivers only accept a song position while stopped
+            self.send(bytes((MIDI_STOP,)))
+        self.send(song_position_message(pulse // PULSES_PER_SIXTEENTH))
+        self.send(bytes((MIDI_CONTINUE,)))
+        self._locate(self.tempo_map.seconds_at(tick), pulse)
+
+    # --- Thread
 
-import mido
-
-try:
-    outport = mido.open_output()
-except Exception as e:
-    print(f"Error opening MIDI output port: {e}")
-    exit()
-
-clock_message = mido.Message("clock")
-tempo = 120
-time_per_pulse = (60 / tempo) / 24
-
-try:
-    while True:
-        outport.send(clock_message)
-        time.sleep(time_per_pulse)
-except KeyboardInterrupt:
-    print("Stopping MIDI clock.")
-finally:
-    outport.close()
+    def run(self) -> None:
+        clock_message = bytes((MIDI_TIMING_CLOCK,))
+        try:
+            while True:
+                with self._condition:
+                    while self._paused_at is not None and not self._stopping:
+                        self._condition.wait()
+                    if self._stopping:
+                        return
+                    generation = self._generation
+                    pulse = self._pulse
+                    due = self._origin + self.pulse_seconds(pulse)
+                if not wait_until(
+                    due,
+                    self._condition,
+                    lambda: self._generation == generation,
+                    self.spin_threshold,
+                    self.clock,
+                ):
+                    continue
+                # --- Under the lock, so a pulse never follows a newer transport message
+                with self._condition:
+                    if self._generation != generation:
+                        continue
+                    self._pulse = pulse + 1
+                    try:
+                        self.send(clock_message)
+                        self.pulses_sent += 1
+                    except Exception as ex:
+                        log.error(
+                            f"Error {ex} occurred sending MIDI clock",
+                            scope=self.__class__.__name__,
+                        )
+        finally:
+            lower_switch_interval(False)
@@ -1,6 +1,9 @@
 """
 jdxi_editor.midi.io.delay
 send midi messages with a delay so that the JD-Xi can process them correctly.
+
+Editors request data through MidiIOHelper.request_data (jdxi_editor.midi.io.request),
+which paces RQ1 requests by the JD-Xi's replies instead of fixed sleeps.
 """
 
 import time
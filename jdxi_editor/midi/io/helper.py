@@ -18,6 +18,7 @@ Dependencies:
 
 """
 
+import functools
 import json
 import logging
 import threading
@@ -46,7 +47,12 @@ from jdxi_editor.midi.data.parameter.program.common import ProgramCommonParam
 from jdxi_editor.midi.data.parameter.vocal_fx import VocalFXParam
 from jdxi_editor.midi.io.input_handler import MidiInHandler
 from jdxi_editor.midi.io.output_handler import MidiOutHandler
+from jdxi_editor.midi.io.request import RQ1RequestEngine
+from jdxi_editor.midi.message.roland import JDXiSysEx
+from jdxi_editor.midi.patch.state import PatchState
+from jdxi_editor.midi.sysex.block import coalesce_dt1_messages
 from jdxi_editor.midi.sysex.composer import JDXiSysExComposer
+from jdxi_editor.midi.sysex.dispatch import SysExDispatchEvent, address_from_parameters
 from jdxi_editor.midi.sysex.sections import SysExSection
 from jdxi_editor.ui.windows.jdxi.helpers.port import find_jdxi_port
 
@@ -92,8 +98,49 @@ class MidiIOHelper(MidiInHandler, MidiOutHandler):
         self.soundfont_synth = None
         self.soundfont_sfid = None
         self.soundfont_lock = threading.RLock()
+        # --- One scheduler for all RQ1 data requests; replies are matched on the decode worker
+        self.request_engine = RQ1RequestEngine(
+            send=self.send_raw_message,
+            replies_expected=lambda: self.is_input_open,
+        )
+        self.add_sysex_frame_observer(self.request_engine.on_sysex_frame)
+        # --- Headless copy of the temporary areas, fed by DT1 in both directions
+        self.patch_state = PatchState()
+        self.add_sysex_frame_observer(self.patch_state.apply_sysex_frame)
+        self.add_sent_sysex_observer(self.patch_state.apply_sent_sysex_frame)
+        # --- Streams .syx files to the synth (see load_sysx_patch)
+        self.syx_sender = None
         self.initialized = True
 
+    def request_data(self, midi_requests: list) -> int:
+        """
+        Queue RQ1 data requests on the request engine (non-blocking).
+
+        :param midi_requests: list RQ1 hex strings, e.g. MidiRequests.PROGRAM_TONE_NAME
+        :return: int number of requests queued after deduplication
+        """
+        return self.request_engine.request(midi_requests)
+
+    def stop_output(self) -> None:
+        """
+        Cancel a .syx load in progress and stop the output scheduler after
+        sending what is queued.
+
+        :return: None
+        """
+        if self.syx_sender is not None and self.syx_sender.is_alive():
+            self.syx_sender.cancel()
+            self.syx_sender.join(1.0)
+        self.stop_output_scheduler()
+
+    def stop_request_engine(self) -> None:
+        """
+        Stop the RQ1 request engine thread.
+
+        :return: None
+        """
+        self.request_engine.stop()
+
     def send_mido_message(self, msg: mido.Message):
         """
         send_mido_message
@@ -103,11 +150,18 @@ class MidiIOHelper(MidiInHandler, MidiOutHandler):
         """
         self.send_raw_message(msg.bytes())
 
-    def send_json_patch_to_instrument(self, json_string: str) -> None:
+    def send_json_patch_to_instrument(
+        self, json_string: str, block_mode: bool = True
+    ) -> None:
         """
         Send all parameters from a JSON patch to the instrument as SysEx messages.
 
+        In block mode, parameters with contiguous addresses are coalesced into
+        multi-byte DT1 messages (see jdxi_editor.midi.sysex.block), so a full tone
+        goes out as a few dozen messages rather than one message per parameter.
+
         :param json_string: str JSON string containing patch data
+        :param block_mode: bool Coalesce contiguous parameters into DT1 blocks
         :return: None
         """
         try:
@@ -211,9 +265,10 @@ class MidiIOHelper(MidiInHandler, MidiOutHandler):
             # Create composer
             composer = JDXiSysExComposer()
 
-            # Send each parameter
+            # Send each parameter (or collect it for coalescing in block mode)
             sent_count = 0
             skipped_count = 0
+            pending_messages: list[JDXiSysEx] = []
             for param_name, param_value in patch_data.items():
                 if param_name in metadata_fields:
                     continue
@@ -315,7 +370,9 @@ class MidiIOHelper(MidiInHandler, MidiOutHandler):
                         param=param,
                         value=value,  # Pass digital value as-is
                     )
-                    if sysex_message:
+                    if sysex_message and block_mode:
+                        pending_messages.append(sysex_message)
+                    elif sysex_message:
                         result = self.send_midi_message(sysex_message)
                         if result:
                             sent_count += 1
@@ -340,6 +397,24 @@ class MidiIOHelper(MidiInHandler, MidiOutHandler):
                     log.warning(f"Error sending {param_name}: {ex}")
                     skipped_count += 1
 
+            if pending_messages:
+                blocks = coalesce_dt1_messages(pending_messages)
+                block_count = 0
+                for block in blocks:
+                    if self.send_midi_message(block):
+                        block_count += 1
+                    else:
+                        log.warning(f"Failed to send DT1 block at {block.address}")
+                if block_count == len(blocks):
+                    sent_count += len(pending_messages)
+                else:
+                    skipped_count += len(pending_messages)
+                log.message(
+                    f"Coalesced {len(pending_messages)} parameters into "
+                    f"{len(blocks)} DT1 block(s) ({block_count} sent)",
+                    scope="MidiIOHelper",
+                )
+
             log.message(
                 f"Sent {sent_count} parameters to instrument (skipped {skipped_count})"
             )
@@ -513,6 +588,29 @@ class MidiIOHelper(MidiInHandler, MidiOutHandler):
             log.error(f"Error saving .syx file: {ex}")
             return False
 
+    def publish_json_patch(self, json_string: str) -> None:
+        """
+        Route a JSON patch to the editors subscribed to its address on the SysEx dispatch bus.
+
+        :param json_string: str JSON patch with ADDRESS, TEMPORARY_AREA and parameter keys
+        :return: None
+        """
+        try:
+            parameters = json.loads(json_string)
+        except json.JSONDecodeError as ex:
+            log.error(f"Invalid JSON patch: {ex}", scope="MidiIOHelper")
+            return
+        address = address_from_parameters(parameters)
+        if address is None:
+            log.warning(
+                f"No ADDRESS in JSON patch, not dispatched: {parameters.get(SysExSection.ADDRESS)}",
+                scope="MidiIOHelper",
+            )
+            return
+        self.sysex_bus.publish(
+            SysExDispatchEvent(address=address, parameters=parameters)
+        )
+
     def load_patch(self, file_path: str):
         """
         Load the patch file and send to the instrument.
@@ -559,6 +657,7 @@ class MidiIOHelper(MidiInHandler, MidiOutHandler):
                                 json_string = json_file_handle.read().decode("utf-8")
                                 # Emit for UI update
                                 self.midi_sysex_json.emit(json_string)
+                                self.publish_json_patch(json_string)
                                 # Send to instrument
                                 self.send_json_patch_to_instrument(json_string)
             except Exception as ex:
@@ -571,6 +670,7 @@ class MidiIOHelper(MidiInHandler, MidiOutHandler):
                 json_string = file_handle.read()
                 # Emit for UI update
                 self.midi_sysex_json.emit(json_string)
+                self.publish_json_patch(json_string)
                 # Send to instrument
                 self.send_json_patch_to_instrument(json_string)
         except Exception as ex:
@@ -593,54 +693,27 @@ class MidiIOHelper(MidiInHandler, MidiOutHandler):
         Supports single messages and concatenated messages (e.g. Perl .syx format).
         Each F0...F7 block is sent as a separate message.
 
+        The file is streamed from a memory map on a sender thread, checksums are
+        verified and messages are paced for the JD-Xi input buffer; a load in
+        progress is cancelled by the next one.
+
         :param file_path: str File path as a string
         :return: None
         """
-        try:
-            with open(file_path, "rb") as file:
-                sysex_data = file.read()
-        except Exception as ex:
-            log.error(f"Error {ex} occurred opening file", scope="MidiIOHelper")
-            return
-
-        if not sysex_data.startswith(b"\xf0"):
-            log.message(
-                "Invalid SysEx file format: does not start with F0",
-                scope="MidiIOHelper",
-            )
-            return
-
-        # Split concatenated SysEx messages (each F0...F7)
-        messages = []
-        pos = 0
-        while pos < len(sysex_data):
-            if sysex_data[pos : pos + 1] != b"\xf0":
-                pos += 1
-                continue
-            start = pos
-            end = sysex_data.find(b"\xf7", pos)
-            if end == -1:
-                log.message("Invalid SysEx: unmatched F0, no F7", scope="MidiIOHelper")
-                break
-            end += 1  # include F7
-            messages.append(sysex_data[start:end])
-            pos = end
-
-        if not messages:
-            log.message("No valid SysEx messages in file", scope="MidiIOHelper")
-            return
-
-        self.midi_messages.extend(messages)
-        sent = 0
-        for msg in messages:
-            try:
-                self.send_raw_message(list(msg))
-                sent += 1
-            except Exception as ex:
-                log.error(f"Error sending SysEx message: {ex}", scope="MidiIOHelper")
-        log.message(
-            f"Sent {sent} SysEx message(s) from {file_path}", scope="MidiIOHelper"
+        from jdxi_editor.midi.io.scheduler import OutputLane
+        from jdxi_editor.midi.io.syx_sender import SysExFileSender
+
+        previous = self.syx_sender
+        if previous is not None and previous.is_alive():
+            previous.cancel()
+            previous.join(1.0)
+        # --- The bulk lane paces the frames and blocks the sender when full
+        self.syx_sender = SysExFileSender(
+            file_path,
+            send=functools.partial(self.send_raw_message, lane=OutputLane.BULK),
+            paced=False,
         )
+        self.syx_sender.start()
 
     def set_midi_ports(self, in_port: str, out_port: str) -> bool:
         """
@@ -0,0 +1,305 @@
+"""
+MIDI Input Ingest Pipeline
+==========================
+
+Moves decoding of incoming MIDI off the rtmidi callback thread.
+
+The rtmidi callback only copies the raw bytes and a timestamp into a bounded
+single-producer/single-consumer ring buffer. A dedicated decode worker drains the
+ring, runs the (possibly expensive) decode step - SysEx parsing, parameter
+decoding, JSON serialisation - and hands decoded events to the Qt thread in batches.
+
+Stages and the timestamps taken for the latency counters:
+
+    rtmidi callback  --push-->  ring  --pop-->  decode worker  --batch-->  Qt thread
+    t_received                            t_decode_start/end            t_delivered
+
+Classes:
+    MidiIngestRing: Bounded SPSC ring buffer filled by the rtmidi callback.
+    IngestLatencyStats: Per-stage latency counters (callback, queue, decode, handoff, total).
+    IngestedEvent: A decoded message with its timestamps.
+    MidiDecodeWorker: Thread draining the ring and delivering decoded batches.
+
+Example usage:
+--------------
+>>> ring = MidiIngestRing(capacity=4096)
+>>> worker = MidiDecodeWorker(ring, decode=decode_fn, deliver=deliver_fn)
+>>> worker.start()
+>>> ring.push(b"\\x90\\x3c\\x64", 0.0)   # from the rtmidi callback
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import mido
+from decologr import Decologr as log
+
+from jdxi_editor.core.instrumentation import instruments
+
+INGEST_RING_CAPACITY = (
+    4096  # raw MIDI frames (a full program dump is ~100 SysEx frames)
+)
+INGEST_MAX_BATCH = 256  # decoded events per hand-off to the Qt thread
+INGEST_IDLE_WAIT = 0.1  # seconds the worker sleeps when the ring is empty
+
+LATENCY_STAGES = ("callback", "queue", "decode", "handoff", "total")
+STAGE_METRICS = {stage: f"midi_in.{stage}" for stage in LATENCY_STAGES}
+
+
+class MidiIngestRing:
+    """
+    Bounded single-producer/single-consumer ring buffer for raw MIDI frames.
+
+    The producer (rtmidi callback) only writes ``_tail`` and the consumer (decode
+    worker) only writes ``_head``; slot contents are published before the index is
+    advanced. Under the GIL each index update is atomic, so neither side takes a
+    lock on the data path. When the ring is full the new frame is dropped and
+    counted in ``overruns`` rather than blocking the MIDI driver thread.
+    """
+
+    def __init__(self, capacity: int = INGEST_RING_CAPACITY):
+        if capacity < 2:
+            raise ValueError(f"Ring capacity must be at least 2, got {capacity}")
+        self.capacity = capacity
+        self._slots: List[Optional[Tuple[bytes, float, int]]] = [None] * capacity
+        self._head = 0  # next slot to read (consumer)
+        self._tail = 0  # next slot to write (producer)
+        self._data_ready = threading.Event()
+        self.overruns = 0
+        self.high_water = 0
+
+    def __len__(self) -> int:
+        return (self._tail - self._head) % self.capacity
+
+    def push(self, data: Iterable[int], deltatime: float = 0.0) -> bool:
+        """
+        Copy a raw MIDI frame into the ring (producer side).
+
+        :param data: Iterable[int] raw MIDI bytes as delivered by rtmidi
+        :param deltatime: float rtmidi delta time
+        :return: bool False if the frame was dropped because the ring is full
+        """
+        tail = self._tail
+        next_tail = (tail + 1) % self.capacity
+        if next_tail == self._head:
+            self.overruns += 1
+            return False
+        self._slots[tail] = (bytes(data), deltatime, time.perf_counter_ns())
+        self._tail = next_tail
+        depth = len(self)
+        if depth > self.high_water:
+            self.high_water = depth
+        self._data_ready.set()
+        return True
+
+    def pop(self) -> Optional[Tuple[bytes, float, int]]:
+        """
+        Remove the oldest frame (consumer side).
+
+        :return: Optional[Tuple[bytes, float, int]] (data, deltatime, t_received_ns)
+        """
+        head = self._head
+        if head == self._tail:
+            return None
+        item = self._slots[head]
+        self._slots[head] = None
+        self._head = (head + 1) % self.capacity
+        return item
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Block the consumer until data is available or the timeout elapses.
+
+        :param timeout: float seconds
+        :return: bool True if data is available
+        """
+        if self._head != self._tail:
+            return True
+        self._data_ready.clear()
+        # --- Re-check after clearing so a push between the test and the clear is not lost
+        if self._head != self._tail:
+            return True
+        return self._data_ready.wait(timeout)
+
+    def wake(self) -> None:
+        """Wake a waiting consumer (used on shutdown)."""
+        self._data_ready.set()
+
+
+@dataclass
+class _StageCounter:
+    """Running latency counter for one pipeline stage (nanoseconds)."""
+
+    count: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    last_ns: int = 0
+
+    def record(self, elapsed_ns: int) -> None:
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.last_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+
+class IngestLatencyStats:
+    """
+    Per-stage latency counters for the input pipeline.
+
+    Stages:
+        callback: time spent inside the rtmidi callback
+        queue:    callback -> decode worker picks the frame up
+        decode:   time spent decoding (mido parse, SysEx parse, JSON)
+        handoff:  decode finished -> delivered on the Qt thread
+        total:    callback -> delivered on the Qt thread
+
+    Each stage is written by a single thread, so no locking is needed.
+    Samples also go to the ``midi_in.<stage>`` instruments when instrumentation
+    is enabled.
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, _StageCounter] = {
+            stage: _StageCounter() for stage in LATENCY_STAGES
+        }
+
+    def record(self, stage: str, elapsed_ns: int) -> None:
+        """
+        Record one latency sample.
+
+        :param stage: str one of LATENCY_STAGES
+        :param elapsed_ns: int elapsed time in nanoseconds
+        """
+        self._stages[stage].record(elapsed_ns)
+        if instruments.enabled:
+            instruments.record_duration(STAGE_METRICS[stage], elapsed_ns)
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        for stage in LATENCY_STAGES:
+            self._stages[stage] = _StageCounter()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return the counters in milliseconds.
+
+        :return: dict {stage: {"count", "mean_ms", "max_ms", "last_ms"}}
+        """
+        result = {}
+        for stage, counter in self._stages.items():
+            mean_ns = counter.total_ns / counter.count if counter.count else 0.0
+            result[stage] = {
+                "count": counter.count,
+                "mean_ms": mean_ns / 1e6,
+                "max_ms": counter.max_ns / 1e6,
+                "last_ms": counter.last_ns / 1e6,
+            }
+        return result
+
+
+@dataclass
+class IngestedEvent:
+    """A decoded incoming MIDI message and its pipeline timestamps."""
+
+    message: mido.Message
+    decoded: Any = None  # decode() result, e.g. parsed SysEx for the Qt-thread stage
+    t_received_ns: int = 0
+    t_decoded_ns: int = 0
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+class MidiDecodeWorker(threading.Thread):
+    """
+    Decode worker draining a MidiIngestRing.
+
+    :param ring: MidiIngestRing filled by the rtmidi callback
+    :param decode: Callable[[mido.Message], Any] run on this thread for every message
+    :param deliver: Callable[[List[IngestedEvent]], None] receives decoded batches;
+        typically emits a Qt signal with a queued connection to the GUI thread
+    :param stats: Optional[IngestLatencyStats]
+    :param max_batch: int maximum events per delivered batch
+    """
+
+    def __init__(
+        self,
+        ring: MidiIngestRing,
+        decode: Callable[[mido.Message], Any],
+        deliver: Callable[[List[IngestedEvent]], None],
+        stats: Optional[IngestLatencyStats] = None,
+        max_batch: int = INGEST_MAX_BATCH,
+    ):
+        super().__init__(name="MidiDecodeWorker", daemon=True)
+        self.ring = ring
+        self.decode = decode
+        self.deliver = deliver
+        self.stats = stats or IngestLatencyStats()
+        self.max_batch = max_batch
+        self._parser = mido.Parser()
+        self._stop_event = threading.Event()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        Ask the worker to exit and wait for it.
+
+        :param timeout: float seconds to wait for the thread to finish
+        """
+        self._stop_event.set()
+        self.ring.wake()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            if not self.ring.wait(INGEST_IDLE_WAIT):
+                continue
+            batch = self.drain()
+            if batch:
+                try:
+                    self.deliver(batch)
+                except Exception as ex:
+                    log.error(
+                        f"Error delivering decoded MIDI batch: {ex}",
+                        scope=self.__class__.__name__,
+                    )
+
+    def drain(self) -> List[IngestedEvent]:
+        """
+        Decode up to ``max_batch`` queued messages.
+
+        :return: List[IngestedEvent]
+        """
+        batch: List[IngestedEvent] = []
+        while len(batch) < self.max_batch:
+            item = self.ring.pop()
+            if item is None:
+                break
+            data, _deltatime, t_received_ns = item
+            t_start_ns = time.perf_counter_ns()
+            self.stats.record("queue", t_start_ns - t_received_ns)
+            # --- One persistent parser; rtmidi delivers whole messages so it never holds partial state
+            self._parser.feed(data)
+            for message in self._parser:
+                try:
+                    decoded = self.decode(message)
+                except Exception as ex:
+                    log.error(
+                        f"Error decoding MIDI message [{message.type}]: {ex}",
+                        scope=self.__class__.__name__,
+                    )
+                    continue
+                t_decoded_ns = time.perf_counter_ns()
+                batch.append(
+                    IngestedEvent(
+                        message=message,
+                        decoded=decoded,
+                        t_received_ns=t_received_ns,
+                        t_decoded_ns=t_decoded_ns,
+                    )
+                )
+            self.stats.record("decode", time.perf_counter_ns() - t_start_ns)
+        return batch
@@ -22,22 +22,32 @@ Dependencies:
 
 import json
 import os
+import time
+from dataclasses import asdict, dataclass
 from typing import Any, Callable, Dict, List, Optional
 
 import mido
 from decologr import Decologr as log
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Qt, Signal
 
 from jdxi_editor.core.jdxi import JDXi
 from jdxi_editor.midi.data.address.address import JDXiSysExAddressStartMSB as AreaMSB
 from jdxi_editor.midi.io.controller import MidiIOController
+from jdxi_editor.midi.io.ingest import (
+    IngestedEvent,
+    IngestLatencyStats,
+    MidiDecodeWorker,
+    MidiIngestRing,
+)
 
 # handle_identity_request moved to JDXiSysExParser.parse_identity_request
 from jdxi_editor.midi.map.synth_type import JDXiMapSynthType
 from jdxi_editor.midi.message.sysex.offset import JDXiSysExIdentityLayout
 from jdxi_editor.midi.program.program import JDXiProgram
+from jdxi_editor.midi.sysex.dispatch import SysExDispatchBus, SysExDispatchEvent
 from jdxi_editor.midi.sysex.parser.model import ParsedSysExMessage
 from jdxi_editor.midi.sysex.parser.sysex import JDXiSysExParser
+from jdxi_editor.midi.sysex.parser.utils import parse_sysex
 from jdxi_editor.midi.sysex.request.data import IGNORED_KEYS
 from jdxi_editor.midi.sysex.sections import SysExSection
 from jdxi_editor.ui.preset.button import JDXiPresetButtonData
@@ -137,6 +147,25 @@ def save_programs_old(program_list: List[Dict[str, str]]) -> None:
         json.dump(program_list, f, indent=4, ensure_ascii=False)
 
 
+@dataclass
+class DecodedSysEx:
+    """SysEx message decoded on the decode worker, ready to be emitted on the Qt thread."""
+
+    parsed: ParsedSysExMessage
+    parsed_dict: dict
+    json_str: str
+    dispatch: Optional[SysExDispatchEvent] = None  # only built when an editor subscribes to the address
+
+
+def _json_safe(obj: Any) -> str:
+    """json.dumps default for parsed SysEx fields (bytes and enums)."""
+    if isinstance(obj, bytes):
+        return obj.hex()
+    if hasattr(obj, "name"):
+        return obj.name
+    return str(obj)
+
+
 class MidiInHandler(MidiIOController):
     """
     Helper class for MIDI communication with the JD-Xi.
@@ -144,6 +173,11 @@ class MidiInHandler(MidiIOController):
     This class listens to incoming MIDI messages, processes them based on
     their preset_type, and emits corresponding signals. It handles SysEx, Control
     Change, Program Change, Note On/Off, and Clock messages.
+
+    The rtmidi callback only enqueues raw bytes (see jdxi_editor.midi.io.ingest).
+    Decoding runs on a MidiDecodeWorker thread and decoded events are handed to
+    the Qt thread in batches via ``_decoded_batch``. Parameter SysEx is routed to
+    editors by address prefix through ``sysex_bus`` (see jdxi_editor.midi.sysex.dispatch).
     """
 
     update_tone_name = Signal(str, str)
@@ -152,6 +186,7 @@ class MidiInHandler(MidiIOController):
     midi_program_changed = Signal(int, int)  # channel, program
     midi_control_changed = Signal(int, int, int)  # channel, control, value
     midi_sysex_json = Signal(str)  # Signal emitting SysEx data as address JSON string
+    _decoded_batch = Signal(list)  # decode worker -> Qt thread, list[IngestedEvent]
 
     def __init__(self, parent: Optional[Any] = None) -> None:
         """
@@ -167,30 +202,139 @@ class MidiInHandler(MidiIOController):
         self.preset_number: int = 0
         self.cc_msb_value: int = 0
         self.cc_lsb_value: int = 0
-        self.midi_in.set_callback(self.midi_callback)
-        self.midi_in.ignore_types(sysex=False, timing=True, active_sense=True)
         self.sysex_parser = JDXiSysExParser()
         self._incoming_preset_data = IncomingPresetData()
         self._incoming_preset_data.msb = 85  # default to Preset Bank
+        # --- Editors subscribe here by address prefix instead of parsing midi_sysex_json
+        self.sysex_bus = SysExDispatchBus()
+        # --- Called on the decode worker with every raw SysEx frame (e.g. RQ1 reply matching)
+        self.sysex_frame_observers: List[Callable[[bytes], None]] = []
+        # --- Ingest pipeline: rtmidi callback -> ring -> decode worker -> Qt thread
+        self.ingest_stats = IngestLatencyStats()
+        self._ingest_ring = MidiIngestRing()
+        self._decoded_batch.connect(
+            self._on_decoded_batch, Qt.ConnectionType.QueuedConnection
+        )
+        self._decode_worker = MidiDecodeWorker(
+            self._ingest_ring,
+            decode=self._decode_midi_message,
+            deliver=self._decoded_batch.emit,
+            stats=self.ingest_stats,
+        )
+        self._decode_worker.start()
+        self.midi_in.set_callback(self.midi_callback)
+        self.midi_in.ignore_types(sysex=False, timing=True, active_sense=True)
 
     def midi_callback(self, message: list[Any], data: Any) -> None:
         """
         callback for rtmidi
-        mido doesn't have callbacks, so we convert
+        Runs on the rtmidi thread: only copies the bytes into the ingest ring.
+        Decoding happens on the decode worker (see _decode_midi_message).
+
         :param message: list[Any]
         :param data: Any
         """
+        t_start_ns = time.perf_counter_ns()
         try:
-            message_content, data = message
-            p = mido.Parser()
-            p.feed(message_content)
-            for message in p:
-                self._handle_midi_message(message)
-        except Exception as ex:
-                log.error(
-                    f"Error in MIDI handler [{message.type}]: {type(ex).__name__}: {ex}",
+            message_content, deltatime = message
+            if not self._ingest_ring.push(message_content, deltatime):
+                log.warning(
+                    f"MIDI ingest ring full, dropped message ({self._ingest_ring.overruns} overruns)",
                     scope=self.__class__.__name__,
                 )
+        except Exception as ex:
+            log.error(
+                f"Error in MIDI callback: {type(ex).__name__}: {ex}",
+                scope=self.__class__.__name__,
+            )
+        self.ingest_stats.record("callback", time.perf_counter_ns() - t_start_ns)
+
+    def add_sysex_frame_observer(self, observer: Callable[[bytes], None]) -> None:
+        """
+        Call observer with every raw SysEx frame, on the decode worker thread.
+
+        :param observer: Callable[[bytes], None] must be fast and thread-safe
+        :return: None
+        """
+        if observer not in self.sysex_frame_observers:
+            # --- Copy-on-write: the decode worker may be iterating the current list
+            self.sysex_frame_observers = self.sysex_frame_observers + [observer]
+
+    def remove_sysex_frame_observer(self, observer: Callable[[bytes], None]) -> None:
+        """
+        Stop calling observer with raw SysEx frames.
+
+        :param observer: Callable[[bytes], None]
+        :return: None
+        """
+        self.sysex_frame_observers = [
+            existing for existing in self.sysex_frame_observers if existing != observer
+        ]
+
+    def stop_ingest(self) -> None:
+        """
+        Stop the decode worker thread.
+
+        :return: None
+        """
+        self._decode_worker.stop()
+
+    def get_ingest_stats(self) -> dict:
+        """
+        Per-stage latency counters for the input pipeline, in milliseconds.
+
+        :return: dict {stage: {"count", "mean_ms", "max_ms", "last_ms"}} plus ring depth/overruns
+        """
+        stats = self.ingest_stats.snapshot()
+        stats["ring"] = {
+            "depth": len(self._ingest_ring),
+            "high_water": self._ingest_ring.high_water,
+            "overruns": self._ingest_ring.overruns,
+        }
+        return stats
+
+    def _decode_midi_message(self, message: mido.Message) -> Any:
+        """
+        Decode stage, run on the decode worker thread.
+
+        SysEx is parsed and serialised here; notes are forwarded to the SoundFont
+        synth here too, so local playback does not wait for the Qt event loop.
+
+        :param message: mido.Message
+        :return: Any DecodedSysEx for parameter SysEx, otherwise None
+        """
+        if message.type == MidoMessageType.SYSEX.value:
+            observers = self.sysex_frame_observers
+            if observers:
+                frame = bytes(message.bin())
+                for observer in observers:
+                    try:
+                        observer(frame)
+                    except Exception as ex:
+                        log.error(
+                            f"Error in SysEx frame observer {observer}: {ex}",
+                            scope=self.__class__.__name__,
+                        )
+            return self._decode_sysex_message(message)
+        if message.type in (
+            MidoMessageType.NOTE_ON.value,
+            MidoMessageType.NOTE_OFF.value,
+        ):
+            self._forward_note_to_soundfont(message)
+        return None
+
+    def _on_decoded_batch(self, batch: List[IngestedEvent]) -> None:
+        """
+        Qt-thread stage: route a batch of decoded events to handlers and signals.
+
+        :param batch: List[IngestedEvent]
+        :return: None
+        """
+        for event in batch:
+            t_delivered_ns = time.perf_counter_ns()
+            self.ingest_stats.record("handoff", t_delivered_ns - event.t_decoded_ns)
+            self._dispatch_midi_message(event.message, event.decoded)
+            self.ingest_stats.record("total", t_delivered_ns - event.t_received_ns)
 
     def reopen_input_port_name(self, in_port: str) -> bool:
         """
@@ -245,11 +389,37 @@ class MidiInHandler(MidiIOController):
             )
 
     def _handle_midi_message(self, message: Any) -> None:
+        """
+        Decode and dispatch a message synchronously on the calling thread.
+
+        :param message: mido.Message
+        :return: None
+        """
+        try:
+            decoded = self._decode_midi_message(message)
+        except Exception as ex:
+            log.error(f"Error {ex} occurred")
+            return
+        self._dispatch_midi_message(message, decoded)
+
+    def _dispatch_midi_message(self, message: Any, decoded: Any = None) -> None:
+        """
+        Route an already-decoded message to its handler and emit signals.
+
+        :param message: mido.Message
+        :param decoded: Any result of _decode_midi_message
+        :return: None
+        """
         try:
             log.debug(f"Incoming MIDI: {message.type}")
 
+            if message.type == MidoMessageType.SYSEX.value:
+                if decoded is not None:
+                    self._emit_decoded_sysex(decoded)
+                self.midi_message_incoming.emit(message)
+                return
+
             handler_map = {
-                MidoMessageType.SYSEX.value: self._handle_sysex_message,
                 MidoMessageType.CONTROL_CHANGE.value: self._handle_control_change,
                 MidoMessageType.PROGRAM_CHANGE.value: self._handle_program_change,
                 MidoMessageType.NOTE_ON.value: self._handle_note_change,
@@ -306,7 +476,7 @@ class MidiInHandler(MidiIOController):
         """
         from jdxi_editor.globals import silence_midi_note_logging
 
-        self._forward_note_to_soundfont(message)
+        # --- Notes were already forwarded to the SoundFont synth in the decode stage
         if not silence_midi_note_logging():
             log.message(f"MIDI message note change: {message.type} as {message}")
 
@@ -362,15 +532,32 @@ class MidiInHandler(MidiIOController):
             return
 
     def _handle_sysex_message(self, message: mido.Message, preset_data: dict) -> None:
+        """
+        Decode and emit a SysEx message synchronously.
+
+        :param message: mido.Message The MIDI SysEx message.
+        :param preset_data: Dictionary for preset data modifications.
+        """
+        decoded = self._decode_sysex_message(message)
+        if decoded is not None:
+            self._emit_decoded_sysex(decoded)
+
+    def _decode_sysex_message(self, message: mido.Message) -> Optional[DecodedSysEx]:
+        """
+        Parse a SysEx message and serialise it to JSON (decode worker thread).
+
+        :param message: mido.Message The MIDI SysEx message.
+        :return: Optional[DecodedSysEx] None for identity replies, non-JD-Xi or invalid messages
+        """
         try:
             if not (message.type == "sysex" and len(message.data) > 6):
-                return
+                return None
 
             # --- Identity check ---
             offset = JDXiSysExIdentityLayout.ID.SUB2 - 1
             if message.data[offset] == JDXi.Midi.SYSEX.IDENTITY.CONST.SUB2_IDENTITY_REPLY:
                 self.sysex_parser.parse_identity_request(message)
-                return
+                return None
 
             # --- Build raw SysEx ---
             sysex_bytes = (
@@ -379,23 +566,19 @@ class MidiInHandler(MidiIOController):
                     bytes([Midi.sysex.END])
             )
 
-            hex_string = " ".join(f"{b:02X}" for b in message.data)
-
             # --- Parse once ---
             try:
                 parsed = self.sysex_parser.parse_bytes(sysex_bytes)
             except ValueError as ex:
                 if "Not a JD-Xi SysEx message" in str(ex):
-                    return
+                    return None
                 log.error(f"Parse error: {ex}")
-                return
+                return None
             except Exception as ex:
                 log.error(f"Parse error: {ex}")
-                return
+                return None
 
             # --- Convert for logging ---
-            from dataclasses import asdict
-
             parsed_dict = asdict(parsed)
 
             filtered_data = {
@@ -403,28 +586,56 @@ class MidiInHandler(MidiIOController):
                 if k not in IGNORED_KEYS
             }
 
+            hex_string = " ".join(f"{b:02X}" for b in message.data)
             log.message(
                 f"[MIDI SysEx received]: {hex_string} {filtered_data}",
                 silent=False,
                 scope=self.__class__.__name__,
             )
 
-            # --- Emit only valid parameter messages ---
-            if parsed.is_parameter:
-                self._emit_program_or_tone_name(parsed)
+            # --- Parameter dict for the editors, parsed once here rather than once per editor
+            dispatch = None
+            if parsed.is_parameter and len(parsed.address) >= 3:
+                address = (parsed.address[0], parsed.address[1], parsed.address[2])
+                if self.sysex_bus.has_subscribers(address):
+                    dispatch = SysExDispatchEvent(
+                        address=address,
+                        parameters=parse_sysex(sysex_bytes),
+                        parsed=parsed,
+                    )
 
             # --- JSON safe emit ---
-            def _json_safe(obj):
-                if isinstance(obj, bytes):
-                    return obj.hex()
-                if hasattr(obj, "name"):
-                    return obj.name
-                return str(obj)
-
             json_str = json.dumps(parsed_dict, default=_json_safe)
+            return DecodedSysEx(
+                parsed=parsed,
+                parsed_dict=parsed_dict,
+                json_str=json_str,
+                dispatch=dispatch,
+            )
+
+        except Exception as ex:
+            log.error(
+                f"Unexpected error {ex} while decoding SysEx message",
+                scope=self.__class__.__name__,
+            )
+            return None
+
+    def _emit_decoded_sysex(self, decoded: DecodedSysEx) -> None:
+        """
+        Emit signals for a decoded SysEx message (Qt thread).
+
+        :param decoded: DecodedSysEx
+        :return: None
+        """
+        try:
+            # --- Emit only valid parameter messages ---
+            if decoded.parsed.is_parameter:
+                self._emit_program_or_tone_name(decoded.parsed)
 
-            self.midi_sysex_json.emit(json_str)
-            log.json(parsed_dict, silent=True)
+            if decoded.dispatch is not None:
+                self.sysex_bus.publish(decoded.dispatch)
+            self.midi_sysex_json.emit(decoded.json_str)
+            log.json(decoded.parsed_dict, silent=True)
 
         except Exception as ex:
             log.error(
@@ -18,7 +18,7 @@ Example usage:
 """
 
 import logging
-from typing import Iterable, Optional
+from typing import Callable, Iterable, List, Optional
 
 from decologr import Decologr as log
 from PySide6.QtCore import Signal
@@ -26,6 +26,7 @@ from PySide6.QtCore import Signal
 from jdxi_editor.globals import silence_midi_note_logging
 from jdxi_editor.midi.data.parsers.util import OUTBOUND_MESSAGE_IGNORED_KEYS
 from jdxi_editor.midi.io.controller import MidiIOController
+from jdxi_editor.midi.io.scheduler import MidiOutputScheduler, OutputLane
 from jdxi_editor.midi.message import (
     ControlChangeMessage,
     IdentityRequestMessage,
@@ -42,6 +43,8 @@ from picomidi.utils.formatting import (
     format_message_to_hex_string as format_midi_message_to_hex_string,
 )
 
+MIDI_SYSTEM_REALTIME = 0xF8  # first system real-time status (clock, start, stop ...)
+
 
 class MidiOutHandler(MidiIOController):
     """Helper class for MIDI communication with the JD-Xi."""
@@ -52,118 +55,174 @@ class MidiOutHandler(MidiIOController):
         super().__init__(parent)
         self.parent = parent
         self.channel = 1
-        self.sysex_parser = JDXiSysExParser()
+        # --- Used only on the output scheduler thread. The parser keeps per-message
+        # --- state, so it is not shared with the input side's sysex_parser
+        self.outbound_sysex_parser = JDXiSysExParser()
+        # --- Called with every SysEx frame sent, on the sending thread (e.g. patch state)
+        self.sent_sysex_observers: List[Callable[[bytes], None]] = []
+        # --- Single writer thread for the output port, started on first send
+        self.output_scheduler = MidiOutputScheduler(transmit=self._transmit_raw_message)
+
+    def add_sent_sysex_observer(self, observer: Callable[[bytes], None]) -> None:
+        """
+        Call observer with every SysEx frame sent, on the sending thread.
 
-    import threading
+        :param observer: Callable[[bytes], None] must be fast and thread-safe
+        :return: None
+        """
+        if observer not in self.sent_sysex_observers:
+            self.sent_sysex_observers = self.sent_sysex_observers + [observer]
 
-    # Global lock for all MIDI output operations
-    _midi_send_lock = threading.RLock()
+    def remove_sent_sysex_observer(self, observer: Callable[[bytes], None]) -> None:
+        """
+        Stop calling observer with sent SysEx frames.
+
+        :param observer: Callable[[bytes], None]
+        :return: None
+        """
+        self.sent_sysex_observers = [
+            existing for existing in self.sent_sysex_observers if existing != observer
+        ]
 
-    def send_raw_message(self, message: Iterable[int]) -> bool:
+    def send_raw_message(
+        self,
+        message: Iterable[int],
+        lane: Optional[OutputLane] = None,
+        gap_after: float = 0.0,
+    ) -> bool:
         """
-        Thread-safe version of sending a raw MIDI message.
-        Handles logging, validation, and exceptions safely.
+        Queue a raw MIDI message on the output scheduler.
+
+        The message is validated here; formatting, logging and the port write
+        happen on the scheduler thread (see jdxi_editor.midi.io.scheduler), so
+        the caller never waits on the port.
+
+        :param message: Iterable[int] raw MIDI message
+        :param lane: Optional[OutputLane] priority lane, by default derived from the message
+        :param gap_after: float seconds the lane stays idle after this message
+        :return: bool True if the message was queued
         """
-        with self._midi_send_lock:
-            try:
-                if not validate_midi_message(message):
-                    log.message("[MidiOutHandler] MIDI message validation failed.")
-                    return False
-
-                # Ensure message is a list of integers before formatting
-                def safe_int(val):
-                    # Check for enums FIRST (IntEnum inherits from int, so isinstance check must come after)
-                    if hasattr(val, "value") and not isinstance(
-                        val, type
-                    ):  # Handle enums (but not enum classes)
-                        enum_val = val.value
-                        # Ensure we get the actual integer value, not the enum
-                        if isinstance(enum_val, int) and not hasattr(enum_val, "value"):
-                            return enum_val
-                        # If enum_val is still an enum, recurse
-                        if hasattr(enum_val, "value"):
-                            return safe_int(enum_val)
-                        try:
-                            return int(float(enum_val))  # Handle string enum values
-                        except (ValueError, TypeError):
-                            return 0
-                    if isinstance(val, int):
-                        return val
-                    try:
-                        return int(float(val))  # Handle floats and strings
-                    except (ValueError, TypeError):
-                        return 0
-
-                message_list_for_formatting = [safe_int(x) for x in message]
-                formatted_message = format_midi_message_to_hex_string(
-                    message_list_for_formatting
-                )
+        try:
+            if not validate_midi_message(message):
+                log.message("[MidiOutHandler] MIDI message validation failed.")
+                return False
+            if not self.midi_out.is_port_open():
+                log.message("[MidiOutHandler] MIDI output port is not open.")
+                return False
+            # --- Validated: every byte is an int in 0..255
+            return self.output_scheduler.submit(
+                bytes(message),
+                lane=lane,
+                gap_after=gap_after,
+                block=lane == OutputLane.BULK,
+            )
+        except Exception as ex:
+            log.error(
+                scope="MidiOutHandler",
+                message=f"Unexpected error sending MIDI message: {ex}",
+            )
+            return False
+
+    def flush_output(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued message has been sent.
+
+        :param timeout: Optional[float] seconds
+        :return: bool True if the output queues drained
+        """
+        return self.output_scheduler.flush(timeout)
+
+    def stop_output_scheduler(self) -> None:
+        """
+        Send what is still queued, then stop the output scheduler thread.
+
+        :return: None
+        """
+        self.output_scheduler.stop()
 
-                if not self.midi_out.is_port_open():
-                    log.message("[MidiOutHandler] MIDI output port is not open.")
-                    return False
-
-                # Parse SysEx safely - only attempt if message is actually SysEx (starts with 0xF0)
-                filtered_data = {}
-                message_list = list(message)
-                if message_list and message_list[0] == Midi.sysex.START:
-                    # This is a SysEx message, try to parse it
-                    try:
-                        parsed_data = self.sysex_parser.parse_bytes(bytes(message))
-                        filtered_data = {
-                            k: v
-                            for k, v in parsed_data.items()
-                            if k not in OUTBOUND_MESSAGE_IGNORED_KEYS
-                        }
-                    except ValueError as parse_ex:
-                        # Skip logging for non-JD-Xi messages (e.g., universal identity_request requests)
-                        error_msg = str(parse_ex)
-                        if "Not a JD-Xi SysEx message" in error_msg:
-                            # This is a universal MIDI message, not a JD-Xi message - skip silently
-                            filtered_data = {}
-                        else:
-                            # Log warning for actual JD-Xi parsing errors
-                            log.message(
-                                f"SysEx parsing failed: {parse_ex}",
-                                level=logging.WARNING,
-                            )
-                            filtered_data = {}
-                    except Exception as parse_ex:
-                        # Log warning for other parsing errors
+    def _transmit_raw_message(self, message: bytes) -> bool:
+        """
+        Write one message to the port; runs on the output scheduler thread.
+        Handles logging and exceptions safely.
+
+        :param message: bytes raw MIDI message
+        :return: bool True if sent
+        """
+        try:
+            if not self.midi_out.is_port_open():
+                log.message("[MidiOutHandler] MIDI output port is not open.")
+                return False
+            formatted_message = format_midi_message_to_hex_string(list(message))
+
+            # Parse SysEx safely - only attempt if message is actually SysEx (starts with 0xF0)
+            filtered_data = {}
+            is_sysex = bool(message) and message[0] == Midi.sysex.START
+            if is_sysex:
+                # This is a SysEx message, try to parse it
+                try:
+                    parsed_data = self.outbound_sysex_parser.parse_bytes(message)
+                    filtered_data = {
+                        k: v
+                        for k, v in parsed_data.items()
+                        if k not in OUTBOUND_MESSAGE_IGNORED_KEYS
+                    }
+                except ValueError as parse_ex:
+                    # Skip logging for non-JD-Xi messages (e.g., universal identity_request requests)
+                    if "Not a JD-Xi SysEx message" not in str(parse_ex):
+                        # Log warning for actual JD-Xi parsing errors
                         log.message(
-                            f"SysEx parsing failed: {parse_ex}", level=logging.WARNING
+                            f"SysEx parsing failed: {parse_ex}",
+                            level=logging.WARNING,
                         )
-                        filtered_data = {}
-                # For non-SysEx messages, filtered_data remains empty (no warning needed)
+                except Exception as parse_ex:
+                    # Log warning for other parsing errors
+                    log.message(
+                        f"SysEx parsing failed: {parse_ex}", level=logging.WARNING
+                    )
+            # For non-SysEx messages, filtered_data remains empty (no warning needed)
 
-                # Log safely (skip logging for note on/off if user prefers to silence them)
-                skip_note_log = (
+            # Log safely (skip logging for note on/off if user prefers to silence them,
+            # and always for clock and transport, which are sent many times a second)
+            skip_note_log = bool(message) and (
+                message[0] >= MIDI_SYSTEM_REALTIME
+                or (
                     silence_midi_note_logging()
-                    and message_list
-                    and (
-                        (message_list[0] & MidiMessage.MIDI_STATUS_MASK)
-                        in (0x80, 0x90)  # note off, note on
-                    )
+                    and (message[0] & MidiMessage.MIDI_STATUS_MASK)
+                    in (0x80, 0x90)  # note off, note on
                 )
-                if not skip_note_log:
-                    log.message(
-                        scope="MidiOutHandler",
-                        message=f"[MIDI QC passed] [ Sending message: {formatted_message} ] {filtered_data}",
-                        level=logging.INFO,
-                        silent=False,
-                    )
-                # Send the message
-                self.midi_out.send_message(message)
-                self.midi_message_outgoing.emit(message)
-                return True
+            )
+            if not skip_note_log:
+                log.message(
+                    scope="MidiOutHandler",
+                    message=f"[MIDI QC passed] [ Sending message: {formatted_message} ] {filtered_data}",
+                    level=logging.INFO,
+                    silent=False,
+                )
+            # Send the message
+            self.midi_out.send_message(list(message))
+            self.midi_message_outgoing.emit(list(message))
+            if is_sysex:
+                self._notify_sent_sysex(message)
+            return True
+
+        except Exception as ex:
+            # Catch everything to prevent C-level crash from propagating
+            log.error(
+                scope="MidiOutHandler",
+                message=f"Unexpected error sending MIDI message: {ex}",
+            )
+            return False
 
+    def _notify_sent_sysex(self, frame: bytes) -> None:
+        """Pass a sent SysEx frame to the observers; observer errors are logged."""
+        for observer in self.sent_sysex_observers:
+            try:
+                observer(frame)
             except Exception as ex:
-                # Catch everything to prevent C-level crash from propagating
                 log.error(
                     scope="MidiOutHandler",
-                    message=f"Unexpected error sending MIDI message: {ex}",
+                    message=f"Error in sent SysEx observer {observer}: {ex}",
                 )
-                return False
 
     def send_note_on(
         self, note: int = 60, velocity: int = 127, channel: int = 1
@@ -309,7 +368,7 @@ class MidiOutHandler(MidiIOController):
             return False
 
     def send_control_change(
-        self, controller: int, value: int, channel: int = 0
+        self, controller: int, value: int, channel: int = 0, gap_after: float = 0.0
     ) -> bool:
         """
         Send control change message.
@@ -317,6 +376,7 @@ class MidiOutHandler(MidiIOController):
         :param controller: int Controller number (0–127).
         :param value: int Controller value (0–127).
         :param channel: int MIDI channel (0–15).
+        :param gap_after: float seconds before the next real-time message is sent
         :return: bool True if successful, False otherwise.
         """
         log.message(scope="MidiOutHandler", message="=====Sending control change====")
@@ -337,7 +397,7 @@ class MidiOutHandler(MidiIOController):
         try:
             control_change_message = ControlChangeMessage(channel, controller, value)
             message = control_change_message.to_message_list()
-            return self.send_raw_message(message)
+            return self.send_raw_message(message, gap_after=gap_after)
         except (ValueError, TypeError, OSError, IOError) as ex:
             log.message(f"send_control_change: Error sending control change: {ex}")
             return False
@@ -446,7 +506,8 @@ class MidiOutHandler(MidiIOController):
     ) -> bool:
         """
         Sends Bank Select and Program Change messages with delays between messages
-        to ensure the synthesizer can process them correctly.
+        to ensure the synthesizer can process them correctly. The delays are
+        kept by the output scheduler, so the caller does not block.
 
         :param channel: int MIDI channel (1-16).
         :param bank_msb: int Bank MSB value.
@@ -455,8 +516,6 @@ class MidiOutHandler(MidiIOController):
         :return: bool True if all messages are sent successfully, False otherwise.
         """
         try:
-            import time
-
             from jdxi_editor.midi.sleep import MIDI_SLEEP_TIME
 
             log.message(
@@ -474,14 +533,14 @@ class MidiOutHandler(MidiIOController):
             log.message(
                 f"-------#1 send_control_change controller=0, bank_msb={bank_msb}, channel: {channel} --------"
             )
-            self.send_control_change(0, bank_msb, channel)
-            time.sleep(MIDI_SLEEP_TIME)  # Small delay between bank select messages
+            # --- Small delay between bank select messages
+            self.send_control_change(0, bank_msb, channel, gap_after=MIDI_SLEEP_TIME)
 
             log.message(
                 f"-------#2 send_control_change controller=32, bank_lsb={bank_lsb}, channel: {channel} --------"
             )
-            self.send_control_change(32, bank_lsb, channel)
-            time.sleep(MIDI_SLEEP_TIME)  # Small delay before program change
+            # --- Small delay before program change
+            self.send_control_change(32, bank_lsb, channel, gap_after=MIDI_SLEEP_TIME)
 
             log.message(
                 f"-------#3 send_program_change program: {program} channel: {channel} --------"
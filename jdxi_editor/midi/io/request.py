@@ -0,0 +1,354 @@
+"""
+RQ1 Request Engine
+==================
+
+Pipelined, reply-correlated scheduler for JD-Xi RQ1 (data request) messages.
+
+``send_with_delay`` used to start a thread per data request and sleep a fixed
+``MIDI_SLEEP_TIME`` after every RQ1, whether or not the synth had already
+answered. The engine replaces that with a single worker thread that:
+
+- keeps a bounded window of RQ1 requests in flight,
+- matches incoming DT1 replies to requests by address range (replies are
+  observed on the MIDI decode worker, so matching does not wait for the Qt event
+  loop); a reply arriving after its request timed out is ignored,
+- grows the window on timely replies and halves it on timeouts, and derives the
+  timeout from the observed round-trip time,
+- drops requests already covered by a pending or in-flight request, so editors
+  asking for the same area at the same time cost one round trip,
+- resends a request that timed out, up to ``REQUEST_MAX_RETRIES`` times.
+
+Pulling the whole temporary program is then bounded by how fast the JD-Xi
+answers rather than by the sum of the sleeps.
+
+When no input port is open there are no replies to wait for; requests are then
+sent in order, paced by ``MIDI_SLEEP_TIME`` as before.
+
+Classes:
+    RQ1Request: One queued request and its retry state.
+    RQ1RequestEngine: The scheduler thread.
+
+Example usage:
+--------------
+>>> engine = RQ1RequestEngine(send=midi_helper.send_raw_message)
+>>> engine.request(MidiRequests.PROGRAM_TONE_NAME)   # list of RQ1 hex strings
+>>> engine.on_sysex_frame(reply_bytes)                # from the decode worker
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterable, List, Optional, Tuple, Union
+
+from decologr import Decologr as log
+
+from jdxi_editor.midi.data.address.address import CommandID
+from jdxi_editor.midi.message.sysex.offset import JDXiSysExMessageLayout
+from jdxi_editor.midi.sleep import MIDI_SLEEP_TIME
+
+REQUEST_MAX_IN_FLIGHT = 4  # upper bound on the adaptive window
+REQUEST_INITIAL_WINDOW = 2
+REQUEST_MIN_INTERVAL = (
+    0.002  # seconds between two sends, keeps the JD-Xi input buffer happy
+)
+REQUEST_INITIAL_RTT = 0.05  # seconds, until a reply has been timed
+REQUEST_MIN_TIMEOUT = 0.15
+REQUEST_MAX_TIMEOUT = 1.0
+REQUEST_TIMEOUT_RTT_FACTOR = 4.0
+REQUEST_RTT_SMOOTHING = 0.125  # EWMA weight of a new round-trip sample
+REQUEST_MAX_RETRIES = 2
+
+RQ1_FRAME_LENGTH = 18  # F0, header(6), 0x11, address(4), size(4), checksum, F7
+RQ1_SIZE_OFFSET = JDXiSysExMessageLayout.ADDRESS.LSB + 1
+DT1_DATA_OFFSET = RQ1_SIZE_OFFSET
+DT1_TRAILER_LENGTH = 2  # checksum, F7
+
+RequestMessage = Union[str, bytes, bytearray, List[int]]
+
+
+def _to_7bit_int(values: Iterable[int]) -> int:
+    """
+    Pack 7-bit address or size bytes into one integer.
+
+    :param values: Iterable[int] most significant byte first
+    :return: int
+    """
+    result = 0
+    for value in values:
+        result = (result << 7) | (value & 0x7F)
+    return result
+
+
+@dataclass
+class RQ1Request:
+    """
+    One request queued on the engine.
+
+    For RQ1 frames ``start`` and ``size`` hold the requested range as packed 7-bit
+    integers; other messages (size 0) are sent once without waiting for a reply.
+    """
+
+    message: bytes
+    start: int = 0
+    size: int = 0
+    attempts: int = 0
+    sent_at: float = 0.0
+    deadline: float = 0.0
+
+    @property
+    def is_tracked(self) -> bool:
+        return self.size > 0
+
+    def answered_by(self, address: int, size: int, now: float) -> bool:
+        """
+        Whether a DT1 reply of size data bytes at address answers this request.
+
+        The JD-Xi answers with the area's actual length, which is often shorter
+        than the size asked for (e.g. 61 bytes for a 0x40 Digital partial
+        request), so any non-empty reply within the requested range counts.
+
+        :param address: int packed 7-bit start address of the reply
+        :param size: int number of data bytes in the reply
+        :param now: float time.monotonic() the reply arrived
+        :return: bool False for a reply arriving after the deadline
+        """
+        return size > 0 and self.covers(address, size) and now <= self.deadline
+
+    def covers(self, start: int, size: int) -> bool:
+        return self.start <= start and start + size <= self.start + self.size
+
+    @classmethod
+    def from_message(cls, message: RequestMessage) -> "RQ1Request":
+        """
+        Build a request from an RQ1 hex string or raw bytes.
+
+        :param message: RequestMessage e.g. "F0 41 10 00 00 00 0E 11 19 01 00 00 00 00 00 40 26 F7"
+        :return: RQ1Request
+        """
+        data = bytes.fromhex(message) if isinstance(message, str) else bytes(message)
+        if (
+            len(data) == RQ1_FRAME_LENGTH
+            and data[JDXiSysExMessageLayout.COMMAND_ID] == CommandID.RQ1
+        ):
+            start = _to_7bit_int(
+                data[JDXiSysExMessageLayout.ADDRESS.MSB : RQ1_SIZE_OFFSET]
+            )
+            size = _to_7bit_int(data[RQ1_SIZE_OFFSET : RQ1_SIZE_OFFSET + 4])
+            return cls(message=data, start=start, size=size)
+        return cls(message=data)
+
+
+class RQ1RequestEngine(threading.Thread):
+    """
+    Scheduler thread keeping a bounded, adaptive window of RQ1 requests in flight.
+
+    :param send: Callable[[bytes], bool] sends a raw message, e.g. MidiOutHandler.send_raw_message
+    :param replies_expected: Callable[[], bool] whether replies can arrive (input port open)
+    :param max_in_flight: int upper bound on the window
+    """
+
+    def __init__(
+        self,
+        send: Callable[[bytes], bool],
+        replies_expected: Optional[Callable[[], bool]] = None,
+        max_in_flight: int = REQUEST_MAX_IN_FLIGHT,
+    ):
+        super().__init__(name="RQ1RequestEngine", daemon=True)
+        self.send = send
+        self.replies_expected = replies_expected or (lambda: True)
+        self.max_in_flight = max_in_flight
+        self.window = min(REQUEST_INITIAL_WINDOW, max_in_flight)
+        self.rtt = REQUEST_INITIAL_RTT
+        self._pending: Deque[RQ1Request] = deque()
+        self._in_flight: List[RQ1Request] = []
+        self._condition = threading.Condition()
+        self._next_send_time = 0.0
+        self._stopping = False
+        self.completed = 0
+        self.deduplicated = 0
+        self.retries = 0
+        self.timeouts = 0
+
+    @property
+    def timeout(self) -> float:
+        """Reply timeout derived from the smoothed round-trip time."""
+        return min(
+            REQUEST_MAX_TIMEOUT,
+            max(REQUEST_MIN_TIMEOUT, REQUEST_TIMEOUT_RTT_FACTOR * self.rtt),
+        )
+
+    def request(self, midi_requests: Iterable[RequestMessage]) -> int:
+        """
+        Queue requests; starts the worker thread on first use.
+
+        :param midi_requests: Iterable[RequestMessage] e.g. an editor's ``midi_requests``
+        :return: int number of requests queued (after deduplication)
+        """
+        queued = 0
+        with self._condition:
+            for message in midi_requests:
+                try:
+                    item = RQ1Request.from_message(message)
+                except ValueError as ex:
+                    log.error(
+                        f"Error {ex} parsing request {message}",
+                        scope=self.__class__.__name__,
+                    )
+                    continue
+                if item.is_tracked and self._is_covered(item):
+                    self.deduplicated += 1
+                    continue
+                self._pending.append(item)
+                queued += 1
+            if queued and not self.is_alive() and not self._stopping:
+                self.start()
+            self._condition.notify()
+        return queued
+
+    def _is_covered(self, item: RQ1Request) -> bool:
+        """Whether a pending or in-flight request already asks for item's range."""
+        for other in self._in_flight:
+            if other.covers(item.start, item.size):
+                return True
+        for other in self._pending:
+            if other.is_tracked and other.covers(item.start, item.size):
+                return True
+        return False
+
+    def on_sysex_frame(self, frame: bytes) -> None:
+        """
+        Match an incoming SysEx frame to an in-flight request (decode worker thread).
+
+        :param frame: bytes complete SysEx frame F0 ... F7
+        :return: None
+        """
+        if (
+            len(frame) <= JDXiSysExMessageLayout.ADDRESS.LSB
+            or frame[JDXiSysExMessageLayout.COMMAND_ID] != CommandID.DT1
+        ):
+            return
+        address = _to_7bit_int(
+            frame[JDXiSysExMessageLayout.ADDRESS.MSB : RQ1_SIZE_OFFSET]
+        )
+        size = len(frame) - DT1_DATA_OFFSET - DT1_TRAILER_LENGTH
+        now = time.monotonic()
+        with self._condition:
+            for item in self._in_flight:
+                # --- The JD-Xi answers an RQ1 with a DT1 within the requested range; a
+                # --- late reply is left for the scheduler to expire and retry
+                if item.answered_by(address, size, now):
+                    self._in_flight.remove(item)
+                    self.completed += 1
+                    if item.attempts == 1:
+                        # --- Only unambiguous samples (no retry) feed the RTT estimate
+                        sample = now - item.sent_at
+                        self.rtt += REQUEST_RTT_SMOOTHING * (sample - self.rtt)
+                    self.window = min(self.max_in_flight, self.window + 1)
+                    self._condition.notify()
+                    return
+
+    def idle(self) -> bool:
+        """Whether no requests are pending or in flight."""
+        with self._condition:
+            return not self._pending and not self._in_flight
+
+    def stats(self) -> dict:
+        """
+        Counters for diagnostics.
+
+        :return: dict
+        """
+        with self._condition:
+            return {
+                "pending": len(self._pending),
+                "in_flight": len(self._in_flight),
+                "window": self.window,
+                "rtt_ms": self.rtt * 1000.0,
+                "timeout_ms": self.timeout * 1000.0,
+                "completed": self.completed,
+                "deduplicated": self.deduplicated,
+                "retries": self.retries,
+                "timeouts": self.timeouts,
+            }
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        Stop the worker thread, discarding anything still queued.
+
+        :param timeout: float seconds to wait for the thread to finish
+        """
+        with self._condition:
+            self._stopping = True
+            self._pending.clear()
+            self._in_flight.clear()
+            self._condition.notify()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def run(self) -> None:
+        while True:
+            with self._condition:
+                if self._stopping:
+                    return
+                to_send, wait = self._schedule(time.monotonic())
+                if not to_send:
+                    self._condition.wait(wait)
+                    continue
+            # --- Send outside the lock so replies can be matched while the port is busy
+            for item in to_send:
+                try:
+                    self.send(item.message)
+                except Exception as ex:
+                    log.error(
+                        f"Error {ex} occurred sending request {item.message.hex(' ')}",
+                        scope=self.__class__.__name__,
+                    )
+
+    def _schedule(self, now: float) -> Tuple[List[RQ1Request], Optional[float]]:
+        """
+        Expire timed-out requests and pick the next requests to send (lock held).
+
+        :param now: float time.monotonic()
+        :return: (requests to send now, seconds to wait otherwise; None waits for a request)
+        """
+        for item in list(self._in_flight):
+            if now < item.deadline:
+                continue
+            self._in_flight.remove(item)
+            self.timeouts += 1
+            self.window = max(1, self.window // 2)
+            if item.attempts <= REQUEST_MAX_RETRIES:
+                self.retries += 1
+                self._pending.appendleft(item)
+            else:
+                log.warning(
+                    f"No reply to request {item.message.hex(' ')} after {item.attempts} attempts",
+                    scope=self.__class__.__name__,
+                )
+
+        tracking = self.replies_expected()
+        interval = REQUEST_MIN_INTERVAL if tracking else MIDI_SLEEP_TIME
+        window_full = len(self._in_flight) >= self.window
+        if self._pending and now >= self._next_send_time:
+            item = self._pending[0]
+            if not (tracking and item.is_tracked and window_full):
+                self._pending.popleft()
+                item.attempts += 1
+                item.sent_at = now
+                if tracking and item.is_tracked:
+                    item.deadline = now + self.timeout
+                    self._in_flight.append(item)
+                self._next_send_time = now + interval
+                return [item], 0.0
+
+        wake_times = [item.deadline for item in self._in_flight]
+        if self._pending and not (
+            tracking and self._pending[0].is_tracked and window_full
+        ):
+            wake_times.append(self._next_send_time)
+        if not wake_times:
+            return [], None
+        return [], max(0.0, min(wake_times) - now)
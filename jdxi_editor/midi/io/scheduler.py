@@ -0,0 +1,360 @@
+"""
+MIDI Output Scheduler
+=====================
+
+A single thread owning all writes to the MIDI output port.
+
+``send_raw_message`` used to validate, format, re-parse and send on the
+caller's thread (usually the GUI thread) under a global lock, with ad hoc
+sleeps for message sequences. Callers now only enqueue; the scheduler sends in
+priority order from three lanes:
+
+- ``REALTIME``: notes, controllers, program changes, MIDI clock; sent at once.
+- ``INTERACTIVE``: parameter DT1 writes and RQ1 requests from the editors.
+- ``BULK``: large DT1 blocks and ``.syx`` dumps.
+
+A lane is only served when every higher lane is empty or waiting on its own
+pacing, so a slider drag never queues behind a patch dump. The paced lanes share
+one port: every paced message holds the port for its transmission time at the
+lane's byte rate, so together they never exceed the DIN rate. When the port is
+free, the highest ready lane is served. Each lane also waits its minimum
+interval (plus any ``gap_after``) after its own messages.
+
+Single-parameter DT1 writes are latest-value-wins: a write to an address that
+still has a write pending replaces the pending payload in place, so dragging a
+slider sends the current value rather than every intermediate one.
+
+The bulk lane is bounded; producers block (``submit(..., block=True)``) until
+there is room, which keeps dumps in constant memory.
+
+With instrumentation enabled each lane reports its queue depth, how long
+messages waited between submit and send, and the pacing after each send
+(``midi_out.depth.*``, ``midi_out.wait.*``, ``midi_out.pacing.*``).
+
+Classes:
+    OutputLane: The priority lanes.
+    LanePacing: Byte rate and minimum interval of a lane.
+    MidiOutputScheduler: The scheduler thread.
+
+Example usage:
+--------------
+>>> scheduler = MidiOutputScheduler(transmit=port_writer)
+>>> scheduler.submit(b"\\x90\\x3c\\x64")                        # note on, REALTIME
+>>> scheduler.submit(dt1_bytes)                                # INTERACTIVE, coalesced
+>>> scheduler.submit(frame, lane=OutputLane.BULK, block=True)  # back-pressure
+>>> scheduler.submit(cc_bytes, gap_after=0.025)                # hold the lane afterwards
+>>> scheduler.flush(timeout=1.0)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from decologr import Decologr as log
+
+from jdxi_editor.core.instrumentation import instruments
+from jdxi_editor.midi.data.address.address import CommandID
+from jdxi_editor.midi.message.sysex.offset import JDXiSysExMessageLayout
+
+SYSEX_START = 0xF0
+MIDI_DIN_BYTES_PER_SECOND = 3125  # 31250 baud, 10 bits per byte
+# --- A DT1 carrying up to one nibbled (4-byte) value is a single parameter write
+SINGLE_PARAMETER_DT1_LENGTH = JDXiSysExMessageLayout.ADDRESS.LSB + 1 + 4 + 2
+BULK_SYSEX_LENGTH = 64  # longer SysEx frames go to the bulk lane
+BULK_MAX_PENDING = 64  # messages queued on the bulk lane before producers block
+
+
+class OutputLane(IntEnum):
+    """Output priority, highest first."""
+
+    REALTIME = 0
+    INTERACTIVE = 1
+    BULK = 2
+
+
+@dataclass(frozen=True)
+class LanePacing:
+    """Pacing of one lane: bytes per second (None: unpaced) and minimum gap."""
+
+    bytes_per_second: Optional[float]
+    min_interval: float
+
+    def transmission(self, length: int) -> float:
+        """Seconds a message of length bytes holds the port (0.0 when unpaced)."""
+        if self.bytes_per_second is None:
+            return 0.0
+        return length / self.bytes_per_second
+
+    def interval(self, length: int) -> float:
+        return max(self.min_interval, self.transmission(length))
+
+
+LANE_PACING: Dict[OutputLane, LanePacing] = {
+    OutputLane.REALTIME: LanePacing(None, 0.0),
+    OutputLane.INTERACTIVE: LanePacing(MIDI_DIN_BYTES_PER_SECOND, 0.002),
+    OutputLane.BULK: LanePacing(MIDI_DIN_BYTES_PER_SECOND, 0.002),
+}
+
+
+def classify(message: bytes) -> OutputLane:
+    """
+    Default lane of a raw message.
+
+    :param message: bytes raw MIDI message
+    :return: OutputLane
+    """
+    if not message or message[0] != SYSEX_START:
+        return OutputLane.REALTIME
+    if len(message) > BULK_SYSEX_LENGTH:
+        return OutputLane.BULK
+    return OutputLane.INTERACTIVE
+
+
+def coalesce_key(message: bytes) -> Optional[Tuple[bytes, int]]:
+    """
+    Key under which a pending write is replaced by a newer one.
+
+    Only single-parameter DT1 writes are coalesced; the key is the address and
+    the frame length, so a one-byte and a nibbled write never replace each other.
+
+    :param message: bytes raw message
+    :return: Optional[Tuple[bytes, int]]
+    """
+    if (
+        len(message) <= SINGLE_PARAMETER_DT1_LENGTH
+        and len(message) > JDXiSysExMessageLayout.ADDRESS.LSB + 2
+        and message[0] == SYSEX_START
+        and message[JDXiSysExMessageLayout.COMMAND_ID] == CommandID.DT1
+    ):
+        address = message[
+            JDXiSysExMessageLayout.ADDRESS.MSB : JDXiSysExMessageLayout.ADDRESS.LSB + 1
+        ]
+        return bytes(address), len(message)
+    return None
+
+
+class _Entry:
+    __slots__ = ("message", "gap_after", "key", "submitted_ns")
+
+    def __init__(self, message: bytes, gap_after: float, key, submitted_ns: int = 0):
+        self.message = message
+        self.gap_after = gap_after
+        self.key = key
+        self.submitted_ns = submitted_ns  # --- set while instrumentation is enabled
+
+
+# --- Instrument names per lane: queue depth, submit-to-send wait, pacing after a send
+LANE_DEPTH_METRICS = {lane: f"midi_out.depth.{lane.name}" for lane in OutputLane}
+LANE_WAIT_METRICS = {lane: f"midi_out.wait.{lane.name}" for lane in OutputLane}
+LANE_PACING_METRICS = {lane: f"midi_out.pacing.{lane.name}" for lane in OutputLane}
+
+
+class MidiOutputScheduler(threading.Thread):
+    """
+    Output thread serving the priority lanes.
+
+    :param transmit: Callable[[bytes], bool] writes one message to the port (scheduler thread)
+    :param pacing: Optional[Dict[OutputLane, LanePacing]] overrides LANE_PACING
+    :param bulk_max_pending: int bulk lane bound
+    """
+
+    def __init__(
+        self,
+        transmit: Callable[[bytes], bool],
+        pacing: Optional[Dict[OutputLane, LanePacing]] = None,
+        bulk_max_pending: int = BULK_MAX_PENDING,
+    ):
+        super().__init__(name="MidiOutputScheduler", daemon=True)
+        self.transmit = transmit
+        self.pacing = {**LANE_PACING, **(pacing or {})}
+        self.bulk_max_pending = bulk_max_pending
+        self._queues: Dict[OutputLane, Deque[_Entry]] = {
+            lane: deque() for lane in OutputLane
+        }
+        self._pending_by_key: Dict[Tuple[bytes, int], _Entry] = {}
+        self._next_send: Dict[OutputLane, float] = {lane: 0.0 for lane in OutputLane}
+        self._port_free_at = 0.0  # --- shared by every paced lane
+        self._condition = threading.Condition()
+        self._sending = False
+        self._stopping = False
+        self.sent = 0
+        self.coalesced = 0
+        self.failed = 0
+
+    def submit(
+        self,
+        message: bytes,
+        lane: Optional[OutputLane] = None,
+        gap_after: float = 0.0,
+        block: bool = False,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Queue a message; starts the thread on first use.
+
+        :param message: bytes raw MIDI message
+        :param lane: Optional[OutputLane] defaults to classify(message)
+        :param gap_after: float seconds the lane stays idle after this message
+        :param block: bool wait for room on the bulk lane instead of exceeding its bound
+        :param timeout: Optional[float] seconds to wait when blocking
+        :return: bool False if the scheduler is stopped or the wait timed out
+        """
+        lane = classify(message) if lane is None else OutputLane(lane)
+        key = coalesce_key(message) if lane == OutputLane.INTERACTIVE else None
+        with self._condition:
+            if self._stopping:
+                return False
+            if block and lane == OutputLane.BULK:
+                if not self._condition.wait_for(
+                    lambda: self._stopping
+                    or len(self._queues[lane]) < self.bulk_max_pending,
+                    timeout,
+                ):
+                    return False
+                if self._stopping:
+                    return False
+            pending = self._pending_by_key.get(key) if key is not None else None
+            if pending is not None:
+                pending.message = message
+                pending.gap_after = max(pending.gap_after, gap_after)
+                self.coalesced += 1
+            else:
+                entry = _Entry(
+                    message,
+                    gap_after,
+                    key,
+                    time.perf_counter_ns() if instruments.enabled else 0,
+                )
+                self._queues[lane].append(entry)
+                if key is not None:
+                    self._pending_by_key[key] = entry
+                if instruments.enabled:
+                    instruments.set_gauge(
+                        LANE_DEPTH_METRICS[lane], len(self._queues[lane])
+                    )
+            if not self.is_alive():
+                self.start()
+            self._condition.notify_all()
+        return True
+
+    def pending(self) -> Dict[str, int]:
+        """
+        Queue lengths per lane, for diagnostics.
+
+        :return: Dict[str, int]
+        """
+        with self._condition:
+            return {lane.name: len(queue) for lane, queue in self._queues.items()}
+
+    def idle(self) -> bool:
+        """Whether nothing is queued or being sent."""
+        with self._condition:
+            return not self._sending and not any(self._queues.values())
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until everything queued so far has been sent.
+
+        :param timeout: Optional[float] seconds
+        :return: bool True if the queues drained
+        """
+        if threading.current_thread() is self:
+            return False
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._stopping
+                or (not self._sending and not any(self._queues.values())),
+                timeout,
+            )
+
+    def stop(self, flush_timeout: float = 0.5) -> None:
+        """
+        Send what is queued (up to flush_timeout), then stop the thread.
+
+        :param flush_timeout: float seconds to wait for the queues to drain
+        """
+        if self.is_alive():
+            self.flush(flush_timeout)
+        with self._condition:
+            self._stopping = True
+            for queue in self._queues.values():
+                queue.clear()
+            self._pending_by_key.clear()
+            self._condition.notify_all()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(1.0)
+
+    def _next(self, now: float) -> Tuple[Optional[OutputLane], Optional[float]]:
+        """
+        Highest lane ready to send (lock held).
+
+        :return: (lane or None, seconds until a lane is ready; None waits for a submit)
+        """
+        wake: Optional[float] = None
+        for lane in OutputLane:
+            if not self._queues[lane]:
+                continue
+            ready_at = self._next_send[lane]
+            if self.pacing[lane].bytes_per_second is not None:
+                ready_at = max(ready_at, self._port_free_at)
+            if now >= ready_at:
+                return lane, 0.0
+            wait = ready_at - now
+            wake = wait if wake is None else min(wake, wait)
+        return None, wake
+
+    def run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if self._stopping:
+                        return
+                    lane, wait = self._next(time.monotonic())
+                    if lane is not None:
+                        break
+                    self._condition.wait(wait)
+                entry = self._queues[lane].popleft()
+                if entry.key is not None:
+                    self._pending_by_key.pop(entry.key, None)
+                if instruments.enabled:
+                    instruments.set_gauge(
+                        LANE_DEPTH_METRICS[lane], len(self._queues[lane])
+                    )
+                    if entry.submitted_ns:
+                        instruments.record_duration(
+                            LANE_WAIT_METRICS[lane],
+                            time.perf_counter_ns() - entry.submitted_ns,
+                        )
+                self._sending = True
+                self._condition.notify_all()  # --- room on the bulk lane
+            # --- Send outside the lock so producers never wait on the port
+            try:
+                ok = self.transmit(entry.message)
+            except Exception as ex:
+                log.error(
+                    f"Error {ex} occurred sending {entry.message.hex(' ')}",
+                    scope=self.__class__.__name__,
+                )
+                ok = False
+            with self._condition:
+                self._sending = False
+                if ok:
+                    self.sent += 1
+                else:
+                    self.failed += 1
+                now = time.monotonic()
+                lane_pacing = self.pacing[lane]
+                pacing = lane_pacing.interval(len(entry.message)) + entry.gap_after
+                self._next_send[lane] = now + pacing
+                if lane_pacing.bytes_per_second is not None:
+                    self._port_free_at = now + lane_pacing.transmission(
+                        len(entry.message)
+                    )
+                if instruments.enabled:
+                    instruments.record_value(LANE_PACING_METRICS[lane], pacing * 1e6)
+                self._condition.notify_all()
@@ -0,0 +1,149 @@
+"""
+SysEx File Sender
+=================
+
+Sends a ``.syx`` file to the JD-Xi from a worker thread, streaming frames from
+``SysExFileReader`` and pacing them so the synth's input buffer is not overrun.
+
+Each frame is followed by a gap of at least its transmission time at the MIDI
+DIN rate (``SYX_BYTES_PER_SECOND``) and never less than
+``SYX_MIN_INTERVAL``. Large bulk dumps therefore arrive no faster than the
+JD-Xi receives them over a 5-pin cable, while single parameter messages are
+paced like other DT1 traffic.
+
+When ``send`` already paces (the output scheduler's bulk lane blocks the
+sender until there is room), pass ``paced=False`` to skip the sender's own gaps.
+
+Classes:
+    SysExSendResult: Counters reported when sending ends.
+    SysExFileSender: The sender thread.
+
+Example usage:
+--------------
+>>> sender = SysExFileSender("dump.syx", send=midi_helper.send_raw_message)
+>>> sender.start()
+>>> sender.cancel()
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from decologr import Decologr as log
+
+from jdxi_editor.midi.sysex.syx_file import SysExFileReader
+
+SYX_BYTES_PER_SECOND = 3125  # MIDI DIN: 31250 baud, 10 bits per byte
+SYX_MIN_INTERVAL = 0.002  # seconds between two frames
+
+
+def frame_interval(length: int) -> float:
+    """
+    Gap to leave after sending a frame.
+
+    :param length: int frame length in bytes
+    :return: float seconds
+    """
+    return max(SYX_MIN_INTERVAL, length / SYX_BYTES_PER_SECOND)
+
+
+@dataclass
+class SysExSendResult:
+    """Outcome of sending one file."""
+
+    file_path: str
+    sent: int = 0
+    failed: int = 0
+    invalid: int = 0
+    bytes_sent: int = 0
+    seconds: float = 0.0
+    cancelled: bool = False
+
+
+class SysExFileSender(threading.Thread):
+    """
+    Streams one .syx file to the synth.
+
+    :param file_path: str .syx file
+    :param send: Callable[[bytes], bool] sends a raw message, e.g. MidiIOHelper.send_raw_message
+    :param on_finished: Optional[Callable[[SysExSendResult], None]] called on the sender thread
+    :param paced: bool leave frame_interval() between frames
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        send: Callable[[bytes], bool],
+        on_finished: Optional[Callable[[SysExSendResult], None]] = None,
+        paced: bool = True,
+    ):
+        super().__init__(name="SysExFileSender", daemon=True)
+        self.file_path = file_path
+        self.send = send
+        self.on_finished = on_finished
+        self.paced = paced
+        self.result = SysExSendResult(file_path=file_path)
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Stop after the current frame."""
+        self._cancel.set()
+
+    def _send(self, message: bytes) -> bool:
+        try:
+            return self.send(message) is not False
+        except Exception as ex:
+            log.error(
+                f"Error sending SysEx message: {ex}", scope=self.__class__.__name__
+            )
+            return False
+
+    def run(self) -> None:
+        result = self.result
+        t_start = time.monotonic()
+        next_send = t_start
+        try:
+            with SysExFileReader(self.file_path) as reader:
+                frames = reader.frames()
+                try:
+                    for frame in frames:
+                        # --- Copy out of the mapping now; the view is released on resume
+                        message = bytes(frame)
+                        del frame
+                        delay = next_send - time.monotonic()
+                        if delay > 0:
+                            self._cancel.wait(delay)
+                        if self._cancel.is_set():
+                            break
+                        if self._send(message):
+                            result.sent += 1
+                            result.bytes_sent += len(message)
+                        else:
+                            result.failed += 1
+                        if self.paced:
+                            next_send = time.monotonic() + frame_interval(len(message))
+                finally:
+                    frames.close()
+                result.invalid = reader.invalid
+        except OSError as ex:
+            log.error(
+                f"Error {ex} occurred opening file", scope=self.__class__.__name__
+            )
+        result.cancelled = self._cancel.is_set()
+        result.seconds = time.monotonic() - t_start
+        if result.sent == 0 and not result.cancelled:
+            log.message(
+                f"No valid SysEx messages in {self.file_path}",
+                scope=self.__class__.__name__,
+            )
+        log.message(
+            f"Sent {result.sent} SysEx message(s) ({result.bytes_sent} bytes) from "
+            f"{self.file_path} in {result.seconds:.2f}s; {result.invalid} invalid, "
+            f"{result.failed} failed{', cancelled' if result.cancelled else ''}",
+            scope=self.__class__.__name__,
+        )
+        if self.on_finished is not None:
+            self.on_finished(result)
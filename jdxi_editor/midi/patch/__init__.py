@@ -0,0 +1,3 @@
+"""
+Headless patch state: the JD-Xi temporary areas held in memory, independent of the editors.
+"""
@@ -0,0 +1,722 @@
+"""
+Patch State
+===========
+
+In-memory model of the JD-Xi temporary areas, keyed by parameter address.
+
+Each temporary area (program common, effects, vocal FX, arpeggio, zones, the
+digital tones' common/modify/partials, analog, drum kit common and partials) is
+a ``bytearray`` holding the raw 7-bit data bytes exactly as they travel in DT1
+messages, plus a mask of which bytes have been seen. Incoming DT1 replies and
+outgoing parameter edits are both written into it, so it mirrors the synth
+without reading any widget.
+
+Because the model is plain data it can be saved, exported or diffed without
+instantiating an editor. Every write stamps the bytes it changed with a write
+generation, so each view (``PatchStateView``, one per editor) can ask which
+parameters the synth changed since it last looked and refresh only those.
+Edits sent from here are stamped as local: the controls that sent them already
+show them.
+
+Addresses: the JD-Xi address space is 7 bits per byte. Parameter addresses such
+as ``0x13C`` in the drum partial map mean "01 3C", i.e. linear offset 188; the
+model works on linear offsets throughout.
+
+Classes:
+    PatchAreaSpec: Static description of one temporary area.
+    PatchArea: Data, seen-mask and dirty offsets of one area.
+    PatchState: All areas, with address lookup and thread-safe updates.
+    PatchStateView: One consumer's record of what it has already seen.
+
+Example usage:
+--------------
+>>> state = PatchState()
+>>> state.apply_sysex_frame(dt1_bytes)            # incoming reply or outgoing edit
+>>> state.get_value("ANALOG_SYNTH_COMMON", AnalogParam.LFO_RATE)
+>>> state.to_parameters("ANALOG_SYNTH_COMMON")     # {"TONE_NAME_1": 65, ...}
+>>> state.take_dirty("ANALOG_SYNTH_COMMON")        # [AnalogParam.LFO_RATE]
+>>> view = PatchStateView(state)                    # e.g. one per editor
+>>> view.take_changes("ANALOG_SYNTH_COMMON")      # {"LFO_RATE": 64}
+>>> state.diff(other_state)
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from decologr import Decologr as log
+
+from jdxi_editor.midi.data.address.address import (
+    CommandID,
+    JDXiSysExAddressStartMSB,
+    JDXiSysExOffsetDrumKitLMB,
+    JDXiSysExOffsetProgramLMB,
+    JDXiSysExOffsetSuperNATURALLMB,
+    JDXiSysExOffsetTemporaryToneUMB,
+)
+from jdxi_editor.midi.data.parameter.analog.address import AnalogParam
+from jdxi_editor.midi.data.parameter.arpeggio import ArpeggioParam
+from jdxi_editor.midi.data.parameter.digital.common import DigitalCommonParam
+from jdxi_editor.midi.data.parameter.digital.modify import DigitalModifyParam
+from jdxi_editor.midi.data.parameter.digital.partial import DigitalPartialParam
+from jdxi_editor.midi.data.parameter.drum.common import DrumCommonParam
+from jdxi_editor.midi.data.parameter.drum.partial import DrumPartialParam
+from jdxi_editor.midi.data.parameter.effects.effects import (
+    DelayParam,
+    Effect1Param,
+    Effect2Param,
+    ReverbParam,
+)
+from jdxi_editor.midi.data.parameter.program.common import ProgramCommonParam
+from jdxi_editor.midi.data.parameter.program.zone import ProgramZoneParam
+from jdxi_editor.midi.data.parameter.vocal_fx import VocalFXParam
+from jdxi_editor.midi.map.drum_tone import DRUM_TONE_MAP
+from jdxi_editor.midi.message.sysex.offset import JDXiSysExMessageLayout
+from jdxi_editor.midi.sysex.block import coalesce_dt1_writes
+from picomidi.sysex.parameter.address import AddressParameter
+
+Address = Tuple[int, int, int, int]
+
+DT1_DATA_OFFSET = (
+    JDXiSysExMessageLayout.ADDRESS.LSB + 1
+)  # first data byte of a DT1 frame
+DT1_TRAILER_LENGTH = 2  # checksum, F7
+NIBBLED_SIZE = 4
+
+
+def pack_address(address: Sequence[int]) -> int:
+    """
+    Pack 7-bit address bytes into one linear integer.
+
+    :param address: Sequence[int] most significant byte first
+    :return: int
+    """
+    result = 0
+    for value in address:
+        result = (result << 7) | (int(value) & 0x7F)
+    return result
+
+
+def unpack_address(value: int) -> Address:
+    """
+    Inverse of pack_address for a 4-byte address.
+
+    :param value: int linear address
+    :return: Address (msb, umb, lmb, lsb)
+    """
+    return (
+        (value >> 21) & 0x7F,
+        (value >> 14) & 0x7F,
+        (value >> 7) & 0x7F,
+        value & 0x7F,
+    )
+
+
+def linear_offset(offset: int) -> int:
+    """
+    Convert a parameter map offset to a linear offset.
+
+    Parameter maps write two-byte offsets as hex, e.g. ``0x13C`` for "01 3C".
+
+    :param offset: int offset as written in the parameter map
+    :return: int linear offset
+    """
+    return (offset >> 8) * 0x80 + (offset & 0xFF)
+
+
+def parameter_size(param: AddressParameter) -> int:
+    """
+    Number of data bytes of a parameter (1, or 4 for nibbled values).
+
+    :param param: AddressParameter
+    :return: int
+    """
+    get_nibbled_size = getattr(param, "get_nibbled_size", None)
+    return get_nibbled_size() if callable(get_nibbled_size) else 1
+
+
+@dataclass(frozen=True)
+class PatchAreaSpec:
+    """
+    One temporary area: where it lives, how big it is and which parameters it holds.
+
+    ``temporary_area`` and ``synth_tone`` are the names used in JSON patches.
+    """
+
+    name: str
+    address: Address
+    size: int  # data bytes, linear
+    param_class: type
+    temporary_area: str
+    synth_tone: str
+
+    @property
+    def start(self) -> int:
+        return pack_address(self.address)
+
+    @property
+    def end(self) -> int:
+        return self.start + self.size
+
+
+# --- Parameter index per parameter class: shared by areas with the same layout
+_PARAMETER_INDEX: Dict[
+    type, Tuple[Dict[int, AddressParameter], List[AddressParameter]]
+] = {}
+
+
+def parameter_index(
+    param_class: type,
+) -> Tuple[Dict[int, AddressParameter], List[AddressParameter]]:
+    """
+    Map every data byte offset to the parameter covering it.
+
+    Parameters whose address is already taken by an earlier member (aliases
+    such as DrumPartialParam.DRUM_PART) are left out.
+
+    :param param_class: type AddressParameter enum
+    :return: (offset -> parameter, parameters in address order)
+    """
+    cached = _PARAMETER_INDEX.get(param_class)
+    if cached is not None:
+        return cached
+    by_offset: Dict[int, AddressParameter] = {}
+    params: List[AddressParameter] = []
+    for param in param_class:
+        address = getattr(param, "address", None)
+        if not isinstance(address, int):
+            continue
+        start = linear_offset(address)
+        if start in by_offset:
+            continue
+        for offset in range(start, start + parameter_size(param)):
+            by_offset.setdefault(offset, param)
+        params.append(param)
+    params.sort(key=lambda p: linear_offset(p.address))
+    _PARAMETER_INDEX[param_class] = (by_offset, params)
+    return by_offset, params
+
+
+def _area_size(size: int, param_class: type) -> int:
+    """Requested size, or the parameter map's extent if that is larger."""
+    by_offset, _params = parameter_index(param_class)
+    return max(linear_offset(size), max(by_offset, default=-1) + 1)
+
+
+def _program_area(lmb, size: int, param_class: type, name: str) -> PatchAreaSpec:
+    return PatchAreaSpec(
+        name=f"PROGRAM_{name}",
+        address=(JDXiSysExAddressStartMSB.TEMPORARY_PROGRAM, 0x00, lmb, 0x00),
+        size=_area_size(size, param_class),
+        param_class=param_class,
+        temporary_area=JDXiSysExAddressStartMSB.TEMPORARY_PROGRAM.name,
+        synth_tone=name,
+    )
+
+
+def _tone_area(
+    umb, lmb, size: int, param_class: type, synth_tone: str
+) -> PatchAreaSpec:
+    prefix = umb.name
+    return PatchAreaSpec(
+        name=f"{prefix}_{synth_tone}",
+        address=(JDXiSysExAddressStartMSB.TEMPORARY_TONE, umb, lmb, 0x00),
+        size=_area_size(size, param_class),
+        param_class=param_class,
+        temporary_area=prefix,
+        synth_tone=synth_tone,
+    )
+
+
+def _build_patch_areas() -> Tuple[PatchAreaSpec, ...]:
+    """Sizes follow the RQ1 sizes in MidiRequests."""
+    lmb = JDXiSysExOffsetProgramLMB
+    areas = [
+        _program_area(lmb.COMMON, 0x40, ProgramCommonParam, "COMMON"),
+        _program_area(lmb.VOCAL_EFFECT, 0x18, VocalFXParam, "VOCAL_EFFECT"),
+        _program_area(lmb.EFFECT_1, 0x111, Effect1Param, "EFFECT_1"),
+        _program_area(lmb.EFFECT_2, 0x111, Effect2Param, "EFFECT_2"),
+        _program_area(lmb.DELAY, 0x64, DelayParam, "DELAY"),
+        _program_area(lmb.REVERB, 0x63, ReverbParam, "REVERB"),
+        _program_area(
+            lmb.ZONE_DIGITAL_SYNTH_1, 0x23, ProgramZoneParam, "ZONE_DIGITAL_SYNTH_1"
+        ),
+        _program_area(
+            lmb.ZONE_DIGITAL_SYNTH_2, 0x23, ProgramZoneParam, "ZONE_DIGITAL_SYNTH_2"
+        ),
+        _program_area(lmb.ZONE_ANALOG, 0x23, ProgramZoneParam, "ZONE_ANALOG"),
+        _program_area(lmb.ZONE_DRUM, 0x23, ProgramZoneParam, "ZONE_DRUM"),
+        _program_area(lmb.CONTROLLER, 0x0C, ArpeggioParam, "CONTROLLER"),
+    ]
+    supernatural = JDXiSysExOffsetSuperNATURALLMB
+    for umb in (
+        JDXiSysExOffsetTemporaryToneUMB.DIGITAL_SYNTH_1,
+        JDXiSysExOffsetTemporaryToneUMB.DIGITAL_SYNTH_2,
+    ):
+        areas.append(
+            _tone_area(umb, supernatural.COMMON, 0x40, DigitalCommonParam, "COMMON")
+        )
+        for partial in (
+            supernatural.PARTIAL_1,
+            supernatural.PARTIAL_2,
+            supernatural.PARTIAL_3,
+        ):
+            areas.append(
+                _tone_area(umb, partial, 0x40, DigitalPartialParam, partial.name)
+            )
+        areas.append(
+            _tone_area(umb, supernatural.MODIFY, 0x40, DigitalModifyParam, "MODIFY")
+        )
+    areas.append(
+        _tone_area(
+            JDXiSysExOffsetTemporaryToneUMB.ANALOG_SYNTH,
+            JDXiSysExOffsetProgramLMB.COMMON,
+            0x40,
+            AnalogParam,
+            "COMMON",
+        )
+    )
+    drum_kit = JDXiSysExOffsetTemporaryToneUMB.DRUM_KIT
+    areas.append(
+        _tone_area(
+            drum_kit, JDXiSysExOffsetDrumKitLMB.COMMON, 0x12, DrumCommonParam, "COMMON"
+        )
+    )
+    for partial_lmb, partial_name in sorted(DRUM_TONE_MAP.items()):
+        if partial_lmb == JDXiSysExOffsetDrumKitLMB.COMMON:
+            continue
+        areas.append(
+            _tone_area(drum_kit, partial_lmb, 0x143, DrumPartialParam, partial_name)
+        )
+    return tuple(areas)
+
+
+PATCH_AREAS: Tuple[PatchAreaSpec, ...] = _build_patch_areas()
+
+
+@dataclass
+class PatchArea:
+    """Data bytes of one area, which of them have been seen, and when they changed."""
+
+    spec: PatchAreaSpec
+    data: bytearray = field(default=None)
+    seen: bytearray = field(default=None)
+    # --- Write generation per byte; negative for local edits
+    changed_at: List[int] = field(default=None)
+
+    def __post_init__(self):
+        if self.data is None:
+            self.data = bytearray(self.spec.size)
+        if self.seen is None:
+            self.seen = bytearray(self.spec.size)
+        if self.changed_at is None:
+            self.changed_at = [0] * self.spec.size
+
+    def write(self, offset: int, values: Sequence[int], generation: int = 0) -> int:
+        """
+        Store data bytes at a linear offset within the area.
+
+        :param offset: int linear offset from the area start
+        :param values: Sequence[int] 7-bit data bytes
+        :param generation: int write generation stamped on the bytes that change,
+            negative for local edits
+        :return: int number of bytes whose value changed or was seen for the first time
+        """
+        changed = 0
+        data, seen, changed_at = self.data, self.seen, self.changed_at
+        for index, value in enumerate(values, start=offset):
+            value &= 0x7F
+            if not seen[index] or data[index] != value:
+                data[index] = value
+                seen[index] = 1
+                changed_at[index] = generation
+                changed += 1
+        return changed
+
+    def changed_since(self, generation: int) -> List[AddressParameter]:
+        """
+        Parameters with a byte changed by the synth after a write generation.
+
+        :param generation: int 0 for every parameter seen, local edits included
+        :return: List[AddressParameter] in address order
+        """
+        by_offset, _params = parameter_index(self.spec.param_class)
+        if generation:
+            offsets = [
+                i for i, stamp in enumerate(self.changed_at) if stamp > generation
+            ]
+        else:
+            offsets = [i for i, seen in enumerate(self.seen) if seen]
+        changed = {by_offset[offset] for offset in offsets if offset in by_offset}
+        return sorted(changed, key=lambda p: linear_offset(p.address))
+
+    def read(self, offset: int, size: int) -> Optional[bytes]:
+        """
+        :return: Optional[bytes] None unless every byte has been seen
+        """
+        if offset + size > self.spec.size or not all(self.seen[offset : offset + size]):
+            return None
+        return bytes(self.data[offset : offset + size])
+
+    @property
+    def complete(self) -> bool:
+        """Whether every parameter of the area has been seen."""
+        by_offset, _params = parameter_index(self.spec.param_class)
+        size = self.spec.size
+        return all(self.seen[offset] for offset in by_offset if offset < size)
+
+    @property
+    def any_seen(self) -> bool:
+        return any(self.seen)
+
+    def copy(self) -> "PatchArea":
+        return PatchArea(
+            spec=self.spec,
+            data=bytearray(self.data),
+            seen=bytearray(self.seen),
+            changed_at=list(self.changed_at),
+        )
+
+
+def decode_value(raw: bytes) -> int:
+    """
+    :param raw: bytes one data byte, or four nibbles (most significant first)
+    :return: int raw MIDI value
+    """
+    if len(raw) == NIBBLED_SIZE:
+        value = 0
+        for nibble in raw:
+            value = (value << 4) | (nibble & 0x0F)
+        return value
+    return raw[0]
+
+
+def encode_value(value: int, size: int) -> List[int]:
+    """
+    :param value: int raw MIDI value
+    :param size: int 1, or 4 for nibbled values
+    :return: List[int] data bytes
+    """
+    if size == NIBBLED_SIZE:
+        return [(value >> shift) & 0x0F for shift in (12, 8, 4, 0)]
+    return [value & 0x7F]
+
+
+class PatchState:
+    """
+    The temporary areas of the JD-Xi, updated from DT1 messages in either direction.
+
+    Writes may come from the MIDI decode worker (replies) and the Qt thread
+    (edits), so all access goes through one lock.
+
+    :param areas: Iterable[PatchAreaSpec] areas to model
+    """
+
+    def __init__(self, areas: Iterable[PatchAreaSpec] = PATCH_AREAS):
+        self._lock = threading.Lock()
+        self.areas: Dict[str, PatchArea] = {}
+        self._pages: Dict[Tuple[int, int, int], List[PatchArea]] = {}
+        self.generation = 0  # --- counts writes; stamps the bytes each one changed
+        self._set_areas([PatchArea(spec=spec) for spec in areas])
+        self._dirty_view = PatchStateView(self)
+
+    def _set_areas(self, areas: List[PatchArea]) -> None:
+        self.areas = {area.spec.name: area for area in areas}
+        # --- (msb, umb, lmb) page -> areas overlapping it, for O(1) address lookup
+        self._pages = {}
+        for area in areas:
+            for page in range(area.spec.start >> 7, ((area.spec.end - 1) >> 7) + 1):
+                self._pages.setdefault(unpack_address(page << 7)[:3], []).append(area)
+
+    def area_at(self, address: Sequence[int]) -> Optional[PatchArea]:
+        """
+        Find the area containing an address.
+
+        :param address: Sequence[int] (msb, umb, lmb, lsb)
+        :return: Optional[PatchArea]
+        """
+        position = pack_address(address)
+        for area in self._pages.get(tuple(int(b) for b in address[:3]), ()):
+            if area.spec.start <= position < area.spec.end:
+                return area
+        return None
+
+    def apply_dt1(
+        self, address: Sequence[int], data: Sequence[int], local: bool = False
+    ) -> int:
+        """
+        Write DT1 data bytes starting at an address; bytes outside any area are ignored.
+
+        :param address: Sequence[int] (msb, umb, lmb, lsb)
+        :param data: Sequence[int] data bytes
+        :param local: bool written here rather than received from the synth
+        :return: int number of bytes that changed
+        """
+        position = pack_address(address)
+        end = position + len(data)
+        changed = 0
+        with self._lock:
+            self.generation += 1
+            stamp = -self.generation if local else self.generation
+            while position < end:
+                area = self.area_at(unpack_address(position))
+                if area is None:
+                    position += 1
+                    continue
+                stop = min(end, area.spec.end)
+                offset = position - area.spec.start
+                start_index = len(data) - (end - position)
+                changed += area.write(
+                    offset,
+                    data[start_index : start_index + stop - position],
+                    stamp,
+                )
+                position = stop
+        return changed
+
+    def apply_sysex_frame(self, frame: Sequence[int], local: bool = False) -> int:
+        """
+        Apply a complete DT1 SysEx frame; other messages are ignored.
+
+        Suitable as a SysEx frame observer for incoming messages.
+
+        :param frame: Sequence[int] F0 ... F7
+        :param local: bool sent from here rather than received from the synth
+        :return: int number of bytes that changed
+        """
+        if (
+            len(frame) < DT1_DATA_OFFSET + DT1_TRAILER_LENGTH
+            or frame[JDXiSysExMessageLayout.COMMAND_ID] != CommandID.DT1
+        ):
+            return 0
+        return self.apply_dt1(
+            frame[JDXiSysExMessageLayout.ADDRESS.MSB : DT1_DATA_OFFSET],
+            frame[DT1_DATA_OFFSET:-DT1_TRAILER_LENGTH],
+            local,
+        )
+
+    def apply_sent_sysex_frame(self, frame: Sequence[int]) -> int:
+        """
+        Apply a DT1 SysEx frame sent to the synth; an observer for outgoing messages.
+
+        :param frame: Sequence[int] F0 ... F7
+        :return: int number of bytes that changed
+        """
+        return self.apply_sysex_frame(frame, local=True)
+
+    def get_value(self, area_name: str, param: AddressParameter) -> Optional[int]:
+        """
+        Raw MIDI value of a parameter.
+
+        :param area_name: str e.g. "DIGITAL_SYNTH_1_PARTIAL_2"
+        :param param: AddressParameter
+        :return: Optional[int] None if not seen yet
+        """
+        area = self.areas[area_name]
+        with self._lock:
+            raw = area.read(linear_offset(param.address), parameter_size(param))
+        return None if raw is None else decode_value(raw)
+
+    def set_value(self, area_name: str, param: AddressParameter, value: int) -> bool:
+        """
+        Store a raw MIDI value, e.g. for an edit made without sending it.
+
+        :param area_name: str
+        :param param: AddressParameter
+        :param value: int raw MIDI value
+        :return: bool whether the value changed
+        """
+        area = self.areas[area_name]
+        with self._lock:
+            self.generation += 1
+            return bool(
+                area.write(
+                    linear_offset(param.address),
+                    encode_value(int(value), parameter_size(param)),
+                    -self.generation,
+                )
+            )
+
+    def to_parameters(self, area_name: str, raw: bool = False) -> Dict[str, int]:
+        """
+        Values of the parameters seen in an area, keyed by parameter name.
+
+        :param area_name: str
+        :param raw: bool keep raw MIDI values instead of converting to display values
+        :return: Dict[str, int]
+        """
+        area = self.areas[area_name]
+        _by_offset, params = parameter_index(area.spec.param_class)
+        values: Dict[str, int] = {}
+        with self._lock:
+            for param in params:
+                data = area.read(linear_offset(param.address), parameter_size(param))
+                if data is None:
+                    continue
+                value = decode_value(data)
+                convert_from_midi = getattr(param, "convert_from_midi", None)
+                if not raw and callable(convert_from_midi):
+                    try:
+                        value = convert_from_midi(value)
+                    except Exception as ex:
+                        log.warning(
+                            f"Keeping raw value of {param.name}: {ex}",
+                            scope=self.__class__.__name__,
+                        )
+                values[param.name] = value
+        return values
+
+    def take_dirty(self, area_name: str) -> List[AddressParameter]:
+        """
+        Parameters of an area the synth changed since the last call.
+
+        Views that must not share this record use their own ``PatchStateView``.
+
+        :param area_name: str
+        :return: List[AddressParameter] in address order
+        """
+        return self._dirty_view.take_dirty(area_name)
+
+    def changed_since(
+        self, area_name: str, generation: int
+    ) -> Tuple[List[AddressParameter], int]:
+        """
+        Parameters of an area the synth changed after a write generation.
+
+        :param area_name: str
+        :param generation: int 0 for every parameter seen, local edits included
+        :return: (parameters in address order, current generation)
+        """
+        area = self.areas[area_name]
+        with self._lock:
+            return area.changed_since(generation), self.generation
+
+    def complete_areas(self) -> List[str]:
+        """Names of areas whose parameters have all been seen."""
+        with self._lock:
+            return [name for name, area in self.areas.items() if area.complete]
+
+    def covers(self, prefix: Sequence[int]) -> bool:
+        """
+        Whether the areas under an address prefix that have been seen are all complete.
+
+        :param prefix: Sequence[int] e.g. (msb, umb) of an editor
+        :return: bool False if nothing under the prefix has been seen
+        """
+        prefix = tuple(int(b) for b in prefix)
+        with self._lock:
+            seen = [
+                area
+                for area in self.areas.values()
+                if area.spec.address[: len(prefix)] == prefix and area.any_seen
+            ]
+            return bool(seen) and all(area.complete for area in seen)
+
+    def to_dt1_blocks(
+        self, area_names: Optional[Iterable[str]] = None
+    ) -> List[Tuple[Address, List[int]]]:
+        """
+        Seen data as contiguous DT1 blocks, e.g. to export or resend a patch.
+
+        :param area_names: Optional[Iterable[str]] defaults to every area
+        :return: List of ((msb, umb, lmb, lsb), data bytes)
+        """
+        writes = []
+        with self._lock:
+            for name in area_names or self.areas:
+                area = self.areas[name]
+                start = area.spec.start
+                for offset in range(area.spec.size):
+                    if area.seen[offset]:
+                        writes.append(
+                            (unpack_address(start + offset), [area.data[offset]])
+                        )
+        return coalesce_dt1_writes(writes)
+
+    def copy(self) -> "PatchState":
+        """Independent snapshot, e.g. to diff against later."""
+        snapshot = PatchState(areas=())
+        with self._lock:
+            snapshot._set_areas([area.copy() for area in self.areas.values()])
+            snapshot.generation = self.generation
+        return snapshot
+
+    def diff(
+        self, other: "PatchState"
+    ) -> Dict[str, Dict[str, Tuple[Optional[int], Optional[int]]]]:
+        """
+        Parameters whose raw values differ between two states.
+
+        :param other: PatchState
+        :return: {area name: {parameter name: (this value, other value)}}
+        """
+        result: Dict[str, Dict[str, Tuple[Optional[int], Optional[int]]]] = {}
+        for name in self.areas:
+            if name not in other.areas:
+                continue
+            mine = self.to_parameters(name, raw=True)
+            theirs = other.to_parameters(name, raw=True)
+            changes = {
+                param: (mine.get(param), theirs.get(param))
+                for param in mine.keys() | theirs.keys()
+                if mine.get(param) != theirs.get(param)
+            }
+            if changes:
+                result[name] = changes
+        return result
+
+
+class PatchStateView:
+    """
+    One consumer's view of a PatchState, e.g. an editor's controls.
+
+    Each view remembers the write generation it has caught up to per area, so
+    several editors subscribed to the same area each see every change once.
+
+    :param state: PatchState
+    """
+
+    def __init__(self, state: PatchState):
+        self.state = state
+        self._generations: Dict[str, int] = {}
+
+    def area_at(self, address: Sequence[int]) -> Optional[PatchArea]:
+        """
+        :param address: Sequence[int] (msb, umb, lmb, lsb)
+        :return: Optional[PatchArea] the state's area containing the address
+        """
+        return self.state.area_at(address)
+
+    def take_dirty(self, area_name: str) -> List[AddressParameter]:
+        """
+        Parameters of an area the synth changed since this view last looked.
+
+        :param area_name: str
+        :return: List[AddressParameter] in address order; every parameter seen
+            the first time, or after invalidate()
+        """
+        changed, generation = self.state.changed_since(
+            area_name, self._generations.get(area_name, 0)
+        )
+        self._generations[area_name] = generation
+        return changed
+
+    def take_changes(self, area_name: str) -> Dict[str, int]:
+        """
+        Raw MIDI values of the parameters returned by take_dirty.
+
+        :param area_name: str
+        :return: Dict[str, int] parameter name -> value, as in incoming SysEx data
+        """
+        values = {}
+        for param in self.take_dirty(area_name):
+            value = self.state.get_value(area_name, param)
+            if value is not None:
+                values[param.name] = value
+        return values
+
+    def invalidate(self) -> None:
+        """Report every seen parameter again, e.g. after an explicit data request."""
+        self._generations.clear()
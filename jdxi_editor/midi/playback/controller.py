@@ -1,9 +1,9 @@
 """
 Pattern Playback Controller Module
 
-Manages MIDI pattern playback using the PlaybackEngine. Handles:
+Manages MIDI pattern playback on a RealtimePlaybackScheduler thread. Handles:
 - Starting/stopping/pausing playback
-- Building MIDI files from patterns
+- Compiling the pattern to a playback timeline (PatternTimeline)
 - UI synchronization during playback
 - Muting/unmuting channels
 - Shuffle play functionality
@@ -13,19 +13,17 @@ import random
 from typing import Any, Callable, Dict, List, Optional
 
 from decologr import Decologr as log
-from mido import Message, MetaMessage, MidiFile, MidiTrack, bpm2tempo
+from mido import Message, MidiFile, bpm2tempo
 from PySide6.QtCore import QObject, Qt, QTimer
 
-from picomidi.core.tempo import bpm_to_ticks
-from picomidi.message.type import MidoMetaMessageType
-from picomidi.messages.note import build_midi_note, note_off, note_on
-from picomidi.playback.engine import (
-    PlaybackEngine,
-    TransportState,
+from jdxi_editor.globals import send_midi_clock
+from jdxi_editor.midi.io.clock import MidiClockMaster
+from jdxi_editor.midi.playback.pattern_timeline import PatternTimeline
+from jdxi_editor.midi.playback.realtime import (
+    PlaybackTimeline,
+    RealtimePlaybackScheduler,
 )
-from picomidi.playback.worker import MidiPlaybackWorker
-from picomidi.sequencer.event import SequencerEvent
-from picomidi.ui.widget.button.note import NoteButtonEvent
+from picomidi.playback.engine import PlaybackEngine
 
 
 class PlaybackConfig:
@@ -81,7 +79,7 @@ class PatternPlaybackController(QObject):
     Controls pattern playback and synchronization.
 
     Manages:
-    - PlaybackEngine operation
+    - The playback scheduler thread, which sends the MIDI messages
     - UI updates during playback (bar/step highlighting)
     - Muting/unmuting channels
     - Pause/resume functionality
@@ -119,10 +117,16 @@ class PatternPlaybackController(QObject):
         # Mute state
         self.muted_channels: List[int] = []
 
-        # Timer for driving playback
-        self.timer: Optional[QTimer] = None
+        # Pattern notes, patched per step and compiled for the scheduler
+        self.pattern_timeline = PatternTimeline(
+            ticks_per_beat=self.config.ticks_per_beat,
+            steps_per_bar=min(self.config.measure_beats, 16),
+        )
 
-        self.worker = MidiPlaybackWorker(parent=self)
+        # Timer for UI updates; messages are sent by the scheduler thread
+        self.timer: Optional[QTimer] = None
+        self.scheduler: Optional[RealtimePlaybackScheduler] = None
+        self.clock_master: Optional[MidiClockMaster] = None
 
         # Callbacks for UI updates
         self.on_playback_started: Optional[Callable[[], None]] = None
@@ -135,6 +139,9 @@ class PatternPlaybackController(QObject):
 
         # Callback for MIDI event sending
         self.on_midi_event: Optional[Callable[[Message], Any]] = None
+        # Callback for MIDI clock and transport bytes; when set, and MIDI clock is
+        # enabled in the preferences, a clock follows playback
+        self.on_clock_message: Optional[Callable[[bytes], Any]] = None
 
     def start_playback(
         self,
@@ -167,44 +174,23 @@ class PatternPlaybackController(QObject):
             if bpm is not None:
                 self.current_bpm = bpm
 
-            # Build MIDI file from measures
-            midi_file = self._build_midi_file_for_playback(measures)
+            # Read the measures once; later edits go through update_step
+            self._load_pattern_timeline(measures)
 
             # Check if there are any notes to play
-            if len(midi_file.tracks[0]) <= 1:
+            if self.pattern_timeline.note_count == 0:
                 log.message(
                     message="Pattern has no notes to play",
                     scope=self.scope,
                 )
                 return False
 
-            # Configure and start engine
-            self.playback_engine.load_file(midi_file)
-
-            # Apply mute state
-            for channel in range(16):
-                self.playback_engine.mute_channel(
-                    channel, channel in self.muted_channels
-                )
-
-            # Set MIDI event callback
-            if self.on_midi_event:
-                self.playback_engine.on_event = lambda msg: self.on_midi_event(msg)
-
-            # Start engine
-            self.playback_engine.start(0)
-
-            # Setup worker for MIDI playback (drives engine.process_until_now)
-            self.worker.setup(
-                buffered_msgs=[],
-                midi_out_port=None,
-                ticks_per_beat=midi_file.ticks_per_beat,
-                play_program_changes=True,
-                start_time=None,
-                initial_tempo=bpm2tempo(self.current_bpm),
-                playback_engine=self.playback_engine,
+            # Keep the engine loaded for get_engine() callers
+            self.playback_engine.load_file(
+                self.pattern_timeline.to_midi_file(self.current_bpm)
             )
-            self.worker.finished.connect(self._on_worker_finished)
+
+            self._start_scheduler(self._compile_timeline(), 0)
 
             # Initialize position tracking
             self.current_position = PlaybackPosition()
@@ -239,10 +225,41 @@ class PatternPlaybackController(QObject):
             )
             return False
 
-    def _on_worker_finished(self) -> None:
-        """Handle worker.finished when engine stops playing."""
-        if self.is_playing:
-            self.stop_playback()
+    def _start_scheduler(self, timeline: PlaybackTimeline, start_tick: int) -> None:
+        """
+        Start a scheduler thread playing timeline, replacing any previous one.
+
+        :param timeline: PlaybackTimeline compiled from the pattern
+        :param start_tick: int absolute tick to start from
+        """
+        self._stop_scheduler()
+        self.scheduler = RealtimePlaybackScheduler(
+            timeline,
+            on_event=self._send_midi_event,
+        )
+        for channel in self.muted_channels:
+            self.scheduler.mute_channel(channel)
+        self.scheduler.play(start_tick)
+        if self.on_clock_message and send_midi_clock():
+            self.clock_master = MidiClockMaster(
+                send=self.on_clock_message,
+                tempo_map=self.scheduler.timeline.tempo_map,
+            )
+            self.clock_master.play(start_tick)
+
+    def _stop_scheduler(self) -> None:
+        """Stop the scheduler and clock threads, if any."""
+        if self.scheduler is not None:
+            self.scheduler.stop()
+            self.scheduler = None
+        if self.clock_master is not None:
+            self.clock_master.stop()
+            self.clock_master = None
+
+    def _send_midi_event(self, msg: Message) -> None:
+        """Forward a message to on_midi_event (scheduler thread)."""
+        if self.on_midi_event:
+            self.on_midi_event(msg)
 
     def stop_playback(self) -> None:
         """Stop pattern playback."""
@@ -250,12 +267,8 @@ class PatternPlaybackController(QObject):
             return
 
         try:
-            self.worker.stop()
+            self._stop_scheduler()
             self.playback_engine.stop()
-            try:
-                self.worker.finished.disconnect(self._on_worker_finished)
-            except (TypeError, RuntimeError):
-                pass
 
             # Stop timer
             self._stop_timer()
@@ -287,6 +300,10 @@ class PatternPlaybackController(QObject):
         try:
             if self.timer:
                 self.timer.stop()
+            if self.scheduler is not None:
+                self.scheduler.pause()
+            if self.clock_master is not None:
+                self.clock_master.pause()
             self.is_paused = True
 
             log.message(
@@ -309,6 +326,10 @@ class PatternPlaybackController(QObject):
             return
 
         try:
+            if self.scheduler is not None:
+                self.scheduler.resume()
+            if self.clock_master is not None:
+                self.clock_master.resume()
             if self.timer:
                 self._update_timer_interval()
                 self.timer.start()
@@ -399,9 +420,9 @@ class PatternPlaybackController(QObject):
                     scope=self.scope,
                 )
 
-        # Update engine if playing
-        if self.is_playing:
-            self.playback_engine.mute_channel(channel, mute)
+        # Update the scheduler if playing; applied from the next message sent
+        if self.is_playing and self.scheduler is not None:
+            self.scheduler.mute_channel(channel, mute)
 
     def mute_row(self, row: int, mute: bool = True) -> None:
         """
@@ -445,7 +466,7 @@ class PatternPlaybackController(QObject):
         """
         Process a playback timer tick.
 
-        Called by timer. Updates engine and returns current position.
+        Called by timer. Reads the scheduler's position and returns it.
 
         :param total_steps: Total steps in pattern (bars * steps_per_bar)
         :return: Updated PlaybackPosition or None if playback has stopped
@@ -454,11 +475,8 @@ class PatternPlaybackController(QObject):
             return None
 
         try:
-            # Drive engine via worker (same pattern as MIDI file editor)
-            self.worker.do_work()
-
-            # Calculate current position from engine state
-            tick = self._get_engine_tick()
+            # Calculate current position from the scheduler's clock
+            tick = self._get_scheduler_tick()
             ticks_per_step = self.config.ticks_per_beat // 4  # 16th notes
             global_step = (
                 (tick // ticks_per_step) % total_steps if total_steps > 0 else 0
@@ -482,8 +500,8 @@ class PatternPlaybackController(QObject):
             if self.on_position_changed:
                 self.on_position_changed(self.current_position)
 
-            # Check if engine has finished
-            if self.playback_engine.state == TransportState.STOPPED:
+            # Check if the scheduler has stopped; a looping one plays until stopped
+            if self.scheduler is None or self.scheduler.finished.is_set():
                 self.stop_playback()
                 return None
 
@@ -536,25 +554,24 @@ class PatternPlaybackController(QObject):
 
     def reload_playback_with_tempo(self, measures: List, bpm: int) -> bool:
         """
-        Rebuild MIDI with new tempo and resume from current position.
+        Retime playback to a new tempo from the current position.
         Call when tempo changes during playback.
 
-        :param measures: Current pattern measures
+        The compiled pattern is only retimed; the measures are not read again
+        (edits reach the timeline through update_step).
+
+        :param measures: Current pattern measures (kept for compatibility)
         :param bpm: New tempo in BPM
         :return: True if reload succeeded
         """
-        if not self.is_playing or self.is_paused:
+        if not self.is_playing or self.is_paused or self.scheduler is None:
             return False
         try:
-            tick = self._get_engine_tick()
             self.current_bpm = max(20, min(300, bpm))
-            midi_file = self._build_midi_file_for_playback(measures)
-            self.playback_engine.load_file(midi_file)
-            for ch in range(16):
-                self.playback_engine.mute_channel(ch, ch in self.muted_channels)
-            if self.on_midi_event:
-                self.playback_engine.on_event = lambda m: self.on_midi_event(m)
-            self.playback_engine.start(tick)
+            timeline = self._compile_timeline()
+            self.scheduler.queue_timeline(timeline, immediate=True)
+            if self.clock_master is not None:
+                self.clock_master.set_tempo_map(timeline.tempo_map)
             return True
         except Exception as ex:
             log.error(
@@ -567,143 +584,54 @@ class PatternPlaybackController(QObject):
         """Get current playback tempo."""
         return self.current_bpm
 
-    def _build_midi_file_for_playback(self, measures: List) -> MidiFile:
+    def update_step(self, bar_index: int, row: int, step: int, button: Any) -> None:
         """
-        Build a MIDI file from the pattern for playback.
+        Patch one step of the compiled pattern after its button changed.
 
-        :param measures: List of PatternMeasure objects
-        :return: MidiFile ready for playback
+        While playing, the scheduler takes up the patched pattern at the next
+        loop boundary; the rest of the pattern is not rebuilt.
+
+        :param bar_index: int
+        :param row: int 0-3
+        :param step: int 0-15
+        :param button: SequencerButton that changed
         """
-        midi_file = MidiFile(
-            type=1,
-            ticks_per_beat=self.config.ticks_per_beat,
+        checked = button.isChecked()
+        self.pattern_timeline.set_button(
+            bar_index,
+            row,
+            step,
+            checked,
+            self._get_button_note_spec(button) if checked else None,
         )
-        track = MidiTrack()
-        midi_file.tracks.append(track)
-
-        # Add tempo (use mido.bpm2tempo to match Playback Worker / MIDI editor)
-        tempo_us = bpm2tempo(self.current_bpm)
-        track.append(
-            MetaMessage(
-                MidoMetaMessageType.SET_TEMPO.value,
-                tempo=tempo_us,
-                time=0,
-            )
-        )
-
-        # Collect all events
-        events: List[SequencerEvent] = self._collect_sequencer_events(measures)
+        if self.is_playing and self.scheduler is not None:
+            self.scheduler.queue_timeline(self._compile_timeline())
 
-        if not events:
-            return midi_file
+    def _compile_timeline(self) -> PlaybackTimeline:
+        """Looping playback timeline of the pattern at the current tempo."""
+        return self.pattern_timeline.compile(self.current_bpm, loop=True)
 
-        # Convert events to MIDI messages with absolute timing
-        midi_events = []
-
-        for e in events:
-            note = build_midi_note(event=e, channel=e.channel, bpm=self.current_bpm)
-            midi_events.extend(
-                [
-                    (e.tick, note_on(note)),
-                    (e.tick + e.duration_ticks, note_off(note)),
-                ]
-            )
-
-        # Sort by tick and convert to relative time
-        midi_events.sort(key=lambda x: x[0])
-
-        prev_tick = 0
-        for tick, msg in midi_events:
-            msg.time = tick - prev_tick
-            track.append(msg)
-            prev_tick = tick
-
-        return midi_file
-
-    def _collect_sequencer_events(self, measures: List) -> List[SequencerEvent]:
+    def _load_pattern_timeline(self, measures: List) -> None:
         """
-        Collect all note events from measures.
+        Read all measures into the pattern timeline.
 
         :param measures: List of PatternMeasure objects
-        :return: List of SequencerEvent objects
         """
-        ticks_per_step = self.config.ticks_per_beat // 4
-        events: List[SequencerEvent] = []
-
-        for bar_index, measure in enumerate(measures):
-            for step in range(min(self.config.measure_beats, 16)):
-                # Skip if step is beyond measure buttons
-                tick = (bar_index * self.config.measure_beats + step) * ticks_per_step
-
-                for row in range(4):
-                    # Skip if row is muted
-                    channel = row if row < 3 else 9
-                    if channel in self.muted_channels:
-                        continue
-
-                    # Skip if step is beyond buttons in row
-                    if step >= len(measure.buttons[row]):
-                        continue
-
-                    button = measure.buttons[row][step]
-
-                    # Skip unchecked buttons
-                    if not button.isChecked():
-                        continue
-
-                    # Get note spec
-                    spec = self._get_button_note_spec(button)
-                    if not spec or not spec.is_active:
-                        continue
-
-                    # Validate velocity
-                    velocity = max(0, min(127, spec.velocity))
-
-                    # Calculate duration
-                    duration_ticks = (
-                        self._ms_to_ticks(spec.duration_ms) or ticks_per_step
-                    )
-
-                    events.append(
-                        self._sequencer_event(
-                            channel, duration_ticks, spec, tick, velocity
-                        )
-                    )
-
-        return events
-
-    def _sequencer_event(
-        self,
-        channel: int,
-        duration_ticks: int,
-        spec: NoteButtonEvent,
-        tick: int,
-        velocity: int,
-    ) -> SequencerEvent:
-        """add sequencer event"""
-        return SequencerEvent(
-            tick=tick,
-            note=spec.note,
-            velocity=velocity,
-            channel=channel,
-            duration_ticks=duration_ticks,
+        self.pattern_timeline.load_measures(
+            measures,
+            note_spec=self._get_button_note_spec,
+            steps_per_bar=min(self.config.measure_beats, 16),
         )
 
-    def _ms_to_ticks(self, duration_ms: float) -> int:
+    def _build_midi_file_for_playback(self, measures: List) -> MidiFile:
         """
-        Convert milliseconds to MIDI ticks.
-
-        Formula: ticks = (duration_ms / 1000) * (bpm / 60) * ticks_per_beat
+        Build a MIDI file from the pattern for playback.
 
-        :param duration_ms: Duration in milliseconds
-        :return: Duration in MIDI ticks
+        :param measures: List of PatternMeasure objects
+        :return: MidiFile ready for playback
         """
-        if duration_ms <= 0:
-            return 0
-        bpm = self.current_bpm
-        ticks_per_beat = self.config.ticks_per_beat
-        ticks = bpm_to_ticks(bpm, duration_ms, ticks_per_beat)
-        return max(1, int(ticks))
+        self._load_pattern_timeline(measures)
+        return self.pattern_timeline.to_midi_file(self.current_bpm)
 
     def _get_button_note_spec(self, button):
         """
@@ -716,22 +644,15 @@ class PatternPlaybackController(QObject):
 
         return get_button_note_spec(button)
 
-    def _get_engine_tick(self) -> int:
+    def _get_scheduler_tick(self) -> int:
         """
-        Get the current tick position from the playback engine.
+        Get the current tick position from the playback scheduler.
 
         :return: Absolute tick position
         """
-        try:
-            if self.playback_engine.events:
-                idx = self.playback_engine.event_index
-                if idx > 0 and idx <= len(self.playback_engine.events):
-                    return self.playback_engine.events[idx - 1].absolute_tick
-                else:
-                    return self.playback_engine.start_tick
-            return 0
-        except Exception:
+        if self.scheduler is None:
             return 0
+        return self.scheduler.current_tick()
 
     def _start_timer(self) -> None:
         """Start the playback timer."""
@@ -0,0 +1,325 @@
+"""
+Compiled Pattern Timeline
+=========================
+
+The pattern sequencer's notes as arrays, compiled to a ``PlaybackTimeline``
+without walking the step buttons.
+
+Playback used to build a ``MidiFile`` from the widgets every time it started,
+looped or the tempo changed: every bar × step × row button was asked
+``isChecked()`` and its note spec, events were sorted into a track and the
+file was indexed again. The pattern is now kept as one slot per
+``(bar, row, step)``:
+
+- ``active``, ``notes``, ``velocities`` and ``durations_ms`` hold the step
+  data; a step toggle or a note edit patches one slot (``set_step``).
+- Each slot's note-on / note-off messages are built once and cached until the
+  slot changes.
+- ``compile(bpm)`` finds the active slots, converts step positions and
+  durations to ticks and ticks to seconds with numpy, and orders the cached
+  messages. A tempo change is only a new ``compile``; no message is rebuilt.
+
+A looping compile wraps note-offs that fall past the end of the pattern to the
+start, so a scheduler playing the timeline round and round
+(``RealtimePlaybackScheduler`` with ``loop_ticks``) releases every note.
+
+Classes:
+    PatternTimeline: Slot arrays with cached messages.
+
+Example usage:
+--------------
+>>> timeline = PatternTimeline(bars=2)
+>>> timeline.set_step(0, 3, 4, note=36, velocity=100, duration_ms=120)
+>>> playback = timeline.compile(bpm=120)          # PlaybackTimeline, loops
+>>> scheduler = RealtimePlaybackScheduler(playback, on_event=send)
+>>> timeline.clear_step(0, 3, 4)
+>>> scheduler.queue_timeline(timeline.compile(bpm=120))   # next loop
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from mido import Message, MetaMessage, MidiFile, MidiTrack, bpm2tempo
+
+from jdxi_editor.midi.file.model import TempoMap
+from jdxi_editor.midi.playback.realtime import PlaybackTimeline
+
+PATTERN_ROW_CHANNELS = (0, 1, 2, 9)  # Digital 1, Digital 2, Analog, Drums
+PATTERN_MAX_STEPS = 16
+STEPS_PER_BEAT = 4  # sixteenth-note steps
+MILLISECONDS_PER_MINUTE = 60000
+
+
+class PatternTimeline:
+    """
+    Pattern steps in ``(bar, row, step)`` arrays, compiled to playback timelines.
+
+    :param bars: int number of bars
+    :param steps_per_bar: int steps played per bar (16 in 4/4, 12 in 3/4)
+    :param ticks_per_beat: int
+    :param row_channels: Tuple[int, ...] MIDI channel of each row
+    """
+
+    def __init__(
+        self,
+        bars: int = 1,
+        steps_per_bar: int = PATTERN_MAX_STEPS,
+        ticks_per_beat: int = 480,
+        row_channels: Tuple[int, ...] = PATTERN_ROW_CHANNELS,
+    ):
+        self.ticks_per_beat = ticks_per_beat
+        self.row_channels = tuple(row_channels)
+        self.steps_per_bar = steps_per_bar
+        shape = (max(0, bars), len(self.row_channels), PATTERN_MAX_STEPS)
+        self.active = np.zeros(shape, dtype=bool)
+        self.notes = np.zeros(shape, dtype=np.int16)
+        self.velocities = np.zeros(shape, dtype=np.int16)
+        self.durations_ms = np.zeros(shape, dtype=np.float64)
+        self._messages: Dict[Tuple[int, int, int], Tuple[Message, Message]] = {}
+        self.revision = 0  # bumped by every change
+
+    @property
+    def bars(self) -> int:
+        return self.active.shape[0]
+
+    @property
+    def ticks_per_step(self) -> int:
+        return self.ticks_per_beat // STEPS_PER_BEAT
+
+    @property
+    def length_ticks(self) -> int:
+        """Length of the pattern; one loop."""
+        return self.bars * self.steps_per_bar * self.ticks_per_step
+
+    @property
+    def note_count(self) -> int:
+        return int(np.count_nonzero(self.active[:, :, : self.steps_per_bar]))
+
+    # --- Editing
+
+    def resize(self, bars: int) -> None:
+        """
+        Add empty bars or drop bars from the end.
+
+        :param bars: int
+        """
+        bars = max(0, bars)
+        if bars == self.bars:
+            return
+        keep = min(bars, self.bars)
+        for name in ("active", "notes", "velocities", "durations_ms"):
+            old = getattr(self, name)
+            new = np.zeros((bars,) + old.shape[1:], dtype=old.dtype)
+            new[:keep] = old[:keep]
+            setattr(self, name, new)
+        self._messages = {
+            slot: messages
+            for slot, messages in self._messages.items()
+            if slot[0] < bars
+        }
+        self.revision += 1
+
+    def set_steps_per_bar(self, steps_per_bar: int) -> None:
+        """
+        :param steps_per_bar: int 1-16
+        """
+        steps_per_bar = max(1, min(PATTERN_MAX_STEPS, steps_per_bar))
+        if steps_per_bar != self.steps_per_bar:
+            self.steps_per_bar = steps_per_bar
+            self.revision += 1
+
+    def set_step(
+        self,
+        bar: int,
+        row: int,
+        step: int,
+        note: int,
+        velocity: int = 100,
+        duration_ms: float = 0.0,
+    ) -> None:
+        """
+        Put a note on a step, replacing whatever was there.
+
+        :param bar: int
+        :param row: int
+        :param step: int
+        :param note: int MIDI note
+        :param velocity: int (clamped to 0-127)
+        :param duration_ms: float; 0 plays for one step
+        """
+        slot = (bar, row, step)
+        velocity = max(0, min(127, int(velocity)))
+        if (
+            self.active[slot]
+            and self.notes[slot] == note
+            and self.velocities[slot] == velocity
+            and self.durations_ms[slot] == duration_ms
+        ):
+            return
+        self.active[slot] = True
+        self.notes[slot] = note
+        self.velocities[slot] = velocity
+        self.durations_ms[slot] = duration_ms
+        self._messages.pop(slot, None)
+        self.revision += 1
+
+    def clear_step(self, bar: int, row: int, step: int) -> None:
+        """
+        :param bar: int
+        :param row: int
+        :param step: int
+        """
+        slot = (bar, row, step)
+        if self.active[slot]:
+            self.active[slot] = False
+            self._messages.pop(slot, None)
+            self.revision += 1
+
+    def set_button(
+        self, bar: int, row: int, step: int, checked: bool, spec: Any
+    ) -> None:
+        """
+        Update a step from a sequencer button's state.
+
+        :param bar: int
+        :param row: int
+        :param step: int
+        :param checked: bool whether the button is checked
+        :param spec: Optional[NoteButtonEvent] the button's note spec
+        """
+        if checked and spec is not None and spec.is_active:
+            self.set_step(
+                bar, row, step, spec.note, spec.velocity, float(spec.duration_ms or 0)
+            )
+        else:
+            self.clear_step(bar, row, step)
+
+    def load_measures(
+        self,
+        measures: Iterable[Any],
+        note_spec: Callable[[Any], Any],
+        steps_per_bar: Optional[int] = None,
+    ) -> None:
+        """
+        Read every step from measure widgets (``measure.buttons[row][step]``).
+
+        Used when a pattern is loaded or edited in bulk; single steps go
+        through set_button.
+
+        :param measures: Iterable of measures with a buttons[row][step] grid
+        :param note_spec: Callable[[button], NoteButtonEvent] reads a button's spec
+        :param steps_per_bar: Optional[int] steps played per bar
+        """
+        measures = list(measures)
+        self.resize(len(measures))
+        if steps_per_bar is not None:
+            self.set_steps_per_bar(steps_per_bar)
+        for bar, measure in enumerate(measures):
+            for row in range(len(self.row_channels)):
+                buttons = measure.buttons[row]
+                for step in range(min(len(buttons), PATTERN_MAX_STEPS)):
+                    button = buttons[step]
+                    checked = button.isChecked()
+                    self.set_button(
+                        bar, row, step, checked, note_spec(button) if checked else None
+                    )
+
+    # --- Compiling
+
+    def _slot_messages(self, bar: int, row: int, step: int) -> Tuple[Message, Message]:
+        slot = (bar, row, step)
+        messages = self._messages.get(slot)
+        if messages is None:
+            channel = self.row_channels[row]
+            note = int(self.notes[slot])
+            messages = (
+                Message(
+                    "note_on",
+                    channel=channel,
+                    note=note,
+                    velocity=int(self.velocities[slot]),
+                ),
+                Message("note_off", channel=channel, note=note),
+            )
+            self._messages[slot] = messages
+        return messages
+
+    def tempo_map(self, bpm: float) -> TempoMap:
+        """
+        :param bpm: float
+        :return: TempoMap with a single tempo
+        """
+        return TempoMap.build(self.ticks_per_beat, (), default_tempo=bpm2tempo(bpm))
+
+    def _note_ticks(self, bpm: float) -> Tuple[np.ndarray, ...]:
+        """Active slots with their note-on and note-off ticks."""
+        bars, rows, steps = np.nonzero(self.active[:, :, : self.steps_per_bar])
+        ticks_per_step = self.ticks_per_step
+        on_ticks = (bars * self.steps_per_bar + steps).astype(np.int64) * ticks_per_step
+        # --- Durations are in milliseconds, so their length in ticks follows the tempo
+        durations = np.floor(
+            self.durations_ms[bars, rows, steps]
+            * bpm
+            * self.ticks_per_beat
+            / MILLISECONDS_PER_MINUTE
+        ).astype(np.int64)
+        durations = np.where(
+            self.durations_ms[bars, rows, steps] > 0,
+            np.maximum(durations, 1),
+            ticks_per_step,
+        )
+        return bars, rows, steps, on_ticks, on_ticks + durations
+
+    def compile(self, bpm: float, loop: bool = True) -> PlaybackTimeline:
+        """
+        Playback timeline of the pattern at a tempo.
+
+        Note-offs sort before note-ons at the same tick, so a repeated note is
+        released before it sounds again.
+
+        :param bpm: float
+        :param loop: bool wrap note-offs past the end to the start and set loop_ticks
+        :return: PlaybackTimeline
+        """
+        bars, rows, steps, on_ticks, off_ticks = self._note_ticks(bpm)
+        length = self.length_ticks
+        if loop and length > 0:
+            # --- A note is at most one loop long; its note-off wraps to the start
+            off_ticks = np.minimum(off_ticks, on_ticks + length) % length
+        slots = list(zip(bars.tolist(), rows.tolist(), steps.tolist()))
+        pairs = [self._slot_messages(*slot) for slot in slots]
+        count = len(pairs)
+        # --- Note-offs first, then note-ons, ordered by tick, note-off first, row
+        ticks = np.concatenate((off_ticks, on_ticks))
+        is_on = np.concatenate(
+            (np.zeros(count, dtype=bool), np.ones(count, dtype=bool))
+        )
+        order = np.lexsort((np.concatenate((rows, rows)), is_on, ticks))
+        messages = [pair[1] for pair in pairs] + [pair[0] for pair in pairs]
+        return PlaybackTimeline.build(
+            ticks[order].tolist(),
+            (messages[i] for i in order.tolist()),
+            np.zeros(2 * count, dtype=np.int32),
+            self.tempo_map(bpm),
+            loop_ticks=length if loop else 0,
+        )
+
+    def to_midi_file(self, bpm: float) -> MidiFile:
+        """
+        The pattern as a one-track MIDI file, e.g. for the USB recorder or to save.
+
+        :param bpm: float
+        :return: MidiFile
+        """
+        midi_file = MidiFile(type=1, ticks_per_beat=self.ticks_per_beat)
+        track = MidiTrack()
+        midi_file.tracks.append(track)
+        track.append(MetaMessage("set_tempo", tempo=bpm2tempo(bpm), time=0))
+        timeline = self.compile(bpm, loop=False)
+        previous = 0
+        for tick, msg in zip(timeline.ticks.tolist(), timeline.messages):
+            track.append(msg.copy(time=tick - previous))
+            previous = tick
+        return midi_file
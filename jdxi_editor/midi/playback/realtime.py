@@ -0,0 +1,616 @@
+"""
+Real-time Playback Scheduler
+============================
+
+A dedicated thread that sends a file's messages at their playback times.
+
+Playback used to be driven from a ``QTimer`` on the GUI thread: every 20 ms the
+engine sent whatever had fallen due, so a busy GUI delayed notes and the
+timer period showed up as jitter. The scheduler thread instead waits for each
+message's due time itself:
+
+- Due times come from a ``PlaybackTimeline``: every message's tick converted to
+  seconds through the file's tempo map (``jdxi_editor.midi.file.model``), so
+  tempo changes in any track apply to all tracks.
+- Times are measured against ``time.perf_counter`` from a fixed origin; each
+  message is due at ``origin + seconds``, so waiting never accumulates drift.
+- Waits are hybrid: the thread sleeps until ``spin_threshold`` before the due
+  time, then spins on the clock for the rest. Pause, seek and stop wake it
+  from the sleep at once.
+- Channel and track mutes and the program/control change suppression are
+  checked when each message is sent, so they apply immediately. Note-offs
+  always pass, so muting a channel never leaves a note hanging.
+- How late each message went out is recorded in a ``JitterHistogram``.
+- A timeline with ``loop_ticks`` repeats: at the loop end the origin moves on
+  by exactly one loop, so repeats do not drift either. ``queue_timeline``
+  hands over an edited timeline, taken up at the next loop boundary (or at
+  once, from the same position, e.g. for a tempo change). Notes still sounding
+  at a hand-over are released, since the new timeline may not hold their
+  note-offs.
+
+While any scheduler is playing, the interpreter's thread switch interval is
+lowered (``GIL_SWITCH_INTERVAL``) so the playback thread gets the GIL back
+promptly when another Python thread is busy.
+
+Functions:
+    wait_until: The hybrid sleep/spin wait, shared with the MIDI clock master.
+    lower_switch_interval: Counted GIL switch interval lowering.
+
+Classes:
+    JitterHistogram: Dispatch lateness statistics.
+    PlaybackTimeline: Messages with their playback times.
+    RealtimePlaybackScheduler: The playback thread.
+
+Example usage:
+--------------
+>>> timeline = PlaybackTimeline.from_model(midi_file_model(midi_file))
+>>> scheduler = RealtimePlaybackScheduler(timeline, on_event=lambda msg: port.send_message(msg.bytes()))
+>>> scheduler.play(start_tick=0)
+>>> scheduler.mute_channel(9, True)          # applies to the next message
+>>> scheduler.current_tick(), scheduler.jitter.snapshot()
+>>> scheduler.stop()
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from decologr import Decologr as log
+from mido import Message
+
+from jdxi_editor.core.instrumentation import instruments
+from jdxi_editor.midi.file.model import (
+    STATUS_CONTROL_CHANGE,
+    STATUS_NOTE_OFF,
+    STATUS_NOTE_ON,
+    STATUS_PROGRAM_CHANGE,
+    STATUS_SYSEX,
+    STATUS_BY_TYPE,
+    MidiFileModel,
+    TempoMap,
+)
+
+SPIN_THRESHOLD = 0.002  # seconds before a due time to stop sleeping and spin
+GIL_SWITCH_INTERVAL = 0.0005  # seconds; interpreter default is 0.005
+JITTER_BUCKETS_US = (50, 100, 250, 500, 1000, 2000, 5000, 10000)
+JITTER_SAMPLES = 4096  # recent lateness samples kept for percentiles
+
+
+class JitterHistogram:
+    """How late messages were sent, in microsecond buckets (also ``playback.jitter``)."""
+
+    def __init__(self, buckets_us: Tuple[int, ...] = JITTER_BUCKETS_US):
+        self.buckets_us = buckets_us
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts = [0] * (len(self.buckets_us) + 1)
+            self.count = 0
+            self.total_us = 0.0
+            self.max_us = 0.0
+            self._recent: Deque[float] = deque(maxlen=JITTER_SAMPLES)
+
+    def record(self, late_seconds: float) -> None:
+        """
+        :param late_seconds: float send time minus due time
+        """
+        late_us = max(0.0, late_seconds * 1e6)
+        bucket = len(self.buckets_us)
+        for i, bound in enumerate(self.buckets_us):
+            if late_us <= bound:
+                bucket = i
+                break
+        with self._lock:
+            self.counts[bucket] += 1
+            self.count += 1
+            self.total_us += late_us
+            self.max_us = max(self.max_us, late_us)
+            self._recent.append(late_us)
+        if instruments.enabled:
+            instruments.record_value("playback.jitter", late_us)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Lateness percentile over the most recent messages.
+
+        :param percent: float 0-100
+        :return: float microseconds
+        """
+        with self._lock:
+            recent = list(self._recent)
+        if not recent:
+            return 0.0
+        return float(np.percentile(recent, percent))
+
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Summary for display and logging.
+
+        :return: dict count, mean_us, p99_us, max_us and per-bucket counts
+        """
+        with self._lock:
+            labels = [f"<={bound}us" for bound in self.buckets_us]
+            labels.append(f">{self.buckets_us[-1]}us")
+            summary = {
+                "count": self.count,
+                "mean_us": self.total_us / self.count if self.count else 0.0,
+                "max_us": self.max_us,
+                "buckets": dict(zip(labels, self.counts)),
+            }
+        summary["p99_us"] = self.percentile(99)
+        return summary
+
+
+@dataclass(frozen=True)
+class PlaybackTimeline:
+    """Channel and SysEx messages in playback order, with their times."""
+
+    ticks: np.ndarray  # int64 absolute tick
+    seconds: np.ndarray  # float64 playback time
+    messages: Tuple[Message, ...]
+    tracks: np.ndarray  # int32 track index
+    channels: np.ndarray  # int16 channel 0-15, -1 for SysEx
+    kinds: np.ndarray  # int16 status without channel (0x80 ... 0xF0)
+    tempo_map: TempoMap
+    loop_ticks: int = 0  # length of one loop; 0 plays once
+
+    @classmethod
+    def from_model(cls, model: MidiFileModel) -> "PlaybackTimeline":
+        """
+        :param model: MidiFileModel
+        :return: PlaybackTimeline of the file's non-meta messages
+        """
+        ticks, messages, tracks = [], [], []
+        for tick, msg, track in model.events:
+            if msg.is_meta:
+                continue
+            ticks.append(tick)
+            messages.append(msg)
+            tracks.append(track)
+        return cls.build(ticks, messages, tracks, model.tempo_map)
+
+    @classmethod
+    def build(
+        cls,
+        ticks: Iterable[int],
+        messages: Iterable[Message],
+        tracks: Iterable[int],
+        tempo_map: TempoMap,
+        loop_ticks: int = 0,
+    ) -> "PlaybackTimeline":
+        """
+        :param ticks: Iterable[int] absolute ticks, in playback order
+        :param messages: Iterable[Message] channel or SysEx messages
+        :param tracks: Iterable[int] track index of each message
+        :param tempo_map: TempoMap
+        :param loop_ticks: int loop length, when the timeline repeats
+        :return: PlaybackTimeline
+        """
+        messages = tuple(messages)
+        ticks = np.fromiter(ticks, dtype=np.int64, count=len(messages))
+        channels = np.fromiter(
+            (getattr(msg, "channel", -1) for msg in messages),
+            dtype=np.int16,
+            count=len(messages),
+        )
+        kinds = np.fromiter(
+            (STATUS_BY_TYPE.get(msg.type, STATUS_SYSEX) for msg in messages),
+            dtype=np.int16,
+            count=len(messages),
+        )
+        return cls(
+            ticks=ticks,
+            seconds=tempo_map.seconds_at_ticks(ticks),
+            messages=messages,
+            tracks=np.fromiter(tracks, dtype=np.int32, count=len(messages)),
+            channels=channels,
+            kinds=kinds,
+            tempo_map=tempo_map,
+            loop_ticks=loop_ticks,
+        )
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    @property
+    def duration_seconds(self) -> float:
+        return float(self.seconds[-1]) if len(self.seconds) else 0.0
+
+    def index_at_tick(self, tick: float) -> int:
+        """Index of the first message at or after tick."""
+        return int(np.searchsorted(self.ticks, tick, side="left"))
+
+
+def wait_until(
+    due: float,
+    condition: threading.Condition,
+    current: Callable[[], bool],
+    spin_threshold: float = SPIN_THRESHOLD,
+    clock: Callable[[], float] = time.perf_counter,
+) -> bool:
+    """
+    Sleep on condition until spin_threshold before due, then spin until due.
+
+    :param due: float clock time
+    :param condition: threading.Condition notified when the wait should be abandoned
+    :param current: Callable[[], bool] False once the wait is abandoned (checked under the lock)
+    :param spin_threshold: float seconds of busy-waiting
+    :param clock: Callable[[], float]
+    :return: bool False if the wait was abandoned
+    """
+    while True:
+        remaining = due - clock()
+        if remaining <= spin_threshold:
+            break
+        with condition:
+            if not current():
+                return False
+            condition.wait(remaining - spin_threshold)
+    while clock() < due:
+        pass
+    return current()
+
+
+_playing_lock = threading.Lock()
+_playing_count = 0
+_saved_switch_interval: Optional[float] = None
+
+
+def lower_switch_interval(active: bool) -> None:
+    """
+    Lower the GIL switch interval while any real-time thread runs.
+
+    Calls are counted: each active=True must be matched by an active=False.
+
+    :param active: bool True when a real-time thread starts, False when it ends
+    """
+    global _playing_count, _saved_switch_interval
+    with _playing_lock:
+        if active:
+            if _playing_count == 0:
+                _saved_switch_interval = sys.getswitchinterval()
+                sys.setswitchinterval(min(_saved_switch_interval, GIL_SWITCH_INTERVAL))
+            _playing_count += 1
+        else:
+            _playing_count = max(0, _playing_count - 1)
+            if _playing_count == 0 and _saved_switch_interval is not None:
+                sys.setswitchinterval(_saved_switch_interval)
+                _saved_switch_interval = None
+
+
+class RealtimePlaybackScheduler(threading.Thread):
+    """
+    Playback thread sending a timeline's messages at their due times.
+
+    A scheduler plays once, or until stopped if its timeline loops: after it
+    finished or was stopped, create a new one.
+
+    :param timeline: PlaybackTimeline
+    :param on_event: Callable[[Message], None] sends one message (scheduler thread)
+    :param on_finished: Optional[Callable[[], None]] called on the scheduler thread at the end
+    :param spin_threshold: float seconds of busy-waiting before each due time
+    :param clock: Callable[[], float] monotonic clock in seconds
+    """
+
+    def __init__(
+        self,
+        timeline: PlaybackTimeline,
+        on_event: Callable[[Message], None],
+        on_finished: Optional[Callable[[], None]] = None,
+        spin_threshold: float = SPIN_THRESHOLD,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        super().__init__(name="RealtimePlaybackScheduler", daemon=True)
+        self.timeline = timeline
+        self.on_event = on_event
+        self.on_finished = on_finished
+        self.spin_threshold = spin_threshold
+        self.clock = clock
+        self.jitter = JitterHistogram()
+        self._set_timeline(timeline)
+        self._pending: Optional[PlaybackTimeline] = None  # taken up at the loop end
+        self._pending_now = False  # take up _pending at the current position
+        self._sounding: Set[Tuple[int, int]] = set()  # (channel, note) not released
+
+        # --- Filters, read at dispatch time
+        self.muted_channels: Set[int] = set()
+        self.muted_tracks: Set[int] = set()
+        self.suppress_program_changes = False
+        self.suppress_control_changes = False
+
+        self._condition = threading.Condition()
+        self._index = 0
+        self._origin = 0.0  # clock time of playback time zero
+        self._paused_at: Optional[float] = None  # playback seconds while paused
+        self._generation = 0  # bumped by pause / seek / stop to abort a wait
+        self._stopping = False
+        self.finished = threading.Event()
+        self.sent = 0
+        self.filtered = 0
+        self.failed = 0
+        self.loops = 0
+
+    def _set_timeline(self, timeline: PlaybackTimeline) -> None:
+        """Switch to timeline, with plain lists for the dispatch loop."""
+        self.timeline = timeline
+        self._seconds = timeline.seconds.tolist()
+        self._kinds = timeline.kinds.tolist()
+        self._tracks = timeline.tracks.tolist()
+        self._channels = timeline.channels.tolist()
+
+    # --- Transport
+
+    def play(self, start_tick: float = 0) -> None:
+        """
+        Start playing from start_tick.
+
+        :param start_tick: float absolute tick
+        """
+        with self._condition:
+            self._paused_at = None
+        self.seek(start_tick)
+        if not self.is_alive():
+            lower_switch_interval(True)
+            self.start()
+
+    def pause(self) -> None:
+        """Hold playback at the current position."""
+        with self._condition:
+            if self._paused_at is None:
+                self._paused_at = self.clock() - self._origin
+                self._generation += 1
+                self._condition.notify_all()
+
+    def resume(self) -> None:
+        """Continue from where pause() held playback."""
+        with self._condition:
+            if self._paused_at is not None:
+                self._origin = self.clock() - self._paused_at
+                self._paused_at = None
+                self._generation += 1
+                self._condition.notify_all()
+
+    def seek(self, tick: float) -> None:
+        """
+        Continue from tick; paused playback stays paused.
+
+        :param tick: float absolute tick
+        """
+        seconds = self.timeline.tempo_map.seconds_at(tick)
+        with self._condition:
+            self._index = self.timeline.index_at_tick(tick)
+            if self._paused_at is not None:
+                self._paused_at = seconds
+            else:
+                self._origin = self.clock() - seconds
+            self._generation += 1
+            self._condition.notify_all()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        Stop the thread; nothing more is sent.
+
+        :param timeout: float seconds to wait for the thread to exit
+        """
+        with self._condition:
+            self._stopping = True
+            self._generation += 1
+            self._condition.notify_all()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def queue_timeline(
+        self, timeline: PlaybackTimeline, immediate: bool = False
+    ) -> None:
+        """
+        Play timeline from the next loop boundary, or from the current position.
+
+        A timeline queued before the scheduler started replaces the current one.
+
+        :param timeline: PlaybackTimeline e.g. the pattern after an edit
+        :param immediate: bool switch now, at the same tick (e.g. for a new tempo)
+        """
+        with self._condition:
+            if not self.is_alive() and not self.finished.is_set():
+                self._set_timeline(timeline)
+                return
+            self._pending = timeline
+            if immediate:
+                self._pending_now = True
+                self._generation += 1
+                self._condition.notify_all()
+
+    @property
+    def paused(self) -> bool:
+        return self._paused_at is not None
+
+    def position_seconds(self) -> float:
+        """Current playback time in seconds."""
+        with self._condition:
+            if self._paused_at is not None:
+                return self._paused_at
+            if self.finished.is_set():
+                return self.timeline.duration_seconds
+            return max(0.0, self.clock() - self._origin)
+
+    def current_tick(self) -> int:
+        """Current playback position as an absolute tick."""
+        return int(self.timeline.tempo_map.tick_at(self.position_seconds()))
+
+    # --- Filters
+
+    def mute_channel(self, channel: int, mute: bool = True) -> None:
+        """
+        :param channel: int 0-15
+        :param mute: bool
+        """
+        if mute:
+            self.muted_channels.add(channel)
+        else:
+            self.muted_channels.discard(channel)
+
+    def mute_track(self, track: int, mute: bool = True) -> None:
+        """
+        :param track: int track index
+        :param mute: bool
+        """
+        if mute:
+            self.muted_tracks.add(track)
+        else:
+            self.muted_tracks.discard(track)
+
+    def _passes(self, index: int) -> bool:
+        """Whether the message at index is sent under the current filters."""
+        kind = self._kinds[index]
+        if kind == STATUS_NOTE_OFF or (
+            kind == STATUS_NOTE_ON and self.timeline.messages[index].velocity == 0
+        ):
+            return True
+        if kind == STATUS_PROGRAM_CHANGE and self.suppress_program_changes:
+            return False
+        if kind == STATUS_CONTROL_CHANGE and self.suppress_control_changes:
+            return False
+        if self._tracks[index] in self.muted_tracks:
+            return False
+        return self._channels[index] not in self.muted_channels
+
+    # --- Thread
+
+    def _wait_until(self, due: float, generation: int) -> bool:
+        """
+        Sleep, then spin, until due.
+
+        :return: bool False if pause, seek or stop interrupted the wait
+        """
+        return wait_until(
+            due,
+            self._condition,
+            lambda: self._generation == generation,
+            self.spin_threshold,
+            self.clock,
+        )
+
+    def _take_pending(self) -> List[Message]:
+        """
+        Switch to the queued timeline (lock held, scheduler thread).
+
+        :return: List[Message] note-offs for the notes still sounding
+        """
+        self._set_timeline(self._pending)
+        self._pending = None
+        self._pending_now = False
+        releases = [
+            Message("note_off", channel=channel, note=note)
+            for channel, note in sorted(self._sounding)
+        ]
+        self._sounding.clear()
+        return releases
+
+    def _switch_now(self) -> List[Message]:
+        """Take up the queued timeline at the current tick (lock held)."""
+        tick = self.timeline.tempo_map.tick_at(max(0.0, self.clock() - self._origin))
+        releases = self._take_pending()
+        self._index = self.timeline.index_at_tick(tick)
+        self._origin = self.clock() - self.timeline.tempo_map.seconds_at(tick)
+        return releases
+
+    def _wrap(self, loop_end: float) -> List[Message]:
+        """Start the next loop at loop_end, a clock time (lock held)."""
+        self._origin = loop_end
+        self._index = 0
+        self.loops += 1
+        return self._take_pending() if self._pending is not None else []
+
+    def _release(self, releases: List[Message]) -> None:
+        for msg in releases:
+            try:
+                self.on_event(msg)
+            except Exception as ex:
+                log.error(
+                    f"Error {ex} occurred sending {msg}",
+                    scope=self.__class__.__name__,
+                )
+
+    def run(self) -> None:
+        try:
+            while True:
+                releases = []
+                with self._condition:
+                    while self._paused_at is not None and not self._stopping:
+                        self._condition.wait()
+                    if self._stopping:
+                        return
+                    if self._pending_now:
+                        releases = self._switch_now()
+                    timeline = self.timeline
+                    seconds = self._seconds
+                    index = self._index
+                    generation = self._generation
+                    origin = self._origin
+                    at_end = index >= len(timeline)
+                    if at_end and not timeline.loop_ticks:
+                        break
+                self._release(releases)
+                if at_end:
+                    loop_end = origin + timeline.tempo_map.seconds_at(
+                        timeline.loop_ticks
+                    )
+                    if self._wait_until(loop_end, generation):
+                        with self._condition:
+                            if self._generation == generation:
+                                releases = self._wrap(loop_end)
+                        self._release(releases)
+                    continue
+                if not self._wait_until(origin + seconds[index], generation):
+                    continue
+                # --- Send everything now due, e.g. all notes of a chord
+                now = self.clock()
+                while index < len(timeline) and origin + seconds[index] <= now:
+                    if self._generation != generation:
+                        break
+                    self._dispatch(index, origin + seconds[index])
+                    index += 1
+                with self._condition:
+                    if self._generation == generation:
+                        self._index = index
+        finally:
+            lower_switch_interval(False)
+        self.finished.set()
+        stats = self.jitter.snapshot()
+        log.message(
+            f"Playback finished: {self.sent} sent, {self.filtered} filtered, "
+            f"jitter mean {stats['mean_us']:.0f}us p99 {stats['p99_us']:.0f}us "
+            f"max {stats['max_us']:.0f}us",
+            scope=self.__class__.__name__,
+        )
+        if self.on_finished is not None:
+            self.on_finished()
+
+    def _dispatch(self, index: int, due: float) -> None:
+        if not self._passes(index):
+            self.filtered += 1
+            return
+        self.jitter.record(self.clock() - due)
+        msg = self.timeline.messages[index]
+        try:
+            self.on_event(msg)
+            self.sent += 1
+            kind = self._kinds[index]
+            if kind == STATUS_NOTE_ON and msg.velocity:
+                self._sounding.add((msg.channel, msg.note))
+            elif kind == STATUS_NOTE_ON or kind == STATUS_NOTE_OFF:
+                self._sounding.discard((msg.channel, msg.note))
+        except Exception as ex:
+            self.failed += 1
+            log.error(
+                f"Error {ex} occurred sending {self.timeline.messages[index]}",
+                scope=self.__class__.__name__,
+            )
@@ -10,6 +10,7 @@ from mido import MidiFile
 from PySide6.QtCore import QThread, QTimer
 
 from jdxi_editor.midi.channel.channel import MidiChannel
+from jdxi_editor.midi.file.model import MidiFileModel
 from picomidi.constant import Midi
 
 
@@ -31,6 +32,7 @@ class MidiPlaybackState:
     event_index: Optional[int] = None
     event_buffer: list = field(default_factory=list)
     file: Optional[MidiFile] = None
+    model: Optional[MidiFileModel] = None  # indexed view of file
     file_duration_seconds: float = 0.0
     # New attributes for playback state
     suppress_control_changes: bool = field(default=True)
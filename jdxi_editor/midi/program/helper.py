@@ -29,13 +29,11 @@ preset changes and communicate them to the UI and MIDI engine.
 
 """
 
-import threading
 from typing import Optional
 
 from decologr import Decologr as log
 from PySide6.QtCore import QObject, Signal
 
-from jdxi_editor.midi.io.delay import send_with_delay
 from jdxi_editor.midi.io.helper import MidiIOHelper
 from jdxi_editor.midi.program.utils import (
     get_next_program_bank_and_number,
@@ -129,10 +127,4 @@ class JDXiProgramHelper(QObject):
         """
         Request the current value of the NRPN parameter from the device.
         """
-        threading.Thread(
-            target=send_with_delay,
-            args=(
-                self.midi_helper,
-                self.midi_requests,
-            ),
-        ).start()
+        self.midi_helper.request_data(self.midi_requests)
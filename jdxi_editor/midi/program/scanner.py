@@ -0,0 +1,337 @@
+"""
+User Bank Scanner
+=================
+
+Background scan of the JD-Xi user banks (E-H) into the program database.
+
+For each program the scanner sends Bank Select + Program Change, then queues
+name-only RQ1 requests (program name and the four tone names, 12 bytes each) on
+the RQ1 request engine. The five requests are in flight together and the
+replies are collected straight from the decode worker, so a program takes one
+load settle plus about one round trip rather than fixed multi-second timers.
+
+Results are written to ``ProgramDatabase`` in batches, one SQLite transaction
+per ``SCAN_COMMIT_BATCH`` programs. A cancelled scan remembers where it stopped
+and can be resumed. Progress reports include throughput in programs/second.
+
+Classes:
+    BankScanProgress: Snapshot emitted while scanning and when finished.
+    UserBankScanner: QObject running the scan on a worker thread.
+
+Example usage:
+--------------
+>>> scanner = UserBankScanner(midi_helper)
+>>> scanner.progress.connect(on_progress)   # BankScanProgress, delivered on the Qt thread
+>>> scanner.finished.connect(on_finished)
+>>> scanner.start()
+>>> scanner.cancel()
+>>> scanner.start(resume=True)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from decologr import Decologr as log
+from PySide6.QtCore import QObject, Signal
+
+from jdxi_editor.midi.channel.channel import MidiChannel
+from jdxi_editor.midi.message.sysex.offset import JDXiSysExMessageLayout
+from jdxi_editor.midi.program.program import JDXiProgram
+from jdxi_editor.midi.sysex.request.midi_requests import MidiRequests
+
+USER_BANKS = ("E", "F", "G", "H")
+PROGRAMS_PER_BANK = 64
+SCAN_COMMIT_BATCH = 16  # programs per SQLite transaction
+SCAN_PROGRAM_SETTLE = 0.2  # seconds for the JD-Xi to load a program before reading it
+SCAN_REPLY_TIMEOUT = 3.0  # seconds to wait for the name replies of one program
+NAME_LENGTH = 12
+
+# (msb, umb, lmb, lsb) of each name block -> JDXiProgram field
+NAME_ADDRESSES: Dict[Tuple[int, int, int, int], str] = {
+    (0x18, 0x00, 0x00, 0x00): "name",
+    (0x19, 0x01, 0x00, 0x00): "digital_1",
+    (0x19, 0x21, 0x00, 0x00): "digital_2",
+    (0x19, 0x42, 0x00, 0x00): "analog",
+    (0x19, 0x70, 0x00, 0x00): "drums",
+}
+
+
+@dataclass
+class BankScanProgress:
+    """Progress of a bank scan."""
+
+    done: int  # programs read (including earlier runs when resumed)
+    total: int
+    saved: int  # programs written to the database in this run
+    failed: int  # programs with no name reply in this run
+    programs_per_second: float
+    current_id: str = ""
+    cancelled: bool = False
+    finished: bool = False
+
+    @property
+    def resumable(self) -> bool:
+        return self.cancelled and self.done < self.total
+
+
+def scan_order(banks: Sequence[str] = USER_BANKS) -> List[Tuple[str, int]]:
+    """
+    Program IDs in scan order.
+
+    :param banks: Sequence[str] bank letters
+    :return: List[Tuple[str, int]] (bank, 1-based program number)
+    """
+    return [
+        (bank, number) for bank in banks for number in range(1, PROGRAMS_PER_BANK + 1)
+    ]
+
+
+def _decode_name(data: bytes) -> str:
+    return bytes(data[:NAME_LENGTH]).decode("ascii", errors="ignore").strip()
+
+
+def merge_with_existing(
+    program: JDXiProgram, existing: Optional[JDXiProgram]
+) -> JDXiProgram:
+    """
+    Keep the genre of an existing entry when nothing else about the program changed.
+
+    :param program: JDXiProgram freshly read from the synth (genre "Unknown")
+    :param existing: Optional[JDXiProgram] current database entry
+    :return: JDXiProgram
+    """
+    if existing is None:
+        return program
+    unchanged = (
+        existing.name == program.name
+        and existing.pc == program.pc
+        and existing.msb == program.msb
+        and existing.lsb == program.lsb
+        and existing.digital_1 == program.digital_1
+        and existing.digital_2 == program.digital_2
+        and existing.analog == program.analog
+        and existing.drums == program.drums
+    )
+    if unchanged and existing.genre:
+        program.genre = existing.genre
+    return program
+
+
+class UserBankScanner(QObject):
+    """
+    Scans user programs on a worker thread and commits them in batches.
+
+    Signals are emitted from the worker thread; connected slots on the GUI
+    thread receive them through Qt's queued connections.
+
+    :param midi_helper: MidiIOHelper connected to the JD-Xi
+    :param database: ProgramDatabase; defaults to the global database
+    :param banks: Sequence[str] banks to scan
+    """
+
+    progress = Signal(object)  # BankScanProgress
+    finished = Signal(object)  # BankScanProgress
+
+    def __init__(
+        self,
+        midi_helper,
+        database=None,
+        banks: Sequence[str] = USER_BANKS,
+        settle_time: float = SCAN_PROGRAM_SETTLE,
+        reply_timeout: float = SCAN_REPLY_TIMEOUT,
+        parent: Optional[QObject] = None,
+    ):
+        super().__init__(parent)
+        self.midi_helper = midi_helper
+        self._database = database
+        self.order = scan_order(banks)
+        self.settle_time = settle_time
+        self.reply_timeout = reply_timeout
+        self.next_index = 0
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._replies: Dict[str, str] = {}
+        self._replies_ready = threading.Condition()
+        self._accepting = False
+
+    @property
+    def database(self):
+        if self._database is None:
+            from jdxi_editor.ui.programs.database import get_database
+
+            self._database = get_database()
+        return self._database
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def resumable(self) -> bool:
+        return 0 < self.next_index < len(self.order) and not self.running
+
+    def start(self, resume: bool = False) -> bool:
+        """
+        Start scanning on a worker thread.
+
+        :param resume: bool continue after the last program read, instead of from E01
+        :return: bool False if a scan is already running
+        """
+        if self.running:
+            return False
+        if not resume:
+            self.next_index = 0
+        self._cancel.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="UserBankScanner", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def cancel(self) -> None:
+        """Stop after the current program; the scan can be resumed later."""
+        self._cancel.set()
+        with self._replies_ready:
+            self._replies_ready.notify_all()
+
+    def on_sysex_frame(self, frame: bytes) -> None:
+        """
+        Collect name replies (decode worker thread).
+
+        :param frame: bytes complete SysEx frame
+        :return: None
+        """
+        if not self._accepting:
+            return
+        start = JDXiSysExMessageLayout.ADDRESS.MSB
+        data_start = JDXiSysExMessageLayout.ADDRESS.LSB + 1
+        field = NAME_ADDRESSES.get(tuple(frame[start:data_start]))
+        # --- data runs from after the address to before checksum and F7
+        if field is None or len(frame) < data_start + NAME_LENGTH + 2:
+            return
+        with self._replies_ready:
+            self._replies[field] = _decode_name(frame[data_start:-2])
+            self._replies_ready.notify_all()
+
+    def _read_program(self, bank: str, number: int) -> Optional[JDXiProgram]:
+        """
+        Select one program and collect its names (worker thread).
+
+        :return: Optional[JDXiProgram] None if the program name did not arrive
+        """
+        from jdxi_editor.ui.editors.helpers.program import calculate_midi_values
+
+        msb, lsb, pc = calculate_midi_values(bank, number)
+        with self._replies_ready:
+            self._replies = {}
+            self._accepting = False
+        self.midi_helper.send_bank_select_and_program_change(
+            MidiChannel.PROGRAM, msb, lsb, pc
+        )
+        if self._cancel.wait(self.settle_time):
+            return None
+        with self._replies_ready:
+            self._accepting = True
+        self.midi_helper.request_data(MidiRequests.PROGRAM_AND_TONE_NAMES_ONLY)
+
+        deadline = time.monotonic() + self.reply_timeout
+        with self._replies_ready:
+            while (
+                len(self._replies) < len(NAME_ADDRESSES) and not self._cancel.is_set()
+            ):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._replies_ready.wait(remaining)
+            self._accepting = False
+            replies = dict(self._replies)
+
+        if "name" not in replies:
+            return None
+        return JDXiProgram(
+            id=f"{bank}{number:02d}",
+            name=replies["name"] or f"User bank {bank} program {number:02d}",
+            genre="Unknown",
+            pc=pc + 1,  # --- stored 1-based, as elsewhere in the database
+            msb=msb,
+            lsb=lsb,
+            digital_1=replies.get("digital_1"),
+            digital_2=replies.get("digital_2"),
+            analog=replies.get("analog"),
+            drums=replies.get("drums"),
+        )
+
+    def _commit(
+        self, batch: List[JDXiProgram], existing: Dict[str, JDXiProgram]
+    ) -> int:
+        merged = [merge_with_existing(p, existing.get(p.id)) for p in batch]
+        return self.database.add_or_replace_programs(merged)
+
+    def _run(self) -> None:
+        total = len(self.order)
+        saved = failed = read_this_run = 0
+        batch: List[JDXiProgram] = []
+        existing = {p.id: p for p in self.database.get_all_programs()}
+        t_start = time.monotonic()
+        current_id = ""
+
+        def snapshot(**flags) -> BankScanProgress:
+            elapsed = time.monotonic() - t_start
+            return BankScanProgress(
+                done=self.next_index,
+                total=total,
+                saved=saved,
+                failed=failed,
+                programs_per_second=read_this_run / elapsed if elapsed > 0 else 0.0,
+                current_id=current_id,
+                **flags,
+            )
+
+        self.midi_helper.add_sysex_frame_observer(self.on_sysex_frame)
+        try:
+            while self.next_index < total and not self._cancel.is_set():
+                bank, number = self.order[self.next_index]
+                current_id = f"{bank}{number:02d}"
+                try:
+                    program = self._read_program(bank, number)
+                except Exception as ex:
+                    log.error(
+                        f"Error reading program {current_id}: {ex}",
+                        scope=self.__class__.__name__,
+                    )
+                    program = None
+                if self._cancel.is_set():
+                    break  # --- re-read this program on resume
+                if program is None:
+                    failed += 1
+                    log.warning(
+                        f"No name reply for program {current_id}",
+                        scope=self.__class__.__name__,
+                    )
+                else:
+                    batch.append(program)
+                self.next_index += 1
+                read_this_run += 1
+                if len(batch) >= SCAN_COMMIT_BATCH:
+                    saved += self._commit(batch, existing)
+                    batch = []
+                self.progress.emit(snapshot())
+        finally:
+            self.midi_helper.remove_sysex_frame_observer(self.on_sysex_frame)
+            if batch:
+                saved += self._commit(batch, existing)
+            result = snapshot(
+                cancelled=self._cancel.is_set(),
+                finished=self.next_index >= total,
+            )
+            log.message(
+                f"Bank scan {'finished' if result.finished else 'stopped'} at "
+                f"{result.done}/{total}: {saved} saved, {failed} failed, "
+                f"{result.programs_per_second:.2f} programs/s",
+                scope=self.__class__.__name__,
+            )
+            self.finished.emit(result)
@@ -2,12 +2,16 @@
 
 import wave
 
-import pyaudio
 from decologr import Decologr as log
 from PySide6.QtCore import QThread, Signal
 from PySide6.QtWidgets import QWidget
 
-from jdxi_editor.midi.utils.usb_recorder import USBRecorder
+from jdxi_editor.midi.recording.stream import (
+    AudioChunkRing,
+    RecordingStats,
+    WavStreamWriter,
+)
+from jdxi_editor.midi.utils.usb_recorder import PA_INT16, USBRecorder, import_pyaudio
 
 
 class WavRecordingThread(QThread):
@@ -23,7 +27,7 @@ class WavRecordingThread(QThread):
         recorder: USBRecorder,
         duration: float = None,
         output_file: str = None,
-        recording_rate=pyaudio.paInt16,
+        recording_rate=PA_INT16,
         parent: QWidget = None,
     ):
         super().__init__(parent)
@@ -32,6 +36,7 @@ class WavRecordingThread(QThread):
         self.duration = duration
         self.output_file = output_file
         self.running = False
+        self.stats = RecordingStats()
 
     def run(self):
         try:
@@ -54,6 +59,9 @@ class WavRecordingThread(QThread):
     def record(self):
         """
         Records audio for the specified duration or until stopped gracefully.
+
+        Chunks are streamed to output_file while recording; see
+        jdxi_editor.midi.recording.stream.
         """
         log.message("[WavRecordingThread] Recording...")
         try:
@@ -80,7 +88,7 @@ class WavRecordingThread(QThread):
             self.recorder.rate = int(info["defaultSampleRate"])
             try:
                 stream = self.recorder.p.open(
-                    format=pyaudio.paInt16,
+                    format=PA_INT16,
                     channels=self.recorder.channels,
                     rate=self.recorder.rate,
                     input=True,
@@ -116,7 +124,18 @@ class WavRecordingThread(QThread):
             return
 
         self.running = True
-        frames = []
+        self.stats = RecordingStats()
+        ring = AudioChunkRing.for_stream(
+            self.recorder.rate, self.recorder.frames_per_buffer
+        )
+        writer = WavStreamWriter(
+            ring,
+            self.output_file,
+            channels=self.recorder.channels,
+            sample_width=self.recorder.p.get_sample_size(PA_INT16),
+            rate=self.recorder.rate,
+        )
+        writer.start()
 
         try:
             for _ in range(
@@ -128,8 +147,18 @@ class WavRecordingThread(QThread):
                 if not self.running:
                     log.message("[WavRecordingThread] Recording interrupted.")
                     break
-                data = stream.read(self.recorder.frames_per_buffer)
-                frames.append(data)
+                if writer.error is not None:
+                    break
+                try:
+                    data = stream.read(self.recorder.frames_per_buffer)
+                except OSError as ex:
+                    if ex.errno != import_pyaudio().paInputOverflowed:
+                        raise
+                    # --- The chunk is lost; keep recording
+                    self.stats.xruns += 1
+                    continue
+                self.stats.chunks_captured += 1
+                ring.push(data)
         except Exception as ex:
             # Ensure exception is converted to string safely
             try:
@@ -146,20 +175,16 @@ class WavRecordingThread(QThread):
         finally:
             stream.stop_stream()
             stream.close()
+            writer.close()
+            self._update_stats(ring, writer)
 
-        log.message("[WavRecordingThread] Recording finished")
-
-        if not frames:
-            log.message("No audio captured.")
-            return
+        log.message(
+            f"[WavRecordingThread] Recording finished: {self.stats.frames_written} frames, "
+            f"{self.stats.xruns} xruns, {self.stats.overruns} overruns"
+        )
 
-        try:
-            with wave.open(self.output_file, "wb") as f:
-                f.setnchannels(self.recorder.channels)
-                f.setsampwidth(self.recorder.p.get_sample_size(pyaudio.paInt16))
-                f.setframerate(self.recorder.rate)
-                f.writeframes(b"".join(frames))
-        except Exception as ex:
+        if writer.error is not None:
+            ex = writer.error
             # Ensure exception is converted to string safely
             try:
                 error_msg = str(ex) if ex else "Unknown error during recording"
@@ -168,6 +193,10 @@ class WavRecordingThread(QThread):
             self.recording_error.emit(error_msg)
             return
 
+        if not writer.bytes_written:
+            log.message("No audio captured.")
+            return
+
         # Ensure output_file is a string before emitting
         if isinstance(self.output_file, str) and self.output_file:
             self.recording_finished.emit(self.output_file)
@@ -179,6 +208,14 @@ class WavRecordingThread(QThread):
             log.error(error_msg)
             self.recording_error.emit(error_msg)
 
+    def _update_stats(self, ring: AudioChunkRing, writer: WavStreamWriter) -> None:
+        """copy the ring and writer counters into stats"""
+        self.stats.overruns = ring.overruns
+        self.stats.ring_high_water = ring.high_water
+        self.stats.bytes_written = writer.bytes_written
+        self.stats.frames_written = writer.frames_written
+        self.stats.header_patches = writer.header_patches
+
     def record_old(self):
         """
         Records audio for the specified duration and saves to a .wav file.
@@ -186,7 +223,7 @@ class WavRecordingThread(QThread):
         log.message("Recording...")
         try:
             stream = self.recorder.p.open(
-                format=pyaudio.paInt16,
+                format=PA_INT16,
                 channels=self.recorder.channels,
                 rate=self.recorder.rate,
                 input=True,
@@ -244,7 +281,7 @@ class WavRecordingThread(QThread):
         try:
             with wave.open(self.output_file, "wb") as f:
                 f.setnchannels(self.recorder.channels)
-                f.setsampwidth(self.recorder.p.get_sample_size(pyaudio.paInt16))
+                f.setsampwidth(self.recorder.p.get_sample_size(PA_INT16))
                 f.setframerate(self.recorder.rate)
                 f.writeframes(b"".join(frames))
         except Exception as ex:
@@ -273,7 +310,7 @@ class WavRecordingThread(QThread):
             log.error(error_msg)
             self.recording_error.emit(error_msg)
 
-        self.recorder.p.terminate()
+        self.recorder.close()
 
     def stop_recording(self):
         """
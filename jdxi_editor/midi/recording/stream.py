@@ -0,0 +1,258 @@
+"""
+Streaming WAV Capture
+=====================
+
+Writes a recording to disk while it is captured.
+
+The recording thread used to keep every chunk read from the input stream in a
+list and write the WAV file when recording stopped, so a long take was held in
+memory (twice, while joining) and lost entirely if the application died. Now
+the capture thread only copies each chunk into a bounded ring buffer; a writer
+thread drains the ring and appends to the WAV file as it goes:
+
+    stream.read  --push-->  ring  --drain-->  writer thread  -->  .wav
+
+Chunks are appended without touching the header; every
+``HEADER_PATCH_INTERVAL`` seconds the RIFF and data sizes are patched to cover
+what has been written, so a partial file stays playable. The header is patched
+a last time when the writer closes.
+
+When the ring is full the chunk is dropped and counted in ``overruns`` rather
+than blocking the capture thread, which would make the device overflow.
+
+Classes:
+    AudioChunkRing: Bounded SPSC ring of captured chunks.
+    RecordingStats: Capture and write counters.
+    WavStreamWriter: Thread writing the ring to a WAV file.
+
+Example usage:
+--------------
+>>> ring = AudioChunkRing(capacity=256)
+>>> writer = WavStreamWriter(ring, "take.wav", channels=2, sample_width=2, rate=48000)
+>>> writer.start()
+>>> ring.push(stream.read(1024))          # capture thread
+>>> writer.close()                        # drains, patches the header, joins
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import wave
+from dataclasses import dataclass
+from typing import BinaryIO, List, Optional
+
+from decologr import Decologr as log
+
+RING_SECONDS = 4.0  # seconds of audio the ring holds before dropping chunks
+HEADER_PATCH_INTERVAL = 1.0  # seconds between WAV header updates
+WRITER_IDLE_WAIT = 0.1  # seconds the writer sleeps when the ring is empty
+
+
+class AudioChunkRing:
+    """
+    Bounded single-producer/single-consumer ring of audio chunks.
+
+    As with ``MidiIngestRing``, the producer (capture thread) only writes
+    ``_tail`` and the consumer (writer thread) only writes ``_head``, so
+    neither side takes a lock on the data path.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 2:
+            raise ValueError(f"Ring capacity must be at least 2, got {capacity}")
+        self.capacity = capacity
+        self._slots: List[Optional[bytes]] = [None] * capacity
+        self._head = 0  # next slot to read (consumer)
+        self._tail = 0  # next slot to write (producer)
+        self._data_ready = threading.Event()
+        self.overruns = 0
+        self.high_water = 0
+
+    @classmethod
+    def for_stream(
+        cls, rate: int, frames_per_buffer: int, seconds: float = RING_SECONDS
+    ) -> "AudioChunkRing":
+        """
+        Ring holding about seconds of audio read frames_per_buffer at a time.
+
+        :param rate: int sample rate
+        :param frames_per_buffer: int frames per chunk
+        :param seconds: float
+        :return: AudioChunkRing
+        """
+        return cls(max(2, int(rate * seconds / max(1, frames_per_buffer)) + 1))
+
+    def __len__(self) -> int:
+        return (self._tail - self._head) % self.capacity
+
+    def push(self, chunk: bytes) -> bool:
+        """
+        Add a captured chunk (producer side).
+
+        :param chunk: bytes
+        :return: bool False if the chunk was dropped because the ring is full
+        """
+        tail = self._tail
+        next_tail = (tail + 1) % self.capacity
+        if next_tail == self._head:
+            self.overruns += 1
+            return False
+        self._slots[tail] = chunk
+        self._tail = next_tail
+        depth = len(self)
+        if depth > self.high_water:
+            self.high_water = depth
+        self._data_ready.set()
+        return True
+
+    def drain(self) -> List[bytes]:
+        """
+        Remove every available chunk, oldest first (consumer side).
+
+        :return: List[bytes]
+        """
+        chunks = []
+        head = self._head
+        tail = self._tail
+        while head != tail:
+            chunks.append(self._slots[head])
+            self._slots[head] = None
+            head = (head + 1) % self.capacity
+        self._head = head
+        return chunks
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Block the consumer until data is available or the timeout elapses.
+
+        :param timeout: float seconds
+        :return: bool True if data is available
+        """
+        if self._head != self._tail:
+            return True
+        self._data_ready.clear()
+        # --- Re-check after clearing so a push between the test and the clear is not lost
+        if self._head != self._tail:
+            return True
+        return self._data_ready.wait(timeout)
+
+    def wake(self) -> None:
+        """Wake a waiting consumer (used on shutdown)."""
+        self._data_ready.set()
+
+
+@dataclass
+class RecordingStats:
+    """Counters for one recording."""
+
+    chunks_captured: int = 0
+    xruns: int = 0  # input overflows reported by the device
+    overruns: int = 0  # chunks dropped because the ring was full
+    ring_high_water: int = 0
+    bytes_written: int = 0
+    frames_written: int = 0
+    header_patches: int = 0
+
+
+class WavStreamWriter(threading.Thread):
+    """
+    Thread appending the chunks of an AudioChunkRing to a WAV file.
+
+    The file is created with the first chunk, so a recording that captured
+    nothing leaves no file behind. An error while writing stops the writer
+    and is kept in ``error`` for the recording thread to report.
+    """
+
+    def __init__(
+        self,
+        ring: AudioChunkRing,
+        output_file: str,
+        channels: int,
+        sample_width: int,
+        rate: int,
+        header_interval: float = HEADER_PATCH_INTERVAL,
+    ):
+        """
+        :param ring: AudioChunkRing filled by the capture thread
+        :param output_file: str .wav path
+        :param channels: int
+        :param sample_width: int bytes per sample
+        :param rate: int sample rate
+        :param header_interval: float seconds between header updates
+        """
+        super().__init__(name="WavStreamWriter", daemon=True)
+        self.ring = ring
+        self.output_file = output_file
+        self.channels = channels
+        self.sample_width = sample_width
+        self.rate = rate
+        self.header_interval = header_interval
+        self.error: Optional[Exception] = None
+        self.bytes_written = 0
+        self.header_patches = 0
+        self._closing = threading.Event()
+        self._file: Optional[BinaryIO] = None
+
+    @property
+    def frames_written(self) -> int:
+        return self.bytes_written // max(1, self.channels * self.sample_width)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Write what is left in the ring, finish the file and wait for the thread.
+
+        :param timeout: Optional[float] seconds to wait for the thread
+        """
+        self._closing.set()
+        self.ring.wake()
+        if self.is_alive():
+            self.join(timeout)
+
+    def _open(self) -> wave.Wave_write:
+        self._file = open(self.output_file, "wb")
+        wav = wave.open(self._file, "wb")
+        wav.setnchannels(self.channels)
+        wav.setsampwidth(self.sample_width)
+        wav.setframerate(self.rate)
+        return wav
+
+    def run(self) -> None:
+        wav = None
+        last_patch = time.monotonic()
+        try:
+            while True:
+                # --- Read before draining: chunks pushed before close() are drained
+                closing = self._closing.is_set()
+                chunks = self.ring.drain()
+                if chunks:
+                    if wav is None:
+                        wav = self._open()
+                    data = b"".join(chunks)
+                    wav.writeframesraw(data)
+                    self.bytes_written += len(data)
+                    now = time.monotonic()
+                    if now - last_patch >= self.header_interval:
+                        # --- writeframes patches the RIFF and data sizes
+                        wav.writeframes(b"")
+                        self._file.flush()
+                        self.header_patches += 1
+                        last_patch = now
+                elif closing:
+                    break
+                else:
+                    self.ring.wait(WRITER_IDLE_WAIT)
+        except Exception as ex:
+            self.error = ex
+            log.error(
+                f"Error {ex} occurred writing {self.output_file}",
+                scope=self.__class__.__name__,
+            )
+        finally:
+            try:
+                if wav is not None:
+                    wav.close()
+                if self._file is not None:
+                    self._file.close()
+            except Exception as ex:
+                self.error = self.error or ex
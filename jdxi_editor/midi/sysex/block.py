@@ -0,0 +1,122 @@
+"""
+DT1 Block Coalescing
+====================
+
+Group single-parameter DT1 messages whose addresses are contiguous under the same
+(MSB, UMB, LMB) base into multi-byte DT1 block messages.
+
+The JD-Xi accepts a DT1 message carrying any number of consecutive data bytes,
+starting at the given address. Sending a whole tone as a few dozen blocks instead
+of hundreds of 15/18-byte messages cuts both the MIDI traffic and the per-message
+overhead (validation, logging, port writes).
+
+Nibbled (4-byte) parameters are handled naturally: their four nibbles occupy four
+consecutive addresses, so the next parameter is contiguous when its LSB equals the
+start LSB plus the number of data bytes already in the block.
+
+Example usage:
+--------------
+>>> messages = [composer.compose_message(address, param, value) for ...]
+>>> for block in coalesce_dt1_messages(messages):
+...     midi_helper.send_midi_message(block)
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from jdxi_editor.midi.data.address.address import CommandID, JDXiSysExAddress
+from jdxi_editor.midi.message.roland import JDXiSysEx
+from picomidi.core.bitmask import BitMask
+
+# Upper bound on data bytes in a single DT1 block. Keeps each message well inside
+# the JD-Xi receive buffer and never lets a block cross a 7-bit LSB page.
+DT1_MAX_BLOCK_SIZE = 64
+
+# One 7-bit address page: a block may not run past LSB 0x7F
+DT1_ADDRESS_PAGE_SIZE = BitMask.LOW_7_BITS + 1
+
+
+def _address_of(message: JDXiSysEx) -> Tuple[int, int, int, int]:
+    """
+    Return the 4-byte address of a composed message as plain ints.
+
+    :param message: JDXiSysEx
+    :return: Tuple[int, int, int, int] (msb, umb, lmb, lsb)
+    """
+    msb, umb, lmb, lsb = (int(b) for b in message.address)
+    return msb, umb, lmb, lsb
+
+
+def coalesce_dt1_writes(
+    writes: Iterable[Tuple[Tuple[int, int, int, int], List[int]]],
+    max_block_size: int = DT1_MAX_BLOCK_SIZE,
+) -> List[Tuple[Tuple[int, int, int, int], List[int]]]:
+    """
+    Coalesce (address, data) writes into contiguous blocks.
+
+    Writes are grouped by (MSB, UMB, LMB) base in first-seen order, and sorted by
+    LSB within each base. A later write to the same start address replaces an
+    earlier one. A new block is started whenever there is an address gap, the
+    block would exceed ``max_block_size`` data bytes, or it would cross the
+    7-bit LSB page.
+
+    :param writes: Iterable of ((msb, umb, lmb, lsb), data_bytes)
+    :param max_block_size: int Maximum data bytes per block
+    :return: List of ((msb, umb, lmb, lsb), data_bytes) blocks
+    """
+    if max_block_size < 1:
+        raise ValueError(f"max_block_size must be positive, got {max_block_size}")
+
+    bases: Dict[Tuple[int, int, int], Dict[int, List[int]]] = {}
+    for address, data in writes:
+        msb, umb, lmb, lsb = address
+        bases.setdefault((msb, umb, lmb), {})[lsb] = list(data)
+
+    blocks: List[Tuple[Tuple[int, int, int, int], List[int]]] = []
+    for (msb, umb, lmb), by_lsb in bases.items():
+        start: Optional[int] = None
+        block: List[int] = []
+        for lsb in sorted(by_lsb):
+            data = by_lsb[lsb]
+            contiguous = start is not None and lsb == start + len(block)
+            fits = len(block) + len(data) <= max_block_size
+            in_page = lsb + len(data) <= DT1_ADDRESS_PAGE_SIZE
+            if contiguous and fits and in_page:
+                block.extend(data)
+                continue
+            if start is not None:
+                blocks.append(((msb, umb, lmb, start), block))
+            start, block = lsb, list(data)
+        if start is not None:
+            blocks.append(((msb, umb, lmb, start), block))
+    return blocks
+
+
+def coalesce_dt1_messages(
+    messages: Iterable[Optional[JDXiSysEx]],
+    max_block_size: int = DT1_MAX_BLOCK_SIZE,
+) -> List[JDXiSysEx]:
+    """
+    Coalesce composed single-parameter DT1 messages into multi-byte DT1 blocks.
+
+    Messages that are not DT1 (e.g. RQ1 requests) are passed through unchanged,
+    after the coalesced blocks.
+
+    :param messages: Iterable[JDXiSysEx] as returned by JDXiSysExComposer.compose_message
+    :param max_block_size: int Maximum data bytes per block
+    :return: List[JDXiSysEx] Block messages ready to send
+    """
+    writes = []
+    passthrough = []
+    for message in messages:
+        if message is None:
+            continue
+        if int(message.command) != CommandID.DT1 or not message.data:
+            passthrough.append(message)
+            continue
+        writes.append((_address_of(message), [int(b) for b in message.data]))
+
+    blocks = [
+        JDXiSysEx(sysex_address=JDXiSysExAddress(*address), value=data)
+        for address, data in coalesce_dt1_writes(writes, max_block_size)
+    ]
+    return blocks + passthrough
@@ -0,0 +1,214 @@
+"""
+SysEx Dispatch Bus
+==================
+
+Address-routed delivery of decoded SysEx parameter messages to editors.
+
+Previously every editor connected to ``midi_sysex_json`` and re-parsed the same
+JSON string, only to discard it when the temporary area did not match. With N
+editors open, one incoming message cost one ``json.dumps`` plus N ``json.loads``
+and N ``log_changes`` diffs.
+
+The bus is keyed by (MSB, UMB, LMB) address prefix. A subscriber registers for a
+prefix of length 0 to 3 - e.g. ``(0x19, 0x42)`` for the Analog Synth or
+``(0x18,)`` for all of the Temporary Program - and only receives events whose
+address starts with that prefix. Publishing an event costs at most four dict
+lookups regardless of how many editors are open, and the parameter dict is
+parsed once, on the decode worker, rather than once per editor.
+
+Classes:
+    SysExDispatchEvent: An already-parsed SysEx parameter message.
+    SysExDispatchBus: Prefix-keyed subscriber registry.
+
+Example usage:
+--------------
+>>> bus = SysExDispatchBus()
+>>> bus.subscribe((0x19, 0x42), analog_editor.on_sysex_event)
+>>> bus.publish(SysExDispatchEvent(address=(0x19, 0x42, 0x00), parameters={...}))
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from decologr import Decologr as log
+
+from jdxi_editor.core.instrumentation import instruments
+from jdxi_editor.midi.sysex.parser.model import ParsedSysExMessage
+from jdxi_editor.midi.sysex.sections import SysExSection
+
+SysExAddressPrefix = Tuple[int, ...]  # (), (msb,), (msb, umb) or (msb, umb, lmb)
+SysExDispatchCallback = Callable[["SysExDispatchEvent"], None]
+
+
+def subscriber_metric(callback: SysExDispatchCallback) -> str:
+    """
+    Instrument name for the time a subscriber takes, by the editor it belongs to.
+
+    :param callback: SysExDispatchCallback usually an editor's bound method
+    :return: str e.g. "ui.update.AnalogSynthEditor"
+    """
+    owner = getattr(callback, "__self__", None)
+    name = (
+        type(owner).__name__
+        if owner is not None
+        else getattr(callback, "__qualname__", type(callback).__name__)
+    )
+    return f"ui.update.{name}"
+
+
+@dataclass(slots=True)
+class SysExDispatchEvent:
+    """
+    A decoded SysEx parameter message ready for the editors.
+
+    :param address: Tuple[int, int, int] (msb, umb, lmb) of the message
+    :param parameters: dict parameter dictionary (SysExSection keys plus parameter names)
+    :param parsed: Optional[ParsedSysExMessage] typed message, None for patches loaded from file
+    """
+
+    address: Tuple[int, int, int]
+    parameters: dict
+    parsed: Optional[ParsedSysExMessage] = None
+
+
+def address_from_parameters(parameters: dict) -> Optional[Tuple[int, int, int]]:
+    """
+    Read the (msb, umb, lmb) address from the ADDRESS field of a JSON patch dictionary.
+
+    :param parameters: dict parsed JSON patch, ADDRESS as hex e.g. "19420000"
+    :return: Optional[Tuple[int, int, int]] None when the address is missing or malformed
+    """
+    address_hex = parameters.get(SysExSection.ADDRESS, "")
+    if not isinstance(address_hex, str) or len(address_hex) < 6:
+        return None
+    try:
+        address_bytes = bytes.fromhex(address_hex[:6])
+    except ValueError:
+        return None
+    return address_bytes[0], address_bytes[1], address_bytes[2]
+
+
+class SysExDispatchBus:
+    """
+    Prefix-keyed registry delivering SysExDispatchEvents to subscribers.
+
+    Subscriptions are made on the Qt thread. The subscriber table is replaced
+    (copy-on-write) on every change, so ``has_subscribers`` can be called from the
+    decode worker without locking.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[
+            SysExAddressPrefix, Tuple[SysExDispatchCallback, ...]
+        ] = {}
+
+    def subscribe(self, prefix: Iterable[int], callback: SysExDispatchCallback) -> None:
+        """
+        Register a callback for all messages whose address starts with prefix.
+
+        Subscribing the same callback to the same prefix twice is a no-op.
+
+        :param prefix: Iterable[int] up to three address bytes (msb, umb, lmb)
+        :param callback: SysExDispatchCallback
+        :return: None
+        """
+        key = tuple(int(b) for b in prefix)
+        if len(key) > 3:
+            raise ValueError(f"Address prefix must have at most 3 bytes, got {key}")
+        callbacks = self._subscribers.get(key, ())
+        if callback in callbacks:
+            return
+        subscribers = dict(self._subscribers)
+        subscribers[key] = callbacks + (callback,)
+        self._subscribers = subscribers
+
+    def unsubscribe(
+        self, callback: SysExDispatchCallback, prefix: Optional[Iterable[int]] = None
+    ) -> None:
+        """
+        Remove a callback from one prefix, or from every prefix when prefix is None.
+
+        :param callback: SysExDispatchCallback
+        :param prefix: Optional[Iterable[int]]
+        :return: None
+        """
+        key = None if prefix is None else tuple(int(b) for b in prefix)
+        subscribers = {}
+        for existing_key, callbacks in self._subscribers.items():
+            if key is None or existing_key == key:
+                callbacks = tuple(cb for cb in callbacks if cb != callback)
+            if callbacks:
+                subscribers[existing_key] = callbacks
+        self._subscribers = subscribers
+
+    def has_subscribers(self, address: Tuple[int, int, int]) -> bool:
+        """
+        Whether any subscriber would receive a message at this address.
+
+        :param address: Tuple[int, int, int] (msb, umb, lmb)
+        :return: bool
+        """
+        subscribers = self._subscribers
+        return any(address[:depth] in subscribers for depth in range(4))
+
+    def subscribers_for(
+        self, address: Tuple[int, int, int]
+    ) -> List[SysExDispatchCallback]:
+        """
+        Callbacks matching the address, most general prefix first, each once.
+
+        :param address: Tuple[int, int, int] (msb, umb, lmb)
+        :return: List[SysExDispatchCallback]
+        """
+        subscribers = self._subscribers
+        matched: List[SysExDispatchCallback] = []
+        for depth in range(4):
+            for callback in subscribers.get(address[:depth], ()):
+                if callback not in matched:
+                    matched.append(callback)
+        return matched
+
+    def publish(self, event: SysExDispatchEvent) -> int:
+        """
+        Deliver an event to every subscriber matching its address.
+
+        Subscribers whose Qt object has been deleted are removed. With
+        instrumentation enabled each subscriber is timed as its editor's UI
+        update (``subscriber_metric``) and the fan-out is recorded.
+
+        :param event: SysExDispatchEvent
+        :return: int number of subscribers the event was delivered to
+        """
+        delivered = 0
+        instrumented = instruments.enabled
+        if instrumented:
+            t_start_ns = time.perf_counter_ns()
+        for callback in self.subscribers_for(event.address):
+            try:
+                if instrumented:
+                    with instruments.span(subscriber_metric(callback)):
+                        callback(event)
+                else:
+                    callback(event)
+                delivered += 1
+            except RuntimeError as ex:
+                # --- "Internal C++ object already deleted": editor closed without unsubscribing
+                log.warning(
+                    f"Removing stale SysEx subscriber {callback}: {ex}",
+                    scope=self.__class__.__name__,
+                )
+                self.unsubscribe(callback)
+            except Exception as ex:
+                log.error(
+                    f"Error dispatching SysEx {bytes(event.address).hex()} to {callback}: {ex}",
+                    scope=self.__class__.__name__,
+                )
+        if instrumented:
+            instruments.record_duration(
+                "sysex_dispatch.publish", time.perf_counter_ns() - t_start_ns
+            )
+            instruments.record_value("sysex_dispatch.fanout", delivered, unit="count")
+        return delivered
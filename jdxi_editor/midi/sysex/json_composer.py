@@ -5,11 +5,12 @@ JDXiSysExComposer
 import json
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 
 from decologr import Decologr as log
 
 if TYPE_CHECKING:
+    from jdxi_editor.midi.patch.state import PatchState
     from jdxi_editor.ui.editors.synth.editor import SynthEditor
 
 from jdxi_editor.midi.data.address.address import (
@@ -108,6 +109,50 @@ class JDXiJSONComposer:
             log.error(f"Error sending message: {ex}")
             return None
 
+    def compose_area(self, state: "PatchState", area_name: str) -> dict:
+        """
+        Compose the JSON patch of one temporary area from the patch state.
+
+        :param state: PatchState headless patch model
+        :param area_name: str e.g. "ANALOG_SYNTH_COMMON"
+        :return: dict JSON patch in the same layout as compose_message
+        """
+        spec = state.areas[area_name].spec
+        editor_data = {
+            SysExSection.JD_XI_HEADER: "f041100000000e",
+            SysExSection.ADDRESS: "".join(f"{int(b):02x}" for b in spec.address),
+            SysExSection.TEMPORARY_AREA: spec.temporary_area,
+            SysExSection.SYNTH_TONE: spec.synth_tone,
+        }
+        editor_data.update(state.to_parameters(area_name))
+        return editor_data
+
+    def process_patch_state(self, state: "PatchState", temp_folder: Path) -> List[Path]:
+        """
+        Save every complete temporary area of the patch state, without any editor.
+
+        Program zones are left out, as they are when saving from the editors.
+
+        :param state: PatchState headless patch model
+        :param temp_folder: Path Temporary folder to save the JSON files
+        :return: List[Path] files written
+        """
+        os.makedirs(temp_folder, exist_ok=True)
+        written = []
+        for area_name in state.complete_areas():
+            if area_name.startswith("PROGRAM_ZONE_"):
+                continue
+            self.json_string = self.compose_area(state, area_name)
+            address_hex = self.json_string[SysExSection.ADDRESS]
+            json_file = Path(temp_folder) / f"jdxi_tone_data_{address_hex}.json"
+            self.save_json(str(json_file))
+            written.append(json_file)
+        log.message(
+            f"Saved {len(written)} areas from the patch state",
+            scope=self.__class__.__name__,
+        )
+        return written
+
     def save_json(self, file_path: str) -> None:
         """
         Save the JSON string to a file
@@ -27,7 +27,12 @@ from jdxi_editor.midi.data.address.address import JDXiSysExOffsetTemporaryToneUM
 from jdxi_editor.midi.data.address.address import (
     JDXiSysExOffsetTemporaryToneUMB as TemporaryToneUMB,
 )
+from jdxi_editor.midi.data.address.index import parameter_at
 from jdxi_editor.midi.data.parameter.drum.partial import DrumPartialParam
+from jdxi_editor.midi.data.parameter.index import (
+    parameter_by_address,
+    parameter_members,
+)
 from jdxi_editor.midi.map.parameter_address import JDXiMapParameterAddress
 from jdxi_editor.midi.message.sysex.offset import JDXiSysExMessageLayout
 from jdxi_editor.midi.sysex.parser.tone_mapper import (
@@ -122,6 +127,8 @@ def parse_parameters(data: bytes, parameter_type: Iterable) -> Dict[str, int]:
     :param parameter_type: Iterable Type
     :return: Dict[str, int]
     """
+    if isinstance(parameter_type, type):
+        parameter_type = parameter_members(parameter_type)
     return {
         param.name: get_byte_offset_by_tone_name(data, param.address)
         for param in parameter_type
@@ -138,13 +145,22 @@ def parse_single_parameter(
     :param parameter_type: Type
     :return: Dict[str, int]
     """
+    # --- The full address identifies the parameter, two-byte offsets included,
+    # --- when it belongs to the requested map
+    found = parameter_at(
+        data[
+            JDXiSysExMessageLayout.ADDRESS.MSB : JDXiSysExMessageLayout.ADDRESS.LSB + 1
+        ]
+    )
+    if found and found[0] is parameter_type:
+        return {"PARAM": found[1].name}
     if isinstance(parameter_type, DrumPartialParam):
         _, offset = get_drum_tone(data[JDXiSysExMessageLayout.ADDRESS.LMB])
         address = data[JDXiSysExMessageLayout.ADDRESS.LSB]
         index = address_to_index(offset, address)
     else:
         index = data[JDXiSysExMessageLayout.ADDRESS.LSB]
-    param = parameter_type.get_parameter_by_address(index)
+    param = parameter_by_address(parameter_type, index)
     if param:
         return {"PARAM": param.name}
     return {}
@@ -176,6 +176,18 @@ class MidiRequests:
         TEMPORARY_TONE_RQ11_HEADER, JDXISysExHex.DRUMS, "36 00 00 00 01 43"
     )
 
+    @staticmethod
+    def drum_partial(lmb: int) -> str:
+        """
+        Request for one partial of the temporary drum kit.
+
+        :param lmb: int partial address offset, e.g. 0x2E for BD1
+        :return: str RQ1 hex string
+        """
+        return create_request(
+            TEMPORARY_TONE_RQ11_HEADER, JDXISysExHex.DRUMS, f"{lmb:02X} 00 00 00 01 43"
+        )
+
     DRUMS_BD1_RIM_BD2_CLAP_BD3 = [
         DRUMS,
         DRUMS_BD1,
@@ -217,3 +229,29 @@ class MidiRequests:
         DIGITAL1_COMMON,
         DIGITAL2_COMMON,
     ]
+
+    # Name-only requests (12 bytes each) for scanning programs without pulling whole areas
+    PROGRAM_NAME_ONLY = create_request(
+        TEMPORARY_PROGRAM_RQ11_HEADER,
+        JDXISysExHex.PROGRAM_COMMON_AREA,
+        "00 00 00 00 00 0C",
+    )
+    PROGRAM_AND_TONE_NAMES_ONLY = [
+        PROGRAM_NAME_ONLY,
+        create_request(
+            TEMPORARY_TONE_RQ11_HEADER,
+            JDXISysExHex.DIGITAL1_COMMON,
+            "00 00 00 00 00 0C",
+        ),
+        create_request(
+            TEMPORARY_TONE_RQ11_HEADER,
+            JDXISysExHex.DIGITAL2_COMMON,
+            "00 00 00 00 00 0C",
+        ),
+        create_request(
+            TEMPORARY_TONE_RQ11_HEADER, JDXISysExHex.ANALOG, "00 00 00 00 00 0C"
+        ),
+        create_request(
+            TEMPORARY_TONE_RQ11_HEADER, JDXISysExHex.DRUMS, "00 00 00 00 00 0C"
+        ),
+    ]
@@ -0,0 +1,199 @@
+"""
+SysEx File Reader
+=================
+
+Streaming reader for ``.syx`` files (single or concatenated F0 ... F7 messages,
+e.g. librarian dumps and Perl-style exports).
+
+The file is memory-mapped and frames are yielded as ``memoryview`` slices of the
+mapping, so nothing is copied until a frame is sent and memory use does not
+grow with the size of the file. Frame boundaries are located with
+``mmap.find`` rather than a byte-by-byte Python loop.
+
+Frames are validated in batches: the Roland checksum of every frame in a batch
+is checked in one NumPy ``add.reduceat`` pass over the batch's bytes. A Roland
+checksum makes the address, data and checksum bytes sum to 0 modulo 128.
+Non-Roland frames (universal SysEx) are passed through unchecked.
+
+Classes:
+    SysExFileReader: Context manager yielding validated frames.
+
+Example usage:
+--------------
+>>> with SysExFileReader("dump.syx") as reader:
+...     for frame in reader.frames():      # memoryview, F0 ... F7
+...         send(bytes(frame))
+>>> reader.valid, reader.invalid
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from typing import Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+from decologr import Decologr as log
+
+from jdxi_editor.midi.data.address.address import RolandID
+from jdxi_editor.midi.message.sysex.offset import JDXiSysExMessageLayout
+
+SYSEX_START = b"\xf0"
+SYSEX_END = b"\xf7"
+SYX_BATCH_FRAMES = 256  # frames validated per NumPy pass
+# --- F0, ID, device, model(4), command, one address byte, checksum, F7
+ROLAND_MIN_FRAME_LENGTH = JDXiSysExMessageLayout.ADDRESS.MSB + 3
+
+Span = Tuple[int, int]  # (start, end) with end one past F7
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+def iter_frame_spans(buffer: Buffer, start: int = 0) -> Iterator[Span]:
+    """
+    Locate F0 ... F7 frames.
+
+    Bytes outside frames are skipped. A frame interrupted by another F0 before
+    its F7 is truncated and dropped; an F0 with no F7 ends the scan.
+
+    :param buffer: Buffer bytes-like object supporting ``find`` (bytes, mmap)
+    :param start: int offset to start from
+    :return: Iterator[Span]
+    """
+    size = len(buffer)
+    pos = buffer.find(SYSEX_START, start)
+    while 0 <= pos < size:
+        end = buffer.find(SYSEX_END, pos + 1)
+        if end == -1:
+            log.message(
+                f"Invalid SysEx: unmatched F0 at offset {pos}, no F7",
+                scope="SysExFileReader",
+            )
+            return
+        restart = buffer.find(SYSEX_START, pos + 1, end)
+        if restart != -1:
+            log.message(
+                f"Invalid SysEx: truncated message at offset {pos}",
+                scope="SysExFileReader",
+            )
+            pos = restart
+            continue
+        yield pos, end + 1
+        pos = buffer.find(SYSEX_START, end + 1)
+
+
+def roland_checksums_valid(buffer: Buffer, spans: Sequence[Span]) -> np.ndarray:
+    """
+    Check the Roland checksum of several frames in one vectorized pass.
+
+    The spans must be in file order; only the bytes from the first start to the
+    last end are read.
+
+    :param buffer: Buffer holding the frames
+    :param spans: Sequence[Span] frames to check
+    :return: np.ndarray of bool, True for valid or non-Roland frames
+    """
+    if not spans:
+        return np.zeros(0, dtype=bool)
+    base = spans[0][0]
+    data = np.frombuffer(buffer, dtype=np.uint8, count=spans[-1][1] - base, offset=base)
+    bounds = np.asarray(spans, dtype=np.int64) - base
+    starts, ends = bounds[:, 0], bounds[:, 1]
+    roland = (ends - starts >= ROLAND_MIN_FRAME_LENGTH) & (
+        data[starts + 1] == int(RolandID.ROLAND_ID)
+    )
+    # --- Sum from the first address byte up to, but excluding, F7
+    last = ends - 1
+    first = np.minimum(starts + JDXiSysExMessageLayout.ADDRESS.MSB, last)
+    indices = np.empty(2 * len(spans), dtype=np.int64)
+    indices[0::2] = first
+    indices[1::2] = last
+    sums = np.add.reduceat(data, indices, dtype=np.uint32)[0::2]
+    del data
+    return ~roland | ((sums & 0x7F) == 0)
+
+
+class SysExFileReader:
+    """
+    Memory-mapped ``.syx`` reader.
+
+    :param file_path: str path of the .syx file
+    :param batch_frames: int frames validated per pass
+    """
+
+    def __init__(self, file_path: str, batch_frames: int = SYX_BATCH_FRAMES):
+        self.file_path = file_path
+        self.batch_frames = batch_frames
+        self.valid = 0
+        self.invalid = 0
+        self._file = None
+        self._map = None
+
+    def __enter__(self) -> "SysExFileReader":
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def size(self) -> int:
+        return len(self._map) if self._map is not None else 0
+
+    def open(self) -> None:
+        """
+        Map the file. Empty files are accepted and yield no frames.
+
+        :raises OSError: if the file cannot be opened
+        """
+        self._file = open(self.file_path, "rb")
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        """Unmap and close the file; frames must no longer be referenced."""
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # --- A frame is still referenced; the mapping goes with it
+                log.warning(
+                    f"{self.file_path}: frames still referenced at close",
+                    scope=self.__class__.__name__,
+                )
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def frames(self) -> Iterator[memoryview]:
+        """
+        Yield checksum-valid frames as zero-copy views of the mapping.
+
+        Each view is released once the consumer asks for the next frame.
+
+        :return: Iterator[memoryview] F0 ... F7
+        """
+        if self._map is None:
+            return
+        batch: List[Span] = []
+        for span in iter_frame_spans(self._map):
+            batch.append(span)
+            if len(batch) >= self.batch_frames:
+                yield from self._validated(batch)
+                batch = []
+        if batch:
+            yield from self._validated(batch)
+
+    def _validated(self, batch: List[Span]) -> Iterator[memoryview]:
+        valid = roland_checksums_valid(self._map, batch)
+        for (start, end), ok in zip(batch, valid):
+            if not ok:
+                self.invalid += 1
+                log.message(
+                    f"Invalid checksum in SysEx message at offset {start}, skipped",
+                    scope=self.__class__.__name__,
+                )
+                continue
+            self.valid += 1
+            with memoryview(self._map) as view, view[start:end] as frame:
+                yield frame
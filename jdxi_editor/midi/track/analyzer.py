@@ -1,109 +1,96 @@
+from typing import Optional
+
+import numpy as np
 from mido import MidiTrack
 
+from jdxi_editor.midi.file.model import (
+    STATUS_CONTROL_CHANGE,
+    STATUS_PITCHWHEEL,
+    TrackColumns,
+    index_track,
+)
 from jdxi_editor.midi.track.data import BASS_NOTE_MAX
+from jdxi_editor.midi.track.notes import NoteArrays
 from jdxi_editor.midi.track.stats import TrackStats
 
+MID_RANGE_NOTE_MAX = 72  # C5 - upper limit of the mid range
+
 
 class TrackAnalyzer:
     """Track analyser to add tracks"""
 
-    def __init__(self, track: MidiTrack, index: int):
+    def __init__(
+        self, track: MidiTrack, index: int, columns: Optional[TrackColumns] = None
+    ):
+        """
+        :param track: MidiTrack
+        :param index: int track number
+        :param columns: Optional[TrackColumns] the track's indexed columns, e.g. from the file model
+        """
         self.track = track
+        self.columns = columns if columns is not None else index_track(track, index)
         self.stats = TrackStats(index)
 
-        self.time = 0
-        self.active_notes: dict[int, int] = {}
-        self.note_start: dict[int, int] = {}
-        self.durations: list[int] = []
-
     def run(self) -> TrackStats:
-        """run the analysis and send to dispatcher"""
-        self._read_track_name()
+        """run the analysis over the track's note arrays"""
+        columns = self.columns
+        s = self.stats
+        s.track_name = columns.name
+        s.channels = set(columns.channels)
 
-        for msg in self.track:
-            self.time += msg.time
-            if msg.is_meta:
-                continue
-            self._dispatch(msg)
+        status = columns.status_type
+        s.has_pitch_bend = bool(np.any(status == STATUS_PITCHWHEEL))
+        s.has_control_change = bool(np.any(status == STATUS_CONTROL_CHANGE))
+        s.program_changes = list(columns.programs)
 
+        notes = NoteArrays.from_columns(columns)
+        self._note_ons(notes)
+        self._note_offs(notes)
         self._finalize()
-        return self.stats
-
-    def _dispatch(self, msg):
-        """dispatch to handler"""
-        if hasattr(msg, "channel"):
-            self.stats.channels.add(msg.channel)
-
-        handler = getattr(self, f"_on_{msg.type}", None)
-        if handler:
-            handler(msg)
-
-    def _on_note_on(self, msg):
-        """on note on"""
-        if msg.velocity == 0:
-            return self._on_note_off(msg)
+        return s
 
+    def _note_ons(self, notes: NoteArrays):
+        """note counts, ranges and velocity statistics"""
         s = self.stats
-        note = msg.note
-
-        s.note_count += 1
-        s.notes.append(note)
-        s.velocities.append(msg.velocity)
-        s.note_ons.append((self.time, note, msg.channel))
-
-        s.lowest_note = min(s.lowest_note, note)
-        s.highest_note = max(s.highest_note, note)
-
-        if note <= BASS_NOTE_MAX:
-            s.bass_note_count += 1
-        elif note <= 72:
-            s.mid_range_note_count += 1
-        else:
-            s.high_note_count += 1
-
-        self.active_notes[note] = self.time
-        s.max_simultaneous = max(s.max_simultaneous, len(self.active_notes))
-
-        self.note_start[note] = self.time
-
-    def _on_note_off(self, msg):
-        """check for legato"""
-        note = msg.note
-        self.stats.note_offs.append((self.time, note))
-
-        start = self.note_start.pop(note, None)
-        if start is None:
+        pitches = notes.on_pitches
+        velocities = notes.on_velocities
+
+        s.note_count = len(pitches)
+        s.notes = pitches.tolist()
+        s.velocities = velocities.tolist()
+        s.note_ons = list(
+            zip(notes.on_ticks.tolist(), s.notes, notes.channel[notes.is_on].tolist())
+        )
+        s.pitch_histogram = notes.pitch_histogram().tolist()
+        if not s.note_count:
             return
 
-        duration = self.time - start
-        self.durations.append(duration)
-
-        # legato detection
-        for other_start in self.note_start.values():
-            if start < other_start < self.time:
-                self.stats.legato_score += 1
+        s.lowest_note = int(pitches.min())
+        s.highest_note = int(pitches.max())
+        s.bass_note_count = int(np.count_nonzero(pitches <= BASS_NOTE_MAX))
+        s.high_note_count = int(np.count_nonzero(pitches > MID_RANGE_NOTE_MAX))
+        s.mid_range_note_count = s.note_count - s.bass_note_count - s.high_note_count
 
-        self.active_notes.pop(note, None)
+        s.velocity_range = int(velocities.max() - velocities.min())
+        s.velocity_std = float(velocities.std())
 
-    def _on_pitchwheel(self, msg):
-        """check for bent notes"""
-        self.stats.has_pitch_bend = True
-
-    def _on_control_change(self, msg):
-        """add cc"""
-        self.stats.has_control_change = True
+    def _note_offs(self, notes: NoteArrays):
+        """durations, polyphony and legato from notes paired per pitch"""
+        s = self.stats
+        off = ~notes.is_on
+        s.note_offs = list(zip(notes.ticks[off].tolist(), notes.pitch[off].tolist()))
 
-    def _on_program_change(self, msg):
-        """add pc"""
-        self.stats.program_changes.append(msg.program)
+        pairs = notes.pair()
+        s.max_simultaneous = pairs.max_polyphony
+        durations = pairs.durations
+        if len(durations):
+            s.avg_note_duration = int(durations.sum()) / len(durations)
+        s.legato_score = pairs.legato_count()
 
     def _finalize(self):
         """finalize analysis"""
         s = self.stats
 
-        if self.durations:
-            s.avg_note_duration = sum(self.durations) / len(self.durations)
-
         if s.lowest_note < 127:
             s.note_range = s.highest_note - s.lowest_note
 
@@ -113,10 +100,3 @@ class TrackAnalyzer:
         from jdxi_editor.midi.track.classification import calculate_scores
 
         calculate_scores(s)
-
-    def _read_track_name(self):
-        """Extract track name from meta messages"""
-        for msg in self.track:
-            if msg.is_meta and msg.type == "track_name":
-                self.stats.track_name = msg.name
-                break
@@ -12,7 +12,9 @@ from typing import Callable, List, Optional
 
 from mido import MidiFile, MidiTrack
 
+from jdxi_editor.midi.file.model import TrackColumns, midi_file_model
 from jdxi_editor.midi.track.analyzer import TrackAnalyzer
+from jdxi_editor.midi.track.notes import cached_analysis
 from jdxi_editor.midi.track.data import (
     BASS_KEYWORDS,
     BASS_NOTE_MAX,
@@ -74,9 +76,7 @@ def legato_score_gt(x):
 
 
 def velocity_range_gt(r):
-    return lambda s: (
-        (max(s.velocities) - min(s.velocities)) > r if s.velocities else False
-    )
+    return lambda s: s.note_count > 0 and s.velocity_range > r
 
 
 def mid_percentage_between(lo, hi):
@@ -87,9 +87,9 @@ def mid_percentage_between(lo, hi):
 
 def velocity_std_lt(threshold):
     def _check(s: TrackStats):
-        if not s.velocities:
+        if not s.note_count:
             return False
-        return _calculate_std_dev(s.velocities) < threshold
+        return s.velocity_std < threshold
 
     return _check
 
@@ -132,7 +132,7 @@ KEYS_RULES = [
     ScoreRule(
         "velocity_range_medium",
         5,
-        lambda s: s.velocities and 40 < (max(s.velocities) - min(s.velocities)) <= 60,
+        lambda s: s.note_count > 0 and 40 < s.velocity_range <= 60,
     ),
     ScoreRule("balanced_mid_notes", 10, mid_percentage_between(30, 70)),
 ]
@@ -167,9 +167,9 @@ STRINGS_RULES = [
 
 
 def analyze_track_for_classification(
-    track: MidiTrack, track_index: int
+    track: MidiTrack, track_index: int, columns: Optional[TrackColumns] = None
 ) -> "TrackStats":
-    return TrackAnalyzer(track, track_index).run()
+    return TrackAnalyzer(track, track_index, columns).run()
 
 
 def score_rules(stats: TrackStats, rules: list[ScoreRule]) -> float:
@@ -189,15 +189,6 @@ def explain_score(stats: TrackStats, rules: list[ScoreRule]):
     return [(rule.name, rule.weight) for rule in rules if rule.condition(stats)]
 
 
-def _calculate_std_dev(values: List[float]) -> float:
-    """Calculate standard deviation of a list of values."""
-    if not values:
-        return 0.0
-    mean = sum(values) / len(values)
-    variance = sum((x - mean) ** 2 for x in values) / len(values)
-    return variance**0.5
-
-
 def classify_tracks(
     midi_file: MidiFile,
     exclude_drum_tracks: Optional[List[int]] = None,
@@ -217,15 +208,22 @@ def classify_tracks(
         - "keys_guitars": List of (track_index, TrackStats) tuples
         - "strings": List of (track_index, TrackStats) tuples
         - "unclassified": List of (track_index, TrackStats) tuples
+        TrackStats are cached per track content and shared; do not modify them.
     """
     exclude_drum_tracks = exclude_drum_tracks or []
 
     # --- Analyze all tracks
     track_analyses = []
-    for i, track in enumerate(midi_file.tracks):
-        if i in exclude_drum_tracks:
+    for columns in midi_file_model(midi_file).tracks:
+        if columns.index in exclude_drum_tracks:
             continue
-        analysis = analyze_track_for_classification(track, i)
+        analysis = cached_analysis(
+            "classification",
+            columns,
+            lambda: analyze_track_for_classification(
+                columns.track, columns.index, columns
+            ),
+        )
         track_analyses.append(analysis)
 
     # --- Classify each track
@@ -0,0 +1,247 @@
+"""
+Note Arrays
+===========
+
+Vectorised note analysis over a track's indexed columns
+(``jdxi_editor.midi.file.model.TrackColumns``), shared by the track
+classifier (``TrackAnalyzer``) and the drum detector.
+
+The note-on and note-off events of a track are gathered into parallel arrays
+in message order. Notes are paired per pitch, as the message-by-message
+analyzers did: a note-on starts (or restarts) its pitch, and a note-off ends the
+pitch only if the previous event on that pitch was a note-on. The number of
+sounding pitches after every event is then a cumulative sum of +1 / -1 steps,
+and the legato count (notes starting while another is held) is a range count
+over the sorted note-on ticks.
+
+Analyses are cached by track content (``cached_analysis``), so classifying
+the same file again, or a file reloaded unchanged, costs a hash per track.
+
+Classes:
+    NoteArrays: Note events of a track.
+    NotePairs: Sounding notes of a track.
+
+Example usage:
+--------------
+>>> notes = NoteArrays.from_columns(model.tracks[1])
+>>> pairs = notes.pair()
+>>> pairs.max_polyphony, pairs.durations.mean(), pairs.legato_count()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, TypeVar
+
+import numpy as np
+
+from jdxi_editor.midi.file.model import (
+    STATUS_NOTE_OFF,
+    STATUS_NOTE_ON,
+    TrackColumns,
+)
+
+MIDI_NOTES = 128
+ANALYSIS_CACHE_SIZE = 512  # track analyses kept, across files
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class NoteArrays:
+    """Note-on and note-off events of one track, in message order."""
+
+    ticks: np.ndarray  # int64 absolute tick
+    pitch: np.ndarray  # int64 note number
+    velocity: np.ndarray  # int64
+    channel: np.ndarray  # int64
+    is_on: np.ndarray  # bool: note_on with velocity > 0; otherwise a note-off
+
+    @classmethod
+    def from_columns(cls, columns: TrackColumns) -> "NoteArrays":
+        """
+        :param columns: TrackColumns
+        :return: NoteArrays
+        """
+        status = columns.status_type
+        mask = (status == STATUS_NOTE_ON) | (status == STATUS_NOTE_OFF)
+        velocity = columns.data2[mask].astype(np.int64)
+        return cls(
+            ticks=columns.ticks[mask].astype(np.int64),
+            pitch=columns.data1[mask].astype(np.int64),
+            velocity=velocity,
+            channel=columns.channel[mask].astype(np.int64),
+            is_on=(status[mask] == STATUS_NOTE_ON) & (velocity > 0),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    @property
+    def on_ticks(self) -> np.ndarray:
+        return self.ticks[self.is_on]
+
+    @property
+    def on_pitches(self) -> np.ndarray:
+        return self.pitch[self.is_on]
+
+    @property
+    def on_velocities(self) -> np.ndarray:
+        return self.velocity[self.is_on]
+
+    def pitch_histogram(self) -> np.ndarray:
+        """Note-on count per note number (128 bins)."""
+        return np.bincount(self.on_pitches, minlength=MIDI_NOTES)
+
+    def max_onsets_per_tick(self) -> int:
+        """Largest number of note-ons sharing one tick."""
+        on_ticks = self.on_ticks
+        if not len(on_ticks):
+            return 0
+        return int(np.unique(on_ticks, return_counts=True)[1].max())
+
+    def first_release_durations(self) -> np.ndarray:
+        """
+        For each note-on, ticks to the first later note-off of the same pitch.
+
+        Note-ons with no later note-off are skipped. Any channel matches.
+
+        :return: np.ndarray int64
+        """
+        off = ~self.is_on
+        if not off.any() or not self.is_on.any():
+            return np.empty(0, dtype=np.int64)
+        # --- One sorted key per (pitch, tick); ticks fit well below 2**40
+        span = np.int64(1) << 40
+        off_keys = np.sort(self.pitch[off] * span + self.ticks[off])
+        on_keys = self.on_pitches * span + self.on_ticks
+        found = np.searchsorted(off_keys, on_keys, side="right")
+        valid = found < len(off_keys)
+        found = found[valid]
+        on_keys = on_keys[valid]
+        same_pitch = off_keys[found] // span == on_keys // span
+        return (off_keys[found] - on_keys)[same_pitch]
+
+    def pair(self) -> "NotePairs":
+        """
+        Pair note-offs with the note-ons they end, per pitch.
+
+        :return: NotePairs
+        """
+        count = len(self)
+        is_on = self.is_on
+        # --- Previous and next event on the same pitch (-1 / count at the ends)
+        order = np.argsort(self.pitch, kind="stable")
+        same = self.pitch[order][1:] == self.pitch[order][:-1]
+        previous = np.full(count, -1, dtype=np.int64)
+        following = np.full(count, count, dtype=np.int64)
+        previous[order[1:][same]] = order[:-1][same]
+        following[order[:-1][same]] = order[1:][same]
+
+        after_on = previous >= 0
+        after_on[after_on] = is_on[previous[after_on]]
+        ending = ~is_on & after_on  # --- note-offs ending a sounding pitch
+        starting = is_on & ~after_on  # --- note-ons of a silent pitch
+        sounding = np.cumsum(starting.astype(np.int64) - ending.astype(np.int64))
+
+        off_index = np.flatnonzero(ending)
+        return NotePairs(
+            notes=self,
+            on_index=previous[off_index],
+            off_index=off_index,
+            following=following,
+            max_polyphony=int(sounding[is_on].max()) if is_on.any() else 0,
+        )
+
+
+@dataclass(frozen=True)
+class NotePairs:
+    """Sounding notes of one track: note-ons with the note-offs ending them."""
+
+    notes: NoteArrays
+    on_index: np.ndarray  # index in notes of each note's note-on
+    off_index: np.ndarray  # index in notes of each note's note-off
+    following: np.ndarray  # per event, index of the next event on its pitch
+    max_polyphony: int  # most pitches sounding at once, counted at note-ons
+
+    @property
+    def durations(self) -> np.ndarray:
+        """Note lengths in ticks, in note-off order."""
+        ticks = self.notes.ticks
+        return ticks[self.off_index] - ticks[self.on_index]
+
+    def legato_count(self) -> int:
+        """
+        Number of (note, other note) pairs where the other note started
+        strictly inside the note and was still sounding when it ended.
+
+        :return: int
+        """
+        if not len(self.off_index):
+            return 0
+        notes = self.notes
+        on_events = np.flatnonzero(notes.is_on)
+        on_ticks = notes.ticks[on_events]
+        low = np.searchsorted(on_ticks, notes.ticks[self.on_index], side="right")
+        high = np.searchsorted(on_ticks, notes.ticks[self.off_index], side="left")
+        width = np.maximum(high - low, 0)
+        total = int(width.sum())
+        if not total:
+            return 0
+        # --- Expand each note's window of candidate note-ons
+        owner = np.repeat(np.arange(len(width)), width)
+        offset = np.arange(total) - np.repeat(np.cumsum(width) - width, width)
+        candidate = on_events[low[owner] + offset]
+        # --- A candidate still sounds if its pitch has no event up to the note-off
+        return int(np.count_nonzero(self.following[candidate] > self.off_index[owner]))
+
+
+def track_digest(columns: TrackColumns) -> bytes:
+    """
+    Content hash of a track's columns.
+
+    :param columns: TrackColumns
+    :return: bytes 16-byte digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in (columns.ticks, columns.status, columns.data1, columns.data2):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    digest.update((columns.name or "").encode("utf-8", "replace"))
+    return digest.digest()
+
+
+_ANALYSES: "OrderedDict[Hashable, object]" = OrderedDict()
+_ANALYSES_LOCK = threading.Lock()
+
+
+def cached_analysis(kind: str, columns: TrackColumns, compute: Callable[[], T]) -> T:
+    """
+    An analysis of a track, computed once per track content and position.
+
+    Cached results are shared; callers must not modify them.
+
+    :param kind: str analysis name, e.g. "drums"
+    :param columns: TrackColumns
+    :param compute: Callable[[], T] computes the analysis on a miss
+    :return: T
+    """
+    key = (kind, columns.index, track_digest(columns))
+    with _ANALYSES_LOCK:
+        if key in _ANALYSES:
+            _ANALYSES.move_to_end(key)
+            return _ANALYSES[key]
+    result = compute()
+    with _ANALYSES_LOCK:
+        _ANALYSES[key] = result
+        while len(_ANALYSES) > ANALYSIS_CACHE_SIZE:
+            _ANALYSES.popitem(last=False)
+    return result
+
+
+def clear_analysis_cache() -> None:
+    """Drop all cached track analyses."""
+    with _ANALYSES_LOCK:
+        _ANALYSES.clear()
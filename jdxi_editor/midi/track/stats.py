@@ -22,6 +22,9 @@ class TrackStats:
     note_count: int = 0
     notes: list[int] = field(default_factory=list)
     velocities: list[int] = field(default_factory=list)
+    velocity_range: int = 0
+    velocity_std: float = 0.0
+    pitch_histogram: list[int] = field(default_factory=list)  # note-ons per note
 
     lowest_note: int = 127
     highest_note: int = 0
@@ -5,13 +5,19 @@ This module provides functions to analyze MIDI tracks and identify which tracks
 are likely drum tracks based on various heuristics.
 """
 
-from collections import defaultdict
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-import mido
+import numpy as np
 from mido import MidiFile, MidiTrack
 
-from picomidi.message.type import MidoMessageType
+from jdxi_editor.midi.file.model import (
+    STATUS_CONTROL_CHANGE,
+    STATUS_PITCHWHEEL,
+    TrackColumns,
+    index_track,
+    midi_file_model,
+)
+from jdxi_editor.midi.track.notes import NoteArrays, cached_analysis
 
 # Standard General MIDI drum note range (35-81)
 DRUM_NOTE_MIN = 35
@@ -34,16 +40,24 @@ DRUM_KEYWORDS = [
 ]
 
 
-def analyze_track_for_drums(track: MidiTrack, track_index: int) -> dict:
+def analyze_track_for_drums(
+    track: MidiTrack, track_index: int, columns: Optional[TrackColumns] = None
+) -> dict:
     """
     Analyze a MIDI track to determine if it's likely a drum track.
 
     Returns a dictionary with analysis results and a score.
+
+    :param track: MidiTrack
+    :param track_index: int
+    :param columns: Optional[TrackColumns] the track's indexed columns, e.g. from the file model
     """
+    if columns is None:
+        columns = index_track(track, track_index)
     analysis = {
         "track_index": track_index,
-        "track_name": None,
-        "channels": set(),
+        "track_name": columns.name,
+        "channels": set(columns.channels),
         "note_count": 0,
         "drum_note_count": 0,
         "note_ons": [],
@@ -53,70 +67,41 @@ def analyze_track_for_drums(track: MidiTrack, track_index: int) -> dict:
         "max_simultaneous": 0,
         "has_pitch_bend": False,
         "has_control_change": False,
-        "program_changes": [],
+        "program_changes": list(columns.programs),
         "score": 0.0,
     }
 
-    # Extract track name from meta messages
-    for msg in track:
-        if msg.is_meta and msg.type == "track_name":
-            analysis["track_name"] = msg.name
-            break
-
-    # Analyze messages
-    active_notes = defaultdict(int)  # Track active notes at each tick
-    absolute_time = 0
-    note_durations = []
-
-    for msg in track:
-        absolute_time += msg.time
-
-        if msg.is_meta:
-            continue
-
-        if hasattr(msg, "channel"):
-            analysis["channels"].add(msg.channel)
-
-        if msg.type == MidoMessageType.NOTE_ON.value and msg.velocity > 0:
-            analysis["note_count"] += 1
-            analysis["note_ons"].append((absolute_time, msg.note, msg.channel))
-
-            # Check if note is in drum range
-            if DRUM_NOTE_MIN <= msg.note <= DRUM_NOTE_MAX:
-                analysis["drum_note_count"] += 1
-
-            # Track simultaneous notes
-            active_notes[absolute_time] += 1
-            analysis["max_simultaneous"] = max(
-                analysis["max_simultaneous"], active_notes[absolute_time]
-            )
-
-        elif msg.type == MidoMessageType.NOTE_OFF.value or (
-            msg.type == MidoMessageType.NOTE_ON.value and msg.velocity == 0
-        ):
-            analysis["note_offs"].append((absolute_time, msg.note))
-
-        elif msg.type == MidoMessageType.PITCH_WHEEL:
-            analysis["has_pitch_bend"] = True
-
-        elif msg.type == MidoMessageType.CONTROL_CHANGE.value:
-            analysis["has_control_change"] = True
-
-        elif msg.type == MidoMessageType.PROGRAM_CHANGE.value:
-            analysis["program_changes"].append(msg.program)
-
-    # Calculate average note duration (simplified)
-    if analysis["note_ons"] and analysis["note_offs"]:
-        # Match note ons with note offs (simplified approach)
-        durations = []
-        for on_time, note, _ in analysis["note_ons"]:
-            # Find corresponding note off
-            for off_time, off_note in analysis["note_offs"]:
-                if off_note == note and off_time > on_time:
-                    durations.append(off_time - on_time)
-                    break
-        if durations:
-            analysis["avg_note_duration"] = sum(durations) / len(durations)
+    notes = NoteArrays.from_columns(columns)
+    on_pitches = notes.on_pitches
+    analysis["note_count"] = len(on_pitches)
+    analysis["note_ons"] = list(
+        zip(
+            notes.on_ticks.tolist(),
+            on_pitches.tolist(),
+            notes.channel[notes.is_on].tolist(),
+        )
+    )
+    off = ~notes.is_on
+    analysis["note_offs"] = list(
+        zip(notes.ticks[off].tolist(), notes.pitch[off].tolist())
+    )
+
+    # Check which notes are in drum range
+    analysis["drum_note_count"] = int(
+        np.count_nonzero((on_pitches >= DRUM_NOTE_MIN) & (on_pitches <= DRUM_NOTE_MAX))
+    )
+
+    # Simultaneous notes: note-ons sharing a tick
+    analysis["max_simultaneous"] = notes.max_onsets_per_tick()
+
+    status = columns.status_type
+    analysis["has_pitch_bend"] = bool(np.any(status == STATUS_PITCHWHEEL))
+    analysis["has_control_change"] = bool(np.any(status == STATUS_CONTROL_CHANGE))
+
+    # Average note duration: each note-on to the next note-off of its pitch
+    durations = notes.first_release_durations()
+    if len(durations):
+        analysis["avg_note_duration"] = int(durations.sum()) / len(durations)
 
     # Calculate score
     score = 0.0
@@ -171,12 +156,17 @@ def detect_drum_tracks(
 
     Returns:
         List of tuples (track_index, analysis_dict) for tracks that meet the threshold,
-        sorted by score (descending)
+        sorted by score (descending). Analyses are cached per track content and
+        shared; do not modify them.
     """
     # Analyze all tracks
     track_analyses = []
-    for i, track in enumerate(midi_file.tracks):
-        analysis = analyze_track_for_drums(track, i)
+    for columns in midi_file_model(midi_file).tracks:
+        analysis = cached_analysis(
+            "drums",
+            columns,
+            lambda: analyze_track_for_drums(columns.track, columns.index, columns),
+        )
         track_analyses.append(analysis)
 
     # Sort by score (descending), then by tie-breaker criteria
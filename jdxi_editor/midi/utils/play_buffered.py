@@ -1,13 +1,16 @@
 import os
 import sys
-import time
 from pathlib import Path
 
 import mido
 import rtmidi
 from decologr import Decologr as log
 
-from jdxi_editor.ui.widgets.midi.utils import ticks_to_seconds
+from jdxi_editor.midi.file.model import TempoMap
+from jdxi_editor.midi.playback.realtime import (
+    PlaybackTimeline,
+    RealtimePlaybackScheduler,
+)
 from picomidi.constant import Midi
 from picomidi.message.type import MidoMessageType
 
@@ -74,34 +77,37 @@ def play_buffered(
     """
     play_buffered
 
-    :param buffered_msgs: list
+    Plays the output of buffer_midi_tracks() on a RealtimePlaybackScheduler
+    thread and waits for it to finish. Message times follow every tempo
+    change in the buffer, not only the tempo of the message's own track.
+
+    :param buffered_msgs: list of (absolute_ticks, raw_bytes or None, tempo)
     :param midi_out_port: rtmidi.MidiOut
     :param ticks_per_beat: int
-    :param suppress_program_changes: bool Whether or not to suppress Program Changes
-    :return:
-    Playback function with program change control
+    :param suppress_program_changes: bool Program Changes are sent when True
+        (the name is kept for existing callers)
+    :return: JitterHistogram of the playback
     """
-    start_time = time.time()
-
-    for _, (abs_ticks, msg, tempo) in enumerate(buffered_msgs):
-        # Convert absolute tick time to seconds
-        msg_time_sec = ticks_to_seconds(abs_ticks, tempo, ticks_per_beat)
-        # Compute delay relative to start
-        delay = msg_time_sec - (time.time() - start_time)
-
-        if delay > 0:
-            time.sleep(delay)
-
-        # Send message based on type and program change flag
-        if not msg.is_meta:
-            if msg.type == MidoMessageType.PROGRAM_CHANGE.value:
-                if suppress_program_changes:
-                    midi_out_port.send_message(msg.bytes())
-                else:
-                    # Skip program change if disabled
-                    continue
-            else:
-                midi_out_port.send_message(msg.bytes())
+    # --- Entries without bytes are the set_tempo messages
+    tempo_changes = [(tick, tempo) for tick, raw, tempo in buffered_msgs if raw is None]
+    entries = [(tick, raw) for tick, raw, _ in buffered_msgs if raw is not None]
+    timeline = PlaybackTimeline.build(
+        ticks=(tick for tick, _ in entries),
+        messages=(mido.Message.from_bytes(raw) for _, raw in entries),
+        tracks=(0 for _ in entries),
+        tempo_map=TempoMap.build(ticks_per_beat, tempo_changes),
+    )
+    scheduler = RealtimePlaybackScheduler(
+        timeline, on_event=lambda msg: midi_out_port.send_message(msg.bytes())
+    )
+    scheduler.suppress_program_changes = not suppress_program_changes
+    scheduler.play(0)
+    try:
+        scheduler.join()
+    except KeyboardInterrupt:
+        scheduler.stop()
+        raise
+    return scheduler.jitter
 
 
 if __name__ == "__main__":
@@ -1,12 +1,30 @@
 """
 USBRecorder
+
+pyaudio is imported, and PortAudio initialized, when a recorder first needs
+its audio interface rather than when the module is imported.
 """
 
 import wave
+from types import ModuleType
 
-import pyaudio
 from decologr import Decologr as log
 
+# --- PortAudio sample formats (pyaudio.paInt16, pyaudio.paInt32)
+PA_INT16 = 0x00000008
+PA_INT32 = 0x00000002
+
+
+def import_pyaudio() -> ModuleType:
+    """
+    pyaudio, imported on first use: importing it loads the PortAudio library.
+
+    :return: the pyaudio module
+    """
+    import pyaudio
+
+    return pyaudio
+
 
 class USBRecorder:
     """
@@ -23,14 +41,21 @@ class USBRecorder:
         """
         Initializes the recorder with the specified settings.
         """
-        self.p = pyaudio.PyAudio()
+        self._p = None
         self.input_device_index = input_device_index
         self.channels = channels
         self.rate = rate
         self.frames_per_buffer = frames_per_buffer
         self.file_save_recording: bool = False  # Default to false
         self.usb_port_input_device_index = None
-        self.usb_recording_rates = {"16bit": pyaudio.paInt16, "32bit": pyaudio.paInt32}
+        self.usb_recording_rates = {"16bit": PA_INT16, "32bit": PA_INT32}
+
+    @property
+    def p(self):
+        """The PyAudio instance, created (and PortAudio initialized) on first use."""
+        if self._p is None:
+            self._p = import_pyaudio().PyAudio()
+        return self._p
 
     def list_devices(self):
         """Prints a list of available audio input devices."""
@@ -49,8 +74,7 @@ class USBRecorder:
         """
         Records audio for the specified duration and saves to a .wav file.
         """
-        rates = {"16bit": pyaudio.paInt16, "32bit": pyaudio.paInt32}
-        rate = rates.get(rate, pyaudio.paInt16)
+        rate = self.usb_recording_rates.get(rate, PA_INT16)
         log.message("[USBRecorder] Recording...")
         try:
             stream = self.p.open(
@@ -85,7 +109,7 @@ class USBRecorder:
 
         with wave.open(output_file, "wb") as f:
             f.setnchannels(self.channels)
-            f.setsampwidth(self.p.get_sample_size(pyaudio.paInt16))
+            f.setsampwidth(self.p.get_sample_size(PA_INT16))
             f.setframerate(self.rate)
             f.writeframes(b"".join(frames))
 
@@ -93,7 +117,9 @@ class USBRecorder:
 
     def close(self):
         """Closes the PyAudio instance."""
-        self.p.terminate()
+        if self._p is not None:
+            self._p.terminate()
+            self._p = None
 
     def stop_recording(self):
         """
@@ -128,6 +128,22 @@ class UiPreferencesDialog(QDialog):
         self.silence_midi_notes_layout.addWidget(self.silence_midi_notes_label)
         self.silence_midi_notes_layout.addWidget(self.silence_midi_notes_checkbox)
 
+        # Send MIDI clock with pattern playback so the arpeggiator can follow it
+        from jdxi_editor.globals import send_midi_clock
+
+        self.midi_clock_layout = QHBoxLayout(self)
+        self.midi_clock_icon = QLabel()
+        self.midi_clock_checkbox = QCheckBox("Send MIDI clock during playback")
+        self.midi_clock_checkbox.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.midi_clock_checkbox.setChecked(send_midi_clock())
+        self.midi_clock_icon.setPixmap(
+            JDXi.UI.Icon.get_icon(JDXi.UI.Icon.REPORT).pixmap(self.icon_size)
+        )
+        self.midi_clock_label = QLabel("Sync the JD-Xi to pattern playback:")
+        self.midi_clock_layout.addWidget(self.midi_clock_icon)
+        self.midi_clock_layout.addWidget(self.midi_clock_label)
+        self.midi_clock_layout.addWidget(self.midi_clock_checkbox)
+
         self.buttonBox = QtWidgets.QDialogButtonBox(self)
         self.buttonBox.setGeometry(QtCore.QRect(150, 250, 341, 32))
         self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
@@ -147,6 +163,7 @@ class UiPreferencesDialog(QDialog):
         main_content_layout.addLayout(self.log_level_layout)
         main_content_layout.addLayout(self.logging_layout)
         main_content_layout.addLayout(self.silence_midi_notes_layout)
+        main_content_layout.addLayout(self.midi_clock_layout)
         main_widget.setLayout(main_content_layout)
         main_layout.addWidget(self.buttonBox)
         self.setLayout(main_layout)
@@ -211,7 +228,10 @@ class UiPreferencesDialog(QDialog):
         on_save_settings
         :return: None
         """
-        from jdxi_editor.globals import SILENCE_MIDI_NOTE_LOGGING_KEY
+        from jdxi_editor.globals import (
+            SEND_MIDI_CLOCK_KEY,
+            SILENCE_MIDI_NOTE_LOGGING_KEY,
+        )
 
         settings = self.settings
         try:
@@ -220,6 +240,9 @@ class UiPreferencesDialog(QDialog):
                 SILENCE_MIDI_NOTE_LOGGING_KEY,
                 bool(self.silence_midi_notes_checkbox.isChecked()),
             )
+            settings.setValue(
+                SEND_MIDI_CLOCK_KEY, bool(self.midi_clock_checkbox.isChecked())
+            )
             settings.sync()
             log_settings()
         except Exception as ex:
@@ -110,7 +110,7 @@ class AnalogSynthEditor(BaseSynthEditor):
 
         if self.midi_helper:
             self.midi_helper.midi_program_changed.connect(self._handle_program_change)
-            self.midi_helper.midi_sysex_json.connect(self.dispatch_sysex_to_area)
+            self.subscribe_sysex()
             log.message(scope=self.__class__.__name__, message="MIDI signals connected")
         else:
             log.message(
@@ -36,12 +36,17 @@ Dependencies:
 
 """
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 from decologr import Decologr as log
 from PySide6.QtGui import QShowEvent
 
-from jdxi_editor.midi.data.address.address import JDXiSysExAddress
+from jdxi_editor.midi.data.address.address import (
+    JDXiSysExAddress,
+    JDXiSysExAddressStartMSB,
+    JDXiSysExOffsetProgramLMB,
+    JDXiSysExOffsetSystemUMB,
+)
 from picomidi.sysex.parameter.address import AddressParameter
 
 if TYPE_CHECKING:
@@ -143,9 +148,24 @@ class ArpeggioEditor(BasicEditor):
         self.setup_ui()
 
         if self.midi_helper:
-            self.midi_helper.midi_sysex_json.connect(self.dispatch_sysex_to_area)
+            self.subscribe_sysex(
+                *(
+                    (
+                        JDXiSysExAddressStartMSB.TEMPORARY_PROGRAM.value,
+                        JDXiSysExOffsetSystemUMB.COMMON.value,
+                        lmb.value,
+                    )
+                    for lmb in (
+                        JDXiSysExOffsetProgramLMB.ZONE_DIGITAL_SYNTH_1,
+                        JDXiSysExOffsetProgramLMB.ZONE_DIGITAL_SYNTH_2,
+                        JDXiSysExOffsetProgramLMB.ZONE_ANALOG,
+                        JDXiSysExOffsetProgramLMB.ZONE_DRUM,
+                        JDXiSysExOffsetProgramLMB.CONTROLLER,
+                    )
+                )
+            )
             log.message(
-                "Arpeggio: Connected to midi_sysex_json signal",
+                "Arpeggio: Subscribed to SysEx dispatch bus",
                 scope=self.__class__.__name__,
             )
 
@@ -188,14 +208,14 @@ class ArpeggioEditor(BasicEditor):
             )
         self.data_request()
 
-    def dispatch_sysex_to_area(self, json_sysex_data: str) -> None:
-        """Parse SysEx JSON and update Arpeggio controls."""
+    def dispatch_sysex_to_area(self, json_sysex_data: Union[str, dict]) -> None:
+        """Parse SysEx JSON (or take the dispatch bus dict) and update Arpeggio controls."""
         try:
-            import json
-
             from jdxi_editor.ui.editors.digital.utils import filter_sysex_keys
 
-            sysex_data = json.loads(json_sysex_data)
+            sysex_data = self._parse_sysex_json(json_sysex_data)
+            if not sysex_data:
+                return
             temporary_area = sysex_data.get(SysExSection.TEMPORARY_AREA, "")
             synth_tone = sysex_data.get(SysExSection.SYNTH_TONE, "")
 
@@ -146,7 +146,6 @@ class BaseSynthEditor(SynthEditor):
 
         if self.midi_helper:
             self.midi_helper.midi_program_changed.connect(self._handle_program_change)
-            self.midi_helper.midi_sysex_json.connect(self.dispatch_sysex_to_area)
             log.message(scope="BaseSynthEditor", message="MIDI signals connected")
         else:
             log.message(scope="BaseSynthEditor", message="MIDI signals not connected")
@@ -534,27 +533,22 @@ class BaseSynthEditor(SynthEditor):
             control.blockSignals(True)
             control.setValue(slider_value)
             control.blockSignals(False)
-            # ADSR plot is driven by envelope_changed; refresh after programmatic update
+            # ADSR plot is driven by envelope_changed; refresh once after this update batch
             amp_env = (
                 self.SYNTH_SPEC.Param.AMP_ENV_ATTACK_TIME,
                 self.SYNTH_SPEC.Param.AMP_ENV_DECAY_TIME,
                 self.SYNTH_SPEC.Param.AMP_ENV_SUSTAIN_LEVEL,
                 self.SYNTH_SPEC.Param.AMP_ENV_RELEASE_TIME,
             )
-            if (
-                param in amp_env
-                and hasattr(self, "amp_section")
-                and self.amp_section
-                and getattr(self.amp_section, "adsr_widget", None)
-            ):
-                self.amp_section.adsr_widget.refresh_plot_from_controls()
-            elif (
-                param not in amp_env
-                and hasattr(self, "filter_section")
-                and self.filter_section
-                and getattr(self.filter_section, "adsr_widget", None)
-            ):
-                self.filter_section.adsr_widget.refresh_plot_from_controls()
+            section = (
+                getattr(self, "amp_section", None)
+                if param in amp_env
+                else getattr(self, "filter_section", None)
+            )
+            if section:
+                self.control_refresh.schedule_plot(
+                    getattr(section, "adsr_widget", None)
+                )
             successes.append(param.name)
             log_slider_parameters(self.address, param, midi_value, slider_value)
         else:
@@ -577,7 +571,7 @@ class BaseSynthEditor(SynthEditor):
         :return: None
         """
         new_value = (
-            param.convert_from_midi(value)
+            parameter.convert_from_midi(value)
             if parameter
             in [
                 self.SYNTH_SPEC.Param.OSC_PITCH_ENV_DEPTH,
@@ -595,8 +589,7 @@ class BaseSynthEditor(SynthEditor):
                 pitch_env = self.oscillator_section.widget_for(
                     OscillatorWidgetTypes.PITCH_ENV
                 )
-                if pitch_env is not None:
-                    pitch_env.refresh_plot_from_controls()
+                self.control_refresh.schedule_plot(pitch_env)
             successes.append(parameter.name)
         else:
             failures.append(parameter.name)
@@ -636,8 +629,7 @@ class BaseSynthEditor(SynthEditor):
                 pwm_widget = self.oscillator_section.widget_for(
                     OscillatorWidgetTypes.PWM
                 )
-                if pwm_widget is not None:
-                    pwm_widget.refresh_plot_from_controls()
+                self.control_refresh.schedule_plot(pwm_widget)
             successes.append(parameter.name)
         else:
             failures.append(parameter.name)
@@ -648,6 +640,9 @@ class BaseSynthEditor(SynthEditor):
         """
         Update sliders and combo boxes based on parsed SysEx data.
 
+        Unchanged values are skipped; envelope and PWM plots repaint once per batch.
+
+        :param partial_no: int partial number
         :param sysex_data: dict SysEx data
         :param successes: list SysEx data
         :param failures: list SysEx data
@@ -659,6 +654,9 @@ class BaseSynthEditor(SynthEditor):
         self._log_and_store_sysex_data(sysex_data)
 
         for param_name, param_value in sysex_data.items():
+            # --- Only values that changed since the last update touch widgets
+            if not self.control_refresh.changed(partial_no, param_name, param_value):
+                continue
             self._process_param_update(param_value, param_name, failures, successes)
 
     def _build_param_handlers(self):
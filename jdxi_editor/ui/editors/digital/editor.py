@@ -13,7 +13,7 @@ Classes:
         - Supports real-time parameter updates via SysEx
 
 Features:
-    - Three independent partial editors
+    - Three independent partial editors, each built when its tab is first shown
     - Common parameter controls (portamento, unison, legato, etc.)
     - Preset management and loading
     - Real-time MIDI parameter updates
@@ -67,6 +67,7 @@ from jdxi_editor.ui.editors.digital import (
     DigitalPartialPanel,
     DigitalToneModifySection,
 )
+from jdxi_editor.ui.editors.helpers.tabs import LazyTabs
 from jdxi_editor.ui.preset.helper import JDXiPresetHelper
 from jdxi_editor.ui.preset.widget import InstrumentPresetWidget
 from jdxi_editor.ui.widgets.editor.base import EditorBaseWidget
@@ -148,7 +149,7 @@ class DigitalSynthEditor(BaseSynthEditor):
         if self.midi_helper:
             self.midi_helper.midi_program_changed.connect(self._handle_program_change)
             self.midi_helper.midi_control_changed.connect(self._handle_control_change)
-            self.midi_helper.midi_sysex_json.connect(self.dispatch_sysex_to_area)
+            self.subscribe_sysex()
         self.refresh_shortcut = QShortcut(QKeySequence.StandardKey.Refresh, self)
         self.refresh_shortcut.activated.connect(self.data_request)
 
@@ -282,23 +283,20 @@ class DigitalSynthEditor(BaseSynthEditor):
         JDXi.UI.Theme.apply_tabs_style(self.tab_widget)
         JDXi.UI.Theme.apply_editor_style(self.tab_widget)
         self.partial_editors = {}
-        # --- Create editor for each partial; each panel keeps its own ControlRegistry (populated in __init__ by sections)
-        for i in range(1, 4):
-            editor = DigitalPartialPanel(
-                midi_helper,
-                self.synth_number,
-                i,
-                preset_type=self.preset_type,
-                parent=self,
-            )
-            self.partial_editors[i] = editor
-            # Use tab definitions for partials
-            if i == 1:
-                self._add_tab(key=Digital.Tab.PARTIAL_1, widget=editor)
-            elif i == 2:
-                self._add_tab(key=Digital.Tab.PARTIAL_2, widget=editor)
-            elif i == 3:
-                self._add_tab(key=Digital.Tab.PARTIAL_3, widget=editor)
+        # --- Each partial's panel is built when its tab is first shown
+        self.partial_tabs = LazyTabs(
+            self.tab_widget,
+            build=self._build_partial_panel,
+            on_page_ready=self._on_partial_panel_ready,
+            name=self.__class__.__name__,
+        )
+        partial_tab_keys = {
+            1: Digital.Tab.PARTIAL_1,
+            2: Digital.Tab.PARTIAL_2,
+            3: Digital.Tab.PARTIAL_3,
+        }
+        for partial_number, key in partial_tab_keys.items():
+            self._add_tab(key=key, widget=self.partial_tabs.add_page(partial_number))
 
         self.common_section = DigitalCommonSection(
             address=self.address,
@@ -313,6 +311,21 @@ class DigitalSynthEditor(BaseSynthEditor):
         self._add_tab(key=Digital.Tab.MISC, widget=self.tone_modify_section)
         container_layout.addWidget(self.tab_widget)
 
+    def _build_partial_panel(self, partial_number: int) -> DigitalPartialPanel:
+        """
+        Build the panel of one partial; it keeps its own ControlRegistry.
+
+        :param partial_number: int 1 to 3
+        :return: DigitalPartialPanel
+        """
+        return DigitalPartialPanel(
+            self.midi_helper,
+            self.synth_number,
+            partial_number,
+            preset_type=self.preset_type,
+            parent=self,
+        )
+
     def _on_partial_state_changed(
         self, partial: DigitalPartial, enabled: bool, selected: bool
     ) -> None:
@@ -433,6 +446,8 @@ class DigitalSynthEditor(BaseSynthEditor):
         """
         Apply updates to the UI components based on the received SysEx data. @@@
 
+        Unchanged values are skipped; envelope and PWM plots repaint once per batch.
+
         :param partial_no: int
         :param sysex_data: dict
         :param successes: list
@@ -440,12 +455,11 @@ class DigitalSynthEditor(BaseSynthEditor):
         :return: None
         """
         if partial_no not in self.partial_editors:
-            log.message(
-                f"_update_controls: no partial_editor for partial_no={partial_no}, skipping",
-                scope=self.__class__.__name__,
-            )
-            return
+            return  # --- not built yet; the patch state keeps its values
         for param_name, param_value in sysex_data.items():
+            # --- Only values that changed since the last update touch widgets
+            if not self.control_refresh.changed(partial_no, param_name, param_value):
+                continue
             # Use same param object as sections (class attribute) so pe.controls.get(param) finds the widget
             param = getattr(Digital.Param, param_name, None)
             if not param:
@@ -739,20 +753,17 @@ class DigitalSynthEditor(BaseSynthEditor):
             spinbox.blockSignals(True)
             spinbox.setValue(control_value)
             spinbox.blockSignals(False)
-            # Plot is driven by envelope_changed; refresh it after programmatic update
+            # Plot is driven by envelope_changed; refresh it once after this update batch
             if param in (
                 Digital.Param.AMP_ENV_ATTACK_TIME,
                 Digital.Param.AMP_ENV_DECAY_TIME,
                 Digital.Param.AMP_ENV_SUSTAIN_LEVEL,
                 Digital.Param.AMP_ENV_RELEASE_TIME,
             ):
-                self.partial_editors[
-                    partial_no
-                ].amp_tab.adsr_widget.refresh_plot_from_controls()
+                tab = self.partial_editors[partial_no].amp_tab
             else:
-                self.partial_editors[
-                    partial_no
-                ].filter_tab.adsr_widget.refresh_plot_from_controls()
+                tab = self.partial_editors[partial_no].filter_tab
+            self.control_refresh.schedule_plot(tab.adsr_widget)
             synth_data = create_synth_data(JDXiSynth.DIGITAL_SYNTH_1, partial_no)
             self.address.lmb = synth_data.lmb
             log_slider_parameters(self.address, param, midi_value, control_value)
@@ -798,7 +809,7 @@ class DigitalSynthEditor(BaseSynthEditor):
             control.blockSignals(True)
             control.setValue(new_value)
             control.blockSignals(False)
-            pitch_env.refresh_plot_from_controls()
+            self.control_refresh.schedule_plot(pitch_env)
             successes.append(param.name)
         else:
             failures.append(param.name)
@@ -859,8 +870,7 @@ class DigitalSynthEditor(BaseSynthEditor):
                 pwm_widget = pe.oscillator_tab.widget_for(
                     DigitalOscillatorWidgetTypes.PWM
                 )
-                if pwm_widget is not None:
-                    pwm_widget.refresh_plot_from_controls()
+                self.control_refresh.schedule_plot(pwm_widget)
             successes.append(param.name)
         else:
             failures.append(param.name)
@@ -36,6 +36,10 @@ Features
 - Supports drum kit preset selection and loading.
 - Provides sliders, spin boxes, and combo boxes for adjusting kit parameters.
 - Includes address tabbed interface for managing individual drum partials.
+  A partial's panel is built when its tab is first shown; until then its
+  values are kept by the patch state model and loaded into the panel when it
+  is built. With ``share_partial_panel`` ("Share Drum Panel" in the
+  Performance panel) one panel is rebound to whichever partial is shown.
 - Sends MIDI System Exclusive (SysEx) messages to update the JD-Xi in real time.
 
 Usage
@@ -67,18 +71,21 @@ if TYPE_CHECKING:
 from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import QGroupBox, QTabWidget
 
+from jdxi_editor.globals import shared_drum_panel
 from jdxi_editor.midi.data.address.address import JDXiSysExOffsetProgramLMB
 from jdxi_editor.midi.data.drum.data import JDXiMapPartialDrum
 from jdxi_editor.midi.data.parameter.drum.common import DrumCommonParam
 from jdxi_editor.midi.data.parameter.drum.partial import DrumPartialParam
 from jdxi_editor.midi.io.helper import MidiIOHelper
+from jdxi_editor.midi.patch.state import PatchState
+from jdxi_editor.midi.sysex.request.midi_requests import MidiRequests
 from jdxi_editor.ui.common import JDXi, QVBoxLayout, QWidget
 from jdxi_editor.ui.editors.drum.common import DrumCommonSection
 from jdxi_editor.ui.editors.drum.partial.panel import DrumPartialPanel
+from jdxi_editor.ui.editors.helpers.tabs import LazyTabs
 from jdxi_editor.ui.editors.synth.editor import SynthEditor
 from jdxi_editor.ui.preset.helper import JDXiPresetHelper
 from jdxi_editor.ui.preset.widget import InstrumentPresetWidget
-from jdxi_editor.ui.widgets.dialog.progress import ProgressDialog
 from jdxi_editor.ui.widgets.editor.base import EditorBaseWidget
 
 
@@ -90,8 +97,20 @@ class DrumCommonEditor(SynthEditor):
         midi_helper: Optional[MidiIOHelper] = None,
         preset_helper: Optional[JDXiPresetHelper] = None,
         parent: Optional["JDXiInstrument"] = None,
+        share_partial_panel: Optional[bool] = None,
     ):
+        """
+        :param midi_helper: Optional[MidiIOHelper]
+        :param preset_helper: Optional[JDXiPresetHelper]
+        :param parent: Optional[JDXiInstrument]
+        :param share_partial_panel: Optional[bool] rebind one partial panel to
+            every drum partial; None reads the saved setting
+        """
         super().__init__(midi_helper, parent)
+        if share_partial_panel is None:
+            share_partial_panel = shared_drum_panel()
+        self.share_partial_panel = share_partial_panel
+        self._partial_names: Dict[int, str] = {}
         # Helpers
         self.instrument_image_group: QGroupBox | None = None
         self.presets_parts_tab_widget = None
@@ -115,7 +134,7 @@ class DrumCommonEditor(SynthEditor):
         if self.midi_helper:
             self.midi_helper.midi_program_changed.connect(self._handle_program_change)
             self.midi_helper.midi_control_changed.connect(self._handle_control_change)
-            self.midi_helper.midi_sysex_json.connect(self.dispatch_sysex_to_area)
+            self.subscribe_sysex()
         self.refresh_shortcut = QShortcut(QKeySequence.StandardKey.Refresh, self)
         self.refresh_shortcut.activated.connect(self.data_request)
         # Note: data_request() is called in showEvent() when editor is displayed
@@ -215,7 +234,6 @@ class DrumCommonEditor(SynthEditor):
 
         self.update_instrument_image()
         self.partial_tab_widget.currentChanged.connect(self.update_partial_number)
-        self.midi_helper.midi_sysex_json.connect(self.dispatch_sysex_to_area)
         # Note: data_request() is called in showEvent() when editor is displayed
 
     def _handle_program_change(self, channel: int, program: int):
@@ -232,94 +250,86 @@ class DrumCommonEditor(SynthEditor):
 
     def _setup_partial_editors(self):
         """
-        Setup the 36 partial editors
+        Add a tab per drum partial; each partial's panel is built when its tab
+        is first shown, or one shared panel is rebound to it.
         """
-        total = len(self.partial_mapping)
-
-        # Use splash screen if available, otherwise fall back to ProgressDialog
-        splash = None
-        splash_progress = None
-        splash_status = None
-        if (
-            self.main_window
-            and hasattr(self.main_window, "splash")
-            and self.main_window.splash
-        ):
-            splash = self.main_window.splash
-            splash_progress = self.main_window.splash_progress_bar
-            splash_status = self.main_window.splash_status_label
-
-        if splash and splash_progress and splash_status:
-            # Update splash screen
-            splash_status.setText(f"Loading drum kit parts ({total} parts)...")
-            splash_progress.setValue(60)  # Start at 60% for drum kit loading
-            from PySide6.QtWidgets import QApplication
-
-            QApplication.processEvents()
-        else:
-            # Fall back to ProgressDialog if splash screen not available
-            progress_dialog = ProgressDialog(
-                "Initializing Editor Window", "Loading drum kit:...", total, self
-            )
-            progress_dialog.show()
-
-        for count, (partial_name, partial_number) in enumerate(
-            self.partial_mapping.items(), 1
-        ):
-            if splash and splash_progress and splash_status:
-                # Update splash screen
-                splash_status.setText(f"Loading {partial_name} ({count} of {total})")
-                # Progress from 60% to 90% for drum kit loading
-                progress_value = 60 + int((count / total) * 30)
-                splash_progress.setValue(progress_value)
-                from PySide6.QtWidgets import QApplication
-
-                QApplication.processEvents()
-            elif not splash:
-                # Use ProgressDialog
-                progress_dialog.progress_bar.setFormat(
-                    f"Loading {partial_name} ({count} of {total})"
-                )
+        self.partial_tabs = LazyTabs(
+            self.partial_tab_widget,
+            build=self._build_partial_panel,
+            on_page_ready=self._on_partial_panel_ready,
+            rebind=self._rebind_partial_panel if self.share_partial_panel else None,
+            name=self.__class__.__name__,
+        )
+        self._partial_names = {
+            partial_number: partial_name
+            for partial_name, partial_number in self.partial_mapping.items()
+        }
+        for partial_name, partial_number in self.partial_mapping.items():
+            self.partial_tabs.add_tab(partial_number, partial_name)
+
+    def _build_partial_panel(self, partial_number: int) -> DrumPartialPanel:
+        """
+        Build the panel of one drum partial.
 
-            editor = DrumPartialPanel(
-                midi_helper=self.midi_helper,
-                partial_number=partial_number,
-                partial_name=partial_name,
-                parent=self,
-            )
-            self.partial_editors[partial_number] = editor
-            self.partial_tab_widget.addTab(editor, partial_name)
+        :param partial_number: int
+        :return: DrumPartialPanel
+        """
+        return DrumPartialPanel(
+            midi_helper=self.midi_helper,
+            partial_number=partial_number,
+            partial_name=self._partial_names[partial_number],
+            parent=self,
+        )
+
+    def _rebind_partial_panel(
+        self, panel: DrumPartialPanel, partial_number: int
+    ) -> None:
+        """
+        Point the shared panel at another drum partial.
 
-            if not splash:
-                progress_dialog.update_progress(count)
+        Controls the patch state holds no value for still show the previous
+        partial's, so unless the partial's area is complete it is requested
+        from the synth; the reply updates them.
 
-        if not splash:
-            progress_dialog.close()
-        elif splash_progress:
-            # Complete drum kit loading
-            splash_progress.setValue(90)
-            splash_status.setText("Drum kit loaded successfully")
-            from PySide6.QtWidgets import QApplication
+        :param panel: DrumPartialPanel
+        :param partial_number: int
+        :return: None
+        """
+        panel.bind_partial(partial_number, self._partial_names[partial_number])
+        if self.midi_helper is not None and not self._partial_complete(panel):
+            self.midi_helper.request_data(
+                [MidiRequests.drum_partial(panel.address.lmb)]
+            )
 
-            QApplication.processEvents()
+    def _partial_complete(self, panel: DrumPartialPanel) -> bool:
+        """
+        Whether the patch state has seen every parameter of a partial panel's area.
+
+        :param panel: DrumPartialPanel
+        :return: bool
+        """
+        patch_state = getattr(self.midi_helper, "patch_state", None)
+        if not isinstance(patch_state, PatchState):
+            return False
+        address = panel.address
+        area = patch_state.area_at((address.msb, address.umb, address.lmb, 0))
+        return area is not None and area.spec.name in patch_state.complete_areas()
 
     def update_partial_number(self, index: int):
         """
         Update the current partial number based on tab index
 
-        :param index: int partial number
+        :param index: int tab index
         """
-        try:
-            partial_name = list(self.partial_editors.keys())[index]
-            self.partial_number = index
-            log.message(
-                f"Updated to partial {partial_name} (index {index})",
-                scope=self.__class__.__name__,
-            )
-        except IndexError:
-            log.message(
-                f"Invalid partial index: {index}", scope=self.__class__.__name__
-            )
+        partial_number = self.partial_tabs.key_at(index)
+        if partial_number is None:
+            log.message(f"Tab {index} is not a partial", scope=self.__class__.__name__)
+            return
+        self.partial_number = partial_number
+        log.message(
+            f"Updated to partial {self._partial_names[partial_number]} (index {index})",
+            scope=self.__class__.__name__,
+        )
 
     def _update_controls(
         self, partial_no: int, sysex_data: dict, successes: list, failures: list
@@ -333,7 +343,8 @@ class DrumCommonEditor(SynthEditor):
         :param failures: list
         :return:
         """
-
+        if partial_no not in self.partial_editors:
+            return  # --- not built yet; the patch state keeps its values
         for param_name, param_value in sysex_data.items():
             param = DrumPartialParam.get_by_name(param_name)
             if param:
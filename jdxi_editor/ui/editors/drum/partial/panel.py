@@ -171,3 +171,25 @@ class DrumPartialPanel(PartialPanel):
 
         main_layout.addWidget(scroll_area)
         scroll_area.setMinimumHeight(1200)
+
+    def bind_partial(self, partial_number: int, partial_name: str) -> None:
+        """
+        Point this panel at another drum partial, keeping its widgets.
+
+        The sections hold this panel's address object, so it is updated in
+        place; the caller loads the new partial's values into the controls, or
+        requests them when the patch state has not seen them all.
+
+        :param partial_number: int
+        :param partial_name: str e.g. "SD1"
+        :return: None
+        """
+        address = self.address
+        self.partial_number = partial_number
+        self.partial_name = partial_name
+        self._init_synth_data(
+            synth_type=JDXiSynth.DRUM_KIT, partial_number=partial_number
+        )
+        address.lmb = self.address.lmb
+        self.address = address
+        self.control_refresh.forget()
@@ -57,6 +57,8 @@ Features:
 
 from __future__ import annotations
 
+from typing import Union
+
 from decologr import Decologr as log
 from PySide6.QtGui import QShowEvent
 from PySide6.QtWidgets import (
@@ -313,11 +315,25 @@ class EffectsCommonEditor(BasicEditor):
                 sw.valueChanged.connect(handler)
                 handler()  # Set initial enabled state
 
-        # Connect to MIDI helper signals to receive SysEx data
+        # Subscribe to the Effects blocks of the Temporary Program on the SysEx dispatch bus
         if self.midi_helper:
-            self.midi_helper.midi_sysex_json.connect(self.dispatch_sysex_to_area)
+            self.subscribe_sysex(
+                *(
+                    (
+                        JDXiSysExAddressStartMSB.TEMPORARY_PROGRAM.value,
+                        JDXiSysExOffsetSystemUMB.COMMON.value,
+                        lmb.value,
+                    )
+                    for lmb in (
+                        JDXiSysExOffsetProgramLMB.EFFECT_1,
+                        JDXiSysExOffsetProgramLMB.EFFECT_2,
+                        JDXiSysExOffsetProgramLMB.DELAY,
+                        JDXiSysExOffsetProgramLMB.REVERB,
+                    )
+                )
+            )
             log.message(
-                "🎛️: Connected to midi_sysex_json signal", scope=self.__class__.__name__
+                "🎛️: Subscribed to SysEx dispatch bus", scope=self.__class__.__name__
             )
         else:
             log.warning(
@@ -1087,7 +1103,7 @@ class EffectsCommonEditor(BasicEditor):
             )
             return False
 
-    def dispatch_sysex_to_area(self, json_sysex_data: str) -> None:
+    def dispatch_sysex_to_area(self, json_sysex_data: Union[str, dict]) -> None:
         """Thin adapter: parse → validate → dispatch"""
 
         log.message("🎛️ _dispatch_sysex_to_area called", scope="EffectsCommonEditor")
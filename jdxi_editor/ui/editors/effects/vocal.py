@@ -21,7 +21,7 @@ Dependencies:
 
 """
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 from decologr import Decologr as log
 from PySide6.QtGui import QShowEvent
@@ -46,6 +46,11 @@ from jdxi_editor.midi.data.vocal_effects.vocal import (
     VocoderEnvelope,
     VocoderHPF,
 )
+from jdxi_editor.midi.data.address.address import (
+    JDXiSysExAddressStartMSB,
+    JDXiSysExOffsetProgramLMB,
+    JDXiSysExOffsetSystemUMB,
+)
 from jdxi_editor.midi.io.helper import MidiIOHelper
 from jdxi_editor.midi.sysex.request.midi_requests import MidiRequests
 from jdxi_editor.midi.sysex.sections import SysExSection
@@ -135,9 +140,21 @@ class VocalFXEditor(BasicEditor):
         ]
 
         if self.midi_helper:
-            self.midi_helper.midi_sysex_json.connect(self.dispatch_sysex_to_area)
+            self.subscribe_sysex(
+                *(
+                    (
+                        JDXiSysExAddressStartMSB.TEMPORARY_PROGRAM.value,
+                        JDXiSysExOffsetSystemUMB.COMMON.value,
+                        lmb.value,
+                    )
+                    for lmb in (
+                        JDXiSysExOffsetProgramLMB.COMMON,
+                        JDXiSysExOffsetProgramLMB.VOCAL_EFFECT,
+                    )
+                )
+            )
             log.message(
-                "🎛️: Connected to midi_sysex_json signal",
+                "🎛️: Subscribed to SysEx dispatch bus",
                 scope=self.__class__.__name__,
             )
 
@@ -151,14 +168,14 @@ class VocalFXEditor(BasicEditor):
             )
         self.data_request()
 
-    def dispatch_sysex_to_area(self, json_sysex_data: str) -> None:
-        """Parse SysEx JSON and update Vocal FX controls."""
+    def dispatch_sysex_to_area(self, json_sysex_data: Union[str, dict]) -> None:
+        """Parse SysEx JSON (or take the dispatch bus dict) and update Vocal FX controls."""
         try:
-            import json
-
             from jdxi_editor.ui.editors.digital.utils import filter_sysex_keys
 
-            sysex_data = json.loads(json_sysex_data)
+            sysex_data = self._parse_sysex_json(json_sysex_data)
+            if not sysex_data:
+                return
             temporary_area = sysex_data.get(SysExSection.TEMPORARY_AREA, "")
             synth_tone = sysex_data.get(SysExSection.SYNTH_TONE, "")
 
@@ -0,0 +1,105 @@
+"""
+Incremental control refresh for synth editors
+=============================================
+
+Incoming SysEx is decoded into a full parameter block (a Digital partial is
+well over a hundred parameters) and handed to ``_update_controls``. Most of
+those values have not changed since the last block, and the envelope, pitch
+envelope and PWM parameters each used to repaint their plot immediately, so
+one block repainted the same plot several times.
+
+``ControlRefresh`` keeps the last value applied per (partial, parameter) so
+unchanged values are skipped, and collects plot widgets to repaint. Plots are
+flushed once, on the next turn of the Qt event loop, however many of their
+parameters arrived.
+
+Example usage:
+--------------
+>>> refresh = ControlRefresh()
+>>> if refresh.changed(1, param, value):
+...     control.setValue(value)
+...     refresh.schedule_plot(adsr_widget)
+>>> refresh.forget(param)   # value edited locally; apply the next incoming one
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from decologr import Decologr as log
+from PySide6.QtCore import QTimer
+
+
+def _next_event_loop_turn(callback: Callable[[], None]) -> None:
+    QTimer.singleShot(0, callback)
+
+
+class ControlRefresh:
+    """
+    Change detection and coalesced plot refresh for one editor.
+
+    :param schedule: Callable run with the flush callback; defaults to the next event-loop turn
+    """
+
+    def __init__(self, schedule: Optional[Callable[[Callable[[], None]], None]] = None):
+        self._schedule = schedule or _next_event_loop_turn
+        self._last_values: Dict[Hashable, Dict[Any, Any]] = {}
+        self._pending_plots: Dict[int, Any] = {}
+        self._flush_scheduled = False
+
+    def changed(self, partial_no: Any, param: Hashable, value: Any) -> bool:
+        """
+        Record a value and report whether it differs from the last one applied.
+
+        :param partial_no: partial number (or None for editors without partials)
+        :param param: Hashable parameter
+        :param value: incoming value
+        :return: bool True when the controls need updating
+        """
+        last = self._last_values.setdefault(param, {})
+        if partial_no in last and last[partial_no] == value:
+            return False
+        last[partial_no] = value
+        return True
+
+    def forget(self, param: Hashable = None) -> None:
+        """
+        Drop remembered values so the next incoming value is applied.
+
+        :param param: Hashable parameter, or None to forget everything
+        :return: None
+        """
+        if param is None:
+            self._last_values.clear()
+        else:
+            self._last_values.pop(param, None)
+
+    def schedule_plot(self, widget: Any) -> None:
+        """
+        Queue ``widget.refresh_plot_from_controls()`` for the next flush.
+
+        :param widget: plot widget (ADSR, pitch envelope, PWM)
+        :return: None
+        """
+        if widget is None:
+            return
+        self._pending_plots[id(widget)] = widget
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._schedule(self.flush)
+
+    def flush(self) -> int:
+        """
+        Repaint every queued plot once.
+
+        :return: int number of plots refreshed
+        """
+        pending = list(self._pending_plots.values())
+        self._pending_plots.clear()
+        self._flush_scheduled = False
+        refreshed = 0
+        for widget in pending:
+            try:
+                widget.refresh_plot_from_controls()
+                refreshed += 1
+            except RuntimeError as ex:  # --- widget deleted before the flush
+                log.warning(f"Plot refresh skipped: {ex}", scope="ControlRefresh")
+        return refreshed
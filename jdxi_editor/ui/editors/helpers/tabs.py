@@ -0,0 +1,196 @@
+"""
+Tabs built on first show
+========================
+
+The drum kit editor has one tab per drum pad (38 of them) and the Digital
+editors one per partial. Each of those pages holds a few hundred sliders, combo
+boxes and envelope plots, and building them all when the editor opens costs
+time and memory for pages the user may never look at.
+
+``LazyTabs`` adds a light ``DeferredPage`` for each tab and builds the real
+page the first time its tab becomes current, or when a caller asks for it.
+Until then the page's values live in the patch state model
+(``MidiIOHelper.patch_state``), which records every parameter received or
+sent; ``on_page_ready`` loads them into the page once it exists.
+
+With ``rebind`` one page is pooled: it is built once and moved into whichever
+tab is shown, and ``rebind(page, key)`` points it at the new key before
+``on_page_ready`` loads that key's values.
+
+Classes:
+    DeferredPage: Empty tab page holding the real page once it is built.
+    LazyTabs: Builds, or rebinds, the page of a tab when it is first shown.
+
+Example usage:
+--------------
+>>> tabs = LazyTabs(tab_widget, build=make_panel, on_page_ready=load_values)
+>>> for partial_name, partial_number in partial_map.items():
+...     tabs.add_tab(partial_number, partial_name)
+>>> tab_widget.addTab(tabs.add_page(3), "Partial 3")   # caller adds the tab
+>>> tabs.page(partial_number)      # the built page, or None
+>>> tabs.ensure(partial_number)    # build it now
+"""
+
+from typing import Callable, Dict, Hashable, List, Optional
+
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QTabWidget, QVBoxLayout, QWidget
+
+from jdxi_editor.core.instrumentation import instruments
+
+
+class DeferredPage(QWidget):
+    """Tab page standing in for the real page until it is built."""
+
+    def __init__(self, key: Hashable, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.key = key
+        self.content: Optional[QWidget] = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+    def set_content(self, widget: QWidget) -> None:
+        """
+        Show widget in this page, taking it from the page that held it.
+
+        :param widget: QWidget the real page
+        :return: None
+        """
+        if self.content is widget:
+            return
+        previous = widget.parentWidget()
+        if isinstance(previous, DeferredPage):
+            previous.take_content()
+        self.layout().addWidget(widget)
+        widget.show()
+        self.content = widget
+
+    def take_content(self) -> Optional[QWidget]:
+        """
+        Remove the real page from this page; the widget itself is kept.
+
+        :return: Optional[QWidget] the page removed
+        """
+        widget, self.content = self.content, None
+        if widget is not None:
+            self.layout().removeWidget(widget)
+        return widget
+
+
+class LazyTabs:
+    """
+    Builds the page of each tab of a QTabWidget when the tab is first shown.
+
+    :param tab_widget: QTabWidget the tabs are added to
+    :param build: Callable[[Hashable], QWidget] builds the page for a key
+    :param on_page_ready: Optional[Callable[[Hashable, QWidget], None]] called
+        each time a page is built or rebound, e.g. to load its values
+    :param rebind: Optional[Callable[[QWidget, Hashable], None]] when given,
+        one page is built and rebound to whichever key is shown
+    :param name: str metric name, ``ui.tab_build.<name>``
+    """
+
+    def __init__(
+        self,
+        tab_widget: QTabWidget,
+        build: Callable[[Hashable], QWidget],
+        on_page_ready: Optional[Callable[[Hashable, QWidget], None]] = None,
+        rebind: Optional[Callable[[QWidget, Hashable], None]] = None,
+        name: str = "tabs",
+    ):
+        self.tab_widget = tab_widget
+        self._build = build
+        self._on_page_ready = on_page_ready
+        self._rebind = rebind
+        self._metric = f"ui.tab_build.{name}"
+        self._deferred: Dict[Hashable, DeferredPage] = {}
+        self._shared: Optional[QWidget] = None
+        self.pages: Dict[Hashable, QWidget] = {}  # --- key -> page built for it
+        tab_widget.currentChanged.connect(self._on_current_changed)
+
+    @property
+    def keys(self) -> List[Hashable]:
+        """Keys of the tabs added, in order."""
+        return list(self._deferred)
+
+    @property
+    def shared(self) -> bool:
+        """Whether one page is rebound to every key."""
+        return self._rebind is not None
+
+    def add_page(self, key: Hashable) -> DeferredPage:
+        """
+        A page for key, for callers adding the tab themselves.
+
+        :param key: Hashable e.g. the partial number
+        :return: DeferredPage to add to the tab widget
+        """
+        deferred = self._deferred[key] = DeferredPage(key)
+        return deferred
+
+    def add_tab(self, key: Hashable, label: str, icon: Optional[QIcon] = None) -> int:
+        """
+        Add a tab whose page is built when it is first shown.
+
+        :param key: Hashable e.g. the partial number
+        :param label: str tab label
+        :param icon: Optional[QIcon]
+        :return: int tab index
+        """
+        deferred = self.add_page(key)
+        if icon is None:
+            return self.tab_widget.addTab(deferred, label)
+        return self.tab_widget.addTab(deferred, icon, label)
+
+    def key_at(self, index: int) -> Optional[Hashable]:
+        """
+        Key of the tab at index.
+
+        :param index: int tab index
+        :return: Optional[Hashable] None for tabs not added here
+        """
+        widget = self.tab_widget.widget(index)
+        if not isinstance(widget, DeferredPage):
+            return None
+        return widget.key if self._deferred.get(widget.key) is widget else None
+
+    def page(self, key: Hashable) -> Optional[QWidget]:
+        """
+        The page built for key, without building it.
+
+        :param key: Hashable
+        :return: Optional[QWidget] None until the tab has been shown
+        """
+        return self.pages.get(key)
+
+    def ensure(self, key: Hashable) -> QWidget:
+        """
+        The page for key, building it (or rebinding the shared page) if needed.
+
+        :param key: Hashable
+        :return: QWidget
+        """
+        page = self.pages.get(key)
+        if page is not None:
+            return page
+        deferred = self._deferred[key]
+        with instruments.span(self._metric):
+            if self._rebind is None:
+                page = self._build(key)
+            elif self._shared is None:
+                page = self._shared = self._build(key)
+            else:
+                page = self._shared
+                self._rebind(page, key)
+                self.pages.clear()
+            deferred.set_content(page)
+            self.pages[key] = page
+            if self._on_page_ready is not None:
+                self._on_page_ready(key, page)
+        return page
+
+    def _on_current_changed(self, index: int) -> None:
+        key = self.key_at(index)
+        if key is not None:
+            self.ensure(key)
@@ -8,7 +8,7 @@ from typing import Any, Optional
 
 import mido
 from decologr import Decologr as log
-from mido import Message, MidiFile, bpm2tempo
+from mido import Message, bpm2tempo
 from PySide6.QtCore import QMargins, Qt, QThread, QTimer
 from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import (
@@ -20,6 +20,7 @@ from PySide6.QtWidgets import (
     QPushButton,
 )
 
+from jdxi_editor.globals import send_midi_clock
 from jdxi_editor.midi.channel.channel import MidiChannel
 from jdxi_editor.midi.data.address.address import (
     JDXiSysExAddress,
@@ -33,7 +34,11 @@ from jdxi_editor.midi.data.parameter.effects.effects import (
     Effect2Param,
     ReverbParam,
 )
+from jdxi_editor.midi.file.loader import MidiFileLoader, MidiFileLoadResult
+from jdxi_editor.midi.file.model import MidiFileModel, midi_file_model
+from jdxi_editor.midi.io.clock import MidiClockMaster
 from jdxi_editor.midi.io.helper import MidiIOHelper
+from jdxi_editor.midi.io.scheduler import OutputLane
 from jdxi_editor.midi.playback.state import MidiPlaybackState
 from jdxi_editor.midi.sysex.composer import JDXiSysExComposer
 from jdxi_editor.ui.common import JDXi, QVBoxLayout, QWidget
@@ -64,7 +69,6 @@ from jdxi_editor.ui.widgets.editor.helper import (
     create_vertical_layout,
 )
 from jdxi_editor.ui.widgets.midi.file.viewer import MidiFileViewer
-from jdxi_editor.ui.widgets.midi.utils import get_total_duration_in_seconds
 from jdxi_editor.ui.widgets.classification_group import ClassificationGroup
 from jdxi_editor.ui.widgets.event_suppression_group import EventSuppressionGroup
 from jdxi_editor.ui.widgets.midi_file_group import MidiFileGroup
@@ -132,10 +136,16 @@ class MidiFilePlayer(SynthEditor):
         self.midi_state: MidiPlaybackState = MidiPlaybackState()
         self.playback_engine: PlaybackEngine = PlaybackEngine()
         self.midi_analyzer: MidiAnalyzer = MidiAnalyzer()
+        # --- Files are parsed and indexed off the GUI thread
+        self.midi_file_loader: MidiFileLoader = MidiFileLoader(parent=self)
+        self.midi_file_loader.loaded.connect(self.midi_file_loaded)
+        self.midi_file_loader.failed.connect(self.midi_file_load_failed)
         self.midi_playback_worker: MidiPlaybackWorker = MidiPlaybackWorker(parent=self)
         self.midi_playback_worker.set_tempo.connect(self.update_tempo_us_from_worker)
         self.midi_total_ticks: int | None = None
         self.midi_port = self.midi_helper.midi_out
+        # --- MIDI clock sent with playback, when enabled in the preferences
+        self._clock_master: Optional[MidiClockMaster] = None
         self.midi_timer_init()
         self.current_tempo_bpm = None  # Store current tempo BPM for digital
         self.midi_preferred_channels = {
@@ -554,16 +564,8 @@ class MidiFilePlayer(SynthEditor):
             return
         msb, lsb, pc = data
 
-        # Convert seconds to absolute ticks (approx using current tempo at position)
-        try:
-            tempo_usecs = self.midi_state.tempo_at_position or Midi.tempo.BPM_120_USEC
-            abs_ticks = int(
-                mido.second2tick(
-                    current_seconds, self.midi_state.file.ticks_per_beat, tempo_usecs
-                )
-            )
-        except Exception:
-            abs_ticks = int(current_seconds / max(self.tick_duration, 1e-9))
+        # Convert seconds to absolute ticks through the file's tempo map
+        abs_ticks = int(round(self._midi_file_model().tick_at(current_seconds)))
 
         # Find a target track that uses this channel, else use track 0
         track_index = self._find_track_for_channel(channel)
@@ -997,14 +999,44 @@ class MidiFilePlayer(SynthEditor):
         """
         Load a MIDI file from a given path and initialize parameters.
 
+        The file is parsed and indexed on a worker thread (see
+        jdxi_editor.midi.file.loader); midi_file_loaded applies it when ready.
+        Picking another file while one is loading cancels the first.
+
         :param file_path: Path to the MIDI file
         """
         if not file_path:
             return
 
-        self.midi_state.file = MidiFile(file_path)
-        # Store filename in the MidiFile object for later use
-        self.midi_state.file.filename = file_path
+        self.ui.digital_title_file_name.setText(f"Loading: {Path(file_path).name}")
+        self.midi_file_loader.load(file_path)
+
+    def midi_file_load_failed(self, file_path: str, error: str) -> None:
+        """
+        Report a file that could not be loaded.
+
+        :param file_path: str
+        :param error: str
+        :return: None
+        """
+        self.ui.digital_title_file_name.setText(
+            f"Could not load: {Path(file_path).name}"
+        )
+        log.warning(f"Could not load MIDI file {file_path}: {error}")
+
+    def midi_file_loaded(self, result: MidiFileLoadResult) -> None:
+        """
+        Initialize parameters from a file loaded by the MIDI file loader.
+
+        :param result: MidiFileLoadResult parsed file and its indexed model
+        :return: None
+        """
+        if not self.midi_file_loader.is_current(result):
+            return  # --- superseded by a later load
+        file_path = result.file_path
+        self.midi_state.file = result.midi_file
+        # Indexed once on the loader thread; the analyzers, track viewer and player read from it
+        self.midi_state.model = result.model
         file_name = f"Loaded: {Path(file_path).name}"
         self.ui.digital_title_file_name.setText(file_name)
         # Update digital to show tempo only (no bar when not playing)
@@ -1094,14 +1126,9 @@ class MidiFilePlayer(SynthEditor):
         :return: None
         Accurate Total Duration Calculation
         """
-        # Handle empty events list gracefully
-        if not getattr(self.midi_state, "events", None):
-            self.midi_total_ticks = 0
-        else:
-            self.midi_total_ticks = max(t for t, _, _ in self.midi_state.events)
-        self.midi_state.file_duration_seconds = get_total_duration_in_seconds(
-            self.midi_state.file
-        )
+        model = self._midi_file_model()
+        self.midi_total_ticks = model.total_ticks
+        self.midi_state.file_duration_seconds = model.duration_seconds
 
     def midi_channel_select(self) -> None:
         """
@@ -1122,12 +1149,7 @@ class MidiFilePlayer(SynthEditor):
         :return: None
         Extract events from the MIDI file and store them in the midi_state.
         """
-        events = []
-        for track_index, track in enumerate(self.midi_state.file.tracks):
-            abs_time = 0
-            for msg in track:
-                abs_time += msg.time
-                events.append((abs_time, msg, track_index))
+        model = self._midi_file_model()
         # Ensure ticks_per_beat is set before calculations
         if (
             not hasattr(self, MidiFileAttrs.TICKS_PER_BEAT)
@@ -1137,7 +1159,17 @@ class MidiFilePlayer(SynthEditor):
                 self.midi_state.file, MidiFileAttrs.TICKS_PER_BEAT, 480
             )
         self.calculate_tick_duration()
-        self.midi_state.events = sorted(events, key=lambda x: x[0])
+        self.midi_state.events = list(model.events)
+
+    def _midi_file_model(self) -> MidiFileModel:
+        """
+        Indexed model of the current file, re-indexed if the file changed.
+
+        :return: MidiFileModel
+        """
+        model = midi_file_model(self.midi_state.file)
+        self.midi_state.model = model
+        return model
 
     def detect_initial_tempo(self) -> dict[int, int]:
         """
@@ -1309,6 +1341,7 @@ class MidiFilePlayer(SynthEditor):
             if start_tick is None:
                 start_tick = 0
             self.playback_engine.start(start_tick)
+            self._start_clock_master(start_tick)
 
         self._disconnect_ui()
         self._connect_worker()
@@ -1445,13 +1478,7 @@ class MidiFilePlayer(SynthEditor):
                 return 0
 
             elapsed_time_secs = time.time() - self.midi_state.playback_start_time
-            return int(
-                mido.second2tick(
-                    second=elapsed_time_secs,
-                    ticks_per_beat=self.midi_state.file.ticks_per_beat,
-                    tempo=self.midi_state.tempo_at_position,
-                )
-            )
+            return int(self._midi_file_model().tick_at(elapsed_time_secs))
         except Exception as ex:
             log.error(f"Error converting playback start time to ticks: {ex}")
             return None
@@ -1577,6 +1604,8 @@ class MidiFilePlayer(SynthEditor):
         ):
             scrub_tick = self.midi_state.events[self.midi_state.event_index][0]
             self.playback_engine.scrub_to_tick(scrub_tick)
+            # --- Scrubbing restarts playback, so the clock moves there and runs
+            self._start_clock_master(scrub_tick)
         self.stop_all_notes()
         self.prepare_for_playback()
 
@@ -1608,15 +1637,14 @@ class MidiFilePlayer(SynthEditor):
     def update_event_index(self, target_time: float) -> None:
         """
         Finds and updates the event index based on the target time.
+        Bisects the file's tempo map and event ticks, so tempo changes are honoured.
         """
-        for i, (tick, _, _) in enumerate(self.midi_state.events):
-            if tick * self.tick_duration >= target_time:
-                self.midi_state.event_index = i
-                log.parameter(
-                    "self.midi_state.event_index now", self.midi_state.event_index
-                )
-                return
-        self.midi_state.event_index = 0  # Default to the start if no match
+        model = self._midi_file_model()
+        index = model.event_index_at(model.tick_at(target_time))
+        if index >= len(self.midi_state.events):
+            index = 0  # Default to the start if no match
+        self.midi_state.event_index = index
+        log.parameter("self.midi_state.event_index now", self.midi_state.event_index)
 
     def update_playback_start_time(self, target_time: float) -> None:
         """
@@ -1706,6 +1734,7 @@ class MidiFilePlayer(SynthEditor):
         self.transport.set_state("stop")
         self.playback_engine.stop()
         self.playback_engine.scrub_to_tick(0)
+        self._stop_clock_master()
         # Reset the worker's index before stopping (if it exists)
         if self.midi_playback_worker:
             self.midi_playback_worker.index = 0
@@ -1755,6 +1784,7 @@ class MidiFilePlayer(SynthEditor):
     def closeEvent(self, event: QCloseEvent) -> None:
         """Ensure background playback thread is stopped before widget destruction."""
         self.stop_playback_worker()
+        self._stop_clock_master()
         super().closeEvent(event)
 
     def reset_midi_state(self):
@@ -1896,12 +1926,8 @@ class MidiFilePlayer(SynthEditor):
             # Cap elapsed time to file duration
             elapsed_time = min(elapsed_time, self.midi_state.file_duration_seconds)
 
-            # Convert elapsed time to ticks
-            current_tick = mido.second2tick(
-                second=elapsed_time,
-                ticks_per_beat=self.midi_state.file.ticks_per_beat,
-                tempo=self.midi_state.tempo_at_position,
-            )
+            # Convert elapsed time to ticks through the tempo map
+            current_tick = self._midi_file_model().tick_at(elapsed_time)
 
             # Calculate bar number (assuming 4/4 time signature: 4 beats per measure)
             # Bar number is 1-based
@@ -1961,6 +1987,8 @@ class MidiFilePlayer(SynthEditor):
             pause_duration = time.time() - self.midi_state.playback_paused_time
             self.midi_state.playback_start_time += pause_duration  # Adjust start time
         self.midi_state.timer.start()
+        if self._clock_master is not None:
+            self._clock_master.resume()
         self.midi_state.playback_paused = False
         self.transport.pause_label.setText("Pause")
 
@@ -1968,9 +1996,41 @@ class MidiFilePlayer(SynthEditor):
         """Pausing playback"""
         self.midi_state.playback_paused_time = time.time()
         self.midi_state.timer.stop()
+        if self._clock_master is not None:
+            self._clock_master.pause()
         self.midi_state.playback_paused = True
         self.transport.pause_label.setText("Resume")
 
+    def _start_clock_master(self, start_tick: int) -> None:
+        """
+        Send MIDI clock from start_tick, when enabled in the preferences.
+
+        A running clock moves to start_tick (Song Position Pointer and Continue)
+        and follows the tempo map of the file now loaded.
+
+        :param start_tick: int absolute tick playback starts from
+        """
+        if not (self.midi_helper and send_midi_clock()):
+            self._stop_clock_master()
+            return
+        tempo_map = self._midi_file_model().tempo_map
+        if self._clock_master is None:
+            self._clock_master = MidiClockMaster(
+                send=lambda message: self.midi_helper.send_raw_message(
+                    message, lane=OutputLane.REALTIME
+                ),
+                tempo_map=tempo_map,
+            )
+        else:
+            self._clock_master.set_tempo_map(tempo_map)
+        self._clock_master.play(start_tick)
+
+    def _stop_clock_master(self) -> None:
+        """Send MIDI Stop and end the clock thread, if any."""
+        if self._clock_master is not None:
+            self._clock_master.stop()
+            self._clock_master = None
+
     def midi_playback_worker_handle_result(self, result=None):
         """
         Handle the result from the worker.
@@ -2,14 +2,14 @@
 MIDI analysis for the file player: tempo, drum detection, track classification, channel selection.
 
 Pure domain logic — no Qt, no UI. The editor calls these methods and applies results to state/UI.
+All methods read the file's indexed model (jdxi_editor.midi.file.model), built once per file.
 """
 
 from typing import Optional
 
+from jdxi_editor.midi.file.model import midi_file_model
 from jdxi_editor.midi.track.classification import classify_tracks
 from jdxi_editor.midi.utils.drum_detection import detect_drum_tracks
-from picomidi.constant import Midi
-from picomidi.message.type import MidoMessageType
 
 
 class MidiAnalyzer:
@@ -27,18 +27,8 @@ class MidiAnalyzer:
                  tempo_initial_usec: first tempo found or default 120 BPM
                  initial_track_tempos: map track_number -> tempo (for tracks that have set_tempo)
         """
-        tempo_initial = Midi.tempo.BPM_120_USEC
-        initial_track_tempos: dict[int, int] = {}
-        for track_number, track in enumerate(midi_file.tracks):
-            for msg in track:
-                if msg.type == MidoMessageType.SET_TEMPO.value:
-                    tempo_initial = msg.tempo
-                    initial_track_tempos[track_number] = msg.tempo
-                    break
-            else:
-                continue
-            break
-        return (tempo_initial, initial_track_tempos)
+        model = midi_file_model(midi_file)
+        return (model.initial_tempo, dict(model.initial_track_tempos))
 
     def get_drum_tracks(
         self, midi_file, min_score: float = 70.0
@@ -83,8 +73,4 @@ class MidiAnalyzer:
         :param preferred_channels: set of channel numbers (e.g. 0, 1, 2, 9 for 1-based 1,2,3,10)
         :return: channel index 0–15, or None if no message uses a preferred channel
         """
-        for track in midi_file.tracks:
-            for msg in track:
-                if hasattr(msg, "channel") and msg.channel in preferred_channels:
-                    return msg.channel
-        return None
+        return midi_file_model(midi_file).first_channel_in(preferred_channels)
@@ -34,16 +34,25 @@ from PySide6.QtWidgets import (
 )
 
 from jdxi_editor.core.jdxi import JDXi
+from jdxi_editor.globals import send_midi_clock
 from jdxi_editor.midi.conversion.note import MidiNoteConverter
 from jdxi_editor.midi.file.controller import (
     MidiFileController,
     MidiFileControllerConfig,
 )
+from jdxi_editor.midi.file.model import TempoMap
+from jdxi_editor.midi.io.clock import MidiClockMaster
 from jdxi_editor.midi.io.helper import MidiIOHelper
+from jdxi_editor.midi.io.scheduler import OutputLane
 from jdxi_editor.midi.playback.controller import (
     PatternPlaybackController,
     PlaybackConfig,
 )
+from jdxi_editor.midi.playback.pattern_timeline import PatternTimeline
+from jdxi_editor.midi.playback.realtime import (
+    PlaybackTimeline,
+    RealtimePlaybackScheduler,
+)
 from jdxi_editor.midi.playback.state import MidiPlaybackState
 from jdxi_editor.ui.editors.helpers.widgets import (
     create_jdxi_button,
@@ -89,12 +98,11 @@ from picomidi.core.tempo import (
     ticks_to_duration_ms,
 )
 from picomidi.message.type import MidoMessageType, MidoMetaMessageType
-from picomidi.messages.note import MidiNote, build_midi_note, note_off, note_on
+from picomidi.messages.note import MidiNote, build_midi_note
 from picomidi.playback.engine import (
     PlaybackEngine,
     TransportState,
 )
-from picomidi.sequencer.event import SequencerEvent
 from picomidi.ui.widget.button.note import NoteButtonEvent
 from picomidi.ui.widget.transport.spec import TransportSpec
 from picoui.helpers import group_with_layout
@@ -172,6 +180,10 @@ class PatternSequenceEditor(PatternUI):
             None  # Last saved/loaded path for USB auto-filename
         )
         self.playback_engine: PlaybackEngine = PlaybackEngine()
+        self._playback_scheduler: Optional[RealtimePlaybackScheduler] = None
+        self._clock_master: Optional[MidiClockMaster] = None
+        # --- Compiled pattern notes; edits during playback patch it
+        self._pattern_timeline = PatternTimeline(ticks_per_beat=self.ppq)
         self._wire_pattern_widget()
         self._init_style()
         self._init_playing_controllers()
@@ -224,6 +236,7 @@ class PatternSequenceEditor(PatternUI):
         duration_ticks = ms_to_ticks(event.duration_ms, self.bpm, self.ppq)
 
         self._add_note_on_off_pair(duration_ticks, event)
+        self._on_pattern_edited()
 
     def _add_note_on_off_pair(self, duration_ticks: int, event: PatternLearnerEvent):
         """add note on off pair to track"""
@@ -343,6 +356,7 @@ class PatternSequenceEditor(PatternUI):
             self._playback_controller.on_midi_event = (
                 lambda msg: self.midi_helper.send_raw_message(msg.bytes())
             )
+            self._playback_controller.on_clock_message = self._send_clock_message
 
     def _init_midi_file_controller(self):
         """init midi file controller"""
@@ -488,6 +502,7 @@ class PatternSequenceEditor(PatternUI):
         self.total_measures = self.pattern_widget.get_measure_count()
         self._sync_pattern_length()
         self._button_manager.set_buttons(self.buttons)
+        self._on_pattern_edited()
         log.message(
             message=f"Added measure. Total: {self.total_measures}",
             scope=self.__class__.__name__,
@@ -606,6 +621,7 @@ class PatternSequenceEditor(PatternUI):
             QMessageBox.warning(self, "Paste", "Invalid clipboard data")
             return
 
+        self._on_pattern_edited()
         num_steps = self.clipboard["end_step"] - self.clipboard["start_step"] + 1
         log.message(
             message=f"Pasted {num_steps} steps to bar {self.current_measure_index + 1} starting at step {start_step}",
@@ -707,6 +723,7 @@ class PatternSequenceEditor(PatternUI):
             self.pattern_widget.ensure_measure_count(count)
         self.total_measures = count
         self._update_pattern_length()
+        self._on_pattern_edited()
 
     def _update_pattern_length(self):
         """Update total pattern length based on measure count"""
@@ -755,6 +772,7 @@ class PatternSequenceEditor(PatternUI):
             # Sync UI to PatternMeasure for data consistency (Phase 2)
             if self.pattern_widget:
                 self.pattern_widget.sync_measure_to_ui(self.current_measure_index)
+            self._on_pattern_step_edited(button)
 
         self._update_button_style(button, checked)
 
@@ -814,6 +832,7 @@ class PatternSequenceEditor(PatternUI):
 
         # Update button states based on beats per bar
         self._update_button_states_for_beats_per_bar()
+        self._on_pattern_edited()
         log.message(f"Beats per bar changed to {self.measure_beats}")
 
     def _update_button_states_for_beats_per_bar(self) -> None:
@@ -866,6 +885,7 @@ class PatternSequenceEditor(PatternUI):
 
         # Update button states based on beats per measure
         self._update_button_states_for_beats_per_measure()
+        self._on_pattern_edited()
         log.message(f"Beats per measure changed to {self.measure_beats}")
 
     def _update_measure_beats(self, beats: int):
@@ -937,9 +957,6 @@ class PatternSequenceEditor(PatternUI):
     def _on_tempo_changed(self, bpm: int):
         """Handle tempo changes from the spinbox"""
         self.set_tempo(bpm)
-        if self.timer and self.timer.isActive():
-            ms_per_step = milliseconds_per_note(bpm)
-            self.timer.setInterval(int(ms_per_step))
 
     def _on_tap_tempo(self):
         """Handle tap tempo button clicks"""
@@ -1047,10 +1064,9 @@ class PatternSequenceEditor(PatternUI):
         if self.midi_file.tracks:
             self.midi_file.tracks[0].insert(0, tempo_message)
 
-        # Update playback speed if sequence is running
-        if hasattr(self, "timer") and self.timer and self.timer.isActive():
-            ms_per_step = milliseconds_per_note(bpm)  # ms per 16th note
-            self.timer.setInterval(int(ms_per_step))
+        # Retime playback from the current position if the pattern is running
+        if getattr(self, "_playback_scheduler", None) is not None:
+            self._queue_pattern_timeline(immediate=True)
 
         log.message(message=f"Tempo set to {bpm} BPM", scope=self.__class__.__name__)
 
@@ -1500,6 +1516,7 @@ class PatternSequenceEditor(PatternUI):
 
             # Sync sequencer digital
             self._sync_sequencer_with_measure(self.current_measure_index)
+            self._on_pattern_edited()
 
     def _detect_bars_from_midi(self, midi_file: MidiFile) -> int:
         """Detect number of bars in MIDI file"""
@@ -1831,17 +1848,12 @@ class PatternSequenceEditor(PatternUI):
     def pattern_transport_pause_toggle(self) -> None:
         """Pause or resume pattern playback."""
         if self._pattern_paused:
-            # Resume: restart engine from current position, then restart timer.
-            # Must call engine.start(current_tick) to reset _start_time so process_until_now
-            # does not think a long pause elapsed (which would cause a burst of notes).
-            if hasattr(self, "playback_engine") and self.playback_engine:
-                events = self.playback_engine.events
-                idx = self.playback_engine.event_index
-                if events and idx < len(events):
-                    current_tick = events[idx].absolute_tick
-                else:
-                    current_tick = self.playback_engine.start_tick
-                self.playback_engine.start(current_tick)
+            # Resume: the scheduler continues from where it paused, then restart
+            # the UI timer.
+            if self._playback_scheduler is not None:
+                self._playback_scheduler.resume()
+            if self._clock_master is not None:
+                self._clock_master.resume()
             if hasattr(self, "timer") and self.timer and not self.timer.isActive():
                 playback_interval_ms = 20
                 self.timer.start(playback_interval_ms)
@@ -1850,11 +1862,13 @@ class PatternSequenceEditor(PatternUI):
                 message="Pattern playback resumed", scope=self.__class__.__name__
             )
         else:
-            # Pause: stop timer and pause engine so no events advance during pause.
+            # Pause: stop timer and hold the scheduler so no events advance during pause.
             if hasattr(self, "timer") and self.timer and self.timer.isActive():
                 self.timer.stop()
-            if hasattr(self, "playback_engine") and self.playback_engine:
-                self.playback_engine.pause()
+            if self._playback_scheduler is not None:
+                self._playback_scheduler.pause()
+            if self._clock_master is not None:
+                self._clock_master.pause()
             self._pattern_paused = True
             log.message(
                 message="Pattern playback paused", scope=self.__class__.__name__
@@ -1871,175 +1885,101 @@ class PatternSequenceEditor(PatternUI):
         self._sync_sequencer_with_measure(idx)
         self.play_pattern()
 
-    def _ms_to_ticks(self, duration_ms: int, ticks_per_beat: int) -> int:
-        """
-        Convert milliseconds to MIDI ticks.
-        1 beat = 60000 / bpm ms = ticks_per_beat ticks
-        """
-        if duration_ms <= 0:
-            return 0
-
-        ticks = (
-            duration_ms
-            * self.timing_bpm
-            * ticks_per_beat
-            / MidiTempo.MILLISECONDS_PER_MINUTE
+    def _load_pattern_timeline(self) -> None:
+        """Read every bar into the compiled pattern timeline."""
+        self._pattern_timeline.load_measures(
+            self.measure_widgets,
+            note_spec=get_button_note_spec,
+            steps_per_bar=min(self.measure_beats, MeasureBeats.PER_MEASURE_4_4),
         )
-        return max(1, int(ticks))
-
-    def _collect_sequencer_events(self, ticks_per_beat: int) -> list[SequencerEvent]:
-        """collect sequencer events"""
-        ticks_per_step = ticks_per_beat // 4  # 16th
-        events: list[SequencerEvent] = []
-
-        for bar_index, measure in enumerate(self.measure_widgets):
-            for step in range(min(self.measure_beats, MeasureBeats.PER_MEASURE_4_4)):
-
-                tick = (bar_index * self.measure_beats + step) * ticks_per_step
-
-                for row in range(self.sequencer_rows):
-                    if step >= len(measure.buttons[row]):
-                        continue
-
-                    if row in self.muted_channels:
-                        continue
-
-                    btn = measure.buttons[row][step]
-                    if not btn.isChecked():
-                        continue
-                    spec = get_button_note_spec(btn)
-
-                    if not spec.is_active:
-                        continue
 
-                    channel = get_channel_for_row(row)
-                    velocity = max(0, min(127, spec.velocity))
-                    duration_ticks = (
-                        self._ms_to_ticks(spec.duration_ms, ticks_per_beat)
-                        or ticks_per_step
-                    )
-
-                    events.append(
-                        self._sequencer_event(
-                            channel, duration_ticks, spec, tick, velocity
-                        )
-                    )
-
-        return events
-
-    def _sequencer_event(
-        self,
-        channel: int,
-        duration_ticks: int,
-        spec: NoteButtonEvent,
-        tick: int,
-        velocity: int,
-    ) -> SequencerEvent:
-        """sequencer Event"""
-        return SequencerEvent(
-            tick=tick,
-            note=spec.note,
-            velocity=velocity,
-            channel=channel,
-            duration_ticks=duration_ticks,
+    def _compile_pattern_timeline(self) -> PlaybackTimeline:
+        """Playback timeline of the pattern at the current tempo."""
+        return self._pattern_timeline.compile(
+            self.timing_bpm, loop=self._pattern_loop_enabled
         )
 
-    def _build_midi_file_for_playback(self) -> MidiFile:
-        """Build a MidiFile from the current pattern for PlaybackEngine."""
-        ticks_per_beat = self.ppq
-
-        # Add tempo (use mido.bpm2tempo to match Playback Worker / MIDI editor)
-        tempo_us = bpm2tempo(self.timing_bpm)
-
-        events: list[SequencerEvent] = self._collect_sequencer_events(ticks_per_beat)
+    def _queue_pattern_timeline(self, immediate: bool = False) -> None:
+        """
+        Hand the recompiled pattern to the playback scheduler, if playing.
 
-        midi_file = MidiFile(type=1, ticks_per_beat=ticks_per_beat)
-        track = MidiTrack()
-        midi_file.tracks.append(track)
+        A pattern played without looping has no loop boundary, so its edits
+        are always taken up at the current position.
 
-        track.append(
-            MetaMessage(
-                MidoMessageType.SET_TEMPO.value,
-                tempo=tempo_us,
-                time=0,
-            )
+        :param immediate: bool switch at the current position (tempo changes)
+            rather than at the next loop boundary (note edits)
+        """
+        scheduler = self._playback_scheduler
+        if scheduler is None:
+            return
+        if not scheduler.timeline.loop_ticks:
+            immediate = True
+        timeline = self._compile_pattern_timeline()
+        scheduler.queue_timeline(timeline, immediate=immediate)
+        if immediate and self._clock_master is not None:
+            self._clock_master.set_tempo_map(timeline.tempo_map)
+
+    def _on_pattern_step_edited(self, button: SequencerButton) -> None:
+        """Patch the step of the current bar that button shows."""
+        bar_index = self.current_measure_index
+        measure_buttons = self.measure_widgets[bar_index].buttons[button.row]
+        if button.column >= len(measure_buttons):
+            return
+        measure_button = measure_buttons[button.column]
+        checked = measure_button.isChecked()
+        self._pattern_timeline.set_button(
+            bar_index,
+            button.row,
+            button.column,
+            checked,
+            get_button_note_spec(measure_button) if checked else None,
         )
+        self._queue_pattern_timeline()
 
-        if not events:
-            return midi_file
+    def _on_pattern_edited(self) -> None:
+        """After a bulk edit (paste, clear, bars, beats, learned notes) while playing."""
+        if getattr(self, "_playback_scheduler", None) is None:
+            return  # --- the bars are read when playback starts
+        self._load_pattern_timeline()
+        self._queue_pattern_timeline()
 
-        # Expand note_on / note_off
-        midi_events = []
-
-        for absolute_tick in events:
-            midi_note = build_midi_note(
-                event=absolute_tick, channel=absolute_tick.channel, bpm=self.timing_bpm
-            )
-            midi_events.append(
-                (
-                    absolute_tick.tick,
-                    note_on(midi_note),
-                )
-            )
-            midi_events.append(
-                (
-                    absolute_tick.tick + absolute_tick.duration_ticks,
-                    note_off(midi_note),
-                )
-            )
-
-        midi_events.sort(key=lambda x: x[0])
-
-        prev_tick = 0
-        for tick, msg in midi_events:
-            msg.time = tick - prev_tick
-            track.append(msg)
-            prev_tick = tick
-
-        return midi_file
-
-    def play_pattern(self, *, restart_loop: bool = False):
-        """Start playing the pattern via PlaybackEngine.
-
-        :param restart_loop: If True, we're restarting after a loop; skip USB recording
-            (recording continues from initial Play).
-        """
+    def play_pattern(self):
+        """Start playing the pattern on the playback scheduler."""
         if hasattr(self, "timer") and self.timer and self.timer.isActive():
             return  # Already playing
         if not self.measure_widgets:
             return
 
-        mid = self._build_midi_file_for_playback()
-        # Engine needs at least one note event to be useful
-        if len(mid.tracks[0]) <= 1:
+        self._load_pattern_timeline()
+        if self._pattern_timeline.note_count == 0:
             log.message(
                 message="Pattern has no notes to play", scope=self.__class__.__name__
             )
             return
 
-        # Start USB recording only on initial Play, not when looping
-        if not restart_loop:
-            self.midi_state.file = mid
-            self.midi_state.file.filename = self._pattern_file_path or "pattern"
-            # Use 1 hour max; user stops recording manually via Stop button
-            self.midi_state.file_duration_seconds = 3600.0
-            if self.usb_recorder.file_auto_generate_checkbox.isChecked():
-                self.usb_recorder.update_auto_wav_filename()
-            self.usb_recorder.start_recording()
-
-        self.playback_engine.load_file(mid)
-        for ch in range(MeasureBeats.PER_MEASURE_4_4):
-            self.playback_engine.mute_channel(ch, ch in self.muted_channels)
-        if self.midi_helper:
-            self.playback_engine.on_event = (
-                lambda msg: self.midi_helper.send_raw_message(msg.bytes())
-            )
-        self.playback_engine.start(0)
+        # Start USB recording; the scheduler loops the pattern, so this runs once
+        self.midi_state.file = self._pattern_timeline.to_midi_file(self.timing_bpm)
+        self.midi_state.file.filename = self._pattern_file_path or "pattern"
+        # Use 1 hour max; user stops recording manually via Stop button
+        self.midi_state.file_duration_seconds = 3600.0
+        if self.usb_recorder.file_auto_generate_checkbox.isChecked():
+            self.usb_recorder.update_auto_wav_filename()
+        self.usb_recorder.start_recording()
+
+        # --- Messages are sent by the scheduler thread, which also loops the
+        # --- pattern; the timer only syncs the UI
+        self._stop_playback_scheduler()
+        self._playback_scheduler = RealtimePlaybackScheduler(
+            self._compile_pattern_timeline(),
+            on_event=self._send_playback_event,
+        )
+        for channel in self.muted_channels:
+            self._playback_scheduler.mute_channel(channel)
+        self._playback_scheduler.play(0)
+        self._start_clock_master(self._playback_scheduler.timeline.tempo_map)
         self._playback_last_bar_index = -1
         self._playback_last_step_in_bar = -1
 
-        # Use a short, precise interval so process_until_now() runs often; the engine
-        # sends events by wall-clock time, so this reduces stutter from timer jitter.
         playback_interval_ms = 20
         self.timer = QTimer(self)
         self.timer.setTimerType(Qt.TimerType.PreciseTimer)
@@ -2057,18 +1997,52 @@ class PatternSequenceEditor(PatternUI):
 
         log.message(message="Pattern playback started", scope=self.__class__.__name__)
 
-    def _on_playback_tick(self):
-        """Drive PlaybackEngine and sync UI to current position."""
-        self.playback_engine.process_until_now()
-        # Sync bar/step highlight from engine position
-        if self.playback_engine.events:
-            idx = self.playback_engine.event_index
-            if idx > 0 and idx <= len(self.playback_engine.events):
-                tick = self.playback_engine.events[idx - 1].absolute_tick
-            else:
-                tick = self.playback_engine.start_tick
+    def _send_playback_event(self, msg: Message) -> None:
+        """Send a pattern message (playback scheduler thread)."""
+        if self.midi_helper:
+            self.midi_helper.send_raw_message(msg.bytes())
+
+    def _stop_playback_scheduler(self) -> None:
+        """Stop the playback scheduler thread, if any."""
+        if self._playback_scheduler is not None:
+            self._playback_scheduler.stop()
+            self._playback_scheduler = None
+
+    def _start_clock_master(self, tempo_map: TempoMap) -> None:
+        """
+        Send MIDI clock with the pattern, when enabled in the preferences.
+
+        A running clock is restarted (MIDI Start) with the new tempo map.
+
+        :param tempo_map: TempoMap of the pattern being played
+        """
+        if not (self.midi_helper and send_midi_clock()):
+            self._stop_clock_master()
+            return
+        if self._clock_master is None:
+            self._clock_master = MidiClockMaster(
+                send=self._send_clock_message, tempo_map=tempo_map
+            )
         else:
-            tick = 0
+            self._clock_master.set_tempo_map(tempo_map)
+        self._clock_master.play(0)
+
+    def _stop_clock_master(self) -> None:
+        """Send MIDI Stop and end the clock thread, if any."""
+        if self._clock_master is not None:
+            self._clock_master.stop()
+            self._clock_master = None
+
+    def _send_clock_message(self, message: bytes) -> None:
+        """Send a MIDI clock or transport message on the real-time lane."""
+        self.midi_helper.send_raw_message(message, lane=OutputLane.REALTIME)
+
+    def _on_playback_tick(self):
+        """Sync UI to the playback scheduler's position."""
+        scheduler = self._playback_scheduler
+        if scheduler is None:
+            return
+        tick = scheduler.current_tick()
         ticks_per_step = self.ppq // 4
         total_steps = (
             len(self.measure_widgets) * self.measure_beats
@@ -2100,16 +2074,12 @@ class PatternSequenceEditor(PatternUI):
                         )
                 self._playback_last_step_in_bar = step_in_bar
 
-        if self.playback_engine.state == TransportState.STOPPED:
+        if scheduler.finished.is_set():
+            # --- Only when looping is off; a looping scheduler plays until stopped
             log.message(
                 message="Pattern playback finished", scope=self.__class__.__name__
             )
-            if self._pattern_loop_enabled:
-                if self.timer:
-                    self.timer.stop()
-                self.play_pattern(restart_loop=True)
-            else:
-                self._apply_transport_state(TransportState.STOPPED)
+            self.stop_pattern()
 
     def _sync_sequencer_on_step_change(self, bar_index: int, last_bar: int | Any):
         """Only sync sequencer and bar list when the displayed bar changes"""
@@ -2137,7 +2107,8 @@ class PatternSequenceEditor(PatternUI):
 
     def stop_pattern(self):
         """Stop playing the pattern"""
-        self.playback_engine.stop()
+        self._stop_playback_scheduler()
+        self._stop_clock_master()
         self._sync_ui_to_stopped()
 
         # Stop USB recording (pattern records until user stops manually)
@@ -2398,6 +2369,8 @@ class PatternSequenceEditor(PatternUI):
         else:
             log.message(message=f"Row {row} unmuted", scope=self.__class__.__name__)
             self.muted_channels.remove(channel)
+        if self._playback_scheduler is not None:
+            self._playback_scheduler.mute_channel(channel, checked)
 
         # Synth-style: unmuted=lit, muted=dark
         if row < len(self.mute_buttons):
@@ -296,22 +296,6 @@ class PresetWidget(QWidget):
             set(preset["category"] for preset in self._actual_preset_list)
         )
 
-        # Category filter function for presets
-        def preset_category_filter(preset_display: str, category: str) -> bool:
-            """Check if a preset matches a category."""
-            if not category:
-                return True
-            # Extract preset ID from digital string (format: "001 - Preset Name")
-            preset_id_str = (
-                preset_display.split(" - ")[0] if " - " in preset_display else None
-            )
-            if preset_id_str:
-                # Find the preset in the list and check its category
-                for preset in self._actual_preset_list:
-                    if preset["id"] == preset_id_str:
-                        return preset["category"] == category
-            return False
-
         # Update the combo box by recreating it (since SearchableFilterableComboBox doesn't have update methods)
         # Get parent widget and layout
         preset_widget = self.digital_preset_type_combo.parent()
@@ -328,7 +312,9 @@ class PresetWidget(QWidget):
                 options=preset_options,
                 values=preset_values,
                 categories=preset_categories,
-                category_filter_func=preset_category_filter,
+                option_categories=[
+                    preset["category"] for preset in self._actual_preset_list
+                ],
                 show_label=True,
                 show_search=True,
                 show_category=True,
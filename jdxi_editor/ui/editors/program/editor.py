@@ -38,7 +38,7 @@ Dependencies:
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from decologr import Decologr as log
 from PySide6.QtCore import Qt, Signal
@@ -196,7 +196,11 @@ class ProgramEditor(BasicEditor):
         self.playlist_editor_widget: Optional[PlaylistEditor] = None
         self.setup_ui()
         self.midi_helper.update_program_name.connect(self.set_current_program_name)
-        self.midi_helper.midi_sysex_json.connect(self.dispatch_sysex_to_area)
+        # --- Program sliders follow both the Temporary Program and the tone levels
+        self.subscribe_sysex(
+            (JDXiSysExAddressStartMSB.TEMPORARY_PROGRAM.value,),
+            (JDXiSysExAddressStartMSB.TEMPORARY_TONE.value,),
+        )
 
     def setup_ui(self):
         """set up ui elements"""
@@ -609,6 +613,7 @@ class ProgramEditor(BasicEditor):
         # --- Build program options, values, and filter data
         program_options = []
         program_values = []
+        program_option_genres = []
         program_genres = set()
         program_banks = set()
 
@@ -621,52 +626,12 @@ class ProgramEditor(BasicEditor):
                     program_genres.add(program.genre)
                 program_options.append(f"{program.id} - {program.name}")
                 program_values.append(len(program_options) - 1)  # Use index as value
+                program_option_genres.append(program.genre or "")
 
         # --- Add user bank placeholders (E, F, G, H) - these will be handled dynamically
         # but we need to ensure they're in the banks list
         program_banks.update(["E", "F", "G", "H"])
 
-        # Bank filter function for programs
-        def program_bank_filter(program_display: str, bank: str) -> bool:
-            """Check if a program matches a bank."""
-            if not bank:
-                return True
-            # --- Extract bank from digital string (format: "A01 - Program Name")
-            if " - " in program_display:
-                program_id = program_display.split(" - ")[0]
-            else:
-                program_id = (
-                    program_display.split()[0] if program_display.split() else ""
-                )
-            if program_id and len(program_id) >= 1:
-                return program_id[0].upper() == bank.upper()
-            return False
-
-        # --- Genre filter function for programs
-        def program_genre_filter(program_display: str, genre: str) -> bool:
-            """Check if a program matches a genre."""
-            if not genre:
-                return True
-            # --- Find the program in the list and check its genre
-            # --- Extract program ID from digital string
-            if " - " in program_display:
-                program_id = program_display.split(" - ")[0]
-            else:
-                program_id = (
-                    program_display.split()[0] if program_display.split() else ""
-                )
-
-            # ---Find program in list
-            program_list_data = (
-                self.program_group_widget._program_list_data
-                if self.program_group_widget
-                else []
-            )
-            for program in program_list_data:
-                if program.id == program_id:
-                    return program.genre == genre if program.genre else False
-            return False
-
         # --- Update the combo box by recreating it (since SearchableFilterableComboBox doesn't have update methods)
         # --- Get parent widget and layout from program_group_widget
         if not self.program_group_widget:
@@ -690,8 +655,7 @@ class ProgramEditor(BasicEditor):
                     values=program_values,
                     categories=sorted(program_genres),
                     banks=sorted(program_banks),
-                    bank_filter_func=program_bank_filter,
-                    category_filter_func=program_genre_filter,
+                    option_categories=program_option_genres,
                     show_label=True,
                     show_search=True,
                     show_category=True,
@@ -1008,7 +972,7 @@ class ProgramEditor(BasicEditor):
             return DRUM_PARTIAL_MAP
         return SYNTH_PARTIAL_MAP
 
-    def dispatch_sysex_to_area(self, json_sysex_data: str) -> None:
+    def dispatch_sysex_to_area(self, json_sysex_data: Union[str, dict]) -> None:
         """
         Dispatch SysEx data to the appropriate area for processing.
 
@@ -0,0 +1,275 @@
+"""
+User Programs Model Module
+
+This module defines the `UserProgramsModel` class, a table model over the
+program database's search results.
+
+The model holds a search (text and sort order) and the number of matching
+programs, not the programs themselves: rows are read from the database a page
+at a time when the view first asks for them, and only the most recently used
+pages are kept. A search is one count query plus one page query per screenful
+of rows shown.
+
+Name and Genre are editable; edits are kept in the model until
+``save_changes`` writes them.
+
+Classes:
+    UserProgramsModel(QAbstractTableModel)
+        Paged table model of the programs matching a search.
+
+Example usage:
+--------------
+>>> model = UserProgramsModel(database=get_database())
+>>> view.setModel(model)
+>>> model.set_search("pad")
+>>> model.program(0).name
+"""
+
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Union
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
+
+from jdxi_editor.midi.program.program import JDXiProgram
+from jdxi_editor.ui.programs.database import ProgramDatabase
+
+COLUMNS = (
+    "ID",
+    "Name",
+    "Genre",
+    "Bank",
+    "PC",
+    "MSB",
+    "LSB",
+    "Digital 1",
+    "Digital 2",
+    "Analog",
+    "Drums",
+    "Play",
+)
+NAME_COLUMN = 1
+GENRE_COLUMN = 2
+PLAY_COLUMN = 11
+
+# --- Database column each table column sorts by (None: not sortable)
+SORT_KEYS = (
+    "id",
+    "name",
+    "genre",
+    "id",
+    "pc",
+    "msb",
+    "lsb",
+    "digital_1",
+    "digital_2",
+    "analog",
+    "drums",
+    None,
+)
+
+PAGE_SIZE = 100
+MAX_CACHED_PAGES = 8
+
+AnyIndex = Union[QModelIndex, QPersistentModelIndex]
+
+
+def _number(value: Optional[int]) -> str:
+    return "" if value is None else str(value)
+
+
+def cell_text(program: JDXiProgram, column: int) -> str:
+    """
+    Text shown for a program in a table column.
+
+    :param program: JDXiProgram
+    :param column: int column index, see COLUMNS
+    :return: str
+    """
+    if column == 0:
+        return program.id or ""
+    if column == NAME_COLUMN:
+        return program.name or ""
+    if column == GENRE_COLUMN:
+        return program.genre or ""
+    if column == 3:
+        return program.id[0] if program.id else ""
+    if column == 4:
+        return _number(program.pc)
+    if column == 5:
+        return _number(program.msb)
+    if column == 6:
+        return _number(program.lsb)
+    if column == 7:
+        return program.digital_1 or ""
+    if column == 8:
+        return program.digital_2 or ""
+    if column == 9:
+        return program.analog or ""
+    if column == 10:
+        return program.drums or ""
+    return ""
+
+
+class UserProgramsModel(QAbstractTableModel):
+    """Paged table model of the programs matching a search."""
+
+    def __init__(self, database: Optional[ProgramDatabase] = None, parent=None):
+        """
+        Initialize the UserProgramsModel.
+
+        :param database: Optional[ProgramDatabase] the global database if None
+        :param parent: Optional[QObject] parent object
+        """
+        super().__init__(parent)
+        self._database = database
+        self._search_text = ""
+        self._order_by = "id"
+        self._descending = False
+        self._row_count = 0
+        self._pages: "OrderedDict[int, List[JDXiProgram]]" = OrderedDict()
+        self._edits: Dict[str, JDXiProgram] = {}
+
+    @property
+    def database(self) -> ProgramDatabase:
+        if self._database is None:
+            from jdxi_editor.ui.programs.database import get_database
+
+            self._database = get_database()
+        return self._database
+
+    @property
+    def search_text(self) -> str:
+        return self._search_text
+
+    def set_search(self, search_text: str = "") -> None:
+        """
+        Show the programs matching search_text.
+
+        :param search_text: str words matched as prefixes of the id, name, genre or tone names
+        """
+        self._search_text = search_text
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-run the search, e.g. after the database changed."""
+        self.beginResetModel()
+        self._pages.clear()
+        self._row_count = self.database.count_programs(self._search_text)
+        self.endResetModel()
+
+    def program(self, row: int) -> Optional[JDXiProgram]:
+        """
+        The program shown in a row, including unsaved edits.
+
+        :param row: int
+        :return: Optional[JDXiProgram] None outside the table
+        """
+        if row < 0 or row >= self._row_count:
+            return None
+        page_number, offset = divmod(row, PAGE_SIZE)
+        page = self._page(page_number)
+        if offset >= len(page):
+            return None
+        program = page[offset]
+        return self._edits.get(program.id, program)
+
+    def _page(self, page_number: int) -> List[JDXiProgram]:
+        page = self._pages.get(page_number)
+        if page is not None:
+            self._pages.move_to_end(page_number)
+            return page
+        page = self.database.search_programs(
+            self._search_text,
+            limit=PAGE_SIZE,
+            offset=page_number * PAGE_SIZE,
+            order_by=self._order_by,
+            descending=self._descending,
+        )
+        self._pages[page_number] = page
+        if len(self._pages) > MAX_CACHED_PAGES:
+            self._pages.popitem(last=False)
+        return page
+
+    # --- Edits
+
+    @property
+    def pending_edits(self) -> List[JDXiProgram]:
+        """Edited programs not yet saved."""
+        return list(self._edits.values())
+
+    def clear_edit(self, program_id: str) -> None:
+        """
+        Forget the edit of a program once it has been saved.
+
+        :param program_id: str
+        """
+        self._edits.pop(program_id, None)
+
+    # --- QAbstractTableModel
+
+    def rowCount(self, parent: AnyIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent: AnyIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+            and 0 <= section < len(COLUMNS)
+        ):
+            return COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: AnyIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            program = self.program(index.row())
+            return None if program is None else cell_text(program, index.column())
+        if role == Qt.ItemDataRole.UserRole:
+            return self.program(index.row())
+        return None
+
+    def flags(self, index: AnyIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.isValid() and index.column() in (NAME_COLUMN, GENRE_COLUMN):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(
+        self, index: AnyIndex, value: Any, role: int = Qt.ItemDataRole.EditRole
+    ) -> bool:
+        if role != Qt.ItemDataRole.EditRole or index.column() not in (
+            NAME_COLUMN,
+            GENRE_COLUMN,
+        ):
+            return False
+        program = self.program(index.row())
+        if program is None:
+            return False
+        text = str(value).strip()
+        if text == cell_text(program, index.column()):
+            return False
+        field = "name" if index.column() == NAME_COLUMN else "genre"
+        self._edits[program.id] = replace(program, **{field: text or None})
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def sort(
+        self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder
+    ) -> None:
+        if not 0 <= column < len(SORT_KEYS) or SORT_KEYS[column] is None:
+            return
+        self.beginResetModel()
+        self._order_by = SORT_KEYS[column]
+        self._descending = order == Qt.SortOrder.DescendingOrder
+        self._pages.clear()
+        self.endResetModel()
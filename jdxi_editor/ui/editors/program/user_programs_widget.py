@@ -4,6 +4,9 @@ User Programs Widget Module
 This module defines the `UserProgramsWidget` class, a widget for managing
 user programs in a sortable, searchable table with database integration.
 
+The table is a view onto `UserProgramsModel`: each search is an indexed
+query against the program database, and only the rows on screen are read.
+
 Classes:
     UserProgramsWidget(QWidget)
         A widget for displaying and managing user programs.
@@ -12,15 +15,14 @@ Classes:
 from typing import Any, Callable, Optional
 
 from decologr import Decologr as log
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QModelIndex, Qt, Signal
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QHeaderView,
     QLabel,
     QLineEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
 )
 
 from jdxi_editor.midi.io.helper import MidiIOHelper
@@ -28,6 +30,10 @@ from jdxi_editor.midi.program.program import JDXiProgram
 from jdxi_editor.ui.common import JDXi, QVBoxLayout, QWidget
 from jdxi_editor.ui.editors.helpers.program import calculate_midi_values
 from jdxi_editor.ui.editors.helpers.widgets import create_jdxi_button, create_jdxi_row
+from jdxi_editor.ui.editors.program.user_programs_model import (
+    PLAY_COLUMN,
+    UserProgramsModel,
+)
 from jdxi_editor.ui.style import JDXiUIDimensions, JDXiUIStyle
 from jdxi_editor.ui.widgets.delegates.play_button import PlayButtonDelegate
 from jdxi_editor.ui.widgets.editor.helper import transfer_layout_items
@@ -61,7 +67,8 @@ class UserProgramsWidget(QWidget):
 
         # UI components
         self.user_programs_search_box: Optional[QLineEdit] = None
-        self.user_programs_table: Optional[QTableWidget] = None
+        self.user_programs_table: Optional[QTableView] = None
+        self.user_programs_model: Optional[UserProgramsModel] = None
         self.save_user_programs_button: Optional[QPushButton] = None
 
         self.setup_ui()
@@ -92,33 +99,24 @@ class UserProgramsWidget(QWidget):
         layout.addLayout(search_layout)
 
         # Create table
-        self.user_programs_table = QTableWidget()
-        self.user_programs_table.setColumnCount(12)
-        self.user_programs_table.setHorizontalHeaderLabels(
-            [
-                "ID",
-                "Name",
-                "Genre",
-                "Bank",
-                "PC",
-                "MSB",
-                "LSB",
-                "Digital 1",
-                "Digital 2",
-                "Analog",
-                "Drums",
-                "Play",
-            ]
+        self.user_programs_model = UserProgramsModel(parent=self)
+        self.user_programs_table = QTableView()
+        self.user_programs_table.setModel(self.user_programs_model)
+        self.user_programs_table.setSelectionBehavior(
+            QTableView.SelectionBehavior.SelectRows
         )
 
         # Apply custom styling
         self.user_programs_table.setStyleSheet(self._get_table_style())
 
-        # Enable sorting
+        # Enable sorting (the model sorts in the database query)
         self.user_programs_table.setSortingEnabled(True)
+        self.user_programs_table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
 
         # Set column widths
         header = self.user_programs_table.horizontalHeader()
+        # Size to the rows on screen only, so resizing never reads the whole table
+        header.setResizeContentsPrecision(0)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # ID
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Name
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Genre
@@ -140,19 +138,19 @@ class UserProgramsWidget(QWidget):
         )  # Drums
         header.setSectionResizeMode(11, QHeaderView.ResizeMode.ResizeToContents)  # Play
 
-        # Set up Play button delegate for column 11
+        # Set up Play button delegate for the Play column
         play_button_delegate = PlayButtonDelegate(
             self.user_programs_table, play_callback=self._play_user_program
         )
-        self.user_programs_table.setItemDelegateForColumn(11, play_button_delegate)
+        self.user_programs_table.setItemDelegateForColumn(
+            PLAY_COLUMN, play_button_delegate
+        )
 
         # Connect double-click to load program
-        self.user_programs_table.itemDoubleClicked.connect(
-            self._on_user_program_selected
-        )
+        self.user_programs_table.doubleClicked.connect(self._on_user_program_selected)
 
         # Connect single-click to load program (alternative)
-        self.user_programs_table.itemSelectionChanged.connect(
+        self.user_programs_table.selectionModel().selectionChanged.connect(
             self._on_user_program_selection_changed
         )
 
@@ -221,193 +219,62 @@ class UserProgramsWidget(QWidget):
 
     def populate_table(self, search_text: str = "") -> None:
         """
-        Populate the user programs table from SQLite database.
+        Show the user programs matching a search, from the SQLite database.
 
         :param search_text: Optional search text to filter programs
         """
-        if not self.user_programs_table:
+        if not self.user_programs_model:
             log.warning(
                 "User programs table not initialized", scope="UserProgramsWidget"
             )
             return
 
         try:
-            from jdxi_editor.ui.programs.database import get_database
-
-            # Get all user programs from database
-            db = get_database()
-            all_programs = db.get_all_programs()
-        except Exception as e:
-            log.error(
-                f"Error getting programs from database: {e}", scope="UserProgramsWidget"
-            )
-            all_programs = []
-
-        # Filter by search text if provided
-        if search_text:
-            search_lower = search_text.lower()
-            all_programs = [
-                p
-                for p in all_programs
-                if (
-                    search_lower in p.id.lower()
-                    or search_lower in p.name.lower()
-                    or (p.genre and search_lower in p.genre.lower())
-                    or (p.digital_1 and search_lower in p.digital_1.lower())
-                    or (p.digital_2 and search_lower in p.digital_2.lower())
-                    or (p.analog and search_lower in p.analog.lower())
-                    or (p.drums and search_lower in p.drums.lower())
-                )
-            ]
-
-        # Clear table
-        try:
-            self.user_programs_table.setRowCount(0)
+            self.user_programs_model.set_search(search_text)
         except Exception as e:
             log.error(
-                f"Error clearing user programs table: {e}", scope="UserProgramsWidget"
+                f"Error searching programs in database: {e}",
+                scope="UserProgramsWidget",
             )
             return
 
-        # Populate table
-        for program in all_programs:
-            row = self.user_programs_table.rowCount()
-            self.user_programs_table.insertRow(row)
-
-            # Extract bank letter from ID
-            bank_letter = program.id[0] if program.id else ""
-
-            # Create items
-            self.user_programs_table.setItem(row, 0, QTableWidgetItem(program.id or ""))
-            # Make Name column editable (column 1)
-            name_item = QTableWidgetItem(program.name or "")
-            name_item.setFlags(name_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.user_programs_table.setItem(row, 1, name_item)
-            # Make Genre column editable (column 2)
-            genre_item = QTableWidgetItem(program.genre or "")
-            genre_item.setFlags(genre_item.flags() | Qt.ItemFlag.ItemIsEditable)
-            self.user_programs_table.setItem(row, 2, genre_item)
-            self.user_programs_table.setItem(row, 3, QTableWidgetItem(bank_letter))
-            self.user_programs_table.setItem(
-                row,
-                4,
-                QTableWidgetItem(str(program.pc) if program.pc is not None else ""),
-            )
-            self.user_programs_table.setItem(
-                row,
-                5,
-                QTableWidgetItem(str(program.msb) if program.msb is not None else ""),
-            )
-            self.user_programs_table.setItem(
-                row,
-                6,
-                QTableWidgetItem(str(program.lsb) if program.lsb is not None else ""),
-            )
-            self.user_programs_table.setItem(
-                row, 7, QTableWidgetItem(program.digital_1 or "")
-            )
-            self.user_programs_table.setItem(
-                row, 8, QTableWidgetItem(program.digital_2 or "")
-            )
-            self.user_programs_table.setItem(
-                row, 9, QTableWidgetItem(program.analog or "")
-            )
-            self.user_programs_table.setItem(
-                row, 10, QTableWidgetItem(program.drums or "")
-            )
-
-            # Store program object in item data for easy access
-            for col in range(11):
-                item = self.user_programs_table.item(row, col)
-                if item:
-                    item.setData(Qt.ItemDataRole.UserRole, program)
-
         log.message(
-            f"✅Populated user programs table with {len(all_programs)} programs",
+            f"✅Populated user programs table with {self.user_programs_model.rowCount()} programs",
             scope="UserProgramsWidget",
         )
 
     def save_changes(self) -> None:
         """Save changes made to the user programs table (e.g., genre edits) to the database."""
-        if not self.user_programs_table:
+        if not self.user_programs_model:
             log.warning(
                 "User programs table not initialized", scope="UserProgramsWidget"
             )
             return
 
         from jdxi_editor.midi.io.input_handler import add_or_replace_program_and_save
-        from jdxi_editor.ui.programs.database import get_database
 
-        db = get_database()
         saved_count = 0
         error_count = 0
 
-        # Iterate through all rows in the table
-        for row in range(self.user_programs_table.rowCount()):
-            # Get the program object from the first column's user data
-            id_item = self.user_programs_table.item(row, 0)
-            if not id_item:
-                continue
-
-            program = id_item.data(Qt.ItemDataRole.UserRole)
-            if not program or not isinstance(program, JDXiProgram):
-                continue
-
-            # Get the updated name from the table (column 1)
-            name_item = self.user_programs_table.item(row, 1)
-            new_name = name_item.text().strip() if name_item else (program.name or "")
-
-            # Get the updated genre from the table (column 2)
-            genre_item = self.user_programs_table.item(row, 2)
-            new_genre = (
-                genre_item.text().strip() if genre_item else (program.genre or "")
-            )
-
-            # Check if name or genre has changed
-            name_changed = new_name != (program.name or "")
-            genre_changed = new_genre != (program.genre or "")
-
-            if name_changed or genre_changed:
-                # Create updated program object
-                updated_program = JDXiProgram(
-                    id=program.id,
-                    name=new_name if new_name else None,
-                    genre=new_genre if new_genre else None,
-                    pc=program.pc,
-                    msb=program.msb,
-                    lsb=program.lsb,
-                    tempo=program.tempo,
-                    measure_length=program.measure_length,
-                    scale=program.scale,
-                    analog=program.analog,
-                    digital_1=program.digital_1,
-                    digital_2=program.digital_2,
-                    drums=program.drums,
+        for updated_program in self.user_programs_model.pending_edits:
+            if add_or_replace_program_and_save(updated_program):
+                saved_count += 1
+                self.user_programs_model.clear_edit(updated_program.id)
+                log.message(
+                    f"✅ Updated {updated_program.id}: name '{updated_program.name}', "
+                    f"genre '{updated_program.genre}'",
+                    scope="UserProgramsWidget",
+                )
+            else:
+                error_count += 1
+                log.error(
+                    f"❌Failed to save update for {updated_program.id}",
+                    scope="UserProgramsWidget",
                 )
 
-                # Save to database
-                if add_or_replace_program_and_save(updated_program):
-                    saved_count += 1
-                    changes = []
-                    if name_changed:
-                        changes.append(f"name: '{program.name}' -> '{new_name}'")
-                    if genre_changed:
-                        changes.append(f"genre: '{program.genre}' -> '{new_genre}'")
-                    log.message(
-                        f"✅ Updated {program.id}: {', '.join(changes)}",
-                        scope="UserProgramsWidget",
-                    )
-                    # Update the stored program object in item data
-                    for col in range(11):
-                        item = self.user_programs_table.item(row, col)
-                        if item:
-                            item.setData(Qt.ItemDataRole.UserRole, updated_program)
-                else:
-                    error_count += 1
-                    log.error(
-                        f"❌Failed to save update for {program.id}",
-                        scope="UserProgramsWidget",
-                    )
+        if saved_count > 0:
+            # Re-read the saved rows
+            self.user_programs_model.refresh()
 
         # Show summary message
         if saved_count > 0:
@@ -428,16 +295,16 @@ class UserProgramsWidget(QWidget):
             else:
                 log.message("ℹ️No changes to save", scope="UserProgramsWidget")
 
-    def _on_user_program_selected(self, item: QTableWidgetItem) -> None:
+    def _on_user_program_selected(self, index: QModelIndex) -> None:
         """
         Handle double-click on a program in the user programs table.
         Loads the program via MIDI Program Change.
 
-        :param item: The table item that was double-clicked
+        :param index: QModelIndex of the cell that was double-clicked
         """
-        self._load_program_from_table(item.row())
+        self._load_program_from_table(index.row())
 
-    def _on_user_program_selection_changed(self) -> None:
+    def _on_user_program_selection_changed(self, *_) -> None:
         """
         Handle selection change in the user programs table.
         Loads the program via MIDI Program Change when a row is selected.
@@ -463,20 +330,11 @@ class UserProgramsWidget(QWidget):
 
         :param row: Row index in the table
         """
-        if (
-            not self.user_programs_table
-            or row < 0
-            or row >= self.user_programs_table.rowCount()
-        ):
-            return
-
-        # Get program from first column's user data
-        item = self.user_programs_table.item(row, 0)
-        if not item:
+        if not self.user_programs_model:
             return
 
-        program = item.data(Qt.ItemDataRole.UserRole)
-        if not program or not isinstance(program, JDXiProgram):
+        program = self.user_programs_model.program(row)
+        if not program:
             return
 
         # Get program ID and extract bank/number
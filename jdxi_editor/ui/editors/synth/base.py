@@ -18,7 +18,6 @@ Classes:
 - SynthControlBase: A base widget for controlling synth parameters via MIDI.
 """
 
-import threading
 from typing import Dict, Optional
 
 import mido
@@ -32,9 +31,10 @@ from jdxi_editor.log.slider_parameter import log_slider_parameters
 from jdxi_editor.midi.data.address.address import JDXiSysExAddress
 from jdxi_editor.midi.data.control_change.base import ControlChange
 from jdxi_editor.midi.data.parameter.digital.spec import TabDefinitionMixin
-from jdxi_editor.midi.io.delay import send_with_delay
 from jdxi_editor.midi.io.helper import MidiIOHelper
+from jdxi_editor.midi.patch.state import PatchStateView
 from jdxi_editor.midi.sysex.composer import JDXiSysExComposer
+from jdxi_editor.ui.editors.helpers.refresh import ControlRefresh
 from jdxi_editor.ui.widgets.combo_box.combo_box import ComboBox
 from jdxi_editor.ui.widgets.controls.registry import ControlRegistry
 from jdxi_editor.ui.widgets.slider import Slider
@@ -104,6 +104,9 @@ class SynthBase(QWidget):
         self._midi_helper = midi_helper
         self.midi_requests = []
         self.sysex_composer = JDXiSysExComposer()
+        self.control_refresh = ControlRefresh()
+        # --- Set by editors receiving SysEx: what the synth changed since they looked
+        self.patch_view: Optional[PatchStateView] = None
 
     @property
     def midi_helper(self) -> MidiIOHelper:
@@ -297,13 +300,29 @@ class SynthBase(QWidget):
         :param channel: int MIDI channel to send the request on (discarded)
         :param program: int Program number to request data for (discarded)
         """
-        threading.Thread(
-            target=send_with_delay,
-            args=(
-                self._midi_helper,
-                self.midi_requests,
-            ),
-        ).start()
+        if not self._midi_helper:
+            return
+        # --- An explicit read re-applies every value, changed or not
+        self.control_refresh.forget()
+        if self.patch_view is not None:
+            self.patch_view.invalidate()
+        self._midi_helper.request_data(self.midi_requests)
+
+    def _forget_applied_value(self, param: AddressParameter) -> None:
+        """
+        Forget the last incoming value of a parameter edited here, in this editor
+        and the editors above it, so the next value from the synth is applied.
+
+        :param param: AddressParameter edited locally
+        :return: None
+        """
+        # --- parentWidget(): self.parent is the constructor argument, not Qt's parent()
+        widget = self
+        while widget is not None:
+            refresh = getattr(widget, "control_refresh", None)
+            if isinstance(refresh, ControlRefresh):
+                refresh.forget(param.name)
+            widget = widget.parentWidget()
 
     def _build_sliders(self, specs: list["SliderSpec"]):
         """build sliders"""
@@ -481,6 +500,7 @@ class SynthBase(QWidget):
                 address=address, param=param, value=midi_value
             )
             result = self._midi_helper.send_midi_message(sysex_message)
+            self._forget_applied_value(param)
             return bool(result)
         except Exception as ex:
             log.error(f"MIDI error setting {param.name}: {ex}")
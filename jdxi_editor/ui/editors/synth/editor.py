@@ -23,7 +23,7 @@ Dependencies:
 import json
 import os
 import re
-from typing import Optional
+from typing import Dict, Iterable, Optional, Union
 
 from decologr import Decologr as log
 from PySide6.QtCore import Qt, Signal
@@ -41,6 +41,8 @@ from jdxi_editor.midi.data.address.address import (
 )
 from jdxi_editor.midi.data.drum.data import DRUM_PARTIAL_MAP
 from jdxi_editor.midi.io.helper import MidiIOHelper
+from jdxi_editor.midi.patch.state import PatchState, PatchStateView, parameter_index
+from jdxi_editor.midi.sysex.dispatch import SysExDispatchEvent
 from jdxi_editor.midi.sysex.parser.json_parser import JDXiJsonSysexParser
 from jdxi_editor.midi.sysex.request.data import SYNTH_PARTIAL_MAP
 from jdxi_editor.midi.sysex.sections import SysExSection
@@ -54,6 +56,7 @@ from jdxi_editor.ui.editors.helpers.preset import (
     get_preset_parameter_value,
     preset_to_jdxi_bank_pc,
 )
+from jdxi_editor.ui.editors.helpers.tabs import LazyTabs
 from jdxi_editor.ui.editors.synth.base import SynthBase
 from jdxi_editor.ui.editors.synth.helper import log_changes
 from jdxi_editor.ui.editors.synth.specs import (
@@ -115,6 +118,9 @@ class SynthEditor(SynthBase):
             self.midi_helper = MidiIOHelper()
         self.midi_helper.midi_program_changed.connect(self._handle_program_change)
         self.midi_helper.midi_control_changed.connect(self._handle_control_change)
+        patch_state = getattr(self.midi_helper, "patch_state", None)
+        if isinstance(patch_state, PatchState):
+            self.patch_view = PatchStateView(patch_state)
         self.cc_parameters = dict()
         self.nrpn_parameters = dict()
         self.nrpn_map = dict()
@@ -130,6 +136,8 @@ class SynthEditor(SynthBase):
         self.preset_helper = None
         self.instrument_selection_combo = None
         self.preset_type = None
+        # --- Set by editors building partial panels on first show
+        self.partial_tabs: Optional[LazyTabs] = None
         if hasattr(self, "instrument_title_label"):
             self.midi_helper.update_tone_name.connect(
                 lambda title, synth_type: self.set_instrument_title_label(
@@ -172,7 +180,6 @@ class SynthEditor(SynthBase):
         if self.midi_helper:
             self.midi_helper.midi_program_changed.connect(self._handle_program_change)
             self.midi_helper.midi_control_changed.connect(self._handle_control_change)
-            # self.midi_helper.midi_sysex_json.connect(self._dispatch_sysex_to_area)
 
             self.preset_loader = JDXiPresetHelper(
                 self.midi_helper, JDXi.UI.Preset.Digital.ENUMERATED
@@ -300,11 +307,75 @@ class SynthEditor(SynthBase):
             return self.preset_helpers[JDXi.Synth.DIGITAL_SYNTH_1]  # Safe fallback
         return handler
 
-    def dispatch_sysex_to_area(self, json_sysex_data: str) -> None:
+    def subscribe_sysex(self, *prefixes: Iterable[int]) -> None:
+        """
+        Receive SysEx parameter messages for the given address prefixes.
+
+        With no prefixes, subscribes to this editor's (MSB, UMB) area.
+
+        :param prefixes: Iterable[int] address prefixes, e.g. (0x19, 0x42) or (0x18,)
+        :return: None
+        """
+        if not self.midi_helper:
+            return
+        if not prefixes:
+            prefixes = ((self.address.msb, self.address.umb),)
+        for prefix in prefixes:
+            self.midi_helper.sysex_bus.subscribe(prefix, self.on_sysex_event)
+
+    def unsubscribe_sysex(self) -> None:
+        """
+        Stop receiving SysEx parameter messages.
+
+        :return: None
+        """
+        if self.midi_helper:
+            self.midi_helper.sysex_bus.unsubscribe(self.on_sysex_event)
+
+    def on_sysex_event(self, event: SysExDispatchEvent) -> None:
+        """
+        SysEx dispatch bus callback: update the UI from an already-parsed message.
+
+        :param event: SysExDispatchEvent
+        :return: None
+        """
+        parameters = self._changed_parameters(event)
+        if parameters is not None:
+            self.dispatch_sysex_to_area(parameters)
+
+    def _changed_parameters(self, event: SysExDispatchEvent) -> Optional[dict]:
+        """
+        The message's parameters narrowed to those the synth changed since this
+        editor last looked, with their values read from the patch state.
+
+        Messages from the synth are written to the patch state on the decode
+        worker before they reach the editors. Patches loaded from file (no
+        parsed message) are passed through whole.
+
+        :param event: SysExDispatchEvent
+        :return: Optional[dict] None when no parameter changed
+        """
+        if self.patch_view is None or event.parsed is None:
+            return event.parameters
+        area = self.patch_view.area_at(tuple(event.address) + (0,))
+        if area is None:
+            return event.parameters
+        changes = self.patch_view.take_changes(area.spec.name)
+        if not changes:
+            return None
+        _by_offset, params = parameter_index(area.spec.param_class)
+        names = {param.name for param in params}
+        parameters = {
+            key: value for key, value in event.parameters.items() if key not in names
+        }
+        parameters.update(changes)
+        return parameters
+
+    def dispatch_sysex_to_area(self, json_sysex_data: Union[str, dict]) -> None:
         """
         Dispatch SysEx data to the appropriate area for processing.
 
-        :param json_sysex_data:
+        :param json_sysex_data: Union[str, dict] JSON string or already-parsed parameter dict
         :return: None
         """
         sysex_data = self._parse_sysex_json(json_sysex_data)
@@ -383,15 +454,58 @@ class SynthEditor(SynthBase):
             "should be over-ridden in a sub class with implementation"
         )
 
-    def _parse_sysex_json(self, json_sysex_data: str) -> Optional[dict]:
+    def _on_partial_panel_ready(self, partial_no: int, panel: QWidget) -> None:
+        """
+        LazyTabs callback: make a partial panel built (or rebound) on first show
+        the partial's editor, register it with the main window and load the
+        partial's values kept by the patch state while it did not exist.
+
+        :param partial_no: int
+        :param panel: QWidget the partial panel
+        :return: None
+        """
+        self.partial_editors = dict(self.partial_tabs.pages)
+        main_window = getattr(self, "main_window", None)
+        registered = getattr(main_window, "editors", None)
+        if isinstance(registered, list) and panel not in registered:
+            main_window.register_editor(panel)
+        values = self._partial_patch_values(panel)
+        if values:
+            successes, failures = [], []
+            self._update_controls(partial_no, values, successes, failures)
+            log.debug_info(
+                successes=successes, failures=failures, scope=self.__class__.__name__
+            )
+
+    def _partial_patch_values(self, panel: QWidget) -> Dict[str, int]:
+        """
+        Raw MIDI values the patch state holds for a partial panel's area.
+
+        :param panel: QWidget partial panel with an address
+        :return: Dict[str, int] parameter name -> value, as in incoming SysEx data
+        """
+        patch_state = getattr(self.midi_helper, "patch_state", None)
+        address = getattr(panel, "address", None)
+        if not isinstance(patch_state, PatchState) or address is None:
+            return {}
+        area = patch_state.area_at((address.msb, address.umb, address.lmb, 0))
+        if area is None:
+            return {}
+        return patch_state.to_parameters(area.spec.name, raw=True)
+
+    def _parse_sysex_json(self, json_sysex_data: Union[str, dict]) -> Optional[dict]:
         """
         _parse_sysex_json
 
-        :param json_sysex_data: str
+        :param json_sysex_data: Union[str, dict] JSON string, or a dict from the SysEx dispatch bus
         :return: dict
         """
         try:
-            data = self.json_parser.parse_json(json_sysex_data)
+            if isinstance(json_sysex_data, dict):
+                # --- Shared between subscribers, so copy before handlers modify it
+                data = dict(json_sysex_data)
+            else:
+                data = self.json_parser.parse_json(json_sysex_data)
             self.sysex_previous_data = self.sysex_current_data
             self.sysex_current_data = data
             log_changes(self.sysex_previous_data, data)
@@ -1,11 +1,15 @@
 """
 Composition of main JDXi components
+
+The preset and program tables are imported on first use of ``JDXiUI.Preset``
+and ``JDXiUI.Program``, not when ``JDXi`` is imported.
 """
 
+from typing import TYPE_CHECKING
+
+from jdxi_editor.core.lazy import LazyImport
 from jdxi_editor.ui.constant import JDXiUIConstants
 from jdxi_editor.ui.parameters import JDXiUIParameters
-from jdxi_editor.ui.preset.tone.lists import JDXiUIPreset
-from jdxi_editor.ui.programs import JDXiUIProgramList
 from jdxi_editor.ui.style import (
     JDXiUIDimensions,
     JDXiUIIconRegistry,
@@ -13,6 +17,10 @@ from jdxi_editor.ui.style import (
     JDXiUIThemeManager,
 )
 
+if TYPE_CHECKING:
+    from jdxi_editor.ui.preset.tone.lists import JDXiUIPreset
+    from jdxi_editor.ui.programs.programs import JDXiUIProgramList
+
 
 class JDXiUI:
     """Composition of main JDXI UI components as a single container."""
@@ -23,5 +31,9 @@ class JDXiUI:
     Dimensions: JDXiUIDimensions = JDXiUIDimensions
     Parameters: JDXiUIParameters = JDXiUIParameters
     Constants: JDXiUIConstants = JDXiUIConstants
-    Preset: JDXiUIPreset = JDXiUIPreset
-    Program: JDXiUIProgramList = JDXiUIProgramList
+    Preset: "type[JDXiUIPreset]" = LazyImport(
+        "jdxi_editor.ui.preset.tone.lists:JDXiUIPreset"
+    )
+    Program: "type[JDXiUIProgramList]" = LazyImport(
+        "jdxi_editor.ui.programs.programs:JDXiUIProgramList"
+    )
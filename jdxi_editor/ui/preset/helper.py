@@ -29,8 +29,6 @@ preset changes and communicate them to the UI and MIDI engine.
 
 """
 
-import threading
-
 from decologr import Decologr as log
 from PySide6.QtCore import QObject, Signal
 
@@ -38,7 +36,6 @@ from jdxi_editor.core.jdxi import JDXi
 from jdxi_editor.core.synth.type import JDXiSynth
 from jdxi_editor.log.midi_info import log_midi_info
 from jdxi_editor.midi.channel.channel import MidiChannel
-from jdxi_editor.midi.io.delay import send_with_delay
 from jdxi_editor.midi.sysex.request.midi_requests import MidiRequests
 from jdxi_editor.ui.editors.helpers.preset import preset_to_jdxi_bank_pc
 from jdxi_editor.ui.preset.button import JDXiPresetButtonData
@@ -130,13 +127,7 @@ class JDXiPresetHelper(QObject):
         """
         Request the current value of the NRPN parameter from the device.
         """
-        threading.Thread(
-            target=send_with_delay,
-            args=(
-                self.midi_helper,
-                self.midi_requests,
-            ),
-        ).start()
+        self.midi_helper.request_data(self.midi_requests)
 
     def send_program_change(self, channel: int, msb: int, lsb: int, pc: int) -> None:
         """
@@ -1,15 +1,29 @@
 """
 JDXi presets
+
+Each part's list is imported on first use, so a Drum kit lookup does not
+evaluate the Digital tone table.
 """
 
-from jdxi_editor.ui.preset.tone.analog.list import JDXiPresetToneListAnalog
-from jdxi_editor.ui.preset.tone.digital.list import JDXiPresetToneListDigital
-from jdxi_editor.ui.preset.tone.drum.list import JDXiPresetToneListDrum
+from typing import TYPE_CHECKING
+
+from jdxi_editor.core.lazy import LazyImport
+
+if TYPE_CHECKING:
+    from jdxi_editor.ui.preset.tone.analog.list import JDXiPresetToneListAnalog
+    from jdxi_editor.ui.preset.tone.digital.list import JDXiPresetToneListDigital
+    from jdxi_editor.ui.preset.tone.drum.list import JDXiPresetToneListDrum
 
 
 class JDXiUIPreset:
     """JDXi Preset 'Tone' lists for each of the 3 parts; Analog, Digital and Drums"""
 
-    Analog: JDXiPresetToneListAnalog = JDXiPresetToneListAnalog
-    Digital: JDXiPresetToneListDigital = JDXiPresetToneListDigital
-    Drum: JDXiPresetToneListDrum = JDXiPresetToneListDrum
+    Analog: "type[JDXiPresetToneListAnalog]" = LazyImport(
+        "jdxi_editor.ui.preset.tone.analog.list:JDXiPresetToneListAnalog"
+    )
+    Digital: "type[JDXiPresetToneListDigital]" = LazyImport(
+        "jdxi_editor.ui.preset.tone.digital.list:JDXiPresetToneListDigital"
+    )
+    Drum: "type[JDXiPresetToneListDrum]" = LazyImport(
+        "jdxi_editor.ui.preset.tone.drum.list:JDXiPresetToneListDrum"
+    )
@@ -109,24 +109,13 @@ class InstrumentPresetWidget(QWidget):
         log.message(f"preset_values: {preset_values}")
         log.message(f"preset_categories: {preset_categories}")
         
-        # Create new category filter function with the updated preset list
-        def preset_category_filter(preset_display: str, category: str) -> bool:
-            """Check if a preset matches a category."""
-            if not category:
-                return True
-            preset_id_str = (
-                preset_display.split(" - ")[0] if " - " in preset_display else None
-            )
-            if preset_id_str:
-                for preset in converted_preset_list:
-                    if preset["id"] == preset_id_str:
-                        return preset["category"] == category
-            return False
-        
-        # Update the combo box with new options and filter function
+        # Update the combo box with new options and each option's category
         current_value = self.instrument_selection_combo.value()
         self.instrument_selection_combo.set_options(
-            preset_options, preset_values, preset_categories, preset_category_filter
+            preset_options,
+            preset_values,
+            preset_categories,
+            option_categories=[preset["category"] for preset in converted_preset_list],
         )
         log.info(
             scope="InstrumentPresetWidget",
@@ -340,29 +329,13 @@ class InstrumentPresetWidget(QWidget):
             set(preset["category"] for preset in converted_preset_list)
         )
 
-        # Category filter function for presets
-        def preset_category_filter(preset_display: str, category: str) -> bool:
-            """Check if a preset matches a category."""
-            if not category:
-                return True
-            # Extract preset ID from digital string (format: "001 - Preset Name")
-            preset_id_str = (
-                preset_display.split(" - ")[0] if " - " in preset_display else None
-            )
-            if preset_id_str:
-                # Find the preset in the list and check its category
-                for preset in converted_preset_list:
-                    if preset["id"] == preset_id_str:
-                        return preset["category"] == category
-            return False
-
         # Create SearchableFilterableComboBox for preset selection
         self.instrument_selection_combo = SearchableFilterableComboBox(
             label="",
             options=preset_options,
             values=preset_values,
             categories=preset_categories,
-            category_filter_func=preset_category_filter,
+            option_categories=[preset["category"] for preset in converted_preset_list],
             show_label=False,
             show_search=True,
             show_category=True,
@@ -448,29 +421,15 @@ class InstrumentPresetWidget(QWidget):
             )
         )
 
-        # Category filter function for presets
-        def cheat_preset_category_filter(preset_display: str, category: str) -> bool:
-            """Check if a preset matches a category."""
-            if not category:
-                return True
-            # Extract preset ID from digital string (format: "001 - Preset Name")
-            preset_id_str = (
-                preset_display.split(" - ")[0] if " - " in preset_display else None
-            )
-            if preset_id_str:
-                # Find the preset in the list and check its category
-                for preset in JDXi.UI.Preset.Digital.LIST:
-                    if preset.get("id") == preset_id_str:
-                        return _preset_category(preset) == category
-            return False
-
         # Create SearchableFilterableComboBox for cheat preset selection
         self.cheat_preset_combo_box = SearchableFilterableComboBox(
             label="Preset",
             options=preset_options,
             values=preset_values,
             categories=preset_categories,
-            category_filter_func=cheat_preset_category_filter,
+            option_categories=[
+                _preset_category(p) for p in JDXi.UI.Preset.Digital.LIST
+            ],
             show_label=True,
             show_search=True,
             show_category=True,
@@ -1,3 +1,14 @@
-from .programs import JDXiUIProgramList
+"""
+JD-Xi program lists and the user program database
 
-all = [JDXiUIProgramList]
+``JDXiUIProgramList`` is imported on first use, so importing
+``jdxi_editor.ui.programs.database`` does not evaluate the ROM program table.
+"""
+
+from jdxi_editor.core.lazy import lazy_module_attributes
+
+__getattr__ = lazy_module_attributes(
+    __name__, {"JDXiUIProgramList": ".programs:JDXiUIProgramList"}
+)
+
+__all__ = ["JDXiUIProgramList"]
@@ -3,17 +3,76 @@ SQLite database module for storing JD-Xi user programs.
 
 This module provides a more robust storage solution than JSON files,
 with proper transactions, better querying, and reduced race conditions.
+
+Program search runs against ``programs_fts``, an FTS5 index over the program
+id, name, genre and tone names. It is an external-content index (the text
+lives only in ``programs``) kept in step by the ProgramDatabase writers, and
+is rebuilt from ``programs`` when first created. Where SQLite was built
+without FTS5, search falls back to a LIKE scan in SQL.
+
+Programs and playlists share one ``ConnectionPool`` per database file: each
+thread keeps a configured connection with its prepared statements, rather
+than connecting per call. Program writes are upserts, and a playlist's
+programs are read with one JOIN.
 """
 
+import re
 import sqlite3
 from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from decologr import Decologr as log
 
+from jdxi_editor.core.db.pool import get_pool
 from jdxi_editor.midi.program.program import JDXiProgram
-from jdxi_editor.ui.programs.playlist_orm import PlaylistORM
+
+# --- Columns in the full-text index, in index order
+SEARCH_COLUMNS = ("id", "name", "genre", "digital_1", "digital_2", "analog", "drums")
+
+# --- Columns search results can be ordered by
+SORT_COLUMNS = (
+    "id",
+    "name",
+    "genre",
+    "pc",
+    "msb",
+    "lsb",
+    "digital_1",
+    "digital_2",
+    "analog",
+    "drums",
+)
+
+# --- Playlists with their item counts; add WHERE / GROUP BY / ORDER BY
+PLAYLIST_SELECT = """
+    SELECT playlists.*, COUNT(playlist_items.id) AS program_count
+    FROM playlists
+    LEFT JOIN playlist_items ON playlist_items.playlist_id = playlists.id
+"""
+
+_SEARCH_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def fts_query(search_text: str) -> str:
+    """
+    FTS5 MATCH expression for search text: every word, as a prefix.
+
+    :param search_text: str e.g. "warm pad"
+    :return: str e.g. '"warm"* AND "pad"*' ("" when there are no words)
+    """
+    return " AND ".join(f'"{token}"*' for token in _SEARCH_TOKEN.findall(search_text))
+
+
+def _isoformat(timestamp: Optional[str]) -> Optional[str]:
+    """ISO 8601 form of an SQLite timestamp ("2025-01-31 12:00:00")."""
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(str(timestamp)).isoformat()
+    except ValueError:
+        return str(timestamp)
 
 
 class ProgramDatabase:
@@ -33,9 +92,9 @@ class ProgramDatabase:
             db_path = json_folder / "user_programs.db"
 
         self.db_path = db_path
+        self.pool = get_pool(db_path)
+        self.fts_enabled = False
         self._init_database()
-        # Initialize ORM for playlists
-        self.playlist_orm = PlaylistORM(db_path=db_path)
 
     def _init_database(self) -> None:
         """Initialize the database schema if it doesn't exist."""
@@ -69,6 +128,8 @@ class ProgramDatabase:
             """
             )
 
+            self._init_search_index(conn)
+
             # Create playlists table
             conn.execute(
                 """
@@ -132,19 +193,84 @@ class ProgramDatabase:
 
             conn.commit()
 
+    def _init_search_index(self, conn: sqlite3.Connection) -> None:
+        """
+        Create the programs_fts full-text index, filling it from programs when new.
+
+        :param conn: sqlite3.Connection
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'programs_fts'"
+        ).fetchone()
+        try:
+            conn.execute(
+                f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS programs_fts USING fts5(
+                    {", ".join(SEARCH_COLUMNS)},
+                    content='programs',
+                    content_rowid='rowid',
+                    prefix='1 2 3'
+                )
+            """
+            )
+        except sqlite3.OperationalError as e:
+            log.warning(
+                f"Full-text search unavailable ({e}), searching with LIKE",
+                scope="ProgramDatabase",
+            )
+            return
+        if not exists:
+            conn.execute("INSERT INTO programs_fts(programs_fts) VALUES ('rebuild')")
+        self.fts_enabled = True
+
+    def _unindex_programs(
+        self, conn: sqlite3.Connection, program_ids: List[str]
+    ) -> None:
+        """
+        Remove programs from the search index; call before deleting their rows.
+
+        :param conn: sqlite3.Connection
+        :param program_ids: List[str] program IDs
+        """
+        if not self.fts_enabled:
+            return
+        columns = ", ".join(SEARCH_COLUMNS)
+        conn.executemany(
+            f"""
+            INSERT INTO programs_fts(programs_fts, rowid, {columns})
+            SELECT 'delete', rowid, {columns} FROM programs WHERE id = ?
+        """,
+            [(program_id,) for program_id in program_ids],
+        )
+
+    def _index_programs(self, conn: sqlite3.Connection, program_ids: List[str]) -> None:
+        """
+        Add programs to the search index; call after inserting their rows.
+
+        :param conn: sqlite3.Connection
+        :param program_ids: List[str] program IDs
+        """
+        if not self.fts_enabled:
+            return
+        columns = ", ".join(SEARCH_COLUMNS)
+        conn.executemany(
+            f"""
+            INSERT INTO programs_fts(rowid, {columns})
+            SELECT rowid, {columns} FROM programs WHERE id = ?
+        """,
+            [(program_id,) for program_id in program_ids],
+        )
+
     @contextmanager
     def _get_connection(self):
-        """Get a database connection with proper error handling."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row  # Return rows as dict-like objects
+        """Get this thread's pooled database connection, rolled back on error."""
+        conn = self.pool.connection()
         try:
             yield conn
         except Exception as e:
             conn.rollback()
             log.error(f"Database error: {e}", scope="_get_connection")
             raise
-        finally:
-            conn.close()
 
     def add_or_replace_program(self, program: JDXiProgram) -> bool:
         """
@@ -153,55 +279,83 @@ class ProgramDatabase:
         :param program: JDXiProgram to add or replace
         :return: True if successful, False otherwise
         """
+        if not self.add_or_replace_programs([program]):
+            return False
+        log.message(f"✅ Saved program to database: {program.id} - {program.name}")
+        return True
+
+    def add_or_replace_programs(self, programs: List[JDXiProgram]) -> int:
+        """
+        Add or replace several programs in a single transaction.
+
+        Used by bulk writers such as the user bank scanner, where one commit per
+        program would dominate the run time. Programs are matched by ID only, as
+        PC values can overlap between banks (e.g. E01 and F01), and updated in
+        place so playlist items referring to them are kept.
+
+        :param programs: List[JDXiProgram] to add or replace
+        :return: int number of programs written (0 if the transaction was rolled back)
+        """
+        if not programs:
+            return 0
         try:
             with self._get_connection() as conn:
-                # Remove any existing entries with same ID only
-                # Note: We don't delete by PC because PC values can overlap between banks
-                # (e.g., E01 and F01 might have the same PC value)
-                conn.execute(
-                    """
-                    DELETE FROM programs 
-                    WHERE id = ?
-                """,
-                    (program.id,),
-                )
-
-                # Insert new program
-                conn.execute(
+                program_ids = list(dict.fromkeys(program.id for program in programs))
+                self._unindex_programs(conn, program_ids)
+                conn.executemany(
                     """
                     INSERT INTO programs (
                         id, name, genre, pc, msb, lsb, tempo,
                         measure_length, scale, analog, digital_1, digital_2, drums
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        name = excluded.name,
+                        genre = excluded.genre,
+                        pc = excluded.pc,
+                        msb = excluded.msb,
+                        lsb = excluded.lsb,
+                        tempo = excluded.tempo,
+                        measure_length = excluded.measure_length,
+                        scale = excluded.scale,
+                        analog = excluded.analog,
+                        digital_1 = excluded.digital_1,
+                        digital_2 = excluded.digital_2,
+                        drums = excluded.drums,
+                        updated_at = CURRENT_TIMESTAMP
                 """,
-                    (
-                        program.id,
-                        program.name,
-                        program.genre,
-                        program.pc,
-                        program.msb,
-                        program.lsb,
-                        program.tempo,
-                        program.measure_length,
-                        program.scale,
-                        program.analog,
-                        program.digital_1,
-                        program.digital_2,
-                        program.drums,
-                    ),
+                    [
+                        (
+                            program.id,
+                            program.name,
+                            program.genre,
+                            program.pc,
+                            program.msb,
+                            program.lsb,
+                            program.tempo,
+                            program.measure_length,
+                            program.scale,
+                            program.analog,
+                            program.digital_1,
+                            program.digital_2,
+                            program.drums,
+                        )
+                        for program in programs
+                    ],
                 )
-
+                self._index_programs(conn, program_ids)
                 conn.commit()
-                log.message(
-                    f"✅ Saved program to database: {program.id} - {program.name}"
-                )
-                return True
+                if len(programs) > 1:
+                    log.message(
+                        f"✅ Saved {len(programs)} programs to database: "
+                        f"{programs[0].id}..{programs[-1].id}"
+                    )
+                return len(programs)
         except Exception as e:
             log.error(
-                f"❌ Failed to save program {program.id}: {e}",
-                scope="add_or_replace_program",
+                f"❌ Failed to save {len(programs)} programs: {e}",
+                scope="add_or_replace_programs",
             )
-            return False
+            return 0
 
     def get_program_by_id(self, program_id: str) -> Optional[JDXiProgram]:
         """
@@ -239,6 +393,90 @@ class ProgramDatabase:
             log.error(f"Error loading all programs: {e}", scope="get_all_programs")
             return []
 
+    def _search_clause(self, search_text: str) -> Tuple[str, tuple]:
+        """
+        FROM/WHERE clause and parameters selecting the programs matching search_text.
+
+        :param search_text: str words to match; every program when empty
+        :return: Tuple[str, tuple] clause and its parameters
+        """
+        if not search_text.strip():
+            return "FROM programs", ()
+        if self.fts_enabled:
+            query = fts_query(search_text)
+            if not query:
+                return "FROM programs WHERE 0", ()
+            return (
+                "FROM programs JOIN programs_fts ON programs_fts.rowid = programs.rowid "
+                "WHERE programs_fts MATCH ?",
+                (query,),
+            )
+        escaped = (
+            search_text.lower()
+            .replace("\\", "\\\\")
+            .replace("%", "\\%")
+            .replace("_", "\\_")
+        )
+        conditions = " OR ".join(
+            f"LOWER({column}) LIKE ? ESCAPE '\\'" for column in SEARCH_COLUMNS
+        )
+        return (
+            f"FROM programs WHERE {conditions}",
+            (f"%{escaped}%",) * len(SEARCH_COLUMNS),
+        )
+
+    def count_programs(self, search_text: str = "") -> int:
+        """
+        Number of programs matching a search.
+
+        :param search_text: str words matched as prefixes of the id, name, genre or tone names
+        :return: int (0 on error)
+        """
+        clause, parameters = self._search_clause(search_text)
+        try:
+            with self._get_connection() as conn:
+                return conn.execute(f"SELECT COUNT(*) {clause}", parameters).fetchone()[
+                    0
+                ]
+        except Exception as e:
+            log.error(f"Error counting programs: {e}", scope="count_programs")
+            return 0
+
+    def search_programs(
+        self,
+        search_text: str = "",
+        limit: int = -1,
+        offset: int = 0,
+        order_by: str = "id",
+        descending: bool = False,
+    ) -> List[JDXiProgram]:
+        """
+        One page of the programs matching a search.
+
+        :param search_text: str words matched as prefixes of the id, name, genre or tone names
+        :param limit: int page size, -1 for all
+        :param offset: int index of the first program in the page
+        :param order_by: str one of SORT_COLUMNS
+        :param descending: bool
+        :return: List[JDXiProgram]
+        """
+        if order_by not in SORT_COLUMNS:
+            raise ValueError(f"Cannot order programs by {order_by!r}")
+        clause, parameters = self._search_clause(search_text)
+        direction = "DESC" if descending else "ASC"
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    f"SELECT programs.* {clause} "
+                    f"ORDER BY programs.{order_by} {direction}, programs.id {direction} "
+                    "LIMIT ? OFFSET ?",
+                    parameters + (limit, offset),
+                ).fetchall()
+                return [self._row_to_program(row) for row in rows]
+        except Exception as e:
+            log.error(f"Error searching programs: {e}", scope="search_programs")
+            return []
+
     def get_programs_by_bank(self, bank: str) -> List[JDXiProgram]:
         """
         Get all programs for a specific bank.
@@ -279,6 +517,7 @@ class ProgramDatabase:
         """
         try:
             with self._get_connection() as conn:
+                self._unindex_programs(conn, [program_id])
                 conn.execute("DELETE FROM programs WHERE id = ?", (program_id,))
                 conn.commit()
                 return True
@@ -304,7 +543,20 @@ class ProgramDatabase:
             drums=row["drums"],
         )
 
-    # Playlist management methods (using ORM)
+    # Playlist management methods
+
+    @staticmethod
+    def _playlist_to_dict(row: sqlite3.Row) -> Dict:
+        """Convert a playlists row (with its program_count) to a dictionary."""
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "description": row["description"],
+            "created_at": _isoformat(row["created_at"]),
+            "updated_at": _isoformat(row["updated_at"]),
+            "program_count": row["program_count"],
+        }
+
     def create_playlist(self, name: str, description: str = None) -> Optional[int]:
         """
         Create a new playlist.
@@ -313,7 +565,23 @@ class ProgramDatabase:
         :param description: Optional description
         :return: Playlist ID if successful, None otherwise
         """
-        return self.playlist_orm.create_playlist(name, description)
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute(
+                    "INSERT INTO playlists (name, description) VALUES (?, ?)",
+                    (name, description),
+                )
+                conn.commit()
+                log.info(
+                    f"✅ Created playlist: {name} (ID: {cursor.lastrowid})",
+                    scope="ProgramDatabase",
+                )
+                return cursor.lastrowid
+        except Exception as e:
+            log.error(
+                f"❌Failed to create playlist '{name}': {e}", scope="ProgramDatabase"
+            )
+            return None
 
     def get_all_playlists(self) -> List[Dict]:
         """
@@ -321,7 +589,15 @@ class ProgramDatabase:
 
         :return: List of playlist dictionaries
         """
-        return self.playlist_orm.get_all_playlists()
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    f"{PLAYLIST_SELECT} GROUP BY playlists.id ORDER BY playlists.name"
+                ).fetchall()
+                return [self._playlist_to_dict(row) for row in rows]
+        except Exception as e:
+            log.error(f"Error loading playlists: {e}", scope="ProgramDatabase")
+            return []
 
     def get_playlist_by_id(self, playlist_id: int) -> Optional[Dict]:
         """
@@ -330,7 +606,18 @@ class ProgramDatabase:
         :param playlist_id: Playlist ID
         :return: Playlist dictionary if found, None otherwise
         """
-        return self.playlist_orm.get_playlist_by_id(playlist_id)
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    f"{PLAYLIST_SELECT} WHERE playlists.id = ? GROUP BY playlists.id",
+                    (playlist_id,),
+                ).fetchone()
+                return self._playlist_to_dict(row) if row else None
+        except Exception as e:
+            log.error(
+                f"Error getting playlist {playlist_id}: {e}", scope="ProgramDatabase"
+            )
+            return None
 
     def update_playlist(
         self, playlist_id: int, name: str = None, description: str = None
@@ -343,7 +630,32 @@ class ProgramDatabase:
         :param description: New description (optional)
         :return: True if successful, False otherwise
         """
-        return self.playlist_orm.update_playlist(playlist_id, name, description)
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute(
+                    """
+                    UPDATE playlists SET
+                        name = COALESCE(?, name),
+                        description = COALESCE(?, description),
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """,
+                    (name, description, playlist_id),
+                )
+                conn.commit()
+                if not cursor.rowcount:
+                    log.error(
+                        f"Playlist {playlist_id} not found", scope="ProgramDatabase"
+                    )
+                    return False
+                log.info(f"✅ Updated playlist {playlist_id}", scope="ProgramDatabase")
+                return True
+        except Exception as e:
+            log.error(
+                f"❌Failed to update playlist {playlist_id}: {e}",
+                scope="ProgramDatabase",
+            )
+            return False
 
     def delete_playlist(self, playlist_id: int) -> bool:
         """
@@ -352,7 +664,25 @@ class ProgramDatabase:
         :param playlist_id: Playlist ID
         :return: True if successful, False otherwise
         """
-        return self.playlist_orm.delete_playlist(playlist_id)
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    "DELETE FROM playlist_items WHERE playlist_id = ?", (playlist_id,)
+                )
+                cursor = conn.execute(
+                    "DELETE FROM playlists WHERE id = ?", (playlist_id,)
+                )
+                conn.commit()
+                if not cursor.rowcount:
+                    return False
+                log.info(f"✅Deleted playlist {playlist_id}", scope="ProgramDatabase")
+                return True
+        except Exception as e:
+            log.error(
+                f"❌Failed to delete playlist {playlist_id}: {e}",
+                scope="ProgramDatabase",
+            )
+            return False
 
     def add_program_to_playlist(
         self, playlist_id: int, program_id: str, position: int = None
@@ -365,9 +695,77 @@ class ProgramDatabase:
         :param position: Position in playlist (optional, will append if not provided)
         :return: True if successful, False otherwise
         """
-        return self.playlist_orm.add_program_to_playlist(
-            playlist_id, program_id, position
-        )
+        try:
+            with self._get_connection() as conn:
+                if not conn.execute(
+                    "SELECT 1 FROM playlists WHERE id = ?", (playlist_id,)
+                ).fetchone():
+                    log.error(
+                        f"Playlist {playlist_id} not found", scope="ProgramDatabase"
+                    )
+                    return False
+
+                if position is None:
+                    position = conn.execute(
+                        "SELECT COALESCE(MAX(position), 0) + 1 FROM playlist_items "
+                        "WHERE playlist_id = ?",
+                        (playlist_id,),
+                    ).fetchone()[0]
+
+                if conn.execute(
+                    "SELECT 1 FROM playlist_items "
+                    "WHERE playlist_id = ? AND program_id = ? AND position = ?",
+                    (playlist_id, program_id, position),
+                ).fetchone():
+                    log.warning(
+                        f"⚠️Program {program_id} already in playlist {playlist_id} at position {position}",
+                        scope="ProgramDatabase",
+                    )
+                    return False
+
+                conn.execute(
+                    "INSERT INTO playlist_items (playlist_id, program_id, position) "
+                    "VALUES (?, ?, ?)",
+                    (playlist_id, program_id, position),
+                )
+                conn.commit()
+                log.info(
+                    f"✅ Added program {program_id} to playlist {playlist_id} at position {position}",
+                    scope="ProgramDatabase",
+                )
+                return True
+        except Exception as e:
+            log.error(
+                f"❌Failed to add program {program_id} to playlist {playlist_id}: {e}",
+                scope="ProgramDatabase",
+            )
+            return False
+
+    def _change_first_playlist_item(
+        self, statement: str, parameters: tuple, playlist_id: int, program_id: str
+    ) -> bool:
+        """
+        Apply an UPDATE or DELETE to the first item (by position) for a program in a playlist.
+
+        :param statement: str e.g. "UPDATE playlist_items SET midi_file_path = ?"
+        :param parameters: tuple parameters of statement
+        :param playlist_id: Playlist ID
+        :param program_id: Program ID
+        :return: True if an item was changed
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                f"""
+                {statement} WHERE id = (
+                    SELECT id FROM playlist_items
+                    WHERE playlist_id = ? AND program_id = ?
+                    ORDER BY position LIMIT 1
+                )
+            """,
+                parameters + (playlist_id, program_id),
+            )
+            conn.commit()
+            return cursor.rowcount > 0
 
     def remove_program_from_playlist(self, playlist_id: int, program_id: str) -> bool:
         """
@@ -377,18 +775,63 @@ class ProgramDatabase:
         :param program_id: Program ID
         :return: True if successful, False otherwise
         """
-        return self.playlist_orm.remove_program_from_playlist(playlist_id, program_id)
+        try:
+            if not self._change_first_playlist_item(
+                "DELETE FROM playlist_items", (), playlist_id, program_id
+            ):
+                return False
+            log.info(
+                f"✅ Removed program {program_id} from playlist {playlist_id}",
+                scope="ProgramDatabase",
+            )
+            return True
+        except Exception as e:
+            log.error(
+                f"❌Failed to remove program {program_id} from playlist {playlist_id}: {e}",
+                scope="ProgramDatabase",
+            )
+            return False
 
     def get_playlist_programs(self, playlist_id: int) -> List[Dict]:
         """
         Get all programs in a playlist with their MIDI file paths, ordered by position.
 
+        One query joins the items to their programs.
+
         :param playlist_id: Playlist ID
-        :return: List of dictionaries with 'program' (JDXiProgram) and 'midi_file_path' (str)
+        :return: List of dictionaries with 'program' (JDXiProgram, or None if the
+            program is not in the database), 'midi_file_path' and 'cheat_preset_id'
         """
-        return self.playlist_orm.get_playlist_programs(
-            playlist_id, get_program_func=self.get_program_by_id
-        )
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT programs.*,
+                        playlist_items.midi_file_path AS item_midi_file_path,
+                        playlist_items.cheat_preset_id AS item_cheat_preset_id
+                    FROM playlist_items
+                    LEFT JOIN programs ON programs.id = playlist_items.program_id
+                    WHERE playlist_items.playlist_id = ?
+                    ORDER BY playlist_items.position
+                """,
+                    (playlist_id,),
+                ).fetchall()
+                return [
+                    {
+                        "program": (
+                            self._row_to_program(row) if row["id"] is not None else None
+                        ),
+                        "midi_file_path": row["item_midi_file_path"],
+                        "cheat_preset_id": row["item_cheat_preset_id"],
+                    }
+                    for row in rows
+                ]
+        except Exception as e:
+            log.error(
+                f"Error loading programs for playlist {playlist_id}: {e}",
+                scope="ProgramDatabase",
+            )
+            return []
 
     def update_playlist_item_midi_file(
         self, playlist_id: int, program_id: str, midi_file_path: str
@@ -401,9 +844,25 @@ class ProgramDatabase:
         :param midi_file_path: Path to MIDI file (or None to clear)
         :return: True if successful, False otherwise
         """
-        return self.playlist_orm.update_playlist_item_midi_file(
-            playlist_id, program_id, midi_file_path if midi_file_path else None
-        )
+        try:
+            if not self._change_first_playlist_item(
+                "UPDATE playlist_items SET midi_file_path = ?",
+                (midi_file_path if midi_file_path else None,),
+                playlist_id,
+                program_id,
+            ):
+                return False
+            log.info(
+                f"✅ Updated MIDI file for playlist {playlist_id}, program {program_id}",
+                scope="ProgramDatabase",
+            )
+            return True
+        except Exception as e:
+            log.error(
+                f"❌Failed to update MIDI file for playlist {playlist_id}, program {program_id}: {e}",
+                scope="ProgramDatabase",
+            )
+            return False
 
     def update_playlist_item_cheat_preset(
         self, playlist_id: int, program_id: str, cheat_preset_id: Optional[str] = None
@@ -416,9 +875,25 @@ class ProgramDatabase:
         :param cheat_preset_id: Cheat preset ID (e.g., "113") or None to clear
         :return: True if updated, False otherwise
         """
-        return self.playlist_orm.update_playlist_item_cheat_preset(
-            playlist_id, program_id, cheat_preset_id
-        )
+        try:
+            if not self._change_first_playlist_item(
+                "UPDATE playlist_items SET cheat_preset_id = ?",
+                (cheat_preset_id,),
+                playlist_id,
+                program_id,
+            ):
+                return False
+            log.info(
+                f"✅ Updated cheat preset for playlist {playlist_id}, program {program_id}: {cheat_preset_id}",
+                scope="ProgramDatabase",
+            )
+            return True
+        except Exception as e:
+            log.error(
+                f"❌ Failed to update cheat preset for playlist {playlist_id}, program {program_id}: {e}",
+                scope="ProgramDatabase",
+            )
+            return False
 
     def migrate_from_json(self, json_file: Path) -> int:
         """
@@ -437,18 +912,17 @@ class ProgramDatabase:
             with open(json_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
 
-            migrated = 0
+            programs = []
             for program_dict in data:
                 try:
-                    program = JDXiProgram.from_dict(program_dict)
-                    if self.add_or_replace_program(program):
-                        migrated += 1
+                    programs.append(JDXiProgram.from_dict(program_dict))
                 except Exception as e:
                     log.error(
                         f"Error migrating program {program_dict.get('id', 'unknown')}: {e}",
                         scope="migrate_from_json",
                     )
 
+            migrated = self.add_or_replace_programs(programs)
             log.message(f"✅ Migrated {migrated} programs from JSON to SQLite")
             return migrated
         except Exception as e:
@@ -473,8 +947,8 @@ def get_database() -> ProgramDatabase:
         json_file = Path.home() / f".{__package_name__}" / "user_programs.json"
         if json_file.exists():
             # Check if database already has programs
-            existing_programs = _db_instance.get_all_programs()
-            if len(existing_programs) == 0:
+            existing_count = _db_instance.count_programs()
+            if existing_count == 0:
                 # Database is empty, safe to migrate
                 migrated_count = _db_instance.migrate_from_json(json_file)
                 if migrated_count > 0:
@@ -485,7 +959,7 @@ def get_database() -> ProgramDatabase:
             else:
                 # Database already has programs, skip migration to avoid overwriting
                 log.message(
-                    f"⚠️  Database already contains {len(existing_programs)} programs. Skipping JSON migration to prevent data loss.",
+                    f"⚠️  Database already contains {existing_count} programs. Skipping JSON migration to prevent data loss.",
                     scope="get_database",
                 )
     return _db_instance
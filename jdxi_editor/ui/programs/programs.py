@@ -4,6 +4,7 @@ from typing import List, Optional
 
 from decologr import Decologr as log
 
+from jdxi_editor.core.lazy import lazy_classattribute
 from jdxi_editor.midi.program.program import JDXiProgram
 from jdxi_editor.project import __package_name__
 
@@ -3765,27 +3766,30 @@ class JDXiUIProgramList:
     """
     JDXiProgramList
 
-    Convert each dict to a JDXiProgram instance
+    Convert each dict to a JDXiProgram instance; ROM_PROGRAM_LIST is built on first use
     """
 
-    ROM_PROGRAM_LIST = [
-        JDXiProgram(
-            id=data["id"],
-            name=data["name"],
-            genre=data.get("genre"),
-            digital_1=data.get("digital_1"),
-            digital_2=data.get("digital_2"),
-            drums=data.get("drum"),  # note: key was "drum" not "drums" in source
-            analog=data.get("analog"),
-            measure_length=int(data["measure_length"]),
-            scale=data.get("scale"),
-            tempo=int(data["tempo"]),
-            msb=int(data["msb"]),
-            lsb=int(data["lsb"]),
-            pc=int(data["pc"]),
-        )
-        for data in ROM_PROGRAMS
-    ]
+    @lazy_classattribute
+    def ROM_PROGRAM_LIST(cls) -> List[JDXiProgram]:
+        return [
+            JDXiProgram(
+                id=data["id"],
+                name=data["name"],
+                genre=data.get("genre"),
+                digital_1=data.get("digital_1"),
+                digital_2=data.get("digital_2"),
+                drums=data.get("drum"),  # note: key was "drum" not "drums" in source
+                analog=data.get("analog"),
+                measure_length=int(data["measure_length"]),
+                scale=data.get("scale"),
+                tempo=int(data["tempo"]),
+                msb=int(data["msb"]),
+                lsb=int(data["lsb"]),
+                pc=int(data["pc"]),
+            )
+            for data in ROM_PROGRAMS
+        ]
+
     json_folder = Path.home() / f".{__package_name__}"
     USER_PROGRAMS_FILE = str(json_folder / "user_programs.json")
     USER_PROGRAMS = []
@@ -0,0 +1,276 @@
+"""
+Preset Catalog
+
+An index over a list of combo box options (presets, programs, waves) that
+answers the search, category and bank filters of
+``SearchableFilterableComboBox`` without rescanning the list, and a filter
+proxy that shows the answer without re-inserting combo box items.
+
+A catalog is built once per option list and shared by every combo box
+showing that list (``get_catalog``), together with one ``QStringListModel``
+of the options:
+
+- the lower-cased options and a posting list (option indices) per word;
+- a posting list per category when the options come with their categories,
+  and per bank (the option's leading letters) on first use;
+- recent search results, so typing one more character only narrows the
+  previous result.
+
+Search is a case-insensitive substring match, as before, but the text is no
+longer treated as a regular expression.
+
+Classes:
+    PresetCatalog: The shared index of one option list.
+    PresetFilterProxyModel: Shows the options a catalog filter accepted.
+
+Example usage:
+--------------
+>>> catalog = get_catalog(options, option_categories=categories)
+>>> proxy = PresetFilterProxyModel()
+>>> proxy.setSourceModel(catalog.model)
+>>> combo_box.setModel(proxy)
+>>> proxy.set_accepted(catalog.filter(search_text="bass", category="Synth Bass"))
+"""
+
+import re
+from collections import OrderedDict
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from PySide6.QtCore import (
+    QModelIndex,
+    QPersistentModelIndex,
+    QSortFilterProxyModel,
+    QStringListModel,
+)
+
+SEARCH_CACHE_SIZE = 64  # --- search results kept per catalog
+CATALOG_CACHE_SIZE = 32  # --- catalogs kept by get_catalog
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+class PresetCatalog:
+    """
+    Word, category and bank posting lists over one list of options.
+
+    :param options: Sequence[str] the options, in combo box order
+    :param option_categories: Optional[Sequence[str]] each option's category
+    """
+
+    def __init__(
+        self,
+        options: Sequence[str],
+        option_categories: Optional[Sequence[str]] = None,
+    ):
+        self.options: Tuple[str, ...] = tuple(options)
+        self._lowered = tuple(option.lower() for option in self.options)
+        self._everything = frozenset(range(len(self.options)))
+
+        postings: Dict[str, List[int]] = {}
+        for index, lowered in enumerate(self._lowered):
+            for word in set(_WORD.findall(lowered)):
+                postings.setdefault(word, []).append(index)
+        self._postings = {word: tuple(indices) for word, indices in postings.items()}
+
+        self._categories: Optional[Dict[str, FrozenSet[int]]] = None
+        if option_categories is not None:
+            if len(option_categories) != len(self.options):
+                raise ValueError(
+                    f"{len(option_categories)} categories for {len(self.options)} options"
+                )
+            by_category: Dict[str, Set[int]] = {}
+            for index, category in enumerate(option_categories):
+                by_category.setdefault(category or "", set()).add(index)
+            self._categories = {
+                category: frozenset(indices)
+                for category, indices in by_category.items()
+            }
+
+        self._banks: Dict[str, FrozenSet[int]] = {}
+        self._searches: "OrderedDict[str, Tuple[int, ...]]" = OrderedDict()
+        self._model: Optional[QStringListModel] = None
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    @property
+    def model(self) -> QStringListModel:
+        """The options as a list model, shared by the combo boxes showing them."""
+        if self._model is None:
+            self._model = QStringListModel(list(self.options))
+        return self._model
+
+    @property
+    def has_categories(self) -> bool:
+        """Whether the options came with their categories."""
+        return self._categories is not None
+
+    def search(self, text: str) -> Tuple[int, ...]:
+        """
+        Options containing text, ignoring case.
+
+        :param text: str
+        :return: Tuple[int, ...] option indices in order
+        """
+        text = text.lower()
+        if not text:
+            return tuple(range(len(self.options)))
+        cached = self._searches.get(text)
+        if cached is not None:
+            self._searches.move_to_end(text)
+            return cached
+
+        candidates = self._search_candidates(text)
+        result = tuple(index for index in candidates if text in self._lowered[index])
+        self._searches[text] = result
+        if len(self._searches) > SEARCH_CACHE_SIZE:
+            self._searches.popitem(last=False)
+        return result
+
+    def _search_candidates(self, text: str) -> Sequence[int]:
+        """Options that may contain text: a cached shorter search, or the posting lists."""
+        for end in range(len(text) - 1, 0, -1):
+            narrower = self._searches.get(text[:end])
+            if narrower is not None:
+                return narrower
+        words = _WORD.findall(text)
+        if not words:
+            return range(len(self.options))
+        # --- An option containing text has a word containing its longest word
+        longest = max(words, key=len)
+        candidates: Set[int] = set()
+        for word, indices in self._postings.items():
+            if longest in word:
+                candidates.update(indices)
+        return sorted(candidates)
+
+    def category(self, category: str) -> FrozenSet[int]:
+        """
+        Options in a category.
+
+        With per-option categories the category must match exactly; otherwise
+        the category name is searched for in the option text.
+
+        :param category: str
+        :return: FrozenSet[int] option indices
+        """
+        if self._categories is not None:
+            return self._categories.get(category, frozenset())
+        return frozenset(self.search(category))
+
+    def bank(self, bank: str) -> FrozenSet[int]:
+        """
+        Options in a bank: those starting with the bank letters (e.g. "A01 - ...").
+
+        :param bank: str e.g. "A"
+        :return: FrozenSet[int] option indices
+        """
+        indices = self._banks.get(bank)
+        if indices is None:
+            prefixes = (bank.upper(), bank.lower())
+            indices = frozenset(
+                index
+                for index, option in enumerate(self.options)
+                if option.startswith(prefixes)
+            )
+            self._banks[bank] = indices
+        return indices
+
+    def matching(
+        self, predicate: Callable[[str], bool], candidates: Optional[Set[int]] = None
+    ) -> FrozenSet[int]:
+        """
+        Options accepted by predicate, for filters the catalog cannot index.
+
+        :param predicate: Callable[[str], bool] called with the option text
+        :param candidates: Optional[Set[int]] only test these options
+        :return: FrozenSet[int] option indices
+        """
+        indices = range(len(self.options)) if candidates is None else candidates
+        return frozenset(index for index in indices if predicate(self.options[index]))
+
+    def filter(
+        self,
+        search_text: str = "",
+        category: str = "",
+        bank: str = "",
+    ) -> Optional[FrozenSet[int]]:
+        """
+        Options passing every filter given; empty filters are ignored.
+
+        :param search_text: str
+        :param category: str
+        :param bank: str
+        :return: Optional[FrozenSet[int]] option indices, None when nothing is filtered
+        """
+        accepted: Optional[FrozenSet[int]] = None
+        if bank:
+            accepted = self.bank(bank)
+        if category:
+            indices = self.category(category)
+            accepted = indices if accepted is None else accepted & indices
+        if search_text:
+            indices = frozenset(self.search(search_text))
+            accepted = indices if accepted is None else accepted & indices
+        return accepted
+
+
+class PresetFilterProxyModel(QSortFilterProxyModel):
+    """Shows the source rows in an accepted set (all rows when the set is None)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._accepted: Optional[FrozenSet[int]] = None
+
+    def set_accepted(self, accepted: Optional[FrozenSet[int]]) -> None:
+        """
+        Show the source rows in accepted; the view only sees the rows that changed.
+
+        :param accepted: Optional[FrozenSet[int]] source rows, None for all
+        """
+        if accepted == self._accepted:
+            return
+        self._accepted = accepted
+        self.invalidateRowsFilter()
+
+    def filterAcceptsRow(
+        self, source_row: int, source_parent: Union[QModelIndex, QPersistentModelIndex]
+    ) -> bool:
+        return self._accepted is None or source_row in self._accepted
+
+
+_catalogs: "OrderedDict[tuple, PresetCatalog]" = OrderedDict()
+
+
+def get_catalog(
+    options: Sequence[str], option_categories: Optional[Sequence[str]] = None
+) -> PresetCatalog:
+    """
+    The shared catalog of an option list, built on first use.
+
+    :param options: Sequence[str]
+    :param option_categories: Optional[Sequence[str]] each option's category
+    :return: PresetCatalog
+    """
+    key = (
+        tuple(options),
+        None if option_categories is None else tuple(option_categories),
+    )
+    catalog = _catalogs.get(key)
+    if catalog is None:
+        catalog = _catalogs[key] = PresetCatalog(*key)
+        if len(_catalogs) > CATALOG_CACHE_SIZE:
+            _catalogs.popitem(last=False)
+    else:
+        _catalogs.move_to_end(key)
+    return catalog
@@ -11,19 +11,26 @@ This module provides a reusable combo box widget that supports:
 The widget maintains a mapping between filtered combo box indices and original values,
 ensuring MIDI commands are sent correctly even when the list is filtered.
 
+The options are indexed once in a shared PresetCatalog and shown through a
+filter proxy, so changing a filter looks up posting lists and hides or shows
+rows instead of clearing and re-adding every item.
+
 Classes:
 --------
 - SearchableFilterableComboBox: A combo box with search, category, and bank filtering capabilities.
 """
 
-import re
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from decologr import Decologr as log
 from PySide6.QtCore import Signal, Slot
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QLineEdit, QSizePolicy
 
 from jdxi_editor.ui.common import JDXi, QWidget
+from jdxi_editor.ui.widgets.combo_box.catalog import (
+    PresetFilterProxyModel,
+    get_catalog,
+)
 from picoui.helpers import create_form_layout, create_header_row
 from picoui.widget.helper import (
     create_combo_row,
@@ -69,6 +76,7 @@ class SearchableFilterableComboBox(QWidget):
         bank_label: str = "Bank:",
         search_label: str = "Search:",
         use_analog_style: bool = False,
+        option_categories: Optional[List[str]] = None,
         parent: Optional[QWidget] = None,
     ):
         """
@@ -80,7 +88,8 @@ class SearchableFilterableComboBox(QWidget):
         :param categories: List of category strings for filtering (optional)
         :param category_filter_func: Function to determine if an option matches a category.
                                     Signature: (option: str, category: str) -> bool
-                                    If None, uses simple substring matching
+                                    If None, uses option_categories, or else simple
+                                    substring matching
         :param banks: List of bank strings for filtering (optional)
         :param bank_filter_func: Function to determine if an option matches a bank.
                                 Signature: (option: str, bank: str) -> bool
@@ -94,6 +103,8 @@ class SearchableFilterableComboBox(QWidget):
         :param bank_label: Label text for bank selector
         :param search_label: Label text for search box
         :param use_analog_style: If True, use blue (analog) accent for search QLineEdit
+        :param option_categories: Category of each option, matched exactly by the
+                                  category filter; cheaper than a category_filter_func
         :param parent: Parent widget
         """
         super().__init__(parent)
@@ -104,14 +115,17 @@ class SearchableFilterableComboBox(QWidget):
             values.copy() if values else list(range(len(self._full_options)))
         )
         self._categories = categories or []
-        self._category_filter_func = (
-            category_filter_func or self._default_category_filter
-        )
+        self._category_filter_func = category_filter_func
         self._banks = banks or []
-        self._bank_filter_func = bank_filter_func or self._default_bank_filter
+        self._bank_filter_func = bank_filter_func
+
+        # --- Shared index of the options, and the proxy showing the filtered ones
+        self._catalog = get_catalog(self._full_options, option_categories)
+        self._proxy = PresetFilterProxyModel(self)
+        self._proxy.setSourceModel(self._catalog.model)
 
-        # --- Mapping from filtered combo box index to original value index
-        self._filtered_to_original: List[int] = []
+        # --- Results of the filter functions, by (kind, category or bank)
+        self._filter_func_cache: Dict[Tuple[str, str], FrozenSet[int]] = {}
 
         # --- Current filter state
         self._current_search_text = ""
@@ -141,6 +155,7 @@ class SearchableFilterableComboBox(QWidget):
 
         # --- Main combo box (slot=None: we connect currentIndexChanged below, not currentTextChanged)
         main_bar, self.combo_box = create_combo_row(label=label, slot=None)
+        self.combo_box.setModel(self._proxy)
         self.combo_box.currentIndexChanged.connect(self._on_combo_index_changed)
         self.set_combo_dimensions(self.combo_box)
         layout.addRow(main_bar)
@@ -204,30 +219,6 @@ class SearchableFilterableComboBox(QWidget):
         search_row = create_row_with_widgets(widgets)
         return search_row
 
-    def _default_category_filter(self, option: str, category: str) -> bool:
-        """
-        Default category filter function using substring matching.
-
-        :param option: Option string to check
-        :param category: Category string to match
-        :return: True if option matches category
-        """
-        return category.lower() in option.lower()
-
-    def _default_bank_filter(self, option: str, bank: str) -> bool:
-        """
-        Default bank filter function using substring matching.
-        Checks if the bank letter appears at the start of the option (e.g., "A01 - Program Name").
-
-        :param option: Option string to check
-        :param bank: Bank string to match
-        :return: True if option matches bank
-        """
-        if not bank:
-            return True
-        # --- Check if bank letter appears at the start of the option (format: "A01 - Program Name")
-        return option.startswith(bank.upper()) or option.startswith(bank.lower())
-
     def _on_search_changed(self, text: str) -> None:
         """Handle search text change."""
         self._current_search_text = text.strip()
@@ -243,48 +234,56 @@ class SearchableFilterableComboBox(QWidget):
         self._current_bank = bank if bank != "All Banks" else ""
         self._populate_combo()
 
+    def _func_matches(
+        self, kind: str, func: Callable[[str, str], bool], value: str
+    ) -> FrozenSet[int]:
+        """Options a category or bank filter function accepts, computed once per value."""
+        key = (kind, value)
+        matches = self._filter_func_cache.get(key)
+        if matches is None:
+            matches = self._catalog.matching(lambda option: func(option, value))
+            self._filter_func_cache[key] = matches
+        return matches
+
     def _populate_combo(self) -> None:
-        """Populate the combo box based on current filters."""
-        # Block signals during population to prevent spurious valueChanged emissions
+        """Show the options passing the current filters."""
+        category = self._current_category
+        bank = self._current_bank
+        accepted = self._catalog.filter(
+            search_text=self._current_search_text,
+            category="" if self._category_filter_func else category,
+            bank="" if self._bank_filter_func else bank,
+        )
+        for kind, func, value in (
+            ("category", self._category_filter_func, category),
+            ("bank", self._bank_filter_func, bank),
+        ):
+            if func and value:
+                matches = self._func_matches(kind, func, value)
+                accepted = matches if accepted is None else accepted & matches
+
+        # Block signals during filtering to prevent spurious valueChanged emissions
         self.combo_box.blockSignals(True)
-
-        # --- Clear existing items and mapping
-        self.combo_box.clear()
-        self._filtered_to_original.clear()
-
-        # --- Filter options
-        filtered_options = []
-        for i, option in enumerate(self._full_options):
-            # Apply search filter
-            if self._current_search_text:
-                if not re.search(self._current_search_text, option, re.IGNORECASE):
-                    continue
-
-            # --- Apply bank filter
-            if self._current_bank:
-                if not self._bank_filter_func(option, self._current_bank):
-                    continue
-
-            # --- Apply category filter
-            if self._current_category:
-                if not self._category_filter_func(option, self._current_category):
-                    continue
-
-            # --- Option passes all filters
-            filtered_options.append(option)
-            self._filtered_to_original.append(i)
-
-        # --- Add filtered items to combo box
-        for option in filtered_options:
-            self.combo_box.addItem(option)
+        self._proxy.set_accepted(accepted)
 
         # --- Select first item by default to avoid -1 index
-        if filtered_options:
+        if self._proxy.rowCount() > 0:
             self.combo_box.setCurrentIndex(0)
 
         # --- Restore signals
         self.combo_box.blockSignals(False)
 
+    def _original_index(self, filtered_index: int) -> int:
+        """
+        Index in the full options of a filtered combo box index.
+
+        :param filtered_index: int
+        :return: int original index, -1 if out of range
+        """
+        if not 0 <= filtered_index < self._proxy.rowCount():
+            return -1
+        return self._proxy.mapToSource(self._proxy.index(filtered_index, 0)).row()
+
     def _on_combo_index_changed(self, filtered_index: int) -> None:
         """
         Handle combo box index change.
@@ -298,8 +297,8 @@ class SearchableFilterableComboBox(QWidget):
             idx = int(filtered_index)
         except (TypeError, ValueError):
             return
-        if 0 <= idx < len(self._filtered_to_original):
-            original_index = self._filtered_to_original[idx]
+        original_index = self._original_index(idx)
+        if original_index >= 0:
             original_value = self._full_values[original_index]
             self.valueChanged.emit(original_value)
             log.debug(
@@ -309,7 +308,7 @@ class SearchableFilterableComboBox(QWidget):
         else:
             log.warning(
                 f"Invalid filtered index {idx} "
-                f"(max: {len(self._filtered_to_original) - 1})"
+                f"(max: {self._proxy.rowCount() - 1})"
             )
 
     def setValue(self, value: int) -> None:
@@ -329,8 +328,10 @@ class SearchableFilterableComboBox(QWidget):
         original_index = self._full_values.index(value)
 
         # --- Find position in filtered list
-        if original_index in self._filtered_to_original:
-            filtered_index = self._filtered_to_original.index(original_index)
+        filtered_index = self._proxy.mapFromSource(
+            self._catalog.model.index(original_index, 0)
+        ).row()
+        if filtered_index >= 0:
             self.combo_box.blockSignals(True)
             self.combo_box.setCurrentIndex(filtered_index)
             self.combo_box.blockSignals(False)
@@ -346,9 +347,8 @@ class SearchableFilterableComboBox(QWidget):
 
         :return: The original value corresponding to the selected option
         """
-        filtered_index = self.combo_box.currentIndex()
-        if 0 <= filtered_index < len(self._filtered_to_original):
-            original_index = self._filtered_to_original[filtered_index]
+        original_index = self._original_index(self.combo_box.currentIndex())
+        if original_index >= 0:
             return self._full_values[original_index]
         return 0
 
@@ -394,6 +394,7 @@ class SearchableFilterableComboBox(QWidget):
         values: Optional[List[int]] = None,
         categories: Optional[List[str]] = None,
         category_filter_func: Optional[Callable[[str, str], bool]] = None,
+        option_categories: Optional[List[str]] = None,
     ) -> None:
         """
         Update the combo box with new options, values, and optionally categories.
@@ -402,11 +403,18 @@ class SearchableFilterableComboBox(QWidget):
         :param values: New list of corresponding integer values (if None, uses indices)
         :param categories: New list of category strings for filtering (optional)
         :param category_filter_func: New category filter function (optional)
+        :param option_categories: Category of each new option (optional)
         """
         self._full_options = options.copy() if options else []
         self._full_values = (
             values.copy() if values else list(range(len(self._full_options)))
         )
+        self._catalog = get_catalog(self._full_options, option_categories)
+        self.combo_box.blockSignals(True)
+        self._proxy.set_accepted(None)
+        self._proxy.setSourceModel(self._catalog.model)
+        self.combo_box.blockSignals(False)
+        self._filter_func_cache.clear()
         
         # Update category filter function if provided
         if category_filter_func is not None:
@@ -12,12 +12,9 @@ def send_nrpn(self, channel, msb, lsb, value):
 
 """
 
-import threading
-
 from decologr import Decologr as log
 
 from jdxi_editor.core.jdxi import JDXi
-from jdxi_editor.midi.io.delay import send_with_delay
 from jdxi_editor.midi.sysex.request.midi_requests import MidiRequests
 from jdxi_editor.ui.widgets.slider import Slider
 
@@ -87,13 +84,7 @@ class NRPNSlider(Slider):
         """
         Request the current value of the NRPN parameter from the device.
         """
-        threading.Thread(
-            target=send_with_delay,
-            args=(
-                self.midi_helper,
-                self.midi_requests,
-            ),
-        ).start()
+        self.midi_helper.request_data(self.midi_requests)
 
     def on_valueChanged(self, value: int):
         """
@@ -8,6 +8,7 @@ from PySide6.QtGui import QColor, QPainter, QPaintEvent, QPen
 from PySide6.QtWidgets import QWidget
 
 from jdxi_editor.core.jdxi import JDXi
+from jdxi_editor.midi.file.model import midi_file_model
 
 
 class TimeRulerWidget(QWidget):
@@ -26,7 +27,9 @@ class TimeRulerWidget(QWidget):
 
     def set_midi_file(self, midi_file: mido.MidiFile) -> None:
         self.midi_file = midi_file
-        self.midi_file_cached_total_length = self.midi_file.length
+        self.midi_file_cached_total_length = midi_file_model(
+            self.midi_file
+        ).duration_seconds
         self.update()
 
     def paintEvent(self, event: QPaintEvent) -> None:
@@ -2,14 +2,17 @@
 Midi Track Widget
 """
 
+from typing import Optional
+
 import mido
 from decologr import Decologr as log
 from PySide6.QtCore import QRectF
 from PySide6.QtGui import QColor, QPainter, QPaintEvent, QPixmap
 
+from jdxi_editor.midi.file.model import TrackColumns, index_track
 from jdxi_editor.ui.common import JDXi, QWidget
 from jdxi_editor.ui.widgets.midi.colors import MIDI_CHANNEL_COLORS
-from jdxi_editor.ui.widgets.midi.utils import generate_track_colors, get_first_channel
+from jdxi_editor.ui.widgets.midi.utils import generate_track_colors
 from picomidi.message.type import MidoMessageType
 
 
@@ -24,6 +27,7 @@ class MidiTrackWidget(QWidget):
         track_number: int,
         total_length: float,
         parent: QWidget = None,
+        columns: Optional[TrackColumns] = None,
     ):
         """
         Initialize the MidiTrackWidget.
@@ -32,6 +36,7 @@ class MidiTrackWidget(QWidget):
         :param track_number: int The track number
         :param total_length: float The total length of the longest of the tracks in seconds
         :param parent: QWidget Parent widget
+        :param columns: Optional[TrackColumns] the track's indexed columns, e.g. from the file model
         """
         super().__init__(parent)
         self.midi_file = None
@@ -49,47 +54,38 @@ class MidiTrackWidget(QWidget):
         self.cached_width = 0
 
         if track:
-            self.set_track(track, total_length)
+            self.set_track(track, total_length, columns)
 
-    def set_track(self, track: mido.MidiTrack, total_length: float) -> None:
+    def set_track(
+        self,
+        track: mido.MidiTrack,
+        total_length: float,
+        columns: Optional[TrackColumns] = None,
+    ) -> None:
         """
         set_track
 
         :param track: mido.MidiTrack
         :param total_length: float
+        :param columns: Optional[TrackColumns] indexed columns of track; built if not given
         :return: None
         """
         self.track = track
         self.track_data = None
         if not track:
             return
+        if columns is None or columns.track is not track:
+            columns = index_track(track, self.track_number)
 
-        abs_time = 0
-        rects = []
-        channels = set()
-        note_count = 0
-        program_changes = []
+        channels = columns.channels
+        first_channel = columns.first_channel
+        program_changes = columns.programs
+        note_count = columns.note_count
 
-        # Find the first channel in the track
-        first_channel = None
-        for msg in track:
-            if hasattr(msg, "channel"):
-                first_channel = msg.channel
-                break
-        if first_channel is None:
-            first_channel = 0  # fallback if no channel found
-
-        for msg in track:
-            abs_time += msg.time
-            if hasattr(msg, "channel"):
-                channels.add(msg.channel)
-            if msg.type == MidoMessageType.NOTE_ON.value and msg.velocity > 0:
-                note_count += 1
-                norm_time = abs_time / total_length if total_length else 0
-                # Use first_channel for all notes
-                rects.append((norm_time, first_channel))
-            if msg.type == MidoMessageType.PROGRAM_CHANGE.value:
-                program_changes.append(msg.program)
+        scale = 1 / total_length if total_length else 0
+        note_ticks = columns.ticks[columns.note_on_mask()].tolist()
+        # Use first_channel for all notes
+        rects = [(tick * scale, first_channel) for tick in note_ticks]
 
         label = (
             f"Track | {track.name if track.name else 'Unnamed'} | Notes: {note_count}"
@@ -177,7 +173,6 @@ class MidiTrackWidget(QWidget):
                     if end_x - start_x < self.note_width:
                         end_x = start_x + self.note_width
                     track_rect = QRectF(start_x, y, end_x - start_x, int(track_height))
-                    channel = get_first_channel(self.track)
                     bg_color = generate_track_colors(16)[int(self.track_number) % 16]
                     if muted:
                         bg_color.setAlpha(50)
@@ -242,7 +237,6 @@ class MidiTrackWidget(QWidget):
             end_x = start_x + self.note_width
         track_rect = QRectF(start_x, y, end_x - start_x, height)
 
-        channel = get_first_channel(self.track)
         bg_color = generate_track_colors(16)[int(self.track_number) % 16]
         if muted:
             bg_color.setAlpha(50)
@@ -7,7 +7,7 @@ from copy import deepcopy
 import mido
 import qtawesome as qta
 from decologr import Decologr as log
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -19,6 +19,11 @@ from PySide6.QtWidgets import (
     QSlider,
 )
 
+from jdxi_editor.midi.file.model import (
+    MidiFileModel,
+    TrackColumns,
+    midi_file_model,
+)
 from jdxi_editor.ui.common import JDXi, QVBoxLayout, QWidget
 from jdxi_editor.ui.preset.tone.digital.list import JDXiPresetToneListDigital
 from jdxi_editor.ui.style.factory import generate_sequencer_button_style
@@ -30,6 +35,8 @@ from jdxi_editor.ui.widgets.midi.utils import get_first_channel
 from picomidi.constant import Midi
 from picomidi.message.type import MidoMetaMessageType, MidoMessageType
 
+TRACK_ROWS_PER_BATCH = 4  # track rows built per event-loop turn when loading a file
+
 
 class MidiTrackViewer(QWidget):
     """
@@ -45,6 +52,7 @@ class MidiTrackViewer(QWidget):
         self.midi_track_widgets = {}  # MidiTrackWidget()
         self.muted_tracks: set[int] = set()  # To track muted tracks
         self._draggable_rows = {}
+        self._row_generation = 0  # --- bumped to cancel pending row batches
 
         # To track muted channels
         self.muted_channels: set[int] = set()
@@ -126,6 +134,7 @@ class MidiTrackViewer(QWidget):
         # Clear MIDI data
         self.midi_file = None
         self.event_index = None
+        self._row_generation += 1
 
         # Unmute all channels
         for ch, btn in self.mute_buttons.items():
@@ -417,6 +426,7 @@ class MidiTrackViewer(QWidget):
         :return: None
         """
         self.midi_file = midi_file
+        model = midi_file_model(midi_file)
         self.ruler.set_midi_file(midi_file)
 
         # Clear existing selectors if reloading
@@ -428,138 +438,30 @@ class MidiTrackViewer(QWidget):
 
         self.midi_track_widgets = {}
         self._draggable_rows = {}
-        # Create each track widget and add it to the layout
-        for i, track in enumerate(midi_file.tracks):
-            hlayout = QHBoxLayout()
-            first_channel = get_first_channel(track) + Midi.channel.BINARY_TO_DISPLAY
-            # Optional: Get the track name to show in dialog
-            track = self.midi_file.tracks[i]
-            track_name = getattr(
-                track, "name", f"Track {i + Midi.channel.BINARY_TO_DISPLAY}"
-            )
-            icon_names = {
-                10: "fa5s.drum",
-            }
-            colors = {3: JDXi.UI.Style.ACCENT_ANALOG}
-            color = colors.get(
-                first_channel, JDXi.UI.Style.ACCENT
-            )  # Default color if not specified
-            icon_name = icon_names.get(
-                first_channel, "mdi.piano"
-            )  # Default icon if not specified
-            # Add QLabel for track number and channel
-            pixmap = qta.icon(icon_name, color=color).pixmap(
-                JDXi.UI.Style.TRACK_ICON_PIXMAP_SIZE,
-                JDXi.UI.Style.TRACK_ICON_PIXMAP_SIZE,
-            )
+        # --- Build the first rows now and the rest from the event loop, so a
+        # --- file with many tracks shows up at once and the UI stays responsive
+        self._row_generation += 1
+        self._add_track_rows(model, 0, self._row_generation)
 
-            track_number_label = QLabel(f"{i + 1}")
-            track_number_label.setFixedWidth(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
-            track_number_label.setFixedHeight(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
-            hlayout.addWidget(track_number_label)
-
-            icon_label = QLabel()
-            icon_label.setPixmap(pixmap)
-            icon_label.setFixedWidth(
-                JDXi.UI.Style.TRACK_ICON_PIXMAP_SIZE
-            )  # Add some padding
-            hlayout.addWidget(icon_label)
-
-            label_vlayout = QVBoxLayout()
-            label_vlayout.setContentsMargins(0, 0, 0, 0)
-            label_vlayout.setSpacing(0)
-            hlayout.addLayout(label_vlayout)
-            line_label_row = QHBoxLayout()
-            label_vlayout.addLayout(line_label_row)
-
-            # Add QLineEdit for track label
-            track_name_line_edit = QLineEdit()
-            track_name_line_edit.setText(track_name)
-            track_name_line_edit.setFixedWidth(JDXi.UI.Style.TRACK_LABEL_WIDTH)
-            track_name_line_edit.setToolTip("Track Name")
-            track_name_line_edit.setStyleSheet(
-                "QLineEdit { background-color: transparent; border: none; }"
-            )
-            track_name_line_edit.setAlignment(Qt.AlignLeft)
-            temp_row = QHBoxLayout()
-            line_label_row.addLayout(temp_row)
-            # temp_row.addWidget(track_number_label)
-            temp_row.addWidget(track_name_line_edit)
-            # temp_row.addWidget(track_channel_label)
-            self._track_name_edits[i] = track_name_line_edit
-
-            # Add QSpinBox for selecting the MIDI channel
-            spin = MidiSpinBox()
-            spin.setToolTip(
-                "Select MIDI Channel for Track, then click 'Apply' to save changes"
-            )
-            spin.setValue(first_channel)  # Offset for digital
-            spin.setFixedWidth(JDXi.UI.Style.TRACK_SPINBOX_WIDTH)
-            spin.setPrefix("Ch")
-            line_label_row.addWidget(spin)
-            self.track_channel_spins[i] = spin
-
-            button_hlayout = QHBoxLayout()
-            label_vlayout.addLayout(button_hlayout)
-
-            apply_icon = JDXi.UI.Icon.get_icon(
-                JDXi.UI.Icon.SAVE, color=JDXi.UI.Style.FOREGROUND
-            )
-            apply_button = QPushButton()
-            apply_button.setIcon(apply_icon)
-            apply_button.setToolTip("Apply changes to Track Channel")
-            apply_button.setFixedWidth(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
-            apply_button.setFixedHeight(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
-            apply_button.clicked.connect(self.make_apply_slot(i, spin))
-            apply_button.clicked.connect(
-                lambda _, tr=i, le=track_name_line_edit: self.change_track_name(
-                    tr, le.text()
-                )
-            )
-            button_hlayout.addWidget(apply_button)
-
-            mute_icon = JDXi.UI.Icon.get_icon(
-                JDXi.UI.Icon.MUTE, color=JDXi.UI.Style.FOREGROUND
-            )
-            mute_button = QPushButton()
-            mute_button.setIcon(mute_icon)
-            mute_button.setToolTip("Mute Track")
-            mute_button.setFixedWidth(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
-            mute_button.setFixedHeight(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
-            mute_button.setCheckable(True)
-            mute_button.clicked.connect(
-                lambda _, tr=i: self.mute_track(tr)
-            )  # Send internal value (0–15)
-            mute_button.toggled.connect(
-                lambda checked, tr=i: self.toggle_track_mute(tr, checked)
-            )
-            button_hlayout.addWidget(mute_button)
-
-            delete_icon = JDXi.UI.Icon.get_icon(
-                JDXi.UI.Icon.DELETE, color=JDXi.UI.Style.FOREGROUND
-            )
-            delete_button = QPushButton()
-            delete_button.setIcon(delete_icon)
-            delete_button.setToolTip("Delete Track")
-            delete_button.setFixedWidth(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
-            delete_button.setCheckable(True)
-            delete_button.clicked.connect(
-                lambda _, tr=i: self.delete_track(tr)
-            )  # Send internal value (0–15)
-            button_hlayout.addWidget(delete_button)
-
-            # Add the MidiTrackWidget for the specific track
-            self.midi_track_widgets[i] = MidiTrackWidget(
-                track=track, track_number=i, total_length=midi_file.length
-            )  # Initialize the dictionary
-            hlayout.addWidget(self.midi_track_widgets[i])
-
-            # Wrap the layout in a draggable row widget
-            draggable_row = DraggableTrackRow(i, hlayout, self.scroll_content)
-            draggable_row.track_moved.connect(self.move_track)
-            self._draggable_rows[i] = draggable_row
-            self.channel_controls_vlayout.addWidget(draggable_row)
+    def _add_track_rows(
+        self, model: MidiFileModel, start: int, generation: int
+    ) -> None:
+        """
+        Add one batch of track rows, then schedule the next.
 
+        :param model: MidiFileModel of the file being shown
+        :param start: int index of the first track in this batch
+        :param generation: int set_midi_file call the batch belongs to
+        :return: None
+        """
+        if generation != self._row_generation:
+            return  # --- superseded by another file or cleared
+        stop = min(start + TRACK_ROWS_PER_BATCH, len(model.tracks))
+        for columns in model.tracks[start:stop]:
+            self._add_track_row(model, columns)
+        if stop < len(model.tracks):
+            QTimer.singleShot(0, lambda: self._add_track_rows(model, stop, generation))
+            return
         # Global Apply button (Apply Presets is in Track Classification group)
         apply_all_layout = QHBoxLayout()
         apply_all_layout.addStretch()
@@ -572,6 +474,150 @@ class MidiTrackViewer(QWidget):
         self.channel_controls_vlayout.addStretch()
         self.update_track_zoom(self.track_zoom_slider.value())
 
+    def _add_track_row(self, model: MidiFileModel, columns: TrackColumns) -> None:
+        """
+        Add the controls and MidiTrackWidget of one track.
+
+        :param model: MidiFileModel of the file being shown
+        :param columns: TrackColumns of the track
+        :return: None
+        """
+        i = columns.index
+        hlayout = QHBoxLayout()
+        first_channel = columns.first_channel + Midi.channel.BINARY_TO_DISPLAY
+        # Optional: Get the track name to show in dialog
+        track = self.midi_file.tracks[i]
+        track_name = getattr(
+            track, "name", f"Track {i + Midi.channel.BINARY_TO_DISPLAY}"
+        )
+        icon_names = {
+            10: "fa5s.drum",
+        }
+        colors = {3: JDXi.UI.Style.ACCENT_ANALOG}
+        color = colors.get(
+            first_channel, JDXi.UI.Style.ACCENT
+        )  # Default color if not specified
+        icon_name = icon_names.get(
+            first_channel, "mdi.piano"
+        )  # Default icon if not specified
+        # Add QLabel for track number and channel
+        pixmap = qta.icon(icon_name, color=color).pixmap(
+            JDXi.UI.Style.TRACK_ICON_PIXMAP_SIZE,
+            JDXi.UI.Style.TRACK_ICON_PIXMAP_SIZE,
+        )
+
+        track_number_label = QLabel(f"{i + 1}")
+        track_number_label.setFixedWidth(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
+        track_number_label.setFixedHeight(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
+        hlayout.addWidget(track_number_label)
+
+        icon_label = QLabel()
+        icon_label.setPixmap(pixmap)
+        icon_label.setFixedWidth(
+            JDXi.UI.Style.TRACK_ICON_PIXMAP_SIZE
+        )  # Add some padding
+        hlayout.addWidget(icon_label)
+
+        label_vlayout = QVBoxLayout()
+        label_vlayout.setContentsMargins(0, 0, 0, 0)
+        label_vlayout.setSpacing(0)
+        hlayout.addLayout(label_vlayout)
+        line_label_row = QHBoxLayout()
+        label_vlayout.addLayout(line_label_row)
+
+        # Add QLineEdit for track label
+        track_name_line_edit = QLineEdit()
+        track_name_line_edit.setText(track_name)
+        track_name_line_edit.setFixedWidth(JDXi.UI.Style.TRACK_LABEL_WIDTH)
+        track_name_line_edit.setToolTip("Track Name")
+        track_name_line_edit.setStyleSheet(
+            "QLineEdit { background-color: transparent; border: none; }"
+        )
+        track_name_line_edit.setAlignment(Qt.AlignLeft)
+        temp_row = QHBoxLayout()
+        line_label_row.addLayout(temp_row)
+        # temp_row.addWidget(track_number_label)
+        temp_row.addWidget(track_name_line_edit)
+        # temp_row.addWidget(track_channel_label)
+        self._track_name_edits[i] = track_name_line_edit
+
+        # Add QSpinBox for selecting the MIDI channel
+        spin = MidiSpinBox()
+        spin.setToolTip(
+            "Select MIDI Channel for Track, then click 'Apply' to save changes"
+        )
+        spin.setValue(first_channel)  # Offset for digital
+        spin.setFixedWidth(JDXi.UI.Style.TRACK_SPINBOX_WIDTH)
+        spin.setPrefix("Ch")
+        line_label_row.addWidget(spin)
+        self.track_channel_spins[i] = spin
+
+        button_hlayout = QHBoxLayout()
+        label_vlayout.addLayout(button_hlayout)
+
+        apply_icon = JDXi.UI.Icon.get_icon(
+            JDXi.UI.Icon.SAVE, color=JDXi.UI.Style.FOREGROUND
+        )
+        apply_button = QPushButton()
+        apply_button.setIcon(apply_icon)
+        apply_button.setToolTip("Apply changes to Track Channel")
+        apply_button.setFixedWidth(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
+        apply_button.setFixedHeight(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
+        apply_button.clicked.connect(self.make_apply_slot(i, spin))
+        apply_button.clicked.connect(
+            lambda _, tr=i, le=track_name_line_edit: self.change_track_name(
+                tr, le.text()
+            )
+        )
+        button_hlayout.addWidget(apply_button)
+
+        mute_icon = JDXi.UI.Icon.get_icon(
+            JDXi.UI.Icon.MUTE, color=JDXi.UI.Style.FOREGROUND
+        )
+        mute_button = QPushButton()
+        mute_button.setIcon(mute_icon)
+        mute_button.setToolTip("Mute Track")
+        mute_button.setFixedWidth(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
+        mute_button.setFixedHeight(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
+        mute_button.setCheckable(True)
+        mute_button.clicked.connect(
+            lambda _, tr=i: self.mute_track(tr)
+        )  # Send internal value (0–15)
+        mute_button.toggled.connect(
+            lambda checked, tr=i: self.toggle_track_mute(tr, checked)
+        )
+        button_hlayout.addWidget(mute_button)
+
+        delete_icon = JDXi.UI.Icon.get_icon(
+            JDXi.UI.Icon.DELETE, color=JDXi.UI.Style.FOREGROUND
+        )
+        delete_button = QPushButton()
+        delete_button.setIcon(delete_icon)
+        delete_button.setToolTip("Delete Track")
+        delete_button.setFixedWidth(JDXi.UI.Style.BUTTON_TRACK_WIDTH)
+        delete_button.setCheckable(True)
+        delete_button.clicked.connect(
+            lambda _, tr=i: self.delete_track(tr)
+        )  # Send internal value (0–15)
+        button_hlayout.addWidget(delete_button)
+
+        # Add the MidiTrackWidget for the specific track
+        self.midi_track_widgets[i] = MidiTrackWidget(
+            track=track,
+            track_number=i,
+            total_length=model.duration_seconds,
+            columns=columns,
+        )  # Initialize the dictionary
+        self.midi_track_widgets[i].update_muted_channels(self.muted_channels)
+        self.midi_track_widgets[i].update_muted_tracks(self.muted_tracks)
+        hlayout.addWidget(self.midi_track_widgets[i])
+
+        # Wrap the layout in a draggable row widget
+        draggable_row = DraggableTrackRow(i, hlayout, self.scroll_content)
+        draggable_row.track_moved.connect(self.move_track)
+        self._draggable_rows[i] = draggable_row
+        self.channel_controls_vlayout.addWidget(draggable_row)
+
     def get_track_controls_width(self) -> int:
         """
         Returns the estimated total width of all controls to the left of the MidiTrackWidget.
@@ -6,7 +6,8 @@ import mido
 from mido import MidiFile
 from PySide6.QtGui import QColor
 
-from picomidi import Midi, MidiTempo
+from jdxi_editor.midi.file.model import midi_file_model
+from picomidi import MidiTempo
 from picomidi.message.type import MidoMessageType
 
 
@@ -23,38 +24,12 @@ def ticks_to_seconds(ticks: int, tempo: int, ticks_per_beat: int) -> float:
 
 def get_total_duration_in_seconds(midi_file: MidiFile) -> float:
     """
-    get_total_duration_in_seconds
+    get_total_duration_in_seconds, following tempo changes (from the file's indexed model)
 
     :param midi_file: MidiFile
     :return: float
     """
-    ticks_per_beat = midi_file.ticks_per_beat
-    current_tempo = Midi.tempo.BPM_120_USEC  # default: 120 BPM
-    time_seconds = 0
-    last_tick = 0
-
-    # Collect all events with absolute ticks
-    events = []
-    for track in midi_file.tracks:
-        abs_tick = 0
-        for msg in track:
-            abs_tick += msg.time
-            events.append((abs_tick, msg))
-
-    # Sort all events by tick
-    events.sort(key=lambda x: x[0])
-
-    for abs_tick, msg in events:
-        delta_ticks = abs_tick - last_tick
-        time_seconds += (current_tempo / MidiTempo.MICROSECONDS_PER_SECOND) * (
-            delta_ticks / ticks_per_beat
-        )
-        last_tick = abs_tick
-
-        if msg.type == MidoMessageType.SET_TEMPO.value:
-            current_tempo = msg.tempo
-
-    return time_seconds
+    return midi_file_model(midi_file).duration_seconds
 
 
 def extract_notes_with_absolute_time(
@@ -55,28 +55,12 @@ class PCMWaveWidget(QWidget):
             set(w["Category"] for w in PCM_WAVES_CATEGORIZED if w["Category"] != "None")
         )
 
-        # --- Category filter function
-        def pcm_category_filter(wave_name: str, category: str) -> bool:
-            """Check if a PCM wave matches a category."""
-            if not category:
-                return True
-            # --- Find the wave in PCM_WAVES_CATEGORIZED and check its category
-            wave_num_str = wave_name.split(":")[0].strip()
-            try:
-                wave_num = int(wave_num_str)
-                for w in PCM_WAVES_CATEGORIZED:
-                    if w["Wave Number"] == wave_num:
-                        return w["Category"] == category
-            except ValueError:
-                pass
-            return False
-
         self.pcm_wave_number = SearchableFilterableComboBox(
             label=Digital.Display.Name.PCM_WAVE_NUMBER,
             options=pcm_options,
             values=pcm_values,
             categories=pcm_categories,
-            category_filter_func=pcm_category_filter,
+            option_categories=[w["Category"] for w in PCM_WAVES_CATEGORIZED],
             show_label=True,
             show_search=True,
             show_category=True,
@@ -7,7 +7,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import pyaudio
 from decologr import Decologr as log
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QCheckBox, QComboBox, QGroupBox, QLabel, QPushButton
@@ -15,7 +14,7 @@ from PySide6.QtWidgets import QCheckBox, QComboBox, QGroupBox, QLabel, QPushButt
 from jdxi_editor.core.jdxi import JDXi
 from jdxi_editor.midi.playback.state import MidiPlaybackState
 from jdxi_editor.midi.utils.helpers import start_recording
-from jdxi_editor.midi.utils.usb_recorder import USBRecorder
+from jdxi_editor.midi.utils.usb_recorder import PA_INT16, USBRecorder
 from jdxi_editor.ui.editors.helpers.widgets import create_jdxi_button_from_spec
 from jdxi_editor.ui.editors.midi_player.helper import (
     create_widget_cell_with_button_spec,
@@ -49,8 +48,15 @@ class USBFileRecordingWidget(JDXiMidiGroup):
         self.file_auto_generate_checkbox: QCheckBox | None = None
         self.port_select_combo: QComboBox = QComboBox()
         self.port_refresh_devices_button: QPushButton = QPushButton()
+        # --- Devices are listed on first show: starting PortAudio is slow
+        self._devices_listed = False
         self.setup_ui()
 
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if not self._devices_listed:
+            self.populate_devices()
+
     def _build_button_specs(self) -> dict[str, ButtonSpec]:
         return {
             "usb_port_refresh": ButtonSpec(
@@ -71,7 +77,6 @@ class USBFileRecordingWidget(JDXiMidiGroup):
         )
         grid.addLayout(usb_port_layout, row, 0)
         self.port_select_combo = QComboBox()
-        self.populate_devices()
         grid.addWidget(self.port_select_combo, row, 1, 1, 2)
         spec = self.specs["buttons"]["usb_port_refresh"]
         self.port_refresh_devices_button = create_jdxi_button_from_spec(
@@ -118,9 +123,7 @@ class USBFileRecordingWidget(JDXiMidiGroup):
         if self.recorder.file_save_recording:
             recording_rate = "32bit"  # Default to 32-bit recording
             try:
-                rate = self.recorder.usb_recording_rates.get(
-                    recording_rate, pyaudio.paInt16
-                )
+                rate = self.recorder.usb_recording_rates.get(recording_rate, PA_INT16)
                 self._start_recording(recording_rate=rate)
             except Exception as ex:
                 log.error(f"Error {ex} occurred starting USB recording")
@@ -157,6 +160,7 @@ class USBFileRecordingWidget(JDXiMidiGroup):
 
         :return: list List of USB devices
         """
+        self._devices_listed = True
         usb_devices = self.recorder.list_devices()
         self.port_select_combo.clear()
         self.port_select_combo.addItems(usb_devices)
@@ -192,7 +196,7 @@ class USBFileRecordingWidget(JDXiMidiGroup):
             f"Auto generate filename based on current date and time and Midi file = {self.file_auto_generate_checkbox.isChecked()}"
         )
 
-    def _start_recording(self, recording_rate: int = pyaudio.paInt16):
+    def _start_recording(self, recording_rate: int = PA_INT16):
         """
         usb_start_recording
 
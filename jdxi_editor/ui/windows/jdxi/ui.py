@@ -74,6 +74,7 @@ class JDXiWindow(QMainWindow):
         self.log_viewer = None
         self.midi_debugger = None
         self.midi_message_monitor = None
+        self.performance_panel = None
         self.old_pos = None
         # JDXi.UI.Theme.apply_dark_theme()
         self.preset_helpers = None
@@ -335,6 +336,11 @@ class JDXiWindow(QMainWindow):
         midi_monitor_action.triggered.connect(self._show_midi_message_monitor)
         self.debug_menu.addAction(midi_monitor_action)
 
+        # --- Add performance panel action
+        performance_action = QAction("Performance Monitor", self)
+        performance_action.triggered.connect(self._show_performance_panel)
+        self.debug_menu.addAction(performance_action)
+
         # --- Add log viewer action
         log_viewer_action = QAction("Log Viewer", self)
         log_viewer_action.triggered.connect(self._show_log_viewer)
@@ -364,6 +370,11 @@ class JDXiWindow(QMainWindow):
         midi_monitor_action.triggered.connect(self._show_midi_message_monitor)
         self.help_menu.addAction(midi_monitor_action)
 
+        # --- Add performance panel action
+        performance_action = QAction("Performance Monitor", self)
+        performance_action.triggered.connect(self._show_performance_panel)
+        self.help_menu.addAction(performance_action)
+
         # --- Add About window action
         about_help_action = QAction("About", self)
         about_help_action.triggered.connect(self._show_about_help)
@@ -646,6 +657,9 @@ class JDXiWindow(QMainWindow):
     def _show_midi_message_monitor(self):
         raise NotImplementedError("Should be implemented in subclass")
 
+    def _show_performance_panel(self):
+        raise NotImplementedError("Should be implemented in subclass")
+
     def _show_log_viewer(self):
         raise NotImplementedError("Should be implemented in subclass")
 
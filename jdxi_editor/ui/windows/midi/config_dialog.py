@@ -27,6 +27,9 @@ Methods:
 
 import os
 import sys
+from functools import lru_cache
+from types import ModuleType
+from typing import Optional
 
 import qtawesome as qta
 from decologr import Decologr as log
@@ -62,19 +65,38 @@ from picoui.specs.widgets import ButtonSpec
 HW_PORT_HINT = "Roland JDXi"  # adjust if your port name differs
 SF2_PATH = os.path.expanduser("~/SoundFonts/FluidR3_GM.sf2")
 
-# Top-level imports so py2app/modulegraph includes these in the bundle
-# (lazy imports inside functions are not traced by the dependency analyzer)
-_fluidsynth_err_msg = ""
-try:
-    import fluidsynth as _fluidsynth_module
-except Exception as _fluidsynth_err:
-    _fluidsynth_module = None
-    _fluidsynth_err_msg = str(_fluidsynth_err)
 
-try:
-    import sounddevice as _sounddevice_module
-except Exception:
-    _sounddevice_module = None
+# --- FluidSynth and sounddevice load native libraries, so they are imported
+# --- when first needed rather than at startup; setup.py "includes" lists them
+# --- for the py2app bundle.
+@lru_cache(maxsize=None)
+def _load_fluidsynth() -> tuple[Optional[ModuleType], str]:
+    """
+    Import pyfluidsynth once.
+
+    :return: (module or None, error message)
+    """
+    try:
+        import fluidsynth
+
+        return fluidsynth, ""
+    except Exception as ex:
+        return None, str(ex)
+
+
+@lru_cache(maxsize=None)
+def _load_sounddevice() -> Optional[ModuleType]:
+    """
+    Import sounddevice once.
+
+    :return: module or None
+    """
+    try:
+        import sounddevice
+
+        return sounddevice
+    except Exception:
+        return None
 
 
 def _get_output_devices() -> list[tuple[str, str]]:
@@ -85,11 +107,12 @@ def _get_output_devices() -> list[tuple[str, str]]:
     On Windows/Linux: device_spec is "index:HostApi:Name" (for PortAudio).
     Requires sounddevice.
     """
-    if _sounddevice_module is None:
+    sounddevice = _load_sounddevice()
+    if sounddevice is None:
         return []
     try:
-        devices = _sounddevice_module.query_devices()
-        hostapis = _sounddevice_module.query_hostapis()
+        devices = sounddevice.query_devices()
+        hostapis = sounddevice.query_hostapis()
         output_devices = [
             (i, d) for i, d in enumerate(devices) if d["max_output_channels"] > 0
         ]
@@ -452,14 +475,15 @@ class MIDIConfigDialog(QDialog):
             self._select_sf2_in_combo(file_path)
 
     def _start_fluidsynth(self) -> None:
-        if _fluidsynth_module is None:
-            if "Couldn't find" in _fluidsynth_err_msg:
+        fluidsynth, fluidsynth_error = _load_fluidsynth()
+        if fluidsynth is None:
+            if "Couldn't find" in fluidsynth_error:
                 msg = "FluidSynth library not found (install libfluidsynth, e.g. brew install fluid-synth)"
             else:
                 msg = "FluidSynth not installed: pip install pyfluidsynth"
             self.fs_status.setText(msg)
             return
-        Synth = _fluidsynth_module.Synth
+        Synth = fluidsynth.Synth
 
         try:
             sf_path = self.sf2_edit.text().strip()
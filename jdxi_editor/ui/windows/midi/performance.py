@@ -0,0 +1,233 @@
+"""
+performance module
+==================
+
+PerformancePanel is a dockable panel showing the live instrumentation
+metrics (``jdxi_editor.core.instrumentation``): MIDI input stages, SysEx
+dispatch and per-editor UI updates, output queue depth and pacing, playback
+jitter and SQLite query times.
+
+Recording is off by default; the panel switches it on and off and remembers
+the choice. While "Trace" is checked, spans are also kept as trace events and
+can be exported as a Chrome trace file for chrome://tracing or Perfetto.
+"Startup Report..." shows the startup milestones and, when the editor was
+started with --importtime, the slowest imports (``jdxi_editor.core.startup``).
+"Share Drum Panel" makes the drum kit editor rebind one partial panel to
+whichever drum partial is shown instead of building one per partial; it
+applies the next time the editor is opened.
+
+Classes:
+    PerformancePanel: The dock widget.
+
+Example usage:
+--------------
+>>> panel = PerformancePanel(parent=main_window)
+>>> main_window.addDockWidget(Qt.RightDockWidgetArea, panel)
+"""
+
+from typing import Dict, List, Optional
+
+from decologr import Decologr as log
+from PySide6.QtCore import QSettings, Qt, QTimer
+from PySide6.QtWidgets import (
+    QCheckBox,
+    QDockWidget,
+    QFileDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QMessageBox,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from jdxi_editor.core import startup
+from jdxi_editor.core.instrumentation import instruments
+from jdxi_editor.globals import SHARED_DRUM_PANEL_KEY
+from jdxi_editor.project import __organization_name__, __program__
+from jdxi_editor.ui.theme import ThemeManager
+
+INSTRUMENTATION_SETTING = "instrumentation_enabled"
+REFRESH_INTERVAL_MS = 500
+COLUMNS = ("Metric", "Count", "Mean", "p50", "p95", "Max", "Unit")
+
+
+def _format(value: float) -> str:
+    return f"{value:.0f}" if abs(value) >= 100 else f"{value:.1f}"
+
+
+def metric_rows(snapshot: Dict[str, Dict]) -> List[List[str]]:
+    """
+    Table rows for an instrumentation snapshot, sorted by metric name.
+
+    :param snapshot: dict from Instrumentation.snapshot()
+    :return: List[List[str]] one row per metric, in COLUMNS order
+    """
+    rows = []
+    for name, stats in snapshot["histograms"].items():
+        rows.append(
+            [
+                name,
+                str(stats["count"]),
+                _format(stats["mean"]),
+                _format(stats["p50"]),
+                _format(stats["p95"]),
+                _format(stats["max"]),
+                stats["unit"],
+            ]
+        )
+    for name, gauge in snapshot["gauges"].items():
+        rows.append(
+            [name, "", _format(gauge["value"]), "", "", _format(gauge["max"]), "level"]
+        )
+    for name, value in snapshot["counters"].items():
+        rows.append([name, str(value), "", "", "", "", "count"])
+    return sorted(rows)
+
+
+class PerformancePanel(QDockWidget):
+    """Dockable table of the instrumentation metrics, refreshed while visible."""
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__("Performance", parent)
+        self.setObjectName("PerformancePanel")
+        self.setAllowedAreas(
+            Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea | Qt.BottomDockWidgetArea
+        )
+        self.settings = QSettings(__organization_name__, __program__)
+
+        content = QWidget()
+        layout = QVBoxLayout(content)
+
+        controls = QHBoxLayout()
+        self.record_checkbox = QCheckBox("Record")
+        self.record_checkbox.setChecked(instruments.enabled)
+        self.record_checkbox.toggled.connect(self._on_record_toggled)
+        controls.addWidget(self.record_checkbox)
+        self.trace_checkbox = QCheckBox("Trace")
+        self.trace_checkbox.setChecked(instruments.tracing)
+        self.trace_checkbox.setEnabled(instruments.enabled)
+        self.trace_checkbox.toggled.connect(self._on_trace_toggled)
+        controls.addWidget(self.trace_checkbox)
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(self._on_reset)
+        controls.addWidget(reset_button)
+        export_button = QPushButton("Export Trace...")
+        export_button.clicked.connect(self.export_trace)
+        controls.addWidget(export_button)
+        startup_button = QPushButton("Startup Report...")
+        startup_button.clicked.connect(self.show_startup_report)
+        controls.addWidget(startup_button)
+        self.shared_drum_panel_checkbox = QCheckBox("Share Drum Panel")
+        self.shared_drum_panel_checkbox.setToolTip(
+            "Rebind one drum partial panel to every drum partial "
+            "(applies when the drum editor is next opened)"
+        )
+        self.shared_drum_panel_checkbox.setChecked(
+            self.settings.value(SHARED_DRUM_PANEL_KEY, False, type=bool)
+        )
+        self.shared_drum_panel_checkbox.toggled.connect(
+            lambda checked: self.settings.setValue(SHARED_DRUM_PANEL_KEY, checked)
+        )
+        controls.addWidget(self.shared_drum_panel_checkbox)
+        controls.addStretch()
+        self.status_label = QLabel()
+        controls.addWidget(self.status_label)
+        layout.addLayout(controls)
+
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(
+            0, QHeaderView.ResizeMode.Stretch
+        )
+        ThemeManager.apply_table_style(self.table)
+        layout.addWidget(self.table)
+        self.setWidget(content)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_INTERVAL_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event) -> None:
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def _on_record_toggled(self, checked: bool) -> None:
+        instruments.enabled = checked
+        self.settings.setValue(INSTRUMENTATION_SETTING, checked)
+        self.trace_checkbox.setEnabled(checked)
+        if not checked:
+            self.trace_checkbox.setChecked(False)
+        self.refresh()
+
+    def _on_trace_toggled(self, checked: bool) -> None:
+        instruments.tracing = checked
+        self.refresh()
+
+    def _on_reset(self) -> None:
+        instruments.reset()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Show the current metrics."""
+        rows = metric_rows(instruments.snapshot())
+        self.table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, text in enumerate(values):
+                item = self.table.item(row, column)
+                if item is None:
+                    item = QTableWidgetItem()
+                    if column:
+                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                    self.table.setItem(row, column, item)
+                if item.text() != text:
+                    item.setText(text)
+        if not instruments.enabled:
+            self.status_label.setText("Not recording")
+        elif instruments.tracing:
+            self.status_label.setText(f"{instruments.trace_event_count} trace events")
+        else:
+            self.status_label.setText("Recording")
+
+    def export_trace(self) -> None:
+        """Ask for a file name and write the trace buffer as a Chrome trace."""
+        if not instruments.trace_event_count:
+            self.status_label.setText("No trace events; check Trace first")
+            return
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Trace", "jdxi_editor_trace.json", "Chrome Trace (*.json)"
+        )
+        if not path:
+            return
+        try:
+            instruments.export_chrome_trace(path)
+            log.message(f"Trace exported to {path}", scope=self.__class__.__name__)
+            self.status_label.setText("Trace exported")
+        except OSError as ex:
+            log.error(
+                f"Error {ex} exporting trace to {path}", scope=self.__class__.__name__
+            )
+            self.status_label.setText("Export failed")
+
+    def show_startup_report(self) -> None:
+        """Show the startup milestones and import times."""
+        dialog = QMessageBox(self)
+        dialog.setWindowTitle("Startup Report")
+        dialog.setText("Time to first window")
+        dialog.setInformativeText(
+            "\n".join(
+                f"{name}: {elapsed:.3f} s" for name, elapsed in startup.milestones
+            )
+        )
+        dialog.setDetailedText(startup.report())
+        dialog.exec()
@@ -198,6 +198,10 @@ class PatchManager(QMainWindow):
             if not temp_folder.exists():
                 temp_folder.mkdir(parents=True, exist_ok=True)
             if self.save_mode:
+                # --- Areas fully known to the patch state are saved without reading widgets
+                patch_state = getattr(self.midi_helper, "patch_state", None)
+                if patch_state is not None:
+                    self.json_composer.process_patch_state(patch_state, temp_folder)
                 for editor in self.editors:
                     log.parameter("Editor", editor)
                     if isinstance(editor, PatternSequenceEditor):
@@ -216,6 +220,10 @@ class PatchManager(QMainWindow):
                             f"Skipping invalid editor: {editor}, has no get_controls_as_dict method"
                         )
                         continue
+                    if patch_state is not None and patch_state.covers(
+                        (editor.address.msb, editor.address.umb)
+                    ):
+                        continue
                     self.json_composer.process_editor(editor, temp_folder)
 
                 # Save Program Common (PROGRAM_LEVEL) from mixer - ProgramEditor is skipped above
@@ -1,5 +1,6 @@
 # run_editor.py
 """Entry point for JD-Xi Editor. Bootstrap env before any imports."""
+
 import os
 import sys
 
@@ -13,6 +14,10 @@ if not os.environ.get("HOMEBREW_PREFIX") and sys.platform == "darwin":
             break
 
 if __name__ == "__main__":
+    # --- Time every editor import when run with --importtime / JDXI_IMPORTTIME=1
+    from jdxi_editor.core import startup
+
+    startup.install_import_timer_if_requested(sys.argv)
     from jdxi_editor.main import main
 
     main()
@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for the MIDI, SysEx and file paths.
+
+Run with ``python -m tests.benchmarks --help``; see harness.py and cases.py.
+"""
@@ -0,0 +1,94 @@
+"""
+Run the performance benchmarks and compare them with a saved baseline.
+
+Example usage:
+--------------
+$ python -m tests.benchmarks --save-baseline            # on a known-good tree
+$ python -m tests.benchmarks                            # later: compare
+$ python -m tests.benchmarks --filter "sysex.*" --output sysex.json
+$ python -m tests.benchmarks --list
+
+Exits with status 1 when a benchmark is more than --tolerance worse than the
+baseline.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from tests.benchmarks import cases  # noqa: F401  registers the benchmarks
+from tests.benchmarks.harness import (
+    DEFAULT_TOLERANCE,
+    compare,
+    format_report,
+    load_results,
+    run_benchmarks,
+    save_results,
+    select,
+)
+
+BENCH_DIR = Path(".benchmarks")
+DEFAULT_OUTPUT = BENCH_DIR / "results.json"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks", description=__doc__.split("\n")[1]
+    )
+    parser.add_argument(
+        "--filter",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="run only benchmarks matching GLOB (repeatable)",
+    )
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="also write the results to the baseline",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="relative change allowed before a regression (default %(default)s)",
+    )
+    parser.add_argument("--list", action="store_true", help="list the benchmarks")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(select(args.filter)))
+        return 0
+
+    results = run_benchmarks(
+        args.filter, progress=lambda result: print(format_report([result]))
+    )
+    save_results(args.output, results)
+    print(f"Results written to {args.output}")
+
+    comparisons = []
+    if args.save_baseline:
+        save_results(args.baseline, results)
+        print(f"Baseline written to {args.baseline}")
+    elif args.baseline.exists():
+        comparisons = compare(results, load_results(args.baseline), args.tolerance)
+        print(f"\nCompared with {args.baseline}:")
+        print(format_report(results, comparisons))
+    else:
+        print(f"No baseline at {args.baseline}; save one with --save-baseline")
+
+    regressions = [comparison for comparison in comparisons if comparison.regressed]
+    for comparison in regressions:
+        print(
+            f"REGRESSION {comparison.name}: {comparison.value:.1f} "
+            f"(baseline {comparison.baseline:.1f}, {comparison.change:+.1%} worse)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
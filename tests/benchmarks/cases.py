@@ -0,0 +1,512 @@
+"""
+Benchmark Cases
+===============
+
+The editor's hot paths, timed headless against the fixtures in ``tests/``:
+
+- ``sysex.parse_to_ir``: ``JDXiSysExParser.parse_to_ir`` over composed
+  parameter frames (frames/s).
+- ``sysex.compose``: ``JDXiSysExComposer.compose_message`` for Digital,
+  Analog and Drum parameters (messages/s).
+- ``json_patch.to_sysex``: ``MidiIOHelper.json_patch_to_sysex_bytes`` over
+  ``tests/json`` (patches/s).
+- ``msz.load``: unpacking the ``tests/msz`` bundles, converting their patches
+  to SysEx and reading their MIDI files; the work ``MidiIOHelper.load_patch``
+  does before it sends (bundles/s).
+- ``midi_file.index``: ``MidiFileModel.build`` over ``tests/midi`` (files/s).
+- ``midi_file.analyze``: track classification and drum detection over
+  ``tests/midi`` (files/s).
+- ``programs.search``: ``ProgramDatabase`` search for the first screenful
+  of results, count and page, over a generated library (searches/s).
+- ``presets.filter``: ``PresetCatalog`` answering a search typed one key at a
+  time, then each category, over a generated option list (filters/s).
+- ``startup.splash_imports``: a fresh interpreter importing what the editor
+  needs before its splash screen shows: ``jdxi_editor.main`` and the splash
+  screen's modules (p95, us).
+- ``playback.jitter``: how late ``RealtimePlaybackScheduler`` sends a dense
+  looping pattern (p95, us).
+- ``input.latency``: an incoming message's trip from the rtmidi callback
+  through the ingest ring and decode worker to ``midi_message_incoming`` on
+  the Qt thread (p95, us).
+
+The playback and input benchmarks use a virtual MIDI port where the rtmidi
+backend has them (ALSA, CoreMIDI): the scheduler sends to a virtual output
+and the input handler listens on a virtual input that a second port feeds.
+Elsewhere messages are handed to the callbacks directly and the result says
+so in ``extra["transport"]``.
+
+Analyses are called uncached, so each iteration does the work rather than
+hitting the per-track cache.
+"""
+
+from __future__ import annotations
+
+import io
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+import zipfile
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterator, List, Tuple
+
+from tests.benchmarks.harness import BenchmarkResult, benchmark, latency_result, measure
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+MIDI_DIR = TESTS_DIR / "midi"
+MSZ_DIR = TESTS_DIR / "msz"
+JSON_DIR = TESTS_DIR / "json"
+
+LOOPBACK_PORT = "JD-Xi Editor Benchmark"
+PLAYBACK_SECONDS = 1.0
+INPUT_MESSAGES = 300
+INPUT_TIMEOUT = 1.0  # seconds to wait for one message to arrive
+
+
+def _fixtures(directory: Path, pattern: str) -> List[Path]:
+    paths = sorted(directory.glob(pattern))
+    if not paths:
+        raise unittest.SkipTest(f"no {pattern} fixtures in {directory}")
+    return paths
+
+
+def _qt_app():
+    from PySide6.QtCore import QCoreApplication
+
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@lru_cache(maxsize=None)
+def _midi_helper():
+    from jdxi_editor.midi.io.helper import MidiIOHelper
+
+    _qt_app()
+    return MidiIOHelper()
+
+
+@lru_cache(maxsize=None)
+def _compose_corpus() -> Tuple[tuple, ...]:
+    """(address, param, value) for every Digital, Analog and Drum parameter."""
+    from jdxi_editor.midi.data.address.address import JDXiSysExAddress
+    from jdxi_editor.midi.data.parameter.analog.address import AnalogParam
+    from jdxi_editor.midi.data.parameter.digital.common import DigitalCommonParam
+    from jdxi_editor.midi.data.parameter.digital.partial import DigitalPartialParam
+    from jdxi_editor.midi.data.parameter.drum.partial import DrumPartialParam
+
+    areas = (
+        (JDXiSysExAddress(0x19, 0x01, 0x00, 0x00), DigitalCommonParam),
+        (JDXiSysExAddress(0x19, 0x01, 0x20, 0x00), DigitalPartialParam),
+        (JDXiSysExAddress(0x19, 0x42, 0x00, 0x00), AnalogParam),
+        (JDXiSysExAddress(0x19, 0x70, 0x2E, 0x00), DrumPartialParam),
+    )
+    return tuple(
+        (address, param, param.min_val)
+        for address, param_class in areas
+        for param in param_class
+    )
+
+
+@lru_cache(maxsize=None)
+def _sysex_frames() -> Tuple[bytes, ...]:
+    """Composed parameter frames that parse."""
+    from jdxi_editor.midi.sysex.composer import JDXiSysExComposer
+    from jdxi_editor.midi.sysex.parser.sysex import JDXiSysExParser
+
+    composer = JDXiSysExComposer()
+    parser = JDXiSysExParser()
+    frames = []
+    for address, param, value in _compose_corpus():
+        message = composer.compose_message(address, param, value)
+        if message is None:
+            continue
+        frame = bytes(message.to_bytes())
+        try:
+            parser.parse_to_ir(frame)
+        except ValueError:
+            continue
+        frames.append(frame)
+    if not frames:
+        raise unittest.SkipTest("no SysEx frames could be composed")
+    return tuple(frames)
+
+
+@lru_cache(maxsize=None)
+def _midi_files() -> tuple:
+    from mido import MidiFile
+
+    return tuple(MidiFile(str(path)) for path in _fixtures(MIDI_DIR, "*.mid"))
+
+
+# --- SysEx
+
+
+@benchmark("sysex.parse_to_ir")
+def bench_sysex_parse() -> BenchmarkResult:
+    from jdxi_editor.midi.sysex.parser.sysex import JDXiSysExParser
+
+    frames = _sysex_frames()
+    parser = JDXiSysExParser()
+
+    def parse_all():
+        for frame in frames:
+            parser.parse_to_ir(frame)
+
+    return measure("sysex.parse_to_ir", parse_all, items=len(frames))
+
+
+@benchmark("sysex.compose")
+def bench_sysex_compose() -> BenchmarkResult:
+    from jdxi_editor.midi.sysex.composer import JDXiSysExComposer
+
+    corpus = _compose_corpus()
+    composer = JDXiSysExComposer()
+
+    def compose_all():
+        for address, param, value in corpus:
+            composer.compose_message(address, param, value)
+
+    return measure("sysex.compose", compose_all, items=len(corpus))
+
+
+@benchmark("json_patch.to_sysex")
+def bench_json_patch_to_sysex() -> BenchmarkResult:
+    patches = [
+        path.read_text(encoding="utf-8") for path in _fixtures(JSON_DIR, "*.json")
+    ]
+    helper = _midi_helper()
+    frames = sum(len(helper.json_patch_to_sysex_bytes(patch)) for patch in patches)
+
+    def convert_all():
+        for patch in patches:
+            helper.json_patch_to_sysex_bytes(patch)
+
+    return measure(
+        "json_patch.to_sysex",
+        convert_all,
+        items=len(patches),
+        extra={"frames_per_iteration": frames},
+    )
+
+
+@benchmark("msz.load")
+def bench_msz_load() -> BenchmarkResult:
+    from mido import MidiFile
+
+    bundles = [path.read_bytes() for path in _fixtures(MSZ_DIR, "*.msz")]
+    helper = _midi_helper()
+
+    def load_all():
+        for bundle in bundles:
+            with zipfile.ZipFile(io.BytesIO(bundle)) as zip_ref:
+                for name in zip_ref.namelist():
+                    if name.endswith(".json"):
+                        patch = zip_ref.read(name).decode("utf-8")
+                        helper.json_patch_to_sysex_bytes(patch)
+                    elif name.endswith(".mid"):
+                        MidiFile(file=io.BytesIO(zip_ref.read(name)))
+
+    return measure("msz.load", load_all, items=len(bundles))
+
+
+# --- MIDI files
+
+
+@benchmark("midi_file.index")
+def bench_midi_file_index() -> BenchmarkResult:
+    from jdxi_editor.midi.file.model import MidiFileModel
+
+    midi_files = _midi_files()
+
+    def index_all():
+        for midi_file in midi_files:
+            MidiFileModel.build(midi_file)
+
+    return measure(
+        "midi_file.index",
+        index_all,
+        items=len(midi_files),
+        extra={"events": sum(sum(len(t) for t in f.tracks) for f in midi_files)},
+    )
+
+
+@benchmark("midi_file.analyze")
+def bench_midi_file_analyze() -> BenchmarkResult:
+    from jdxi_editor.midi.file.model import MidiFileModel
+    from jdxi_editor.midi.track.classification import analyze_track_for_classification
+    from jdxi_editor.midi.utils.drum_detection import analyze_track_for_drums
+
+    models = [MidiFileModel.build(midi_file) for midi_file in _midi_files()]
+
+    def analyze_all():
+        for model in models:
+            for columns in model.tracks:
+                analyze_track_for_drums(columns.track, columns.index, columns)
+                analyze_track_for_classification(columns.track, columns.index, columns)
+
+    return measure(
+        "midi_file.analyze",
+        analyze_all,
+        items=len(models),
+        extra={"tracks": sum(len(model.tracks) for model in models)},
+    )
+
+
+# --- Program database
+
+
+SEARCH_LIBRARY_SIZE = 4096
+SEARCH_TERMS = ("acid", "pad", "e1", "tr-8", "warm bass", "house stab", "zzz")
+
+
+@benchmark("programs.search")
+def bench_programs_search() -> BenchmarkResult:
+    from jdxi_editor.midi.program.program import JDXiProgram
+    from jdxi_editor.ui.editors.program.user_programs_model import PAGE_SIZE
+    from jdxi_editor.ui.programs.database import ProgramDatabase
+
+    words = ("Acid", "Warm", "Deep", "Glass", "Bass", "Pad", "House", "Stab")
+    library = [
+        JDXiProgram(
+            id=f"{chr(ord('E') + n // 1024)}{n % 1024:04d}",
+            name=f"{words[n % 8]} {words[n // 8 % 8]} {n}",
+            genre=words[n // 64 % 8],
+            pc=n % 128,
+            digital_1=f"{words[n // 3 % 8]} Lead",
+            digital_2=f"{words[n // 5 % 8]} Pad",
+            analog=f"{words[n // 7 % 8]} Bass",
+            drums=f"TR-{808 + n % 2 * 101}",
+        )
+        for n in range(SEARCH_LIBRARY_SIZE)
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        database = ProgramDatabase(Path(directory) / "programs.db")
+        database.add_or_replace_programs(library)
+
+        def search_all():
+            for term in SEARCH_TERMS:
+                database.count_programs(term)
+                database.search_programs(term, limit=PAGE_SIZE)
+
+        try:
+            return measure(
+                "programs.search",
+                search_all,
+                items=len(SEARCH_TERMS),
+                extra={"programs": len(library), "fts": database.fts_enabled},
+            )
+        finally:
+            database.pool.close()
+
+
+PRESET_LIBRARY_SIZE = 4096
+PRESET_KEYSTROKES = ("w", "wa", "war", "warm", "warm ", "warm p", "warm pa")
+
+
+@benchmark("presets.filter")
+def bench_presets_filter() -> BenchmarkResult:
+    from jdxi_editor.ui.widgets.combo_box.catalog import PresetCatalog
+
+    words = ("Acid", "Warm", "Deep", "Glass", "Bass", "Pad", "House", "Stab")
+    options = [
+        f"{n:04d}: {words[n % 8]} {words[n // 8 % 8]} {n // 64}"
+        for n in range(PRESET_LIBRARY_SIZE)
+    ]
+    categories = [words[n // 3 % 8] for n in range(PRESET_LIBRARY_SIZE)]
+
+    def filter_all():
+        # --- A fresh catalog, so each iteration indexes rather than hits the cache
+        catalog = PresetCatalog(options, categories)
+        for text in PRESET_KEYSTROKES:
+            catalog.filter(search_text=text)
+        for category in words:
+            catalog.filter(search_text=PRESET_KEYSTROKES[-1], category=category)
+
+    return measure(
+        "presets.filter",
+        filter_all,
+        items=len(PRESET_KEYSTROKES) + len(words),
+        extra={"options": len(options)},
+    )
+
+
+STARTUP_RUNS = 5
+SPLASH_IMPORTS = """
+import time
+start = time.perf_counter()
+import jdxi_editor.main
+from jdxi_editor.core.jdxi import JDXi
+from jdxi_editor.ui.widgets.digital.title import DigitalTitle
+from jdxi_editor.ui.widgets.editor.helper import create_layout_with_items
+JDXi.UI.Style.PROGRESS_BAR
+print(time.perf_counter() - start)
+"""
+
+
+@benchmark("startup.splash_imports")
+def bench_startup_splash_imports() -> BenchmarkResult:
+    # --- A fresh interpreter per run: imports are only slow once per process
+    samples = []
+    for _ in range(STARTUP_RUNS):
+        result = subprocess.run(
+            [sys.executable, "-c", SPLASH_IMPORTS],
+            cwd=TESTS_DIR.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append(float(result.stdout.split()[-1]))
+    return latency_result("startup.splash_imports", samples)
+
+
+# --- Real-time paths
+
+
+@contextmanager
+def _virtual_output() -> Iterator[Tuple[Callable[[list], None], str]]:
+    """A send function to a virtual output port, or a no-op without one."""
+    import rtmidi
+
+    midi_out = rtmidi.MidiOut()
+    try:
+        midi_out.open_virtual_port(LOOPBACK_PORT)
+    except (rtmidi.RtMidiError, NotImplementedError):
+        yield (lambda message: None), "direct"
+        return
+    try:
+        yield midi_out.send_message, "virtual port"
+    finally:
+        midi_out.close_port()
+
+
+@contextmanager
+def _loopback(handler) -> Iterator[Tuple[Callable[[list], None], str]]:
+    """
+    A send function whose messages reach handler.midi_callback.
+
+    The handler listens on a virtual input fed by a second port; without
+    virtual ports the callback is called directly.
+    """
+    import rtmidi
+
+    midi_out = rtmidi.MidiOut()
+    try:
+        handler.midi_in.open_virtual_port(LOOPBACK_PORT)
+        ports = midi_out.get_ports()
+        midi_out.open_port(
+            next(i for i, name in enumerate(ports) if LOOPBACK_PORT in name)
+        )
+    except (rtmidi.RtMidiError, NotImplementedError, StopIteration):
+        if handler.midi_in.is_port_open():
+            handler.midi_in.close_port()
+        yield (lambda message: handler.midi_callback([message, 0.0], None)), "direct"
+        return
+    try:
+        yield midi_out.send_message, "virtual port"
+    finally:
+        midi_out.close_port()
+        handler.midi_in.close_port()
+
+
+@benchmark("playback.jitter")
+def bench_playback_jitter() -> BenchmarkResult:
+    from jdxi_editor.midi.playback.pattern_timeline import (
+        PATTERN_ROW_CHANNELS,
+        PatternTimeline,
+    )
+    from jdxi_editor.midi.playback.realtime import RealtimePlaybackScheduler
+
+    # --- Every step of every row at 300 BPM: 4 rows x 20 steps per second, on and off
+    pattern = PatternTimeline(bars=2)
+    for bar in range(pattern.bars):
+        for row in range(len(PATTERN_ROW_CHANNELS)):
+            for step in range(pattern.steps_per_bar):
+                pattern.set_step(bar, row, step, note=36 + row * 12 + step % 12)
+    with _virtual_output() as (send, transport):
+        scheduler = RealtimePlaybackScheduler(
+            pattern.compile(bpm=300), lambda msg: send(msg.bytes())
+        )
+        scheduler.play(0)
+        try:
+            time.sleep(PLAYBACK_SECONDS)
+        finally:
+            scheduler.stop()
+    jitter = scheduler.jitter
+    snapshot = jitter.snapshot()
+    if not snapshot["count"]:
+        raise unittest.SkipTest("the scheduler sent nothing")
+    return BenchmarkResult(
+        name="playback.jitter",
+        value=jitter.percentile(95),
+        unit="us",
+        higher_is_better=False,
+        iterations=snapshot["count"],
+        stats={
+            "mean": snapshot["mean_us"],
+            "median": jitter.percentile(50),
+            "p95": jitter.percentile(95),
+            "p99": snapshot["p99_us"],
+            "max": snapshot["max_us"],
+        },
+        extra={
+            "transport": transport,
+            "loops": scheduler.loops,
+            "failed": scheduler.failed,
+        },
+    )
+
+
+@benchmark("input.latency")
+def bench_input_latency() -> BenchmarkResult:
+    from jdxi_editor.midi.io.input_handler import MidiInHandler
+
+    app = _qt_app()
+    frames = _sysex_frames()
+    handler = MidiInHandler()
+    handler._auto_add_enabled = False  # --- never write the program list
+    arrivals: List[float] = []
+    handler.midi_message_incoming.connect(
+        lambda message: arrivals.append(time.perf_counter())
+    )
+    samples: List[float] = []
+    lost = 0
+    try:
+        with _loopback(handler) as (send, transport):
+            for i in range(INPUT_MESSAGES):
+                kind = i % 3
+                if kind == 0:
+                    message = [0x90, 60 + i % 12, 100]
+                elif kind == 1:
+                    message = [0x80, 60 + i % 12, 0]
+                else:
+                    message = list(frames[i % len(frames)])
+                expected = len(arrivals) + 1
+                sent_at = time.perf_counter()
+                send(message)
+                while len(arrivals) < expected:
+                    app.processEvents()
+                    if time.perf_counter() - sent_at > INPUT_TIMEOUT:
+                        lost += 1
+                        break
+                else:
+                    samples.append(arrivals[-1] - sent_at)
+    finally:
+        handler.stop_ingest()
+    if not samples:
+        raise unittest.SkipTest("no message reached the input handler")
+    stages = handler.get_ingest_stats()
+    return latency_result(
+        "input.latency",
+        samples,
+        extra={
+            "transport": transport,
+            "lost": lost,
+            "stage_mean_ms": {
+                stage: counters["mean_ms"]
+                for stage, counters in stages.items()
+                if "mean_ms" in counters
+            },
+        },
+    )
@@ -0,0 +1,396 @@
+"""
+Benchmark Harness
+=================
+
+Timing, result storage and baseline comparison for the performance benchmarks
+in ``tests/benchmarks/cases.py``.
+
+A benchmark is a function registered with ``@benchmark(name)`` that returns a
+``BenchmarkResult``. Results have one headline ``value``, which is compared
+with the same benchmark in a saved baseline:
+
+- throughput benchmarks (``measure``) report items per second, higher is better;
+- latency benchmarks (``latency_result``) report the 95th percentile in
+  microseconds, lower is better.
+
+Results are written as JSON together with a description of the machine they
+ran on. Baselines are only comparable on the machine that produced them, so
+they are saved locally (``--save-baseline``) and not committed.
+
+Classes:
+    BenchmarkResult: One benchmark's headline value and statistics.
+    Comparison: A result compared with its baseline.
+
+Example usage:
+--------------
+>>> @benchmark("sum")
+... def bench_sum() -> BenchmarkResult:
+...     data = list(range(1000))
+...     return measure("sum", lambda: sum(data), items=len(data))
+>>> results = run_benchmarks()
+>>> save_results("results.json", results)
+>>> regressions = [c for c in compare(results, load_results("baseline.json")) if c.regressed]
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+RESULTS_FORMAT = 1
+DEFAULT_TOLERANCE = 0.15  # 15 % slower than the baseline is a regression
+DEFAULT_MIN_TIME = 0.2  # seconds of timed iterations per throughput benchmark
+
+BENCHMARKS: Dict[str, Callable[[], "BenchmarkResult"]] = {}
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    One benchmark's result.
+
+    :param name: str benchmark name
+    :param value: float headline value compared with the baseline
+    :param unit: str unit of value, e.g. "items/s" or "us"
+    :param higher_is_better: bool True for throughput, False for latency
+    :param iterations: int timed iterations or samples
+    :param stats: Dict[str, float] summary statistics in the unit of the samples
+    :param extra: Dict[str, object] benchmark-specific details
+    """
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool
+    iterations: int
+    stats: Dict[str, float] = field(default_factory=dict)
+    extra: Dict[str, object] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BenchmarkResult":
+        return cls(
+            name=data["name"],
+            value=float(data["value"]),
+            unit=data["unit"],
+            higher_is_better=bool(data["higher_is_better"]),
+            iterations=int(data.get("iterations", 0)),
+            stats=dict(data.get("stats", {})),
+            extra=dict(data.get("extra", {})),
+        )
+
+
+@dataclass
+class Comparison:
+    """
+    A result compared with the baseline.
+
+    :param name: str benchmark name
+    :param value: float current value
+    :param baseline: float baseline value
+    :param change: float relative change, positive when worse
+    :param regressed: bool change exceeds the tolerance
+    """
+
+    name: str
+    value: float
+    baseline: float
+    change: float
+    regressed: bool
+
+
+def benchmark(name: str) -> Callable[[Callable[[], BenchmarkResult]], Callable]:
+    """
+    Register a benchmark function.
+
+    :param name: str unique benchmark name
+    :return: decorator
+    """
+
+    def register(func: Callable[[], BenchmarkResult]) -> Callable[[], BenchmarkResult]:
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark {name!r} is already registered")
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+def percentile(samples: Sequence[float], percent: float) -> float:
+    """
+    Percentile of samples, interpolated between the nearest ranks.
+
+    :param samples: Sequence[float]
+    :param percent: float 0-100
+    :return: float (0.0 with no samples)
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * percent / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """
+    :param samples: Sequence[float]
+    :return: Dict[str, float] mean, median, p95, p99, min, max and stdev
+    """
+    if not samples:
+        return {}
+    return {
+        "mean": statistics.fmean(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "min": min(samples),
+        "max": max(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    items: int = 1,
+    min_time: float = DEFAULT_MIN_TIME,
+    min_iterations: int = 5,
+    warmup: int = 1,
+    extra: Optional[Dict[str, object]] = None,
+) -> BenchmarkResult:
+    """
+    Throughput of func: items processed per second, from the median iteration.
+
+    Iterations repeat until min_time has passed (at least min_iterations);
+    the garbage collector is paused while timing.
+
+    :param name: str benchmark name
+    :param func: Callable[[], object] one iteration
+    :param items: int items processed by one iteration (frames, files, ...)
+    :param min_time: float seconds
+    :param min_iterations: int
+    :param warmup: int untimed iterations first (caches, imports)
+    :param extra: Optional[Dict[str, object]]
+    :return: BenchmarkResult in items/s; stats are seconds per iteration
+    """
+    for _ in range(warmup):
+        func()
+    samples: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        while len(samples) < min_iterations or time.perf_counter() - started < min_time:
+            t0 = time.perf_counter_ns()
+            func()
+            samples.append((time.perf_counter_ns() - t0) / 1e9)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    stats = summarize(samples)
+    median = stats["median"]
+    return BenchmarkResult(
+        name=name,
+        value=items / median if median > 0 else float("inf"),
+        unit="items/s",
+        higher_is_better=True,
+        iterations=len(samples),
+        stats=stats,
+        extra={"items_per_iteration": items, **(extra or {})},
+    )
+
+
+def latency_result(
+    name: str,
+    samples_seconds: Sequence[float],
+    extra: Optional[Dict[str, object]] = None,
+) -> BenchmarkResult:
+    """
+    Latency result from samples: the 95th percentile in microseconds.
+
+    :param name: str benchmark name
+    :param samples_seconds: Sequence[float] latencies in seconds
+    :param extra: Optional[Dict[str, object]]
+    :return: BenchmarkResult in us; stats are microseconds
+    """
+    samples_us = [sample * 1e6 for sample in samples_seconds]
+    stats = summarize(samples_us)
+    return BenchmarkResult(
+        name=name,
+        value=stats.get("p95", 0.0),
+        unit="us",
+        higher_is_better=False,
+        iterations=len(samples_us),
+        stats=stats,
+        extra=dict(extra or {}),
+    )
+
+
+def select(patterns: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Registered benchmark names matching any of the glob patterns.
+
+    :param patterns: Optional[Iterable[str]] e.g. ["sysex.*"]; all when empty
+    :return: List[str] in registration order
+    """
+    patterns = list(patterns or [])
+    if not patterns:
+        return list(BENCHMARKS)
+    return [
+        name
+        for name in BENCHMARKS
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+    ]
+
+
+def run_benchmarks(
+    patterns: Optional[Iterable[str]] = None,
+    progress: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> List[BenchmarkResult]:
+    """
+    Run the selected benchmarks.
+
+    A benchmark that cannot run here (missing fixture, no MIDI backend) raises
+    ``unittest.SkipTest`` and is left out of the results.
+
+    :param patterns: Optional[Iterable[str]] glob patterns, see select()
+    :param progress: Optional[Callable[[BenchmarkResult], None]] called after each
+    :return: List[BenchmarkResult]
+    """
+    from unittest import SkipTest
+
+    results = []
+    for name in select(patterns):
+        try:
+            result = BENCHMARKS[name]()
+        except SkipTest as ex:
+            print(f"{name}: skipped ({ex})", file=sys.stderr)
+            continue
+        results.append(result)
+        if progress is not None:
+            progress(result)
+    return results
+
+
+def machine_info() -> Dict[str, object]:
+    """
+    :return: Dict[str, object] what the results depend on besides the code
+    """
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save_results(path: Union[str, Path], results: Iterable[BenchmarkResult]) -> Path:
+    """
+    Write results as JSON.
+
+    :param path: Union[str, Path]
+    :param results: Iterable[BenchmarkResult]
+    :return: Path written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "format": RESULTS_FORMAT,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": machine_info(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    path.write_text(json.dumps(document, indent=2, sort_keys=True), encoding="utf-8")
+    return path
+
+
+def load_results(path: Union[str, Path]) -> Dict[str, BenchmarkResult]:
+    """
+    Read results written by save_results.
+
+    :param path: Union[str, Path]
+    :return: Dict[str, BenchmarkResult] by name
+    """
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    if document.get("format") != RESULTS_FORMAT:
+        raise ValueError(
+            f"{path}: unsupported results format {document.get('format')!r}"
+        )
+    return {
+        name: BenchmarkResult.from_dict(data)
+        for name, data in document.get("results", {}).items()
+    }
+
+
+def compare(
+    results: Iterable[BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[Comparison]:
+    """
+    Compare results with a baseline.
+
+    The change is relative to the baseline and positive when the result is
+    worse: lower throughput or higher latency. Benchmarks missing from the
+    baseline, or measured in another unit, are not compared.
+
+    :param results: Iterable[BenchmarkResult]
+    :param baseline: Dict[str, BenchmarkResult] from load_results
+    :param tolerance: float relative change allowed before a regression
+    :return: List[Comparison]
+    """
+    comparisons = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None or previous.unit != result.unit or previous.value <= 0:
+            continue
+        if result.higher_is_better:
+            change = (previous.value - result.value) / previous.value
+        else:
+            change = (result.value - previous.value) / previous.value
+        comparisons.append(
+            Comparison(
+                name=result.name,
+                value=result.value,
+                baseline=previous.value,
+                change=change,
+                regressed=change > tolerance,
+            )
+        )
+    return comparisons
+
+
+def format_report(
+    results: Iterable[BenchmarkResult],
+    comparisons: Iterable[Comparison] = (),
+) -> str:
+    """
+    :param results: Iterable[BenchmarkResult]
+    :param comparisons: Iterable[Comparison]
+    :return: str one line per benchmark
+    """
+    by_name = {comparison.name: comparison for comparison in comparisons}
+    lines = []
+    for result in results:
+        line = f"{result.name:<32} {result.value:>14.1f} {result.unit:<8}"
+        comparison = by_name.get(result.name)
+        if comparison is not None:
+            line += f" {-comparison.change:+7.1%} vs baseline"
+            if comparison.regressed:
+                line += "  REGRESSION"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,29 @@
+"""
+Fake monotonic clock for the real-time thread tests (playback scheduler,
+MIDI clock master): deadlines are checked without depending on how busy
+the machine is.
+"""
+
+import threading
+
+
+class SteppingClock:
+    """
+    Clock moving on by step seconds every time it is read.
+
+    Used with ``spin_threshold=float("inf")`` a thread never sleeps: it spins
+    on this clock to each deadline, so it reaches every deadline within a few
+    steps.
+
+    :param step: float seconds added on every read
+    """
+
+    def __init__(self, step: float = 1e-5):
+        self.step = step
+        self.now = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        with self._lock:
+            self.now += self.step
+            return self.now
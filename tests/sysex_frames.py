@@ -0,0 +1,45 @@
+"""
+Roland SysEx frames for the tests: DT1 (data set) and RQ1 (data request)
+messages to and from the JD-Xi, with a valid checksum.
+"""
+
+from typing import Iterable
+
+JDXI_HEADER = [0xF0, 0x41, 0x10, 0x00, 0x00, 0x00, 0x0E]
+RQ1, DT1 = 0x11, 0x12
+
+
+def roland_frame(command: int, body: Iterable[int]) -> bytes:
+    """
+    A JD-Xi SysEx frame around body, followed by its checksum.
+
+    :param command: int RQ1 or DT1
+    :param body: Iterable[int] address followed by the data or size bytes
+    :return: bytes F0 ... F7
+    """
+    body = list(body)
+    checksum = (128 - (sum(body) % 128)) % 128
+    return bytes(JDXI_HEADER + [command] + body + [checksum, 0xF7])
+
+
+def dt1(address: Iterable[int], data: Iterable[int]) -> bytes:
+    """
+    A DT1 frame writing data at address.
+
+    :param address: Iterable[int] (MSB, UMB, LMB, LSB)
+    :param data: Iterable[int] data bytes
+    :return: bytes
+    """
+    return roland_frame(DT1, list(address) + list(data))
+
+
+def rq1(address: Iterable[int], size: int) -> bytes:
+    """
+    An RQ1 frame asking for size bytes from address.
+
+    :param address: Iterable[int] (MSB, UMB, LMB, LSB)
+    :param size: int number of bytes, sent as four 7-bit bytes
+    :return: bytes
+    """
+    size_bytes = [(size >> shift) & 0x7F for shift in (21, 14, 7, 0)]
+    return roland_frame(RQ1, list(address) + size_bytes)
@@ -0,0 +1,65 @@
+"""
+Tests for the user bank scanner (jdxi_editor.midi.program.scanner)
+"""
+
+import unittest
+
+from jdxi_editor.midi.program.program import JDXiProgram
+from jdxi_editor.midi.program.scanner import (
+    PROGRAMS_PER_BANK,
+    UserBankScanner,
+    merge_with_existing,
+    scan_order,
+)
+from tests.sysex_frames import dt1
+
+
+def program(**overrides):
+    values = dict(
+        id="E01",
+        name="Init",
+        genre="Unknown",
+        pc=1,
+        msb=85,
+        lsb=64,
+        digital_1="A",
+        digital_2="B",
+        analog="C",
+        drums="D",
+    )
+    values.update(overrides)
+    return JDXiProgram(**values)
+
+
+class TestScanOrder(unittest.TestCase):
+    def test_banks_in_order(self):
+        order = scan_order(("E", "F"))
+        self.assertEqual(len(order), 2 * PROGRAMS_PER_BANK)
+        self.assertEqual(order[0], ("E", 1))
+        self.assertEqual(order[PROGRAMS_PER_BANK], ("F", 1))
+
+
+class TestMergeWithExisting(unittest.TestCase):
+    def test_keeps_genre_when_unchanged(self):
+        merged = merge_with_existing(program(), program(genre="Ambient"))
+        self.assertEqual(merged.genre, "Ambient")
+
+    def test_renamed_program_resets_genre(self):
+        merged = merge_with_existing(program(name="New"), program(genre="Ambient"))
+        self.assertEqual(merged.genre, "Unknown")
+
+
+class TestNameReplies(unittest.TestCase):
+    def test_collects_names_only_while_accepting(self):
+        scanner = UserBankScanner(midi_helper=None, database=object())
+        frame = dt1((0x19, 0x42, 0x00, 0x00), b"Analog Bass ")
+        scanner.on_sysex_frame(frame)
+        self.assertEqual(scanner._replies, {})
+        scanner._accepting = True
+        scanner.on_sysex_frame(frame)
+        scanner.on_sysex_frame(dt1((0x19, 0x42, 0x00, 0x0C), b"not a name  "))
+        self.assertEqual(scanner._replies, {"analog": "Analog Bass"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests for the benchmark harness: statistics, result files and regression
+comparison against a baseline.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.benchmarks.harness import (
+    BenchmarkResult,
+    compare,
+    latency_result,
+    load_results,
+    measure,
+    percentile,
+    save_results,
+)
+
+
+def _result(name, value, higher_is_better=True, unit="items/s"):
+    return BenchmarkResult(
+        name=name,
+        value=value,
+        unit=unit,
+        higher_is_better=higher_is_better,
+        iterations=10,
+    )
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    def test_percentile(self):
+        samples = [float(n) for n in range(101)]
+        self.assertEqual(percentile(samples, 95), 95.0)
+        self.assertEqual(percentile([1.0, 2.0], 50), 1.5)
+        self.assertEqual(percentile([], 95), 0.0)
+
+    def test_measure_and_latency(self):
+        """Throughput is items per median iteration; latency is p95 in us"""
+        result = measure("noop", lambda: None, items=10, min_time=0.01)
+        self.assertTrue(result.higher_is_better)
+        self.assertGreaterEqual(result.iterations, 5)
+        self.assertAlmostEqual(result.value, 10 / result.stats["median"])
+        latency = latency_result("lat", [0.001] * 19 + [0.002])
+        self.assertFalse(latency.higher_is_better)
+        self.assertEqual(latency.unit, "us")
+        self.assertAlmostEqual(latency.value, 1050.0)
+
+    def test_save_and_load(self):
+        results = [_result("a", 100.0), latency_result("b", [0.001, 0.002])]
+        with tempfile.TemporaryDirectory() as directory:
+            path = save_results(Path(directory) / "results.json", results)
+            loaded = load_results(path)
+        self.assertEqual(list(loaded), ["a", "b"])
+        self.assertEqual(loaded["a"], results[0])
+        self.assertEqual(loaded["b"].stats, results[1].stats)
+
+    def test_compare(self):
+        """Lower throughput or higher latency beyond the tolerance regresses"""
+        baseline = {
+            "fast": _result("fast", 100.0),
+            "slow": _result("slow", 100.0),
+            "latency": _result("latency", 100.0, False, "us"),
+            "unit": _result("unit", 100.0, unit="frames/s"),
+        }
+        results = [
+            _result("fast", 120.0),
+            _result("slow", 80.0),
+            _result("latency", 130.0, False, "us"),
+            _result("unit", 1.0),
+            _result("new", 1.0),
+        ]
+        comparisons = {c.name: c for c in compare(results, baseline, tolerance=0.15)}
+        self.assertEqual(sorted(comparisons), ["fast", "latency", "slow"])
+        self.assertAlmostEqual(comparisons["fast"].change, -0.2)
+        self.assertFalse(comparisons["fast"].regressed)
+        self.assertTrue(comparisons["slow"].regressed)
+        self.assertAlmostEqual(comparisons["latency"].change, 0.3)
+        self.assertTrue(comparisons["latency"].regressed)
+
+
+if __name__ == "__main__":
+    unittest.main()
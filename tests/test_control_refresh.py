@@ -0,0 +1,49 @@
+"""
+Tests for incremental editor refresh (jdxi_editor.ui.editors.helpers.refresh)
+"""
+
+import unittest
+
+from jdxi_editor.ui.editors.helpers.refresh import ControlRefresh
+
+
+class Plot:
+    def __init__(self):
+        self.repaints = 0
+
+    def refresh_plot_from_controls(self):
+        self.repaints += 1
+
+
+class TestControlRefresh(unittest.TestCase):
+    def setUp(self):
+        self.queued = []
+        self.refresh = ControlRefresh(schedule=self.queued.append)
+
+    def test_unchanged_values_are_skipped(self):
+        self.assertTrue(self.refresh.changed(1, "AMP_ENV_ATTACK_TIME", 10))
+        self.assertFalse(self.refresh.changed(1, "AMP_ENV_ATTACK_TIME", 10))
+        self.assertTrue(self.refresh.changed(2, "AMP_ENV_ATTACK_TIME", 10))
+        self.assertTrue(self.refresh.changed(1, "AMP_ENV_ATTACK_TIME", 11))
+
+    def test_forget_applies_next_value(self):
+        self.refresh.changed(1, "OSC_PULSE_WIDTH", 64)
+        self.refresh.forget("OSC_PULSE_WIDTH")
+        self.assertTrue(self.refresh.changed(1, "OSC_PULSE_WIDTH", 64))
+        self.refresh.forget()
+        self.assertTrue(self.refresh.changed(1, "OSC_PULSE_WIDTH", 64))
+
+    def test_plot_repaints_once_per_flush(self):
+        amp, pitch = Plot(), Plot()
+        for _ in range(4):  # --- attack, decay, sustain, release
+            self.refresh.schedule_plot(amp)
+        self.refresh.schedule_plot(pitch)
+        self.assertEqual(len(self.queued), 1)
+        self.assertEqual(self.queued[0](), 2)
+        self.assertEqual((amp.repaints, pitch.repaints), (1, 1))
+        self.refresh.schedule_plot(amp)
+        self.assertEqual(len(self.queued), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -111,9 +111,18 @@ class TestDigitalSynthEditor(unittest.TestCase):
         self.assertIsNotNone(self.editor.tone_modify_section)
 
     def test_partial_editors_created(self):
-        """Test that partial editors are created."""
+        """Test that partial editors are created when their tabs are first shown."""
         self.editor.setup_ui()
-        
+
+        # Presets tab is current: no partial editor is built yet
+        self.assertEqual(self.editor.partial_editors, {})
+        self.assertEqual(self.editor.partial_tabs.keys, [1, 2, 3])
+
+        self.editor.tab_widget.setCurrentIndex(2)  # Partial 2
+        self.assertEqual(list(self.editor.partial_editors), [2])
+        for partial_number in (1, 3):
+            self.editor.partial_tabs.ensure(partial_number)
+
         # Should have 3 partial editors
         self.assertEqual(len(self.editor.partial_editors), 3)
         self.assertIn(1, self.editor.partial_editors)
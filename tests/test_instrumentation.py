@@ -0,0 +1,117 @@
+"""
+Tests for the hot-path instrumentation: disabled no-ops, histograms, gauges,
+SQLite statement timing and the Chrome trace export.
+"""
+
+import json
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from jdxi_editor.core.db.instrumented import InstrumentedConnection, query_metric
+from jdxi_editor.core.instrumentation import Histogram, Instrumentation, instruments
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.instruments = Instrumentation(enabled=True)
+
+    def test_disabled_records_nothing(self):
+        """A disabled registry hands out the shared no-op span"""
+        disabled = Instrumentation()
+        self.assertIs(disabled.span("a"), disabled.span("b"))
+        with disabled.span("a"):
+            pass
+        disabled.record_duration("b", 1000)
+        disabled.set_gauge("c", 1)
+        disabled.count("d")
+        self.assertEqual(
+            disabled.snapshot(), {"counters": {}, "gauges": {}, "histograms": {}}
+        )
+
+    def test_histogram(self):
+        histogram = Histogram("h")
+        for value in range(1, 101):
+            histogram.record(float(value))
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["count"], 100)
+        self.assertAlmostEqual(snapshot["mean"], 50.5)
+        self.assertEqual(snapshot["p95"], 96.0)
+        self.assertEqual(snapshot["max"], 100.0)
+        self.assertEqual(snapshot["buckets"]["<=1"], 1)
+        self.assertEqual(snapshot["buckets"]["<=100"], 50)  # --- 51 to 100
+
+    def test_spans_gauges_and_counters(self):
+        with self.instruments.span("work"):
+            pass
+        self.instruments.record_duration("decode", 2_500)
+        self.instruments.record_value("fanout", 3, unit="count")
+        self.instruments.set_gauge("depth", 4)
+        self.instruments.set_gauge("depth", 1)
+        self.instruments.count("drops", 2)
+
+        @self.instruments.timed("call")
+        def call():
+            return 7
+
+        self.assertEqual(call(), 7)
+        snapshot = self.instruments.snapshot()
+        histograms = snapshot["histograms"]
+        self.assertEqual(histograms["work"]["count"], 1)
+        self.assertEqual(histograms["decode"]["max"], 2.5)  # --- microseconds
+        self.assertEqual(histograms["fanout"]["unit"], "count")
+        self.assertEqual(histograms["call"]["count"], 1)
+        self.assertEqual(snapshot["gauges"]["depth"], {"value": 1, "max": 4})
+        self.assertEqual(snapshot["counters"]["drops"], 2)
+        self.instruments.reset()
+        self.assertEqual(self.instruments.snapshot()["histograms"], {})
+
+    def test_chrome_trace(self):
+        """Spans become complete events and gauges counter events, per thread"""
+        self.instruments.record_duration("untraced", 1_000)
+        self.instruments.tracing = True
+        self.instruments.record_duration("decode", 5_000)
+        worker = threading.Thread(
+            target=self.instruments.set_gauge, args=("depth", 3), name="Worker"
+        )
+        worker.start()
+        worker.join()
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.instruments.export_chrome_trace(Path(directory) / "t.json")
+            events = json.loads(path.read_text())["traceEvents"]
+        names = {e["args"]["name"] for e in events if e["ph"] == "M"}
+        self.assertIn("Worker", names)
+        complete = [e for e in events if e["ph"] == "X"]
+        self.assertEqual([e["name"] for e in complete], ["decode"])
+        self.assertEqual(complete[0]["dur"], 5.0)
+        self.assertEqual(complete[0]["cat"], "decode")
+        counter = [e for e in events if e["ph"] == "C"]
+        self.assertEqual(counter[0]["args"], {"value": 3})
+        self.assertNotEqual(counter[0]["tid"], complete[0]["tid"])
+        self.instruments.enabled = False
+        self.assertFalse(self.instruments.tracing)
+
+
+class TestInstrumentedConnection(unittest.TestCase):
+    def test_times_statements(self):
+        instruments.reset()
+        instruments.enabled = True
+        try:
+            conn = sqlite3.connect(":memory:", factory=InstrumentedConnection)
+            conn.execute("CREATE TABLE t (x)")
+            conn.cursor().executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+            self.assertEqual(conn.execute("select count(*) from t").fetchone(), (2,))
+            conn.close()
+            histograms = instruments.snapshot()["histograms"]
+        finally:
+            instruments.enabled = False
+            instruments.reset()
+        for verb in ("CREATE", "INSERT", "SELECT"):
+            self.assertEqual(histograms[f"db.query.{verb}"]["count"], 1)
+        self.assertEqual(query_metric("  "), "db.query.EMPTY")
+
+
+if __name__ == "__main__":
+    unittest.main()
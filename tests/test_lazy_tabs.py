@@ -0,0 +1,99 @@
+"""
+Tests for tabs built on first show (jdxi_editor.ui.editors.helpers.tabs)
+"""
+
+import unittest
+
+from PySide6.QtWidgets import QApplication, QLabel, QTabWidget, QWidget
+
+from jdxi_editor.ui.editors.helpers.tabs import DeferredPage, LazyTabs
+
+PARTIALS = {"BD1": 1, "RIM": 2, "BD2": 3}
+
+
+class Panel(QLabel):
+    def __init__(self, key):
+        super().__init__(str(key))
+        self.key = key
+
+
+class LazyTabsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.tab_widget = QTabWidget()
+        self.built, self.ready = [], []
+
+    def tearDown(self):
+        self.tab_widget.deleteLater()
+
+    def build(self, key):
+        self.built.append(key)
+        return Panel(key)
+
+    def on_page_ready(self, key, page):
+        self.ready.append((key, page.key))
+
+    def add_partials(self, tabs):
+        for name, number in PARTIALS.items():
+            tabs.add_tab(number, name)
+        self.tab_widget.addTab(QWidget(), "Common")
+
+
+class TestLazyTabs(LazyTabsTest):
+    def test_pages_are_built_when_first_shown(self):
+        tabs = LazyTabs(self.tab_widget, self.build, self.on_page_ready)
+        self.add_partials(tabs)
+        self.assertEqual(self.built, [1])  # --- the first tab is current
+        self.assertIsNone(tabs.page(3))
+        self.tab_widget.setCurrentIndex(2)
+        self.tab_widget.setCurrentIndex(0)
+        self.tab_widget.setCurrentIndex(2)
+        self.assertEqual(self.built, [1, 3])
+        self.assertEqual(self.ready, [(1, 1), (3, 3)])
+        self.assertIs(self.tab_widget.widget(2).content, tabs.page(3))
+        self.assertEqual(sorted(tabs.pages), [1, 3])
+
+    def test_key_at_and_ensure(self):
+        tabs = LazyTabs(self.tab_widget, self.build)
+        self.add_partials(tabs)
+        self.assertEqual([tabs.key_at(i) for i in range(4)], [1, 2, 3, None])
+        self.assertEqual(tabs.keys, [1, 2, 3])
+        page = tabs.ensure(2)
+        self.assertIs(tabs.ensure(2), page)
+        self.assertEqual(self.built, [1, 2])
+
+    def test_caller_added_page(self):
+        tabs = LazyTabs(self.tab_widget, self.build)
+        self.tab_widget.addTab(QWidget(), "Presets")
+        self.tab_widget.addTab(tabs.add_page(1), "Partial 1")
+        self.assertEqual(self.built, [])
+        self.tab_widget.setCurrentIndex(1)
+        self.assertEqual(self.built, [1])
+
+
+class TestSharedPage(LazyTabsTest):
+    def rebind(self, page, key):
+        page.key = key
+        page.setText(str(key))
+
+    def test_one_page_is_rebound_to_each_tab(self):
+        tabs = LazyTabs(self.tab_widget, self.build, self.on_page_ready, self.rebind)
+        self.add_partials(tabs)
+        page = tabs.page(1)
+        self.tab_widget.setCurrentIndex(2)
+        self.tab_widget.setCurrentIndex(1)
+        self.assertTrue(tabs.shared)
+        self.assertEqual(self.built, [1])
+        self.assertEqual(self.ready, [(1, 1), (3, 3), (2, 2)])
+        self.assertEqual(tabs.pages, {2: page})
+        self.assertIs(page.parentWidget(), self.tab_widget.widget(1))
+        self.assertIsNone(self.tab_widget.widget(2).content)
+        self.assertIsNone(self.tab_widget.widget(0).content)
+        self.assertIsInstance(self.tab_widget.widget(0), DeferredPage)
+
+
+if __name__ == "__main__":
+    unittest.main()
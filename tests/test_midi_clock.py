@@ -0,0 +1,149 @@
+"""
+Tests for the MIDI clock master: absolute-deadline pulses, tempo map
+changes and transport messages.
+"""
+
+import threading
+import time
+import unittest
+
+from mido import bpm2tempo
+
+from jdxi_editor.midi.file.model import TempoMap
+from jdxi_editor.midi.io.clock import (
+    MIDI_CONTINUE,
+    MIDI_START,
+    MIDI_STOP,
+    MIDI_TIMING_CLOCK,
+    MidiClockMaster,
+    song_position_message,
+)
+from tests.stepping_clock import SteppingClock
+
+TICKS_PER_BEAT = 480
+PULSE_LIMIT = 48  # --- half a second of pulses at 240 BPM
+
+
+class Recorder:
+    """Collects (clock time, message) pairs from the clock master."""
+
+    def __init__(self, clock: SteppingClock, pulse_limit: int = PULSE_LIMIT):
+        self.clock = clock
+        self.pulse_limit = pulse_limit
+        self.on_limit = None  # --- called on the clock thread at pulse_limit
+        self.lock = threading.Lock()
+        self.messages = []
+        self.done = threading.Event()  # --- pulse_limit pulses sent
+
+    def __call__(self, message: bytes) -> None:
+        with self.lock:
+            self.messages.append((self.clock.now, bytes(message)))
+        if not self.done.is_set() and len(self.pulses()) >= self.pulse_limit:
+            if self.on_limit is not None:
+                self.on_limit()
+            self.done.set()
+
+    def pulses(self) -> list:
+        with self.lock:
+            return [t for t, m in self.messages if m[0] == MIDI_TIMING_CLOCK]
+
+    def transport(self) -> list:
+        with self.lock:
+            return [m for _, m in self.messages if m[0] != MIDI_TIMING_CLOCK]
+
+
+def _tempo_map(*changes) -> TempoMap:
+    return TempoMap.build(TICKS_PER_BEAT, changes, default_tempo=bpm2tempo(240))
+
+
+class TestMidiClockMaster(unittest.TestCase):
+    def _master(self, tempo_map: TempoMap, **recorder_args) -> tuple:
+        """Clock master on a stepping clock; waits spin instead of sleeping."""
+        clock = SteppingClock()
+        recorder = Recorder(clock, **recorder_args)
+        master = MidiClockMaster(
+            recorder, tempo_map, spin_threshold=float("inf"), clock=clock
+        )
+        return master, recorder, 5 * clock.step
+
+    def _run(self, master: MidiClockMaster, recorder: Recorder) -> None:
+        try:
+            self.assertTrue(recorder.done.wait(10))
+        finally:
+            master.stop()
+
+    def test_start_and_pulse_deadlines(self):
+        """Pulses land on origin + n / (24 * beats per second), without drift"""
+        master, recorder, tolerance = self._master(_tempo_map())
+        master.play(0)
+        self._run(master, recorder)
+
+        self.assertEqual(recorder.transport()[0], bytes((MIDI_START,)))
+        self.assertEqual(recorder.transport()[-1], bytes((MIDI_STOP,)))
+        pulses = recorder.pulses()[:PULSE_LIMIT]
+        origin = pulses[0]
+        for n, sent_at in enumerate(pulses):
+            self.assertAlmostEqual(sent_at - origin, n / 96.0, delta=tolerance)
+
+    def test_follows_tempo_map(self):
+        """A tempo change halves the pulse rate from its tick"""
+        master, recorder, tolerance = self._master(
+            _tempo_map((TICKS_PER_BEAT // 4, bpm2tempo(120))), pulse_limit=13
+        )
+        # --- Pulse 6 is at the tempo change: 6 x 1/96 s, then 1/48 s per pulse
+        self.assertAlmostEqual(master.pulse_seconds(6), 6 / 96.0)
+        self.assertAlmostEqual(master.pulse_seconds(12), 6 / 96.0 + 6 / 48.0)
+        master.play(0)
+        self._run(master, recorder)
+        pulses = recorder.pulses()
+        self.assertAlmostEqual(pulses[6] - pulses[0], 6 / 96.0, delta=tolerance)
+        self.assertAlmostEqual(pulses[12] - pulses[6], 6 / 48.0, delta=tolerance)
+
+    def test_seek_sends_song_position(self):
+        """Seeking while playing sends Stop, Song Position Pointer, Continue"""
+        master, recorder, _ = self._master(_tempo_map(), pulse_limit=1)
+        master.play(0)
+        # --- 1000 ticks: the next sixteenth (120 ticks each) is the 9th
+        master.seek(1000)
+        self._run(master, recorder)
+        self.assertEqual(
+            recorder.transport()[:4],
+            [
+                bytes((MIDI_START,)),
+                bytes((MIDI_STOP,)),
+                song_position_message(9),
+                bytes((MIDI_CONTINUE,)),
+            ],
+        )
+
+    def test_pause_resume(self):
+        """No pulses are sent while paused; resuming carries on from the pause"""
+        master, recorder, tolerance = self._master(_tempo_map(), pulse_limit=4)
+        # --- Paused from the clock thread, so nothing reads the clock meanwhile
+        recorder.on_limit = master.pause
+        master.play(0)
+        self.assertTrue(recorder.done.wait(10))
+        self.assertEqual(recorder.transport()[-1], bytes((MIDI_STOP,)))
+        time.sleep(0.05)
+        self.assertEqual(len(recorder.pulses()), 4)
+
+        # --- Time passing while paused does not count towards the next pulse
+        recorder.clock.now += 1.0
+        recorder.on_limit = None
+        recorder.pulse_limit = 5
+        recorder.done.clear()
+        master.resume()
+        self._run(master, recorder)
+        continued_at = [t for t, m in recorder.messages if m[0] == MIDI_CONTINUE][0]
+        pulses = recorder.pulses()
+        self.assertAlmostEqual(pulses[4] - continued_at, 1 / 96.0, delta=tolerance)
+        self.assertAlmostEqual(pulses[4] - pulses[3], 1.0 + 1 / 96.0, delta=tolerance)
+        self.assertFalse(master.is_alive())
+
+    def test_song_position_message(self):
+        self.assertEqual(song_position_message(200), bytes((0xF2, 0x48, 0x01)))
+        self.assertEqual(song_position_message(1 << 20), bytes((0xF2, 0x7F, 0x7F)))
+
+
+if __name__ == "__main__":
+    unittest.main()
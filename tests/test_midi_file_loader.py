@@ -0,0 +1,76 @@
+"""
+Tests for the background MIDI file loader (jdxi_editor.midi.file.loader)
+"""
+
+import os
+import time
+import unittest
+
+from PySide6.QtCore import QCoreApplication
+
+from jdxi_editor.midi.file.loader import MidiFileLoader
+from jdxi_editor.midi.file.model import midi_file_model
+
+MIDI_DIR = os.path.join(os.path.dirname(__file__), "midi")
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    """Run the Qt event loop until condition() holds; results arrive queued."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+    return True
+
+
+class TestMidiFileLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.loader = MidiFileLoader()
+        self.results = []
+        self.failures = []
+        self.done = False
+        self.loader.loaded.connect(self._on_loaded)
+        self.loader.failed.connect(self._on_failed)
+
+    def _on_loaded(self, result):
+        self.results.append(result)
+        if self.loader.is_current(result):
+            self.done = True
+
+    def _on_failed(self, file_path, message):
+        self.failures.append((file_path, message))
+        self.done = True
+
+    def test_load(self):
+        path = os.path.join(MIDI_DIR, "clap.mid")
+        request_id = self.loader.load(path)
+        self.assertTrue(wait_for(lambda: self.done))
+        result = self.results[-1]
+        self.assertEqual(result.request_id, request_id)
+        self.assertEqual(result.midi_file.filename, path)
+        # --- The model is cached with the file for later consumers
+        self.assertIs(midi_file_model(result.midi_file), result.model)
+
+    def test_newer_load_supersedes(self):
+        first = self.loader.load(os.path.join(MIDI_DIR, "87216.mid"))
+        second = self.loader.load(os.path.join(MIDI_DIR, "clap.mid"))
+        self.assertTrue(wait_for(lambda: self.done))
+        current = [r for r in self.results if self.loader.is_current(r)]
+        self.assertEqual([r.request_id for r in current], [second])
+        self.assertNotEqual(first, second)
+
+    def test_failure(self):
+        self.loader.load(os.path.join(MIDI_DIR, "missing.mid"))
+        self.assertTrue(wait_for(lambda: self.done))
+        self.assertEqual(self.results, [])
+        self.assertEqual(len(self.failures), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Tests for the indexed MIDI file model (jdxi_editor.midi.file.model)
+"""
+
+import gc
+import os
+import unittest
+import weakref
+
+from mido import Message, MetaMessage, MidiFile, MidiTrack
+
+from jdxi_editor.midi.file.model import (
+    STATUS_META,
+    STATUS_NOTE_ON,
+    TempoMap,
+    index_track,
+    midi_file_model,
+)
+
+MIDI_DIR = os.path.join(os.path.dirname(__file__), "midi")
+
+
+def two_tempo_file() -> MidiFile:
+    """Tempo track (120 -> 60 BPM at beat 4) and one note track on channel 9."""
+    midi_file = MidiFile(ticks_per_beat=480)
+    tempo = MidiTrack(
+        [
+            MetaMessage("set_tempo", tempo=500000, time=0),
+            MetaMessage("set_tempo", tempo=1000000, time=1920),
+            MetaMessage("end_of_track", time=0),
+        ]
+    )
+    notes = MidiTrack(
+        [
+            MetaMessage("track_name", name="Drums", time=0),
+            Message("program_change", channel=9, program=3, time=0),
+            Message("note_on", channel=9, note=36, velocity=100, time=0),
+            Message("note_on", channel=9, note=36, velocity=0, time=960),
+            Message("pitchwheel", channel=9, pitch=-8192, time=0),
+            Message("note_on", channel=9, note=38, velocity=90, time=1920),
+            Message("note_off", channel=9, note=38, velocity=0, time=480),
+            MetaMessage("end_of_track", time=0),
+        ]
+    )
+    midi_file.tracks.extend([tempo, notes])
+    return midi_file
+
+
+def naive_events(midi_file: MidiFile) -> list:
+    events = []
+    for track_index, track in enumerate(midi_file.tracks):
+        tick = 0
+        for msg in track:
+            tick += msg.time
+            events.append((tick, msg, track_index))
+    return sorted(events, key=lambda event: event[0])
+
+
+class TestIndexTrack(unittest.TestCase):
+    def test_columns(self):
+        columns = index_track(two_tempo_file().tracks[1], 1)
+        self.assertEqual(columns.name, "Drums")
+        self.assertEqual(columns.ticks.tolist(), [0, 0, 0, 960, 960, 2880, 3360, 3360])
+        self.assertEqual(columns.status[0], STATUS_META)
+        self.assertEqual(columns.status[2], STATUS_NOTE_ON | 9)
+        self.assertEqual(columns.channels, frozenset({9}))
+        self.assertEqual(columns.first_channel, 9)
+        self.assertEqual(columns.programs, (3,))
+        self.assertEqual(columns.note_count, 2)
+        self.assertEqual(columns.note_on_mask().tolist().count(True), 2)
+        self.assertEqual(columns.note_off_mask().tolist().count(True), 2)
+        self.assertEqual((columns.data1[4], columns.data2[4]), (0, 0))  # pitch -8192
+
+
+class TestTempoMap(unittest.TestCase):
+    def test_seconds_at(self):
+        tempo_map = TempoMap.build(480, [(0, 500000), (1920, 1000000)])
+        self.assertEqual(tempo_map.ticks, (0, 1920))
+        self.assertAlmostEqual(tempo_map.seconds_at(1920), 2.0)
+        self.assertAlmostEqual(tempo_map.seconds_at(2400), 3.0)
+        self.assertEqual(tempo_map.tempo_at(1919), 500000)
+
+    def test_tick_at_inverts_seconds_at(self):
+        tempo_map = TempoMap.build(480, [(0, 500000), (1920, 1000000), (2400, 250000)])
+        self.assertAlmostEqual(tempo_map.tick_at(2.0), 1920)
+        self.assertAlmostEqual(tempo_map.tick_at(2.5), 2160)
+        for tick in (0, 100, 1919, 1920, 2399, 2400, 9000):
+            self.assertAlmostEqual(tempo_map.tick_at(tempo_map.seconds_at(tick)), tick)
+
+
+class TestMidiFileModel(unittest.TestCase):
+    def test_summary(self):
+        midi_file = two_tempo_file()
+        model = midi_file_model(midi_file)
+        self.assertEqual(model.total_ticks, 3360)
+        self.assertAlmostEqual(model.duration_seconds, midi_file.length)
+        self.assertEqual(model.initial_tempo, 500000)
+        self.assertEqual(model.initial_track_tempos, {0: 500000})
+        self.assertEqual(model.first_channel_in({1, 9}), 9)
+        self.assertIsNone(model.first_channel_in({0}))
+        self.assertEqual(list(model.events), naive_events(midi_file))
+
+    def test_seek(self):
+        model = midi_file_model(two_tempo_file())
+        # --- 3 s is 4 beats at 120 BPM, then 1 beat at 60 BPM
+        self.assertAlmostEqual(model.tick_at(3.0), 2400)
+        index = model.event_index_at(model.tick_at(3.0))
+        self.assertEqual(model.events[index][0], 2880)
+        self.assertEqual(model.events[index - 1][0], 1920)
+        self.assertEqual(model.event_index_at(10_000), len(model.events))
+
+    def test_cached_until_tracks_change(self):
+        midi_file = two_tempo_file()
+        model = midi_file_model(midi_file)
+        self.assertIs(midi_file_model(midi_file), model)
+        midi_file.tracks[1].append(Message("note_on", note=40, time=10))
+        self.assertIsNot(midi_file_model(midi_file), model)
+
+    def test_cached_model_is_freed_with_file(self):
+        """The cache does not keep a file (or its model) alive"""
+        midi_file = two_tempo_file()
+        midi_file_model(midi_file)
+        file_ref = weakref.ref(midi_file)
+        del midi_file
+        gc.collect()
+        self.assertIsNone(file_ref())
+
+    def test_matches_mido_on_repo_files(self):
+        for name in sorted(os.listdir(MIDI_DIR))[:4]:
+            if not name.endswith(".mid"):
+                continue
+            with self.subTest(name=name):
+                midi_file = MidiFile(os.path.join(MIDI_DIR, name))
+                model = midi_file_model(midi_file)
+                self.assertEqual(list(model.events), naive_events(midi_file))
+                self.assertAlmostEqual(
+                    model.duration_seconds, midi_file.length, places=6
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
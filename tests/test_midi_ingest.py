@@ -0,0 +1,71 @@
+"""
+Tests for the MIDI input ingest pipeline (jdxi_editor.midi.io.ingest)
+"""
+
+import time
+import unittest
+
+from jdxi_editor.midi.io.ingest import (
+    IngestLatencyStats,
+    MidiDecodeWorker,
+    MidiIngestRing,
+)
+
+
+class TestMidiIngestRing(unittest.TestCase):
+    def test_fifo_order(self):
+        ring = MidiIngestRing(capacity=8)
+        for note in (60, 62, 64):
+            self.assertTrue(ring.push([0x90, note, 100]))
+        self.assertEqual(len(ring), 3)
+        notes = [ring.pop()[0][1] for _ in range(3)]
+        self.assertEqual(notes, [60, 62, 64])
+        self.assertIsNone(ring.pop())
+
+    def test_overrun_drops_newest(self):
+        ring = MidiIngestRing(capacity=4)
+        results = [ring.push([0xB0, 7, i]) for i in range(5)]
+        self.assertEqual(results, [True, True, True, False, False])
+        self.assertEqual(ring.overruns, 2)
+        self.assertEqual(ring.pop()[0], bytes([0xB0, 7, 0]))
+
+
+class TestMidiDecodeWorker(unittest.TestCase):
+    def test_decodes_and_delivers_batches(self):
+        ring = MidiIngestRing(capacity=64)
+        delivered = []
+        worker = MidiDecodeWorker(
+            ring, decode=lambda message: message.type, deliver=delivered.extend
+        )
+        worker.start()
+        try:
+            ring.push([0x90, 60, 100])
+            ring.push([0xF0, 0x41, 0x10, 0x00, 0x00, 0x00, 0x0E, 0xF7])
+            ring.push([0xC0, 5])
+            deadline = time.monotonic() + 2.0
+            while len(delivered) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            worker.stop()
+        self.assertEqual(
+            [event.decoded for event in delivered],
+            ["note_on", "sysex", "program_change"],
+        )
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(worker.stats.snapshot()["queue"]["count"], 3)
+
+
+class TestIngestLatencyStats(unittest.TestCase):
+    def test_snapshot_in_milliseconds(self):
+        stats = IngestLatencyStats()
+        stats.record("decode", 2_000_000)
+        stats.record("decode", 4_000_000)
+        decode = stats.snapshot()["decode"]
+        self.assertEqual(decode["count"], 2)
+        self.assertAlmostEqual(decode["mean_ms"], 3.0)
+        self.assertAlmostEqual(decode["max_ms"], 4.0)
+        self.assertAlmostEqual(decode["last_ms"], 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+Tests for the MIDI output scheduler (jdxi_editor.midi.io.scheduler)
+"""
+
+import threading
+import time
+import unittest
+
+from jdxi_editor.midi.io.scheduler import (
+    LanePacing,
+    MidiOutputScheduler,
+    OutputLane,
+    classify,
+    coalesce_key,
+)
+from tests.sysex_frames import dt1
+
+NOTE_ON = bytes([0x90, 0x3C, 0x64])
+UNPACED = {lane: LanePacing(None, 0.0) for lane in OutputLane}
+
+
+class GatedTransmit:
+    """Records messages; blocks on the first one until released."""
+
+    def __init__(self):
+        self.sent = []
+        self.first = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, message):
+        self.sent.append(message)
+        if not self.first.is_set():
+            self.first.set()
+            self.release.wait(2.0)
+        return True
+
+
+class TestClassify(unittest.TestCase):
+    def test_lanes(self):
+        self.assertEqual(classify(NOTE_ON), OutputLane.REALTIME)
+        self.assertEqual(classify(bytes([0xF8])), OutputLane.REALTIME)
+        self.assertEqual(
+            classify(dt1((0x19, 0x01, 0x00, 0x00), [0x40])), OutputLane.INTERACTIVE
+        )
+        self.assertEqual(
+            classify(dt1((0x19, 0x01, 0x00, 0x00), [0] * 100)), OutputLane.BULK
+        )
+
+    def test_coalesce_key(self):
+        one = dt1((0x19, 0x01, 0x00, 0x10), [0x40])
+        self.assertEqual(coalesce_key(one), (bytes([0x19, 0x01, 0x00, 0x10]), len(one)))
+        self.assertIsNone(coalesce_key(dt1((0x19, 0x01, 0x00, 0x00), [0] * 16)))
+        self.assertIsNone(coalesce_key(NOTE_ON))
+
+
+class TestMidiOutputScheduler(unittest.TestCase):
+    def setUp(self):
+        self.transmit = GatedTransmit()
+        self.scheduler = MidiOutputScheduler(self.transmit, pacing=UNPACED)
+
+    def tearDown(self):
+        self.transmit.release.set()
+        self.scheduler.stop()
+
+    def _hold(self):
+        """Occupy the thread with a first message so the queues can be filled."""
+        self.scheduler.submit(bytes([0xF8]))
+        self.assertTrue(self.transmit.first.wait(1.0))
+
+    def test_priority_order(self):
+        self._hold()
+        bulk = dt1((0x19, 0x01, 0x00, 0x00), [0] * 100)
+        param = dt1((0x19, 0x01, 0x00, 0x10), [0x40])
+        self.scheduler.submit(bulk)
+        self.scheduler.submit(param)
+        self.scheduler.submit(NOTE_ON)
+        self.transmit.release.set()
+        self.assertTrue(self.scheduler.flush(1.0))
+        self.assertEqual(self.transmit.sent[1:], [NOTE_ON, param, bulk])
+
+    def test_latest_value_wins(self):
+        self._hold()
+        address = (0x19, 0x01, 0x00, 0x10)
+        other = dt1((0x19, 0x01, 0x00, 0x11), [0x01])
+        self.scheduler.submit(dt1(address, [0x10]))
+        self.scheduler.submit(other)
+        self.scheduler.submit(dt1(address, [0x20]))
+        self.scheduler.submit(dt1(address, [0x30]))
+        self.transmit.release.set()
+        self.assertTrue(self.scheduler.flush(1.0))
+        self.assertEqual(self.transmit.sent[1:], [dt1(address, [0x30]), other])
+        self.assertEqual(self.scheduler.coalesced, 2)
+
+    def test_gap_after_holds_lane(self):
+        self.transmit.first.set()  # --- no gating
+        stamps = []
+        self.scheduler.transmit = lambda message: stamps.append(time.monotonic())
+        self.scheduler.submit(bytes([0xB0, 0x00, 0x00]), gap_after=0.05)
+        self.scheduler.submit(bytes([0xC0, 0x01]))
+        self.assertTrue(self.scheduler.flush(1.0))
+        self.assertEqual(len(stamps), 2)
+        self.assertGreaterEqual(stamps[1] - stamps[0], 0.045)
+
+    def test_bulk_backpressure(self):
+        scheduler = MidiOutputScheduler(
+            self.transmit, pacing=UNPACED, bulk_max_pending=2
+        )
+        self.addCleanup(scheduler.stop)
+        scheduler.submit(bytes([0xF8]))
+        self.assertTrue(self.transmit.first.wait(1.0))
+        frame = dt1((0x19, 0x01, 0x00, 0x00), [0] * 100)
+        self.assertTrue(scheduler.submit(frame, block=True, timeout=0.1))
+        self.assertTrue(scheduler.submit(frame, block=True, timeout=0.1))
+        self.assertFalse(scheduler.submit(frame, block=True, timeout=0.05))
+        self.transmit.release.set()
+        self.assertTrue(scheduler.submit(frame, block=True, timeout=1.0))
+        self.assertTrue(scheduler.flush(1.0))
+        self.assertEqual(len(self.transmit.sent), 4)
+
+    def test_paced_lanes_share_the_port(self):
+        rate = 5000.0
+        scheduler = MidiOutputScheduler(
+            self.transmit,
+            pacing={
+                OutputLane.INTERACTIVE: LanePacing(rate, 0.0),
+                OutputLane.BULK: LanePacing(rate, 0.0),
+            },
+        )
+        self.addCleanup(scheduler.stop)
+        stamps = []
+
+        def transmit(message):
+            stamps.append(time.monotonic())
+            return self.transmit(message)
+
+        scheduler.transmit = transmit
+        scheduler.submit(bytes([0xF8]))  # --- unpaced, holds the thread
+        self.assertTrue(self.transmit.first.wait(1.0))
+        bulk = [dt1((0x19, 0x01, 0x00, index), [0] * 60) for index in range(6)]
+        params = [dt1((0x19, 0x02, 0x00, index), [0] * 40) for index in range(6)]
+        for frame in bulk:
+            scheduler.submit(frame)
+        for frame in params:
+            scheduler.submit(frame)
+        self.transmit.release.set()
+        self.assertTrue(scheduler.flush(2.0))
+        sent = self.transmit.sent[1:]
+        self.assertEqual(sent, params + bulk)
+        # --- Each send starts only once the port has carried every earlier byte
+        stamps = stamps[1:]
+        carried = 0
+        for stamp, message in zip(stamps, sent):
+            self.assertGreaterEqual(stamp - stamps[0], carried / rate - 0.001)
+            carried += len(message)
+
+    def test_stopped_scheduler_rejects(self):
+        self.scheduler.stop()
+        self.assertFalse(self.scheduler.submit(NOTE_ON))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests for the parameter lookup indexes (jdxi_editor.midi.data.parameter.index and
+jdxi_editor.midi.data.address.index)
+"""
+
+import unittest
+from enum import Enum, IntEnum
+
+from jdxi_editor.midi.data.parameter.index import (
+    address_index,
+    member_address,
+    parameter_by_address,
+    parameter_members,
+)
+from tests.sysex_frames import dt1
+
+
+class ToneParam(Enum):
+    """Stand-in parameter map with an alias."""
+
+    LEVEL = (0x0E, 0, 127)
+    PAN = (0x0F, 0, 127)
+    LEVEL_ALIAS = (0x0E, 0, 127)
+
+    def __init__(self, address, min_val, max_val):
+        self.address = address
+
+
+class AreaByte(IntEnum):
+    COMMON = 0x00
+    PARTIAL = 0x20
+
+
+class TestParameterIndex(unittest.TestCase):
+    def test_lookup_by_address(self):
+        self.assertIs(parameter_by_address(ToneParam, 0x0F), ToneParam.PAN)
+        self.assertIsNone(parameter_by_address(ToneParam, 0x10))
+
+    def test_first_member_wins(self):
+        self.assertEqual(parameter_members(ToneParam), (ToneParam.LEVEL, ToneParam.PAN))
+        self.assertIs(parameter_by_address(ToneParam, 0x0E), ToneParam.LEVEL)
+
+    def test_index_is_built_once(self):
+        self.assertIs(address_index(ToneParam), address_index(ToneParam))
+
+    def test_value_based_enums(self):
+        self.assertEqual(member_address(AreaByte.PARTIAL), 0x20)
+        self.assertIs(parameter_by_address(AreaByte, 0x20), AreaByte.PARTIAL)
+
+
+class TestParameterAddressIndex(unittest.TestCase):
+    def test_full_address_lookup(self):
+        from jdxi_editor.midi.data.address.index import parameter_at
+        from jdxi_editor.midi.data.parameter.analog.address import AnalogParam
+        from jdxi_editor.midi.data.parameter.drum.partial import DrumPartialParam
+        from jdxi_editor.midi.data.parameter.system.common import SystemCommonParam
+
+        self.assertEqual(
+            parameter_at((0x19, 0x42, 0x00, 0x16)),
+            (AnalogParam, AnalogParam.OSC_WAVEFORM),
+        )
+        # --- drum partial offset 0x102 ("01 02") lands on the next LMB page
+        self.assertEqual(
+            parameter_at((0x19, 0x70, 0x2F, 0x02)),
+            (DrumPartialParam, DrumPartialParam.WMT4_WAVE_NUMBER_R),
+        )
+        self.assertEqual(
+            parameter_at((0x02, 0x00, 0x00, 0x05)),
+            (SystemCommonParam, SystemCommonParam.MASTER_LEVEL),
+        )
+        self.assertIsNone(parameter_at((0x19, 0x42, 0x00, 0x7F)))
+
+    def test_single_parameter_stays_in_the_requested_map(self):
+        from jdxi_editor.midi.data.parameter.analog.address import AnalogParam
+        from jdxi_editor.midi.data.parameter.digital.common import DigitalCommonParam
+        from jdxi_editor.midi.sysex.parser.utils import parse_single_parameter
+
+        frame = dt1((0x19, 0x42, 0x00, 0x16), [0])
+        self.assertEqual(
+            parse_single_parameter(frame, AnalogParam), {"PARAM": "OSC_WAVEFORM"}
+        )
+        other = parameter_by_address(DigitalCommonParam, 0x16)
+        self.assertEqual(
+            parse_single_parameter(frame, DigitalCommonParam),
+            {"PARAM": other.name} if other else {},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
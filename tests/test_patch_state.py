@@ -0,0 +1,127 @@
+"""
+Tests for the headless patch state (jdxi_editor.midi.patch.state)
+"""
+
+import unittest
+from enum import Enum
+
+from jdxi_editor.midi.patch.state import (
+    PATCH_AREAS,
+    PatchAreaSpec,
+    PatchState,
+    PatchStateView,
+    linear_offset,
+)
+from tests.sysex_frames import dt1
+
+
+class ToneParam(Enum):
+    """Small stand-in parameter map: one byte, one nibbled and one two-byte offset."""
+
+    NAME_1 = (0x00, 1)
+    LEVEL = (0x0E, 1)
+    TUNE = (0x10, 4)
+    LEVEL_ALIAS = (0x0E, 1)
+    TAIL = (0x13C, 1)
+
+    def __init__(self, address, size):
+        self.address = address
+        self.size = size
+
+    def get_nibbled_size(self):
+        return self.size
+
+
+TONE = PatchAreaSpec(
+    name="TONE",
+    address=(0x19, 0x42, 0x00, 0x00),
+    size=linear_offset(0x13D),
+    param_class=ToneParam,
+    temporary_area="ANALOG_SYNTH",
+    synth_tone="COMMON",
+)
+
+
+class TestPatchState(unittest.TestCase):
+    def setUp(self):
+        self.state = PatchState(areas=[TONE])
+
+    def test_applies_dt1_frames(self):
+        self.assertEqual(
+            self.state.apply_sysex_frame(dt1((0x19, 0x42, 0x00, 0x0E), [100])), 1
+        )
+        self.assertEqual(self.state.get_value("TONE", ToneParam.LEVEL), 100)
+        self.assertIsNone(self.state.get_value("TONE", ToneParam.NAME_1))
+
+    def test_ignores_rq1_and_unknown_addresses(self):
+        rq1 = bytearray(dt1((0x19, 0x42, 0x00, 0x0E), [0, 0, 0, 1]))
+        rq1[7] = 0x11
+        self.assertEqual(self.state.apply_sysex_frame(bytes(rq1)), 0)
+        self.assertEqual(
+            self.state.apply_sysex_frame(dt1((0x19, 0x01, 0x00, 0x00), [1])), 0
+        )
+
+    def test_nibbled_and_two_byte_offsets(self):
+        self.state.apply_dt1((0x19, 0x42, 0x00, 0x10), [0x8, 0x0, 0x7, 0xF])
+        self.assertEqual(self.state.get_value("TONE", ToneParam.TUNE), 0x807F)
+        # --- 0x13C is "01 3C": the next LMB page
+        self.state.apply_dt1((0x19, 0x42, 0x01, 0x3C), [42])
+        self.assertEqual(self.state.get_value("TONE", ToneParam.TAIL), 42)
+
+    def test_dirty_parameters(self):
+        self.state.apply_dt1((0x19, 0x42, 0x00, 0x0E), [1, 0, 0, 0, 0, 2])
+        self.assertEqual(
+            self.state.take_dirty("TONE"), [ToneParam.LEVEL, ToneParam.TUNE]
+        )
+        self.assertEqual(self.state.take_dirty("TONE"), [])
+        self.state.apply_dt1((0x19, 0x42, 0x00, 0x0E), [1])  # unchanged
+        self.assertEqual(self.state.take_dirty("TONE"), [])
+
+    def test_views_each_see_every_change(self):
+        program_view, tone_view = PatchStateView(self.state), PatchStateView(self.state)
+        self.state.apply_dt1((0x19, 0x42, 0x00, 0x0E), [7])
+        self.assertEqual(program_view.take_changes("TONE"), {"LEVEL": 7})
+        self.state.apply_dt1((0x19, 0x42, 0x00, 0x00), [65])
+        self.assertEqual(program_view.take_changes("TONE"), {"NAME_1": 65})
+        self.assertEqual(tone_view.take_changes("TONE"), {"NAME_1": 65, "LEVEL": 7})
+        self.assertEqual(tone_view.take_changes("TONE"), {})
+        self.state.apply_dt1((0x19, 0x42, 0x00, 0x0E), [8], local=True)
+        self.assertEqual(tone_view.take_changes("TONE"), {})  # --- sent from here
+        tone_view.invalidate()
+        self.assertEqual(
+            tone_view.take_dirty("TONE"), [ToneParam.NAME_1, ToneParam.LEVEL]
+        )
+
+    def test_aliases_are_skipped(self):
+        self.state.apply_dt1((0x19, 0x42, 0x00, 0x0E), [5])
+        self.assertEqual(self.state.to_parameters("TONE"), {"LEVEL": 5})
+
+    def test_diff_and_copy(self):
+        self.state.set_value("TONE", ToneParam.TUNE, 300)
+        snapshot = self.state.copy()
+        self.state.set_value("TONE", ToneParam.TUNE, 301)
+        self.assertEqual(snapshot.diff(self.state), {"TONE": {"TUNE": (300, 301)}})
+
+    def test_dt1_blocks_round_trip(self):
+        self.state.apply_dt1((0x19, 0x42, 0x00, 0x00), [65])
+        self.state.apply_dt1((0x19, 0x42, 0x00, 0x0E), [9, 0, 0, 1, 2, 3])
+        other = PatchState(areas=[TONE])
+        for address, data in self.state.to_dt1_blocks():
+            other.apply_dt1(address, data)
+        self.assertEqual(other.diff(self.state), {})
+        self.assertFalse(other.covers((0x19, 0x42)))
+        other.apply_dt1((0x19, 0x42, 0x01, 0x3C), [0])
+        self.assertTrue(other.covers((0x19, 0x42)))
+
+
+class TestPatchAreas(unittest.TestCase):
+    def test_drum_partials_span_two_pages(self):
+        state = PatchState()
+        drum_partials = [s for s in PATCH_AREAS if s.name.startswith("DRUM_KIT_")]
+        self.assertEqual(len(drum_partials), 39)  # common + 38 partials
+        area = state.area_at((0x19, 0x70, 0x2F, 0x10))
+        self.assertEqual(area.spec.address, (0x19, 0x70, 0x2E, 0x00))
+
+
+if __name__ == "__main__":
+    unittest.main()
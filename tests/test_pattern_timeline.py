@@ -0,0 +1,189 @@
+"""
+Tests for the compiled pattern timeline: step patches, tempo recompiles,
+looping playback and timelines handed over at the loop boundary.
+"""
+
+import threading
+import unittest
+from types import SimpleNamespace
+
+from jdxi_editor.midi.playback.pattern_timeline import PatternTimeline
+from jdxi_editor.midi.playback.realtime import RealtimePlaybackScheduler
+from tests.stepping_clock import SteppingClock
+
+TICKS_PER_BEAT = 480
+
+
+def _events(playback) -> list:
+    return [
+        (tick, msg.type, msg.channel, msg.note)
+        for tick, msg in zip(playback.ticks.tolist(), playback.messages)
+    ]
+
+
+class _Button:
+    def __init__(self, note=None, velocity=100, duration_ms=120):
+        self.note_spec = SimpleNamespace(
+            note=note,
+            velocity=velocity,
+            duration_ms=duration_ms,
+            is_active=note is not None,
+        )
+
+    def isChecked(self):
+        return self.note_spec.is_active
+
+
+class TestPatternTimeline(unittest.TestCase):
+    def test_compile(self):
+        """Steps become note-on/note-off pairs; durations follow the tempo"""
+        timeline = PatternTimeline(bars=2)
+        timeline.set_step(0, 0, 0, note=60, velocity=200, duration_ms=125)
+        timeline.set_step(1, 3, 2, note=36, duration_ms=0)
+        playback = timeline.compile(bpm=120, loop=False)
+        self.assertEqual(
+            _events(playback),
+            [
+                (0, "note_on", 0, 60),
+                (120, "note_off", 0, 60),  # --- 125 ms at 120 BPM
+                (1920 + 240, "note_on", 9, 36),
+                (1920 + 360, "note_off", 9, 36),  # --- 0 ms: one step
+            ],
+        )
+        self.assertEqual(playback.messages[0].velocity, 127)
+        self.assertEqual(playback.loop_ticks, 0)
+
+    def test_tempo_recompile_reuses_messages(self):
+        """A new tempo rescales times without building messages again"""
+        timeline = PatternTimeline()
+        timeline.set_step(0, 1, 4, note=62, duration_ms=250)
+        slow = timeline.compile(bpm=60, loop=False)
+        fast = timeline.compile(bpm=120, loop=False)
+        self.assertIs(slow.messages[0], fast.messages[0])
+        self.assertAlmostEqual(slow.seconds[0], 1.0)
+        self.assertAlmostEqual(fast.seconds[0], 0.5)
+        # --- 250 ms is a quarter of a beat at 60 BPM and half a beat at 120 BPM
+        self.assertEqual(slow.ticks[1] - slow.ticks[0], 120)
+        self.assertEqual(fast.ticks[1] - fast.ticks[0], 240)
+
+    def test_patch_and_load(self):
+        """Toggling a step patches one slot; measures load in one pass"""
+        buttons = [[_Button() for _ in range(16)] for _ in range(4)]
+        buttons[2][5] = _Button(note=48)
+        timeline = PatternTimeline()
+        timeline.load_measures(
+            [SimpleNamespace(buttons=buttons)], note_spec=lambda b: b.note_spec
+        )
+        self.assertEqual(timeline.note_count, 1)
+        revision = timeline.revision
+        timeline.set_button(0, 2, 5, True, buttons[2][5].note_spec)
+        self.assertEqual(timeline.revision, revision)  # --- unchanged step
+        timeline.set_button(0, 2, 5, False, None)
+        self.assertEqual(timeline.note_count, 0)
+        self.assertGreater(timeline.revision, revision)
+
+    def test_loop_wraps_note_offs(self):
+        """A note held past the end of the pattern is released at the start"""
+        timeline = PatternTimeline(steps_per_bar=4)
+        timeline.set_step(0, 0, 3, note=60, duration_ms=0)
+        timeline.set_step(0, 0, 0, note=60, duration_ms=0)
+        playback = timeline.compile(bpm=120)
+        self.assertEqual(playback.loop_ticks, 480)
+        self.assertEqual(
+            _events(playback),
+            [
+                (0, "note_off", 0, 60),  # --- from step 3, before step 0 sounds
+                (0, "note_on", 0, 60),
+                (120, "note_off", 0, 60),
+                (360, "note_on", 0, 60),
+            ],
+        )
+
+    def test_to_midi_file(self):
+        timeline = PatternTimeline()
+        timeline.set_step(0, 0, 1, note=64, duration_ms=0)
+        midi_file = timeline.to_midi_file(bpm=90)
+        track = midi_file.tracks[0]
+        self.assertEqual(track[0].type, "set_tempo")
+        self.assertEqual(
+            [(m.type, m.time) for m in track[1:]], [("note_on", 120), ("note_off", 120)]
+        )
+
+
+class TestLoopingScheduler(unittest.TestCase):
+    def _scheduler(self, playback, on_event, step: float = 1e-5) -> tuple:
+        """Scheduler on a stepping clock; waits spin instead of sleeping."""
+        clock = SteppingClock(step)
+        scheduler = RealtimePlaybackScheduler(
+            playback, on_event, spin_threshold=float("inf"), clock=clock
+        )
+        return scheduler, clock
+
+    def test_loops_and_takes_queued_timeline_at_boundary(self):
+        """Playback repeats; an edit is heard from the next loop, with no gap"""
+        sent = []
+        edited = threading.Event()
+        done = threading.Event()
+        timeline = PatternTimeline(steps_per_bar=4)  # --- one beat: 0.25 s at 240 BPM
+        timeline.set_step(0, 0, 0, note=60, duration_ms=0)
+
+        def on_event(msg):
+            sent.append((clock.now, msg.type, msg.note))
+            if msg.type != "note_on":
+                return
+            if not edited.is_set():
+                # --- Edited while the first loop plays
+                edited.set()
+                timeline.set_step(0, 0, 2, note=67, duration_ms=0)
+                scheduler.queue_timeline(timeline.compile(bpm=240))
+            elif msg.note == 67:
+                scheduler.stop()
+                done.set()
+
+        scheduler, clock = self._scheduler(timeline.compile(bpm=240), on_event)
+        scheduler.play(0)
+        try:
+            self.assertTrue(done.wait(10))
+        finally:
+            scheduler.stop()
+        self.assertEqual(scheduler.loops, 1)
+        note_ons = [(t, note) for t, kind, note in sent if kind == "note_on"]
+        starts = [t for t, note in note_ons if note == 60]
+        tolerance = 10 * clock.step
+        # --- Loop starts are one loop apart; the edit plays from the second loop
+        self.assertAlmostEqual(starts[1] - starts[0], 0.25, delta=tolerance)
+        self.assertEqual([note for _, note in note_ons], [60, 60, 67])
+        self.assertAlmostEqual(note_ons[2][0] - starts[1], 0.125, delta=tolerance)
+
+    def test_immediate_switch_releases_sounding_notes(self):
+        """A tempo change switches at once and releases held notes"""
+        sent = []
+        release_ticks = []
+        switched = threading.Event()
+        timeline = PatternTimeline()
+        timeline.set_step(0, 0, 0, note=60, duration_ms=1500)
+
+        def on_event(msg):
+            sent.append(msg)
+            if switched.is_set():
+                return
+            if msg.type == "note_on":
+                scheduler.queue_timeline(timeline.compile(bpm=60), immediate=True)
+            else:
+                # --- The release, sent on taking up the new timeline
+                release_ticks.append(scheduler.current_tick())
+                switched.set()
+
+        scheduler, _ = self._scheduler(timeline.compile(bpm=120), on_event, step=1e-4)
+        scheduler.play(0)
+        try:
+            self.assertTrue(switched.wait(10))
+        finally:
+            scheduler.stop()
+        self.assertEqual(scheduler.timeline.tempo_map.tempos[0], 1000000)
+        self.assertLess(release_ticks[0], 120)
+        self.assertEqual([m.type for m in sent[:2]], ["note_on", "note_off"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests for the shared preset catalog and its filter proxy
+(jdxi_editor.ui.widgets.combo_box.catalog)
+"""
+
+import unittest
+from unittest import mock
+
+from jdxi_editor.ui.widgets.combo_box import catalog as catalog_module
+from jdxi_editor.ui.widgets.combo_box.catalog import (
+    PresetCatalog,
+    PresetFilterProxyModel,
+    get_catalog,
+)
+
+OPTIONS = [
+    "001: JP8 Strings1",
+    "002: Soft Pad",
+    "003: Toxic Bass 1",
+    "004: Bass Pad",
+    "005: Strings (x)",
+]
+CATEGORIES = ["Strings", "Pad", "Bass", "Pad", "Strings"]
+
+
+class TestPresetCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = PresetCatalog(OPTIONS, CATEGORIES)
+
+    def test_search_is_case_insensitive_substring(self):
+        self.assertEqual(self.catalog.search("BASS"), (2, 3))
+        self.assertEqual(self.catalog.search("trings"), (0, 4))
+        self.assertEqual(self.catalog.search("(x"), (4,))
+        self.assertEqual(self.catalog.search("s 1"), (2,))
+        self.assertEqual(self.catalog.search(""), (0, 1, 2, 3, 4))
+
+    def test_search_narrows_cached_result(self):
+        self.catalog.search("pa")
+        with mock.patch.object(
+            self.catalog, "_postings", {}
+        ):  # --- a narrower search must not need the postings
+            self.assertEqual(self.catalog.search("pad"), (1, 3))
+
+    def test_categories_and_banks(self):
+        self.assertEqual(self.catalog.category("Pad"), {1, 3})
+        self.assertEqual(self.catalog.category("Lead"), frozenset())
+        self.assertEqual(PresetCatalog(OPTIONS).category("strings"), {0, 4})
+        self.assertEqual(PresetCatalog(["A01 - x", "b02 - y"]).bank("B"), {1})
+
+    def test_filter_combines_filters(self):
+        self.assertIsNone(self.catalog.filter())
+        self.assertEqual(self.catalog.filter("bass", category="Pad"), {3})
+        self.assertEqual(self.catalog.filter(category="Strings", bank="00"), {0, 4})
+        self.assertEqual(self.catalog.matching(lambda o: "1" in o[3:]), {0, 2})
+
+    def test_categories_must_match_options(self):
+        with self.assertRaises(ValueError):
+            PresetCatalog(OPTIONS, CATEGORIES[:2])
+
+    def test_get_catalog_is_shared(self):
+        catalog = get_catalog(OPTIONS, CATEGORIES)
+        self.assertIs(get_catalog(list(OPTIONS), list(CATEGORIES)), catalog)
+        self.assertIsNot(get_catalog(OPTIONS), catalog)
+        with mock.patch.object(catalog_module, "CATALOG_CACHE_SIZE", 1):
+            get_catalog(["other"])
+            self.assertIsNot(get_catalog(OPTIONS, CATEGORIES), catalog)
+
+
+class TestPresetFilterProxyModel(unittest.TestCase):
+    def test_shows_accepted_rows(self):
+        catalog = PresetCatalog(OPTIONS, CATEGORIES)
+        proxy = PresetFilterProxyModel()
+        proxy.setSourceModel(catalog.model)
+        self.assertEqual(proxy.rowCount(), 5)
+        proxy.set_accepted(catalog.filter(category="Pad"))
+        self.assertEqual(
+            [proxy.index(row, 0).data() for row in range(proxy.rowCount())],
+            ["002: Soft Pad", "004: Bass Pad"],
+        )
+        source = proxy.mapToSource(proxy.index(1, 0))
+        self.assertEqual(source.row(), 3)
+        self.assertEqual(proxy.mapFromSource(catalog.model.index(0, 0)).row(), -1)
+        proxy.set_accepted(None)
+        self.assertEqual(proxy.rowCount(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
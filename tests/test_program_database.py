@@ -0,0 +1,131 @@
+"""
+Tests for the pooled program database: per-thread connections, program upserts
+and playlists (jdxi_editor.ui.programs.database, jdxi_editor.core.db.pool)
+"""
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from jdxi_editor.core.db.pool import ConnectionPool, get_pool
+from jdxi_editor.core.instrumentation import instruments
+from jdxi_editor.midi.program.program import JDXiProgram
+from jdxi_editor.ui.programs.database import ProgramDatabase
+
+
+def program(program_id, name="Init"):
+    return JDXiProgram(id=program_id, name=name, genre="Unknown", pc=1, msb=85, lsb=64)
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.pool = ConnectionPool(Path(self.tmp.name) / "pool.db")
+
+    def tearDown(self):
+        self.pool.close()
+        self.tmp.cleanup()
+
+    def test_one_connection_per_thread(self):
+        conn = self.pool.connection()
+        self.assertIs(self.pool.connection(), conn)
+        other = []
+        thread = threading.Thread(target=lambda: other.append(self.pool.connection()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], conn)
+
+    def test_pragmas(self):
+        conn = self.pool.connection()
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+
+    def test_transaction_rolls_back(self):
+        with self.pool.transaction() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+        with self.assertRaises(RuntimeError):
+            with self.pool.transaction() as conn:
+                conn.execute("INSERT INTO t VALUES (1)")
+                raise RuntimeError("abort")
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM t").fetchone()[0], 0)
+
+    def test_close_reconnects(self):
+        conn = self.pool.connection()
+        self.pool.close()
+        self.assertIsNot(self.pool.connection(), conn)
+
+    def test_shared_per_file(self):
+        path = Path(self.tmp.name) / "shared.db"
+        self.assertIs(get_pool(path), get_pool(Path(self.tmp.name) / "." / "shared.db"))
+        get_pool(path).close()
+
+
+class TestProgramDatabase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = ProgramDatabase(Path(self.tmp.name) / "programs.db")
+
+    def tearDown(self):
+        self.db.pool.close()
+        self.tmp.cleanup()
+
+    def test_upsert_keeps_playlist_items(self):
+        self.db.add_or_replace_programs([program("E01"), program("E02")])
+        playlist_id = self.db.create_playlist("Set")
+        self.assertTrue(self.db.add_program_to_playlist(playlist_id, "E01"))
+        self.assertTrue(self.db.add_or_replace_program(program("E01", "Renamed")))
+        items = self.db.get_playlist_programs(playlist_id)
+        self.assertEqual([item["program"].name for item in items], ["Renamed"])
+
+    def test_playlists(self):
+        self.db.add_or_replace_programs([program(f"E{n:02d}") for n in range(1, 4)])
+        playlist_id = self.db.create_playlist("Live", "Friday")
+        self.assertIsNone(self.db.create_playlist("Live"))
+        for program_id in ("E03", "E01", "E02"):
+            self.assertTrue(self.db.add_program_to_playlist(playlist_id, program_id))
+        self.assertFalse(self.db.add_program_to_playlist(playlist_id, "E01", 2))
+        self.assertTrue(
+            self.db.update_playlist_item_midi_file(playlist_id, "E01", "song.mid")
+        )
+        self.assertTrue(self.db.remove_program_from_playlist(playlist_id, "E02"))
+        self.assertTrue(self.db.update_playlist(playlist_id, name="Live 2"))
+        self.assertFalse(self.db.update_playlist(999, name="Missing"))
+
+        playlist = self.db.get_playlist_by_id(playlist_id)
+        self.assertEqual(
+            (playlist["name"], playlist["description"], playlist["program_count"]),
+            ("Live 2", "Friday", 2),
+        )
+        self.assertIn("T", playlist["created_at"])
+        self.assertEqual([p["name"] for p in self.db.get_all_playlists()], ["Live 2"])
+        items = self.db.get_playlist_programs(playlist_id)
+        self.assertEqual(
+            [(item["program"].id, item["midi_file_path"]) for item in items],
+            [("E03", None), ("E01", "song.mid")],
+        )
+
+        self.assertTrue(self.db.delete_playlist(playlist_id))
+        self.assertEqual(self.db.get_all_playlists(), [])
+        self.assertEqual(self.db.get_playlist_programs(playlist_id), [])
+
+    def test_playlist_programs_is_one_query(self):
+        self.db.add_or_replace_programs([program(f"E{n:02d}") for n in range(1, 65)])
+        playlist_id = self.db.create_playlist("Long")
+        for n in range(1, 65):
+            self.db.add_program_to_playlist(playlist_id, f"E{n:02d}")
+        instruments.reset()
+        instruments.enabled = True
+        try:
+            items = self.db.get_playlist_programs(playlist_id)
+        finally:
+            instruments.enabled = False
+        self.assertEqual(len(items), 64)
+        self.assertEqual(
+            instruments.snapshot()["histograms"]["db.query.SELECT"]["count"], 1
+        )
+        instruments.reset()
+
+
+if __name__ == "__main__":
+    unittest.main()
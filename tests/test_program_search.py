@@ -0,0 +1,151 @@
+"""
+Tests for the indexed program search (ProgramDatabase.search_programs) and the
+paged UserProgramsModel
+"""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from PySide6.QtCore import Qt
+
+from jdxi_editor.midi.program.program import JDXiProgram
+from jdxi_editor.ui.editors.program import user_programs_model
+from jdxi_editor.ui.editors.program.user_programs_model import UserProgramsModel
+from jdxi_editor.ui.programs.database import ProgramDatabase, fts_query
+
+
+def program(program_id, name, **overrides):
+    values = dict(
+        id=program_id,
+        name=name,
+        genre="Unknown",
+        pc=int(program_id[1:]),
+        msb=85,
+        lsb=64,
+        digital_1="JP8 Strings",
+        digital_2="Warm Pad",
+        analog="Toxic Bass",
+        drums="TR-808",
+    )
+    values.update(overrides)
+    return JDXiProgram(**values)
+
+
+class TestProgramSearch(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / "programs.db"
+        self.db = ProgramDatabase(self.db_path)
+        self.db.add_or_replace_programs(
+            [
+                program("E01", "Acid Line", genre="Techno"),
+                program("E02", "Glass Piano", genre="Ambient", digital_1="Piano"),
+                program("E03", "Deep House Stab", genre="House"),
+                program("F01", "Acid Rain", genre="Ambient", drums="TR-909"),
+            ]
+        )
+
+    def tearDown(self):
+        self.db.pool.close()
+        self.tmp.cleanup()
+
+    def ids(self, search_text, **kwargs):
+        return [p.id for p in self.db.search_programs(search_text, **kwargs)]
+
+    def test_fts_query(self):
+        self.assertEqual(fts_query('warm "pad'), '"warm"* AND "pad"*')
+        self.assertEqual(fts_query("  "), "")
+
+    def test_matches_word_prefixes_in_every_field(self):
+        self.assertTrue(self.db.fts_enabled)
+        self.assertEqual(self.ids("acid"), ["E01", "F01"])
+        self.assertEqual(self.ids("amb"), ["E02", "F01"])
+        self.assertEqual(self.ids("pia"), ["E02"])
+        self.assertEqual(self.ids("909"), ["F01"])
+        self.assertEqual(self.ids("e0"), ["E01", "E02", "E03"])
+        self.assertEqual(self.ids("acid amb"), ["F01"])
+        self.assertEqual(self.ids(""), ["E01", "E02", "E03", "F01"])
+        self.assertEqual(self.ids("-"), [])
+        self.assertEqual(self.db.count_programs("acid"), 2)
+        self.assertEqual(self.db.count_programs(), 4)
+
+    def test_pages_and_order(self):
+        self.assertEqual(self.ids("", limit=2, offset=1), ["E02", "E03"])
+        self.assertEqual(
+            self.ids("acid", order_by="name", descending=True), ["F01", "E01"]
+        )
+        with self.assertRaises(ValueError):
+            self.db.search_programs(order_by="name; DROP TABLE programs")
+
+    def test_index_follows_writes(self):
+        self.db.add_or_replace_program(program("E01", "Rubber Bass"))
+        self.assertEqual(self.ids("acid"), ["F01"])
+        self.assertEqual(self.ids("rubber"), ["E01"])
+        self.db.delete_program("F01")
+        self.assertEqual(self.ids("acid"), [])
+        self.assertEqual(self.db.count_programs(), 3)
+
+    def test_index_built_for_existing_database(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DROP TABLE programs_fts")
+        conn.commit()
+        conn.close()
+        self.db.pool.close()
+        reopened = ProgramDatabase(self.db_path)
+        self.assertEqual(
+            [p.id for p in reopened.search_programs("acid")], ["E01", "F01"]
+        )
+
+    def test_like_fallback_without_fts(self):
+        self.db.fts_enabled = False
+        self.assertEqual(self.ids("cid"), ["E01", "F01"])
+        self.assertEqual(self.ids("tr-9"), ["F01"])
+        self.assertEqual(self.ids("%"), [])
+
+
+class TestUserProgramsModel(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = ProgramDatabase(Path(self.tmp.name) / "programs.db")
+        self.db.add_or_replace_programs(
+            [program(f"E{n:02d}", f"Program {n}") for n in range(1, 65)]
+        )
+        self.model = UserProgramsModel(database=self.db)
+
+    def tearDown(self):
+        self.db.pool.close()
+        self.tmp.cleanup()
+
+    def test_reads_only_the_pages_shown(self):
+        with mock.patch.object(user_programs_model, "PAGE_SIZE", 10):
+            with mock.patch.object(
+                self.db, "search_programs", wraps=self.db.search_programs
+            ) as search:
+                self.model.set_search("program")
+                self.assertEqual(self.model.rowCount(), 64)
+                search.assert_not_called()
+                index = self.model.index(42, 0)
+                self.assertEqual(self.model.data(index), "E43")
+                self.assertEqual(self.model.data(self.model.index(49, 1)), "Program 50")
+                self.assertEqual(search.call_count, 1)
+                self.assertEqual(search.call_args.kwargs["offset"], 40)
+
+    def test_sort_and_edit(self):
+        self.model.set_search("")
+        self.model.sort(0, Qt.SortOrder.DescendingOrder)
+        self.assertEqual(self.model.program(0).id, "E64")
+        index = self.model.index(0, 2)
+        self.assertTrue(self.model.flags(index) & Qt.ItemFlag.ItemIsEditable)
+        self.assertTrue(self.model.setData(index, "Trance"))
+        self.assertEqual(self.model.data(index), "Trance")
+        self.assertEqual(
+            [(p.id, p.genre) for p in self.model.pending_edits], [("E64", "Trance")]
+        )
+        self.assertFalse(self.model.setData(self.model.index(0, 4), "7"))
+
+
+if __name__ == "__main__":
+    unittest.main()
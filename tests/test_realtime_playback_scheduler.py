@@ -0,0 +1,189 @@
+"""
+Tests for the real-time playback scheduler: tempo-map due times, filters
+applied at dispatch, pause/seek, and dispatch deadlines.
+"""
+
+import threading
+import time
+import unittest
+
+from mido import Message, MetaMessage, MidiFile, MidiTrack, bpm2tempo
+
+from jdxi_editor.midi.file.model import MidiFileModel
+from jdxi_editor.midi.playback.realtime import (
+    JitterHistogram,
+    PlaybackTimeline,
+    RealtimePlaybackScheduler,
+)
+from tests.stepping_clock import SteppingClock
+
+TICKS_PER_BEAT = 480
+
+
+def _file(notes_track: list, tempo_track: list) -> MidiFile:
+    """Two-track file: tempo changes in track 0, messages in track 1."""
+    midi_file = MidiFile(type=1, ticks_per_beat=TICKS_PER_BEAT)
+    for messages in (tempo_track, notes_track):
+        track = MidiTrack()
+        track.extend(messages)
+        midi_file.tracks.append(track)
+    return midi_file
+
+
+def _timeline(midi_file: MidiFile) -> PlaybackTimeline:
+    return PlaybackTimeline.from_model(MidiFileModel.build(midi_file))
+
+
+class TestPlaybackTimeline(unittest.TestCase):
+    def test_tempo_change_in_other_track(self):
+        """Tempo set in track 0 applies to notes in track 1"""
+        midi_file = _file(
+            [
+                Message("note_on", note=60, velocity=100, time=0),
+                Message("note_off", note=60, time=TICKS_PER_BEAT),
+                Message("note_on", note=62, velocity=100, time=TICKS_PER_BEAT),
+            ],
+            [
+                MetaMessage("set_tempo", tempo=bpm2tempo(120), time=0),
+                MetaMessage("set_tempo", tempo=bpm2tempo(60), time=TICKS_PER_BEAT),
+            ],
+        )
+        timeline = _timeline(midi_file)
+        self.assertEqual(len(timeline), 3)  # --- meta messages are not sent
+        self.assertAlmostEqual(timeline.seconds[1], 0.5)
+        self.assertAlmostEqual(timeline.seconds[2], 1.5)
+        self.assertEqual(timeline.index_at_tick(TICKS_PER_BEAT), 1)
+
+
+class TestRealtimePlaybackScheduler(unittest.TestCase):
+    def _play(self, midi_file: MidiFile, **filters) -> tuple:
+        sent = []
+        scheduler = RealtimePlaybackScheduler(
+            _timeline(midi_file), on_event=sent.append
+        )
+        for name, value in filters.items():
+            setattr(scheduler, name, value)
+        scheduler.play(0)
+        self.assertTrue(scheduler.finished.wait(5))
+        return scheduler, sent
+
+    def test_sends_in_order(self):
+        """Every message is sent once, in tick order"""
+        notes = []
+        for i in range(20):
+            notes.append(Message("note_on", note=40 + i, velocity=90, time=0))
+            notes.append(Message("note_off", note=40 + i, time=24))
+        midi_file = _file(notes, [MetaMessage("set_tempo", tempo=bpm2tempo(240))])
+        scheduler, sent = self._play(midi_file)
+        self.assertEqual(
+            [m.bytes() for m in sent],
+            [m.bytes() for m in _timeline(midi_file).messages],
+        )
+        self.assertEqual(scheduler.sent, 40)
+        self.assertEqual(scheduler.jitter.count, 40)
+
+    def test_filters(self):
+        """Muted channels and suppressed program changes are dropped; note-offs pass"""
+        midi_file = _file(
+            [
+                Message("program_change", program=5, channel=0, time=0),
+                Message("note_on", note=60, velocity=100, channel=0, time=0),
+                Message("note_on", note=36, velocity=100, channel=9, time=0),
+                Message("note_off", note=36, channel=9, time=10),
+                Message("note_off", note=60, channel=0, time=0),
+            ],
+            [MetaMessage("set_tempo", tempo=bpm2tempo(240))],
+        )
+        scheduler, sent = self._play(
+            midi_file, muted_channels={9}, suppress_program_changes=True
+        )
+        self.assertEqual(
+            [(m.type, m.channel) for m in sent],
+            [("note_on", 0), ("note_off", 9), ("note_off", 0)],
+        )
+        self.assertEqual(scheduler.filtered, 2)
+
+    def test_pause_resume_and_seek(self):
+        """Position holds while paused; seek moves it"""
+        midi_file = _file(
+            [
+                Message("note_on", note=60, velocity=100, time=0),
+                Message("note_off", note=60, time=TICKS_PER_BEAT * 8),
+            ],
+            [MetaMessage("set_tempo", tempo=bpm2tempo(120))],
+        )
+        scheduler = RealtimePlaybackScheduler(
+            _timeline(midi_file), on_event=lambda msg: None
+        )
+        scheduler.play(0)
+        try:
+            scheduler.pause()
+            held = scheduler.position_seconds()
+            time.sleep(0.05)
+            self.assertTrue(scheduler.paused)
+            self.assertEqual(scheduler.position_seconds(), held)
+
+            scheduler.seek(TICKS_PER_BEAT * 4)
+            self.assertEqual(scheduler.current_tick(), TICKS_PER_BEAT * 4)
+            scheduler.resume()
+            time.sleep(0.05)
+            self.assertGreater(scheduler.current_tick(), TICKS_PER_BEAT * 4)
+        finally:
+            scheduler.stop()
+        self.assertFalse(scheduler.is_alive())
+
+    def test_dispatch_deadlines(self):
+        """Messages go out at their due times, measured on an injected clock"""
+        notes = [Message("note_on", note=60, velocity=100, time=12)] * 100
+        midi_file = _file(notes, [MetaMessage("set_tempo", tempo=bpm2tempo(120))])
+        timeline = _timeline(midi_file)
+        clock = SteppingClock()
+        sent_at = []
+        # --- No sleeping: every wait spins on the stepping clock
+        scheduler = RealtimePlaybackScheduler(
+            timeline,
+            on_event=lambda msg: sent_at.append(clock.now),
+            spin_threshold=float("inf"),
+            clock=clock,
+        )
+        scheduler.play(0)
+        self.assertTrue(scheduler.finished.wait(30))
+        self.assertEqual(len(sent_at), 100)
+        tolerance = 5 * clock.step
+        for i in range(1, 100):
+            expected = timeline.seconds[i] - timeline.seconds[0]
+            self.assertAlmostEqual(sent_at[i] - sent_at[0], expected, delta=tolerance)
+        self.assertLessEqual(scheduler.jitter.max_us, tolerance * 1e6)
+
+    def test_stop_from_callback(self):
+        """stop() called on the scheduler thread does not deadlock"""
+        stopped = threading.Event()
+        notes = [Message("note_on", note=60, velocity=100, time=0)] * 3
+        midi_file = _file(notes, [MetaMessage("set_tempo", tempo=bpm2tempo(120))])
+        scheduler = None
+
+        def on_event(msg):
+            scheduler.stop()
+            stopped.set()
+
+        scheduler = RealtimePlaybackScheduler(_timeline(midi_file), on_event=on_event)
+        scheduler.play(0)
+        self.assertTrue(stopped.wait(5))
+        scheduler.join(5)
+        self.assertFalse(scheduler.is_alive())
+        self.assertEqual(scheduler.sent, 1)
+
+
+class TestJitterHistogram(unittest.TestCase):
+    def test_buckets(self):
+        histogram = JitterHistogram(buckets_us=(100, 1000))
+        for late in (0.00005, 0.0005, 0.002, -0.001):
+            histogram.record(late)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["count"], 4)
+        self.assertEqual(sum(snapshot["buckets"].values()), 4)
+        self.assertAlmostEqual(snapshot["max_us"], 2000.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Tests for the RQ1 request engine (jdxi_editor.midi.io.request)
+"""
+
+import threading
+import time
+import unittest
+
+from jdxi_editor.midi.io.request import RQ1Request, RQ1RequestEngine
+from tests.sysex_frames import dt1, rq1
+
+
+class FakeSynth:
+    """Records sent requests and optionally answers them."""
+
+    def __init__(self, answer=True):
+        self.answer = answer
+        self.sent = []
+        self.engine = None
+        self.lock = threading.Lock()
+
+    def send(self, message: bytes) -> bool:
+        with self.lock:
+            self.sent.append(message)
+        if self.answer and message[7] == 0x11:
+            reply = dt1(message[8:12], [0] * RQ1Request.from_message(message).size)
+            threading.Timer(0.005, self.engine.on_sysex_frame, args=(reply,)).start()
+        return True
+
+
+def wait_until(predicate, timeout=3.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class TestRQ1Request(unittest.TestCase):
+    def test_parses_hex_string(self):
+        item = RQ1Request.from_message(rq1((0x19, 0x01, 0x20, 0x00), 0x3D).hex(" "))
+        self.assertTrue(item.is_tracked)
+        self.assertEqual(item.size, 0x3D)
+        self.assertEqual(item.start, (0x19 << 21) | (0x01 << 14) | (0x20 << 7))
+
+    def test_non_rq1_is_untracked(self):
+        self.assertFalse(RQ1Request.from_message(bytes([0xB0, 0x07, 0x64])).is_tracked)
+
+
+class TestRQ1RequestEngine(unittest.TestCase):
+    def make_engine(self, answer=True, replies_expected=True):
+        synth = FakeSynth(answer=answer)
+        engine = RQ1RequestEngine(synth.send, replies_expected=lambda: replies_expected)
+        synth.engine = engine
+        self.addCleanup(engine.stop)
+        return synth, engine
+
+    def test_all_requests_answered(self):
+        synth, engine = self.make_engine()
+        requests = [
+            rq1((0x19, 0x01, lmb, 0x00), 0x40) for lmb in (0x00, 0x20, 0x21, 0x22, 0x50)
+        ]
+        self.assertEqual(engine.request(requests), 5)
+        self.assertTrue(wait_until(engine.idle))
+        self.assertEqual(len(synth.sent), 5)
+        self.assertEqual(engine.stats()["completed"], 5)
+        self.assertEqual(engine.stats()["timeouts"], 0)
+
+    def test_window_bounds_in_flight(self):
+        synth, engine = self.make_engine(answer=False)
+        engine.request([rq1((0x19, 0x01, lmb, 0x00), 0x40) for lmb in range(8)])
+        time.sleep(0.05)
+        self.assertLessEqual(engine.stats()["in_flight"], engine.max_in_flight)
+        self.assertLess(len(synth.sent), 8)
+
+    def test_overlapping_requests_are_deduplicated(self):
+        _synth, engine = self.make_engine(answer=False)
+        engine.request([rq1((0x18, 0x00, 0x00, 0x00), 0x40)])
+        self.assertEqual(engine.request([rq1((0x18, 0x00, 0x00, 0x00), 0x40)]), 0)
+        self.assertEqual(engine.request([rq1((0x18, 0x00, 0x00, 0x10), 0x04)]), 0)
+        self.assertEqual(engine.stats()["deduplicated"], 2)
+
+    def test_timeout_retries_then_gives_up(self):
+        synth, engine = self.make_engine(answer=False)
+        engine.request([rq1((0x19, 0x42, 0x00, 0x00), 0x40)])
+        self.assertTrue(wait_until(engine.idle, timeout=5.0))
+        self.assertEqual(len(synth.sent), 3)  # first attempt plus two retries
+        self.assertEqual(engine.stats()["timeouts"], 3)
+        self.assertEqual(engine.window, 1)
+
+    def test_reply_must_fall_within_requested_range(self):
+        _synth, engine = self.make_engine(answer=False)
+        engine.request([rq1((0x19, 0x42, 0x00, 0x01), 0x04)])
+        self.assertTrue(wait_until(lambda: engine.stats()["in_flight"] == 1))
+        engine.on_sysex_frame(dt1((0x19, 0x42, 0x00, 0x00), [0] * 2))
+        engine.on_sysex_frame(dt1((0x19, 0x42, 0x00, 0x02), [0] * 4))
+        engine.on_sysex_frame(dt1((0x19, 0x42, 0x01, 0x01), [0] * 4))
+        self.assertEqual(engine.stats()["completed"], 0)
+        engine.on_sysex_frame(dt1((0x19, 0x42, 0x00, 0x01), [0] * 4))
+        self.assertEqual(engine.stats()["completed"], 1)
+
+    def test_shorter_reply_answers_request(self):
+        """A Digital partial answers a 0x40-byte RQ1 with 61 bytes"""
+        _synth, engine = self.make_engine(answer=False)
+        engine.request([rq1((0x19, 0x01, 0x20, 0x00), 0x40)])
+        self.assertTrue(wait_until(lambda: engine.stats()["in_flight"] == 1))
+        engine.on_sysex_frame(dt1((0x19, 0x01, 0x20, 0x00), [0] * 61))
+        self.assertEqual(engine.stats()["completed"], 1)
+        self.assertEqual(engine.stats()["timeouts"], 0)
+        self.assertTrue(engine.idle())
+
+    def test_reply_after_deadline_is_ignored(self):
+        item = RQ1Request.from_message(rq1((0x19, 0x42, 0x00, 0x00), 0x04))
+        item.deadline = 10.0
+        self.assertTrue(item.answered_by(item.start, 4, now=10.0))
+        self.assertFalse(item.answered_by(item.start, 4, now=10.5))
+
+    def test_without_input_requests_are_paced_not_tracked(self):
+        synth, engine = self.make_engine(answer=False, replies_expected=False)
+        engine.request([rq1((0x19, 0x01, lmb, 0x00), 0x40) for lmb in range(3)])
+        self.assertTrue(wait_until(lambda: len(synth.sent) == 3 and engine.idle()))
+        self.assertEqual(engine.stats()["timeouts"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
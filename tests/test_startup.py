@@ -0,0 +1,162 @@
+"""
+Tests for the deferred startup: lazy attributes (jdxi_editor.core.lazy), the
+import timer (jdxi_editor.core.startup) and what importing JDXi loads
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from jdxi_editor.core import startup
+from jdxi_editor.core.lazy import LazyImport, lazy_classattribute
+from jdxi_editor.core.startup import ImportTimer
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TemporaryModules(unittest.TestCase):
+    """Writes modules to a temporary directory on sys.path."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        sys.path.insert(0, self.tmp.name)
+        self.addCleanup(self._cleanup)
+
+    def _cleanup(self):
+        sys.path.remove(self.tmp.name)
+        for name in [
+            name for name in sys.modules if name.startswith("startup_fixture")
+        ]:
+            del sys.modules[name]
+        self.tmp.cleanup()
+
+    def write(self, relative_path: str, source: str = "") -> None:
+        path = Path(self.tmp.name) / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(source))
+
+
+class TestLazyAttributes(TemporaryModules):
+    def test_lazy_import_imports_on_first_access(self):
+        self.write("startup_fixture_table.py", "TABLE = [1, 2, 3]\n")
+
+        class Holder:
+            Table = LazyImport("startup_fixture_table:TABLE")
+
+        self.assertNotIn("startup_fixture_table", sys.modules)
+        self.assertEqual(Holder.Table, [1, 2, 3])
+        self.assertIn("startup_fixture_table", sys.modules)
+        self.assertEqual(Holder.__dict__["Table"], [1, 2, 3])
+
+    def test_lazy_classattribute_is_computed_once(self):
+        calls = []
+
+        class Holder:
+            @lazy_classattribute
+            def ITEMS(cls):
+                calls.append(cls)
+                return [cls.__name__]
+
+        self.assertEqual(calls, [])
+        self.assertEqual(Holder.ITEMS, ["Holder"])
+        Holder.ITEMS += ["more"]
+        self.assertEqual(Holder().ITEMS, ["Holder", "more"])
+        self.assertEqual(calls, [Holder])
+
+    def test_lazy_module_attributes(self):
+        self.write(
+            "startup_fixture_pkg/__init__.py",
+            """
+            from jdxi_editor.core.lazy import lazy_module_attributes
+
+            __getattr__ = lazy_module_attributes(__name__, {"Big": ".big:Big"})
+            """,
+        )
+        self.write("startup_fixture_pkg/big.py", "class Big:\n    pass\n")
+        import startup_fixture_pkg
+
+        self.assertNotIn("startup_fixture_pkg.big", sys.modules)
+        from startup_fixture_pkg import Big
+
+        self.assertIs(Big, sys.modules["startup_fixture_pkg.big"].Big)
+        with self.assertRaises(AttributeError):
+            startup_fixture_pkg.Missing
+
+
+class TestImportTimer(TemporaryModules):
+    def test_records_nested_imports(self):
+        self.write("startup_fixture_outer.py", "import startup_fixture_inner\n")
+        self.write("startup_fixture_inner.py", "VALUE = sum(range(1000))\n")
+        timer = ImportTimer()
+        timer.install()
+        try:
+            import startup_fixture_outer  # noqa: F401
+        finally:
+            timer.uninstall()
+        self.assertFalse(timer.installed)
+        records = {record.name: record for record in timer.records}
+        inner = records["startup_fixture_inner"]
+        outer = records["startup_fixture_outer"]
+        self.assertEqual((outer.depth, inner.depth), (0, 1))
+        self.assertGreaterEqual(outer.cumulative_us, inner.cumulative_us)
+        self.assertLessEqual(outer.self_us, outer.cumulative_us)
+        report = timer.report().splitlines()
+        self.assertEqual(
+            report[0], "import time: self [us] | cumulative | imported package"
+        )
+        self.assertTrue(report[-1].endswith("| startup_fixture_outer"))
+        self.assertIn(outer, timer.slowest(10))
+
+    def test_requested_by_argument_or_environment(self):
+        with mock.patch.dict(os.environ, {startup.IMPORTTIME_ENVIRONMENT: ""}):
+            self.assertFalse(startup.import_timing_requested(["editor"]))
+            self.assertTrue(startup.import_timing_requested(["editor", "--importtime"]))
+        with mock.patch.dict(os.environ, {startup.IMPORTTIME_ENVIRONMENT: "1"}):
+            self.assertTrue(startup.import_timing_requested([]))
+
+    def test_report_lists_milestones(self):
+        with mock.patch.object(startup, "milestones", []):
+            startup.mark("first_window")
+            self.assertIn("first_window", startup.report())
+
+
+class TestDeferredImports(unittest.TestCase):
+    def test_jdxi_does_not_load_tables_or_native_libraries(self):
+        code = textwrap.dedent("""
+            import sys
+            from jdxi_editor.core.jdxi import JDXi
+            from jdxi_editor.ui.programs import programs
+
+            deferred = [
+                "jdxi_editor.ui.preset.tone.digital.list",
+                "jdxi_editor.ui.preset.tone.analog.list",
+                "jdxi_editor.ui.preset.tone.drum.list",
+                "fluidsynth",
+                "pyaudio",
+                "sqlalchemy",
+            ]
+            print([name for name in deferred if name in sys.modules])
+            rom_list = programs.JDXiUIProgramList.__dict__["ROM_PROGRAM_LIST"]
+            print(isinstance(rom_list, list))
+            print(
+                len(JDXi.UI.Program.ROM_PROGRAM_LIST) > 0,
+                len(JDXi.UI.Preset.Digital.LIST) > 0,
+            )
+            """)
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.split("\n")[:3], ["[]", "False", "True True"])
+
+
+if __name__ == "__main__":
+    unittest.main()
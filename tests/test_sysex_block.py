@@ -0,0 +1,94 @@
+"""
+Tests for DT1 block coalescing (jdxi_editor.midi.sysex.block)
+"""
+
+import unittest
+
+from jdxi_editor.midi.data.address.address import JDXiSysExAddress
+from jdxi_editor.midi.message.roland import JDXiSysEx
+from jdxi_editor.midi.sysex.block import (
+    DT1_MAX_BLOCK_SIZE,
+    coalesce_dt1_messages,
+    coalesce_dt1_writes,
+)
+
+
+class TestCoalesceDT1Writes(unittest.TestCase):
+    def test_contiguous_single_bytes_merge(self):
+        writes = [((0x19, 0x01, 0x20, lsb), [lsb]) for lsb in range(0x00, 0x10)]
+        blocks = coalesce_dt1_writes(writes)
+        self.assertEqual(blocks, [((0x19, 0x01, 0x20, 0x00), list(range(0x10)))])
+
+    def test_gap_starts_new_block(self):
+        writes = [
+            ((0x19, 0x01, 0x20, 0x00), [1]),
+            ((0x19, 0x01, 0x20, 0x01), [2]),
+            ((0x19, 0x01, 0x20, 0x05), [3]),
+        ]
+        blocks = coalesce_dt1_writes(writes)
+        self.assertEqual(
+            blocks,
+            [((0x19, 0x01, 0x20, 0x00), [1, 2]), ((0x19, 0x01, 0x20, 0x05), [3])],
+        )
+
+    def test_nibbled_parameter_is_contiguous_with_next(self):
+        # PCM_WAVE_NUMBER-style 4-nibble value at 0x35, next parameter at 0x39
+        writes = [
+            ((0x19, 0x01, 0x20, 0x34), [0x01]),
+            ((0x19, 0x01, 0x20, 0x35), [0x00, 0x00, 0x01, 0x02]),
+            ((0x19, 0x01, 0x20, 0x39), [0x03]),
+        ]
+        blocks = coalesce_dt1_writes(writes)
+        self.assertEqual(
+            blocks,
+            [((0x19, 0x01, 0x20, 0x34), [0x01, 0x00, 0x00, 0x01, 0x02, 0x03])],
+        )
+
+    def test_bases_are_not_merged(self):
+        writes = [
+            ((0x19, 0x01, 0x00, 0x00), [1]),
+            ((0x19, 0x01, 0x20, 0x01), [2]),
+        ]
+        self.assertEqual(len(coalesce_dt1_writes(writes)), 2)
+
+    def test_block_size_is_bounded(self):
+        writes = [((0x19, 0x70, 0x2E, lsb), [0]) for lsb in range(0x00, 0x80)]
+        blocks = coalesce_dt1_writes(writes)
+        self.assertTrue(all(len(data) <= DT1_MAX_BLOCK_SIZE for _, data in blocks))
+        self.assertEqual(sum(len(data) for _, data in blocks), 0x80)
+
+    def test_block_does_not_cross_lsb_page(self):
+        writes = [
+            ((0x19, 0x70, 0x2E, 0x7E), [1]),
+            ((0x19, 0x70, 0x2E, 0x7F), [0x00, 0x00, 0x00, 0x01]),
+        ]
+        self.assertEqual(len(coalesce_dt1_writes(writes)), 2)
+
+    def test_later_write_to_same_address_wins(self):
+        writes = [
+            ((0x18, 0x00, 0x00, 0x10), [1]),
+            ((0x18, 0x00, 0x00, 0x10), [7]),
+        ]
+        self.assertEqual(coalesce_dt1_writes(writes), [((0x18, 0x00, 0x00, 0x10), [7])])
+
+
+class TestCoalesceDT1Messages(unittest.TestCase):
+    def test_messages_become_one_block(self):
+        messages = [
+            JDXiSysEx(
+                sysex_address=JDXiSysExAddress(0x19, 0x42, 0x00, lsb), value=[lsb]
+            )
+            for lsb in range(0x16, 0x1A)
+        ]
+        blocks = coalesce_dt1_messages(messages)
+        self.assertEqual(len(blocks), 1)
+        raw = list(blocks[0].to_bytes())
+        self.assertEqual(raw[8:12], [0x19, 0x42, 0x00, 0x16])
+        self.assertEqual(raw[12:16], [0x16, 0x17, 0x18, 0x19])
+        checksum = (128 - (sum(raw[8:-2]) & 0x7F)) & 0x7F
+        self.assertEqual(raw[-2], checksum)
+        self.assertEqual(raw[-1], 0xF7)
+
+
+if __name__ == "__main__":
+    unittest.main()
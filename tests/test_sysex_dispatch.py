@@ -0,0 +1,116 @@
+"""
+Tests for the address-routed SysEx dispatch bus (jdxi_editor.midi.sysex.dispatch)
+"""
+
+import unittest
+
+from jdxi_editor.core.instrumentation import instruments
+from jdxi_editor.midi.sysex.dispatch import (
+    SysExDispatchBus,
+    SysExDispatchEvent,
+    address_from_parameters,
+    subscriber_metric,
+)
+from jdxi_editor.midi.sysex.sections import SysExSection
+
+
+class TestSysExDispatchBus(unittest.TestCase):
+    def setUp(self):
+        self.bus = SysExDispatchBus()
+        self.received = {"analog": [], "tone": [], "program": [], "all": []}
+        self.bus.subscribe((0x19, 0x42), self.received["analog"].append)
+        self.bus.subscribe((0x19,), self.received["tone"].append)
+        self.bus.subscribe((0x18, 0x00, 0x02), self.received["program"].append)
+        self.bus.subscribe((), self.received["all"].append)
+
+    def test_routes_by_prefix(self):
+        event = SysExDispatchEvent(address=(0x19, 0x42, 0x00), parameters={})
+        self.assertEqual(self.bus.publish(event), 3)
+        self.assertEqual(self.received["analog"], [event])
+        self.assertEqual(self.received["tone"], [event])
+        self.assertEqual(self.received["program"], [])
+        self.assertEqual(self.received["all"], [event])
+
+    def test_lmb_prefix_is_exact(self):
+        self.bus.publish(SysExDispatchEvent(address=(0x18, 0x00, 0x04), parameters={}))
+        self.assertEqual(self.received["program"], [])
+        self.bus.publish(SysExDispatchEvent(address=(0x18, 0x00, 0x02), parameters={}))
+        self.assertEqual(len(self.received["program"]), 1)
+
+    def test_has_subscribers(self):
+        bus = SysExDispatchBus()
+        bus.subscribe((0x19, 0x01), lambda event: None)
+        self.assertTrue(bus.has_subscribers((0x19, 0x01, 0x20)))
+        self.assertFalse(bus.has_subscribers((0x19, 0x21, 0x20)))
+
+    def test_duplicate_subscription_delivers_once(self):
+        bus = SysExDispatchBus()
+        received = []
+        bus.subscribe((0x19, 0x01), received.append)
+        bus.subscribe((0x19, 0x01), received.append)
+        bus.subscribe((0x19,), received.append)
+        bus.publish(SysExDispatchEvent(address=(0x19, 0x01, 0x00), parameters={}))
+        self.assertEqual(len(received), 1)
+
+    def test_unsubscribe_everywhere(self):
+        callback = self.received["analog"].append
+        self.bus.subscribe((0x18,), callback)
+        self.bus.unsubscribe(callback)
+        self.bus.publish(SysExDispatchEvent(address=(0x19, 0x42, 0x00), parameters={}))
+        self.bus.publish(SysExDispatchEvent(address=(0x18, 0x00, 0x00), parameters={}))
+        self.assertEqual(self.received["analog"], [])
+
+    def test_instrumented_publish(self):
+        """Each subscriber is timed under its editor's name; fan-out is recorded"""
+
+        class AnalogSynthEditor:
+            def on_sysex_event(self, event):
+                pass
+
+        editor = AnalogSynthEditor()
+        self.assertEqual(
+            subscriber_metric(editor.on_sysex_event), "ui.update.AnalogSynthEditor"
+        )
+        self.bus.subscribe((0x19, 0x42), editor.on_sysex_event)
+        instruments.reset()
+        instruments.enabled = True
+        try:
+            event = SysExDispatchEvent(address=(0x19, 0x42, 0x00), parameters={})
+            self.bus.publish(event)
+            histograms = instruments.snapshot()["histograms"]
+        finally:
+            instruments.enabled = False
+            instruments.reset()
+        self.assertEqual(histograms["ui.update.AnalogSynthEditor"]["count"], 1)
+        self.assertEqual(histograms["sysex_dispatch.fanout"]["max"], 4)
+        self.assertEqual(histograms["sysex_dispatch.publish"]["count"], 1)
+
+    def test_deleted_subscriber_is_removed(self):
+        bus = SysExDispatchBus()
+
+        def deleted(event):
+            raise RuntimeError("Internal C++ object already deleted.")
+
+        bus.subscribe((0x19,), deleted)
+        self.assertEqual(
+            bus.publish(SysExDispatchEvent(address=(0x19, 0x42, 0x00), parameters={})),
+            0,
+        )
+        self.assertFalse(bus.has_subscribers((0x19, 0x42, 0x00)))
+
+
+class TestAddressFromParameters(unittest.TestCase):
+    def test_reads_patch_address(self):
+        self.assertEqual(
+            address_from_parameters({SysExSection.ADDRESS: "19420000"}),
+            (0x19, 0x42, 0x00),
+        )
+
+    def test_missing_or_malformed(self):
+        self.assertIsNone(address_from_parameters({}))
+        self.assertIsNone(address_from_parameters({SysExSection.ADDRESS: "zz"}))
+        self.assertIsNone(address_from_parameters({SysExSection.ADDRESS: "zzzzzzzz"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
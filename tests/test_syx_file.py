@@ -0,0 +1,73 @@
+"""
+Tests for the streaming .syx reader and sender (jdxi_editor.midi.sysex.syx_file,
+jdxi_editor.midi.io.syx_sender)
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from jdxi_editor.midi.io import syx_sender
+from jdxi_editor.midi.io.syx_sender import SysExFileSender, frame_interval
+from jdxi_editor.midi.sysex.syx_file import (
+    SysExFileReader,
+    iter_frame_spans,
+    roland_checksums_valid,
+)
+from tests.sysex_frames import dt1
+
+IDENTITY_REQUEST = bytes([0xF0, 0x7E, 0x7F, 0x06, 0x01, 0xF7])
+
+
+class TestFrameSpans(unittest.TestCase):
+    def test_skips_junk_and_truncated_frames(self):
+        good = dt1((0x19, 0x42, 0x00, 0x00), [1, 2, 3])
+        data = b"\x00\x01" + good + b"\xf0\x41\x10" + good + b"\xf0\x00"
+        spans = list(iter_frame_spans(data))
+        start = 2 + len(good) + 3
+        self.assertEqual(spans, [(2, 2 + len(good)), (start, start + len(good))])
+
+    def test_checksums_checked_per_frame(self):
+        good = dt1((0x18, 0x00, 0x00, 0x00), b"Init Program")
+        bad = bytearray(good)
+        bad[-2] ^= 0x01
+        data = good + bytes(bad) + IDENTITY_REQUEST
+        spans = list(iter_frame_spans(data))
+        self.assertEqual(list(roland_checksums_valid(data, spans)), [True, False, True])
+
+
+class TestSysExFile(unittest.TestCase):
+    def setUp(self):
+        self.frames = [dt1((0x19, 0x01, 0x00, n), [n]) for n in range(10)]
+        handle, self.path = tempfile.mkstemp(suffix=".syx")
+        with os.fdopen(handle, "wb") as file:
+            file.write(b"".join(self.frames))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_reader_streams_views_in_batches(self):
+        with SysExFileReader(self.path, batch_frames=3) as reader:
+            frames = [bytes(frame) for frame in reader.frames()]
+        self.assertEqual(frames, self.frames)
+        self.assertEqual((reader.valid, reader.invalid), (10, 0))
+
+    def test_sender_sends_every_frame(self):
+        sent = []
+        with mock.patch.object(syx_sender, "SYX_MIN_INTERVAL", 0.0), mock.patch.object(
+            syx_sender, "SYX_BYTES_PER_SECOND", 1e9
+        ):
+            sender = SysExFileSender(self.path, send=sent.append)
+            sender.run()
+        self.assertEqual(sent, self.frames)
+        self.assertEqual(sender.result.sent, 10)
+        self.assertFalse(sender.result.cancelled)
+
+    def test_pacing_follows_frame_length(self):
+        self.assertEqual(frame_interval(1), syx_sender.SYX_MIN_INTERVAL)
+        self.assertAlmostEqual(frame_interval(3125), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Tests for the vectorised track analysis (jdxi_editor.midi.track.notes)
+"""
+
+import unittest
+
+from mido import Message, MetaMessage, MidiFile, MidiTrack
+
+from jdxi_editor.midi.file.model import index_track
+from jdxi_editor.midi.track.analyzer import TrackAnalyzer
+from jdxi_editor.midi.track.classification import classify_tracks
+from jdxi_editor.midi.track.notes import NoteArrays, clear_analysis_cache
+from jdxi_editor.midi.utils.drum_detection import (
+    analyze_track_for_drums,
+    detect_drum_tracks,
+)
+
+
+def on(note, time, velocity=100, channel=0):
+    return Message("note_on", note=note, velocity=velocity, channel=channel, time=time)
+
+
+def off(note, time, channel=0):
+    return Message("note_off", note=note, channel=channel, time=time)
+
+
+def pad_track() -> MidiTrack:
+    """
+    Ticks:   0     100   200   300   400   500
+    60:      on ---------------------off
+    64:            on ----------off
+    67:                  on(retrigger at 250) ------off
+    """
+    return MidiTrack(
+        [
+            MetaMessage("track_name", name="Pad", time=0),
+            on(60, 0),
+            on(64, 100),
+            on(67, 100),
+            on(67, 50),  # --- retrigger: restarts 67 at 250
+            off(64, 50),
+            off(60, 100),
+            off(67, 100),
+            off(67, 10),  # --- already released: ignored
+        ]
+    )
+
+
+class TestNotePairs(unittest.TestCase):
+    def test_pairing(self):
+        pairs = NoteArrays.from_columns(index_track(pad_track(), 0)).pair()
+        self.assertEqual(pairs.max_polyphony, 3)
+        # --- note-off order: 64 (100-300), 60 (0-400), 67 (250-500)
+        self.assertEqual(pairs.durations.tolist(), [200, 400, 250])
+        # --- 64 holds 67 (started 250); 60 holds 67 (250), 64 has ended
+        self.assertEqual(pairs.legato_count(), 2)
+
+    def test_analyzer(self):
+        stats = TrackAnalyzer(pad_track(), 0).run()
+        self.assertEqual(stats.track_name, "Pad")
+        self.assertEqual(stats.note_count, 4)
+        self.assertEqual(stats.note_range, 7)
+        self.assertEqual(stats.max_simultaneous, 3)
+        self.assertAlmostEqual(stats.avg_note_duration, 850 / 3)
+        self.assertAlmostEqual(stats.legato_score, 0.5)
+        self.assertEqual(len(stats.note_offs), 4)
+        self.assertEqual(stats.pitch_histogram[67], 2)
+        self.assertEqual(stats.velocity_range, 0)
+
+
+class TestDrumDetection(unittest.TestCase):
+    def setUp(self):
+        clear_analysis_cache()
+
+    def drum_file(self) -> MidiFile:
+        drums = MidiTrack([MetaMessage("track_name", name="Drums", time=0)])
+        for _ in range(4):
+            drums.extend(
+                [
+                    on(36, 0, channel=9),
+                    on(42, 0, channel=9),
+                    off(36, 60, channel=9),
+                    off(42, 0, channel=9),
+                    on(38, 60, channel=9),
+                    off(38, 60, channel=9),
+                ]
+            )
+        midi_file = MidiFile()
+        midi_file.tracks.extend([pad_track(), drums])
+        return midi_file
+
+    def test_drum_track(self):
+        analysis = analyze_track_for_drums(self.drum_file().tracks[1], 1)
+        self.assertEqual(analysis["note_count"], 12)
+        self.assertEqual(analysis["drum_note_count"], 12)
+        self.assertEqual(analysis["max_simultaneous"], 2)
+        self.assertAlmostEqual(analysis["avg_note_duration"], 60.0)
+        self.assertEqual(analysis["score"], 50 + 30 + 20 + 5 + 5)
+
+    def test_detect_and_cache(self):
+        midi_file = self.drum_file()
+        first = detect_drum_tracks(midi_file)
+        self.assertEqual([index for index, _ in first], [1])
+        # --- A reload of the same content reuses the analyses
+        reloaded = MidiFile()
+        reloaded.tracks.extend(MidiTrack(list(t)) for t in midi_file.tracks)
+        self.assertIs(detect_drum_tracks(reloaded)[0][1], first[0][1])
+
+    def test_classify_excludes_drums(self):
+        classifications = classify_tracks(self.drum_file(), exclude_drum_tracks=[1])
+        indices = [i for tracks in classifications.values() for i, _ in tracks]
+        self.assertEqual(indices, [0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,7 +10,9 @@ Tests cover:
 
 import os
 import tempfile
+import time
 import unittest
+import wave
 from unittest.mock import MagicMock, patch
 
 import pyaudio
@@ -22,6 +24,7 @@ from jdxi_editor.midi.utils.helpers import (
     on_usb_recording_error,
 )
 from jdxi_editor.midi.recording.recording_thread import WavRecordingThread
+from jdxi_editor.midi.recording.stream import AudioChunkRing, WavStreamWriter
 
 
 class TestUSBRecorder(unittest.TestCase):
@@ -199,7 +202,7 @@ class TestWavRecordingThread(unittest.TestCase):
 
             # Mock wave file
             mock_wave_file = MagicMock()
-            mock_wave_open.return_value.__enter__.return_value = mock_wave_file
+            mock_wave_open.return_value = mock_wave_file
 
             # Calculate expected iterations
             expected_iterations = int(
@@ -231,20 +234,51 @@ class TestWavRecordingThread(unittest.TestCase):
             self.mock_stream.close.assert_called_once()
 
             # Verify wave file was opened and configured
-            mock_wave_open.assert_called_once_with(output_file, "wb")
+            mock_wave_open.assert_called_once()
+            self.assertEqual(mock_wave_open.call_args.args[1], "wb")
             mock_wave_file.setnchannels.assert_called_once_with(
                 self.mock_recorder.channels
             )
             mock_wave_file.setframerate.assert_called_once_with(
                 self.mock_recorder.rate
             )
-            mock_wave_file.writeframes.assert_called_once()
+            # Chunks are streamed to the file as they are captured
+            written = b"".join(
+                call.args[0] for call in mock_wave_file.writeframesraw.call_args_list
+            )
+            self.assertEqual(len(written), expected_iterations * 1024)
+            mock_wave_file.close.assert_called_once()
+            self.assertEqual(thread.stats.chunks_captured, expected_iterations)
 
         finally:
             # Clean up
             if os.path.exists(output_file):
                 os.unlink(output_file)
 
+    def test_record_streams_to_file(self):
+        """Recording writes a playable WAV file and counts device overflows."""
+        overflow = OSError(pyaudio.paInputOverflowed, "Input overflowed")
+        self.mock_stream.read.side_effect = [b"\x01\x00" * 512, overflow] + [
+            b"\x02\x00" * 512
+        ] * 10
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "take.wav")
+            thread = WavRecordingThread(
+                recorder=self.mock_recorder,
+                duration=0.1,
+                output_file=output_file,
+            )
+            thread.record()
+
+            with wave.open(output_file, "rb") as f:
+                self.assertEqual(f.getnchannels(), 1)
+                self.assertEqual(f.getframerate(), 44100)
+                frames = f.readframes(f.getnframes())
+        # --- 4 reads: one chunk, one overflow, two chunks
+        self.assertEqual(frames, b"\x01\x00" * 512 + b"\x02\x00" * 1024)
+        self.assertEqual(thread.stats.xruns, 1)
+        self.assertEqual(thread.stats.frames_written, 1536)
+
     def test_record_no_frames(self):
         """Test recording when no frames are captured."""
         thread = WavRecordingThread(
@@ -420,6 +454,49 @@ class TestWavRecordingThread(unittest.TestCase):
         self.assertIn("Test error", error_calls[0])
 
 
+class TestWavStreaming(unittest.TestCase):
+    """Test cases for the ring buffer and streaming WAV writer."""
+
+    def test_ring_overrun(self):
+        """A full ring drops chunks and counts them."""
+        ring = AudioChunkRing(capacity=3)
+        self.assertTrue(ring.push(b"a"))
+        self.assertTrue(ring.push(b"b"))
+        self.assertFalse(ring.push(b"c"))
+        self.assertEqual(ring.overruns, 1)
+        self.assertEqual(ring.high_water, 2)
+        self.assertEqual(ring.drain(), [b"a", b"b"])
+        self.assertEqual(len(ring), 0)
+
+    def test_partial_file_is_playable(self):
+        """The header covers the audio written so far while recording."""
+        ring = AudioChunkRing(capacity=16)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "partial.wav")
+            writer = WavStreamWriter(
+                ring,
+                output_file,
+                channels=2,
+                sample_width=2,
+                rate=8000,
+                header_interval=0.0,
+            )
+            writer.start()
+            ring.push(b"\x00" * 400)
+            for _ in range(500):
+                if writer.header_patches:
+                    break
+                time.sleep(0.01)
+            # --- Read while the writer still has the file open
+            with wave.open(output_file, "rb") as f:
+                self.assertEqual(f.getnframes(), 100)
+            ring.push(b"\x00" * 400)
+            writer.close()
+            self.assertIsNone(writer.error)
+            with wave.open(output_file, "rb") as f:
+                self.assertEqual(f.getnframes(), 200)
+
+
 class TestRecordingHelpers(unittest.TestCase):
     """Test cases for recording helper functions."""
 